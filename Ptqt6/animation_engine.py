@@ -0,0 +1,196 @@
+"""
+Shared animation driver for plain QGraphicsItems
+QPropertyAnimation only works on QObjects, so it cannot animate a
+QGraphicsRectItem's rect or opacity. ItemAnimator tweens rect, position,
+opacity and brush/pen colour on any graphics item from one shared timer:
+every running tween advances on the same tick, arrows touched during the
+tick are recomputed once, and the animator owns each tween until it finishes.
+
+Usage:
+    from animation_engine import animator
+    animator().animate(node, "rect", QRectF(x, y, w, h), duration=300)
+    animator().animate(node, "opacity", 1.0, start=0.0, delay=500)
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from PyQt6.QtWidgets import QGraphicsItem
+from PyQt6.QtGui import QBrush, QColor, QPen
+from PyQt6.QtCore import QObject, QTimer, QRectF, QPointF, QEasingCurve, Qt
+
+from edge_geometry import flush_dirty_edges
+
+# ~60 fps shared tick
+FRAME_MS = 16
+
+
+def _lerp(a, b, t):
+    return a + (b - a) * t
+
+
+def _get_rect(item):
+    return item.rect()
+
+
+def _set_rect(item, rect):
+    # Nodes with incident arrows resize through set_rect() so the arrows follow
+    if hasattr(item, "set_rect"):
+        item.set_rect(rect)
+    else:
+        item.setRect(rect)
+
+
+def _mix_rect(a, b, t):
+    return QRectF(_lerp(a.x(), b.x(), t), _lerp(a.y(), b.y(), t),
+                  _lerp(a.width(), b.width(), t), _lerp(a.height(), b.height(), t))
+
+
+def _mix_point(a, b, t):
+    return QPointF(_lerp(a.x(), b.x(), t), _lerp(a.y(), b.y(), t))
+
+
+def _mix_color(a, b, t):
+    return QColor(round(_lerp(a.red(), b.red(), t)), round(_lerp(a.green(), b.green(), t)),
+                  round(_lerp(a.blue(), b.blue(), t)), round(_lerp(a.alpha(), b.alpha(), t)))
+
+
+def _set_brush_color(item, color):
+    brush = QBrush(item.brush())
+    brush.setStyle(Qt.BrushStyle.SolidPattern)
+    brush.setColor(color)
+    item.setBrush(brush)
+
+
+def _set_pen_color(item, color):
+    pen = QPen(item.pen())
+    pen.setColor(color)
+    item.setPen(pen)
+
+
+# property name -> (getter, setter, interpolate)
+PROPERTIES = {
+    "rect": (_get_rect, _set_rect, _mix_rect),
+    "pos": (QGraphicsItem.pos, QGraphicsItem.setPos, _mix_point),
+    "opacity": (QGraphicsItem.opacity, QGraphicsItem.setOpacity, _lerp),
+    "brush_color": (lambda item: QColor(item.brush().color()), _set_brush_color, _mix_color),
+    "pen_color": (lambda item: QColor(item.pen().color()), _set_pen_color, _mix_color),
+}
+
+
+@dataclass(eq=False)
+class Tween:
+    """One property of one item moving from start to end"""
+    item: Any
+    prop: str
+    start: Any
+    end: Any
+    duration: float
+    delay: float
+    easing: QEasingCurve
+    on_finished: Optional[Callable] = None
+    started_at: float = field(default=0.0)
+
+    def apply(self, now):
+        """Advance to time now; returns True once the tween is complete"""
+        elapsed = now - self.started_at - self.delay
+        if elapsed < 0:
+            return False
+
+        getter, setter, mix = PROPERTIES[self.prop]
+        if self.start is None:
+            # Pick up the current value when the (possibly delayed) tween begins
+            self.start = getter(self.item)
+        progress = 1.0 if self.duration <= 0 else min(elapsed / self.duration, 1.0)
+        setter(self.item, mix(self.start, self.end, self.easing.valueForProgress(progress)))
+        return progress >= 1.0
+
+
+class ItemAnimator(QObject):
+    """Owns all running tweens and advances them from a single timer"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tweens = {}
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(FRAME_MS)
+        self.timer.timeout.connect(self.tick)
+
+    def animate(self, item, prop, end, duration=300, delay=0, start=None,
+                easing=QEasingCurve.Type.OutCubic, on_finished=None):
+        """Tween item.prop to end; replaces any tween already running on that property
+
+        duration and delay are in milliseconds. With start=None the tween
+        begins from the item's value at the moment it starts moving.
+        """
+        if prop not in PROPERTIES:
+            raise ValueError(f"Cannot animate property: {prop}")
+
+        tween = Tween(item, prop, start, end, duration / 1000, delay / 1000,
+                      QEasingCurve(easing), on_finished, started_at=time.perf_counter())
+        if start is not None and delay > 0:
+            # Hold the start value during the delay (e.g. stay invisible before a fade-in)
+            PROPERTIES[prop][1](item, start)
+        self.tweens[(id(item), prop)] = tween
+        if not self.timer.isActive():
+            self.timer.start()
+        return tween
+
+    def stop(self, item, prop=None):
+        """Drop running tweens on an item, leaving it where it currently is"""
+        for key in [key for key in self.tweens if key[0] == id(item) and prop in (None, key[1])]:
+            del self.tweens[key]
+
+    def finish_all(self):
+        """Jump every running tween to its end value (used by headless rendering)"""
+        # Completion callbacks may chain new tweens; settle those too
+        for _ in range(100):
+            if not self.tweens:
+                break
+            self.advance(float("inf"))
+
+    def is_running(self, item=None):
+        if item is None:
+            return bool(self.tweens)
+        return any(key[0] == id(item) for key in self.tweens)
+
+    def tick(self):
+        self.advance(time.perf_counter())
+
+    def advance(self, now):
+        """Apply one frame to every tween, then recompute touched arrows once"""
+        finished = []
+        for key, tween in list(self.tweens.items()):
+            try:
+                done = tween.apply(now)
+            except RuntimeError:
+                # Underlying C++ item was deleted with its scene
+                done = True
+                tween.on_finished = None
+            if done:
+                finished.append((key, tween))
+
+        for key, tween in finished:
+            if self.tweens.get(key) is tween:
+                del self.tweens[key]
+        flush_dirty_edges()
+
+        for _, tween in finished:
+            if tween.on_finished is not None:
+                tween.on_finished()
+
+        if not self.tweens:
+            self.timer.stop()
+
+
+_animator = None
+
+
+def animator():
+    """The application-wide ItemAnimator (created on first use)"""
+    global _animator
+    if _animator is None:
+        _animator = ItemAnimator()
+    return _animator
@@ -7,6 +7,9 @@ from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
 from PyQt6.QtGui import QFont, QTextCharFormat, QColor, QSyntaxHighlighter, QTextCursor
 from PyQt6.QtCore import Qt, QRegularExpression
 
+from memory_layout import SOURCE_DIR, default_estimator, describe_line
+from concurrency_check import check_source, findings_by_line
+
 class JavaSyntaxHighlighter(QSyntaxHighlighter):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -63,7 +66,7 @@ class JavaSyntaxHighlighter(QSyntaxHighlighter):
 class CodeAnalyzerWidget(QWidget):
     def __init__(self):
         super().__init__()
-        self.project_path = "/Users/jguida941/Downloads/Singleton_GameService--main-2/src/com/gamingroom"
+        self.project_path = SOURCE_DIR
         self.current_file = None
         self.current_content = []
         self.init_ui()
@@ -205,21 +208,21 @@ class CodeAnalyzerWidget(QWidget):
                 14: {
                     "line": "private long id;",
                     "explanation": "Private instance field storing unique identifier. 'long' is a 64-bit primitive type. Private access ensures encapsulation - only accessible within this class.",
-                    "memory": "8 bytes per instance in heap memory. Stored inline within object memory layout.",
+                    "memory": "Stored inline within the object's memory layout.",
                     "pattern": "Encapsulation - Information hiding principle of OOP.",
                     "complexity": "O(1) - Direct memory access"
                 },
                 16: {
                     "line": "private String name;",
                     "explanation": "Private instance field storing entity name. String is a reference type, so this stores a reference (pointer) to the actual String object.",
-                    "memory": "8 bytes for reference (64-bit JVM) + String object size (varies based on content).",
+                    "memory": "Reference stored inline; the String object it points to lives separately in the heap.",
                     "pattern": "Encapsulation - Private field with public getter.",
                     "complexity": "O(1) - Reference storage"
                 },
                 19: {
                     "line": "public Entity(long id, String name) {",
                     "explanation": "Public constructor that requires both id and name. This ensures every Entity has these values from creation - no Entity can exist without them.",
-                    "memory": "Stack frame allocated during construction. Parameters passed: 8 bytes (long) + 8 bytes (String reference).",
+                    "memory": "Stack frame allocated during construction. Parameters passed: a long and a String reference.",
                     "pattern": "Constructor pattern - Ensures valid initial state.",
                     "complexity": "O(1) - Simple assignment"
                 },
@@ -240,7 +243,7 @@ class CodeAnalyzerWidget(QWidget):
                 30: {
                     "line": "public String getName() {",
                     "explanation": "Public getter for name field. Returns the String reference, not a copy, so caller could modify the String if it were mutable (but Strings are immutable in Java).",
-                    "memory": "No allocation. Returns existing reference (8 bytes).",
+                    "memory": "No allocation. Returns the existing reference.",
                     "pattern": "Getter pattern - Encapsulation.",
                     "complexity": "O(1) - Direct reference return"
                 },
@@ -254,7 +257,7 @@ class CodeAnalyzerWidget(QWidget):
                 44: {
                     "line": "return getClass().getSimpleName() + \" [id=\" + id + \", name=\" + name + \"]\";",
                     "explanation": "Uses reflection (getClass()) to get actual runtime type, then getSimpleName() for class name without package. This ensures subclasses show their actual type, not 'Entity'.",
-                    "memory": "Creates multiple temporary String objects. Each + operation may create new String. Total: ~100-200 bytes temporary.",
+                    "memory": "Creates temporary String objects (a StringBuilder and its result) on every call.",
                     "pattern": "Polymorphism - Method returns actual subclass type.",
                     "complexity": "O(n) - Multiple string concatenations"
                 }
@@ -270,14 +273,14 @@ class CodeAnalyzerWidget(QWidget):
                 19: {
                     "line": "private static GameService instance = null;",
                     "explanation": "Static field holding the single instance. Initialized to null for lazy initialization. 'static' means this belongs to the class, not instances.",
-                    "memory": "8 bytes in method area/metaspace. Shared across all class users.",
+                    "memory": "Single slot in the class's static storage. Shared across all class users.",
                     "pattern": "Singleton Pattern - Instance holder with lazy initialization.",
                     "complexity": "O(1) - Static field"
                 },
                 22: {
                     "line": "private static List<Game> games = new ArrayList<Game>();",
                     "explanation": "Static list to store all games. ArrayList provides dynamic sizing. Initial capacity is 10 by default.",
-                    "memory": "ArrayList object (~48 bytes) + backing array (10 * 8 bytes initially) in heap.",
+                    "memory": "ArrayList object in heap; its backing array is allocated on the first add.",
                     "pattern": "Singleton Pattern - Centralized storage.",
                     "complexity": "O(1) - Initialization"
                 },
@@ -305,7 +308,7 @@ class CodeAnalyzerWidget(QWidget):
                 44: {
                     "line": "instance = new GameService();",
                     "explanation": "Creates the singleton instance. This line executes ONLY ONCE in application lifetime, on first getInstance() call.",
-                    "memory": "Allocates GameService object (~32-48 bytes) in heap.",
+                    "memory": "Allocates the single GameService object in heap.",
                     "pattern": "Singleton Pattern - Single instance creation.",
                     "complexity": "O(1) - Object allocation"
                 },
@@ -319,7 +322,7 @@ class CodeAnalyzerWidget(QWidget):
                 100: {
                     "line": "return ++nextGameId;",
                     "explanation": "Pre-increment operator: increments first, then returns new value. Ensures unique sequential IDs. Thread-unsafe in current form.",
-                    "memory": "Modifies static long field (8 bytes).",
+                    "memory": "Updates a long field in place - no allocation.",
                     "pattern": "ID Generation Pattern - Sequential unique IDs.",
                     "complexity": "O(1) - Increment and return"
                 }
@@ -328,14 +331,14 @@ class CodeAnalyzerWidget(QWidget):
                 20: {
                     "line": "public class Game extends Entity {",
                     "explanation": "Game inherits from Entity, gaining id and name fields plus their methods. 'extends' creates IS-A relationship: Game IS-A Entity.",
-                    "memory": "Inherits Entity's fields (16 bytes) plus own fields. Virtual method table for polymorphism.",
+                    "memory": "Inherits Entity's fields plus own fields. Virtual method table for polymorphism.",
                     "pattern": "Inheritance - Extending abstract base class.",
                     "complexity": "O(1) - Class declaration"
                 },
                 23: {
                     "line": "private List<Team> teams = new ArrayList<Team>();",
                     "explanation": "Composition relationship: Game HAS-A list of Teams. ArrayList allows dynamic team addition/removal.",
-                    "memory": "8 bytes (reference) + ArrayList object + backing array in heap.",
+                    "memory": "Reference field + ArrayList object; backing array allocated on the first add.",
                     "pattern": "Composition Pattern - Game contains Teams.",
                     "complexity": "O(1) - Initialization"
                 },
@@ -372,14 +375,14 @@ class CodeAnalyzerWidget(QWidget):
                 12: {
                     "line": "public class Team extends Entity {",
                     "explanation": "Team inherits from Entity, gaining id and name. Continues the hierarchy: Entity <- Game <- Team <- Player.",
-                    "memory": "Inherits 16 bytes from Entity + own fields.",
+                    "memory": "Inherits Entity's fields + own fields.",
                     "pattern": "Inheritance hierarchy - Template pattern.",
                     "complexity": "O(1) - Class declaration"
                 },
                 15: {
                     "line": "private List<Player> players = new ArrayList<>();",
                     "explanation": "Composition: Team HAS-A list of Players. Diamond operator <> infers type from declaration.",
-                    "memory": "8 bytes reference + ArrayList allocation.",
+                    "memory": "Reference field + ArrayList allocation.",
                     "pattern": "Composition Pattern - Aggregation.",
                     "complexity": "O(1) - Initialization"
                 },
@@ -402,7 +405,7 @@ class CodeAnalyzerWidget(QWidget):
                 15: {
                     "line": "public class Player extends Entity {",
                     "explanation": "Player is the leaf node in hierarchy. Simplest entity - just inherits from Entity without adding fields.",
-                    "memory": "Only Entity's 16 bytes - no additional fields.",
+                    "memory": "Only Entity's fields - no additional fields.",
                     "pattern": "Inheritance - Leaf node in hierarchy.",
                     "complexity": "O(1) - Class declaration"
                 },
@@ -432,6 +435,7 @@ class CodeAnalyzerWidget(QWidget):
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 self.current_content = content.split('\n')
+            self.concurrency_findings = findings_by_line(check_source(content, file_path))
             
             # Add line numbers
             numbered_lines = []
@@ -450,9 +454,11 @@ class CodeAnalyzerWidget(QWidget):
         except FileNotFoundError:
             self.code_editor.setPlainText(f"Error: Could not find file {file_path}")
             self.current_content = []
+            self.concurrency_findings = {}
         except Exception as e:
             self.code_editor.setPlainText(f"Error loading file: {str(e)}")
             self.current_content = []
+            self.concurrency_findings = {}
     
     def reload_current_file(self):
         """Reload the current file"""
@@ -482,15 +488,16 @@ class CodeAnalyzerWidget(QWidget):
                         
                         # Update all analysis panels
                         self.explanation_text.setHtml(f"<p style='color: #cccccc;'>{analysis['explanation']}</p>")
-                        self.memory_text.setPlainText(analysis['memory'])
-                        self.pattern_text.setPlainText(f"Pattern: {analysis['pattern']}\nComplexity: {analysis['complexity']}")
+                        self.memory_text.setPlainText(self.memory_estimate(line_content, analysis['memory']))
+                        self.pattern_text.setPlainText(self.concurrency_notes(
+                            line_num, f"Pattern: {analysis['pattern']}\nComplexity: {analysis['complexity']}"))
                         
                         # Highlight the current line
                         self.highlight_current_line(block_number)
                     else:
-                        self.show_default_message()
+                        self.show_default_message(line_content, line_num)
                 else:
-                    self.show_default_message()
+                    self.show_default_message(line_content, line_num)
             except ValueError:
                 self.show_default_message()
         else:
@@ -516,13 +523,35 @@ class CodeAnalyzerWidget(QWidget):
         highlight_format.setBackground(QColor(50, 50, 80))
         cursor.setCharFormat(highlight_format)
     
-    def show_default_message(self):
+    def memory_estimate(self, line_content, notes):
+        """Computed layout/allocation figures for the line, followed by the notes"""
+        if not self.current_file:
+            return notes
+        try:
+            estimate = describe_line(default_estimator(), Path(self.current_file).stem, line_content)
+        except OSError:
+            estimate = None
+        if not estimate:
+            return notes
+        return f"{estimate}\n\n{notes}" if notes else estimate
+    
+    def concurrency_notes(self, line_num, notes):
+        """Thread-safety warnings for the line, followed by the notes"""
+        findings = getattr(self, "concurrency_findings", {}).get(line_num)
+        if not findings:
+            return notes
+        warnings = "\n".join(f"⚠ Thread safety: {f.message}\nFix: {f.fix}" for f in findings)
+        return f"{warnings}\n\n{notes}" if notes else warnings
+
+    def show_default_message(self, line_content="", line_num=None):
         """Show default message when no analysis is available"""
         self.explanation_text.setHtml(
             "<p style='color: #888;'><i>Click on a line with analysis available to see detailed explanation.</i></p>"
         )
-        self.memory_text.setPlainText("Memory analysis will appear here when you select an analyzed line.")
-        self.pattern_text.setPlainText("Design pattern and complexity information will appear here.")
+        self.memory_text.setPlainText(self.memory_estimate(line_content, "")
+                                      or "Memory analysis will appear here when you select an analyzed line.")
+        self.pattern_text.setPlainText(self.concurrency_notes(line_num, "")
+                                       or "Design pattern and complexity information will appear here.")
 
 def test_code_analyzer():
     """Test the code analyzer widget independently"""
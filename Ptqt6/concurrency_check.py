@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Thread-safety check for the GamingRoom Java sources
+Flags the two races in the Java GameService: a lazy getInstance() that
+tests a static field for null and assigns it outside any synchronized code
+(two threads can both construct an instance), and id counters bumped with
+field++ in unsynchronized methods (two callers can get the same id).
+
+Usage:
+    python concurrency_check.py                 # check src/com/gamingroom
+    python concurrency_check.py Foo.java Bar.java
+"""
+
+import os
+import re
+import sys
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List
+
+from memory_layout import CLASS_RE, FIELD_RE, SOURCE_DIR, _strip_comments
+
+METHOD_RE = re.compile(
+    r"^\s*((?:(?:public|protected|private|static|final|synchronized|abstract)\s+)*)"
+    r"[\w.<>\[\], ]+\s+(\w+)\s*\([^;{]*(?:\{.*)?$")
+SYNCHRONIZED_BLOCK_RE = re.compile(r"\bsynchronized\s*\(")
+NULL_CHECK_RE = re.compile(r"\bif\s*\(\s*(\w+)\s*==\s*null\s*\)")
+INCREMENT_RE = re.compile(r"(?:\b(\w+)\s*(?:\+\+|--))|(?:(?:\+\+|--)\s*(\w+)\b)|(?:\b(\w+)\s*[-+]=)")
+
+ATOMIC_FIX = "Use an AtomicLong (getAndIncrement()) or make the method synchronized."
+SINGLETON_FIX = ("Make getInstance() synchronized, use double-checked locking on a volatile field, "
+                 "or initialise the instance in a static holder class.")
+
+
+@dataclass
+class Finding:
+    path: str
+    line: int
+    rule: str
+    message: str
+    fix: str
+
+    def __str__(self):
+        return f"{os.path.basename(self.path)}:{self.line}: [{self.rule}] {self.message}\n    Fix: {self.fix}"
+
+
+def check_source(source, path="") -> List[Finding]:
+    """Races in one Java source file"""
+    fields = {}
+    class_name = None
+    findings = []
+    depth = 0
+    method = None
+    method_synchronized = False
+    synchronized_depths = []
+    lazy_checks = {}
+
+    def scan(line, start, number):
+        # Code after "synchronized (...)" on this line is inside the block, so the
+        # block's depth is pushed before anything following it is checked
+        block = SYNCHRONIZED_BLOCK_RE.search(line, start)
+        text = line[start:block.start() if block else len(line)]
+        if not method_synchronized and not synchronized_depths:
+            match = NULL_CHECK_RE.search(text)
+            if match and "static" in fields.get(match.group(1), ()):
+                lazy_checks[match.group(1)] = number
+            for name, checked_at in list(lazy_checks.items()):
+                if re.search(rf"\b{name}\s*=\s*new\b", text):
+                    findings.append(Finding(
+                        path, checked_at, "lazy-singleton",
+                        f"{method}() checks static '{name}' for null and assigns it without "
+                        f"synchronization; two threads can each create a {class_name}.",
+                        SINGLETON_FIX))
+                    del lazy_checks[name]
+            for groups in INCREMENT_RE.findall(text):
+                name = next(group for group in groups if group)
+                modifiers = fields.get(name)
+                if modifiers is not None and "final" not in modifiers:
+                    findings.append(Finding(
+                        path, number, "unsynchronized-increment",
+                        f"'{line.strip().rstrip(';')}' in {method}() is a read-modify-write of field "
+                        f"'{name}' without synchronization; concurrent callers can get the same value.",
+                        ATOMIC_FIX))
+        if block:
+            before = line[:block.start()]
+            synchronized_depths.append(depth + before.count("{") - before.count("}") + 1)
+
+    for number, line in enumerate(_strip_comments(source).split("\n"), 1):
+        if class_name is None:
+            match = CLASS_RE.search(line)
+            if match:
+                class_name = match.group(1)
+        elif depth == 1:
+            match = FIELD_RE.match(line)
+            if match and match.group(2) not in ("return", "new"):
+                fields[match.group(3)] = match.group(1).split()
+            else:
+                match = METHOD_RE.match(line)
+                if match:
+                    method = match.group(2)
+                    method_synchronized = "synchronized" in match.group(1).split()
+                    lazy_checks.clear()
+                    body = line.find("{")
+                    if body >= 0:
+                        # The body starts on the header line (possibly all of it: "{ return n++; }")
+                        scan(line, body + 1, number)
+        elif method is not None:
+            scan(line, 0, number)
+
+        depth += line.count("{") - line.count("}")
+        while synchronized_depths and depth < synchronized_depths[-1]:
+            synchronized_depths.pop()
+        if depth <= 1:
+            method = None if depth < 1 or "}" in line else method
+    return findings
+
+
+def check_sources(source_dir=SOURCE_DIR) -> List[Finding]:
+    """Findings for every .java file in source_dir"""
+    findings = []
+    for filename in sorted(os.listdir(source_dir)):
+        if filename.endswith(".java"):
+            findings += check_file(os.path.join(source_dir, filename))
+    return findings
+
+
+def check_file(path) -> List[Finding]:
+    with open(path, "r", encoding="utf-8") as f:
+        return check_source(f.read(), path)
+
+
+def findings_by_line(findings) -> Dict[int, List[Finding]]:
+    lines = {}
+    for finding in findings:
+        lines.setdefault(finding.line, []).append(finding)
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag unsynchronized lazy singletons and counters in Java sources")
+    parser.add_argument("files", nargs="*", help="Java files (default: the GamingRoom sources)")
+    args = parser.parse_args()
+
+    findings = []
+    if args.files:
+        for path in args.files:
+            findings += check_file(path)
+    else:
+        findings = check_sources()
+    for finding in findings:
+        print(finding)
+    print(f"{len(findings)} finding(s)")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Shared geometry bookkeeping for diagram nodes and arrows
+Nodes keep a list of their incident arrows and mark only those dirty when they
+move or resize. Dirty arrows are recomputed once per event-loop pass (or on
+demand via flush_dirty_edges()), so dragging one node costs O(incident edges)
+no matter how many arrows the scene holds. Arrows taken out of their scene
+leave the dirty set, and ones Qt has already deleted are skipped.
+"""
+
+import math
+import weakref
+from functools import lru_cache
+
+from PyQt6 import sip
+from PyQt6.QtWidgets import QGraphicsItem
+from PyQt6.QtGui import QPolygonF
+from PyQt6.QtCore import QCoreApplication, QPointF, QTimer
+
+# Arrows waiting for a recompute, flushed together on the next event-loop pass;
+# weak, so the set never keeps a discarded arrow alive
+_dirty_edges = weakref.WeakSet()
+_flush_scheduled = False
+
+
+def flush_dirty_edges():
+    """Recompute every arrow whose endpoints changed since the last flush"""
+    global _flush_scheduled
+    _flush_scheduled = False
+    while _dirty_edges:
+        edge = _dirty_edges.pop()
+        # scene.clear() and scene deletion destroy the C++ item without an ItemSceneChange
+        if not sip.isdeleted(edge):
+            edge.ensure_geometry()
+
+
+def _schedule_flush():
+    global _flush_scheduled
+    if _flush_scheduled:
+        return
+    if QCoreApplication.instance() is None:
+        flush_dirty_edges()
+        return
+    _flush_scheduled = True
+    QTimer.singleShot(0, flush_dirty_edges)
+
+
+@lru_cache(maxsize=4096)
+def arrow_wing_offsets(angle, length, degrees):
+    """Offsets of the two arrow-head wings for a line angle (Qt degrees)
+
+    QLineF.angle() is counter-clockwise with y pointing up, so the y component
+    is negated for scene coordinates. Angles are rounded by the caller, which
+    keeps the cache small while staying visually exact.
+    """
+    wing1 = math.radians(angle + 180 - degrees)
+    wing2 = math.radians(angle + 180 + degrees)
+    return (length * math.cos(wing1), -length * math.sin(wing1),
+            length * math.cos(wing2), -length * math.sin(wing2))
+
+
+def arrow_head_polygon(line, length=12, degrees=25):
+    """Triangle pointing at line.p2()"""
+    tip = line.p2()
+    dx1, dy1, dx2, dy2 = arrow_wing_offsets(round(line.angle(), 1), length, degrees)
+    return QPolygonF([tip, QPointF(tip.x() + dx1, tip.y() + dy1), QPointF(tip.x() + dx2, tip.y() + dy2)])
+
+
+def clip_to_rect(inside, outside, rect):
+    """Point where the segment inside->outside leaves rect (rect border intersection)"""
+    dx = outside.x() - inside.x()
+    dy = outside.y() - inside.y()
+    if dx == 0 and dy == 0:
+        return QPointF(inside)
+
+    # Smallest positive scale that reaches a vertical or horizontal edge
+    scales = []
+    if dx:
+        scales.append(((rect.right() if dx > 0 else rect.left()) - inside.x()) / dx)
+    if dy:
+        scales.append(((rect.bottom() if dy > 0 else rect.top()) - inside.y()) / dy)
+    t = min(s for s in scales if s >= 0) if any(s >= 0 for s in scales) else 0
+    t = min(t, 1.0)
+    return QPointF(inside.x() + dx * t, inside.y() + dy * t)
+
+
+def rect_key(rect):
+    return (rect.x(), rect.y(), rect.width(), rect.height())
+
+
+class EdgeEndpointMixin:
+    """For node items: tracks incident arrows and notifies them on geometry changes
+
+    Mix in before the QGraphicsItem base class and call init_endpoint() from
+    __init__. Use set_rect() instead of setRect() so arrows follow resizes.
+    """
+
+    def init_endpoint(self, movable=True):
+        self.edges = []
+        flags = QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges
+        if movable:
+            flags |= QGraphicsItem.GraphicsItemFlag.ItemIsMovable
+        self.setFlags(self.flags() | flags)
+
+    def add_edge(self, edge):
+        self.edges.append(edge)
+
+    def scene_rect(self):
+        """Node rectangle in scene coordinates (includes any drag offset)"""
+        return self.mapRectToScene(self.rect())
+
+    def set_rect(self, rect):
+        self.setRect(rect)
+        self.notify_edges()
+
+    def notify_edges(self):
+        for edge in self.edges:
+            edge.mark_geometry_dirty()
+
+    def itemChange(self, change, value):
+        if change in (QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged,
+                      QGraphicsItem.GraphicsItemChange.ItemTransformHasChanged):
+            self.notify_edges()
+        return super().itemChange(change, value)
+
+
+class CachedEdgeMixin:
+    """For arrow items: lazy recompute with a dirty flag and cached endpoints
+
+    Subclasses implement compute_geometry(start_rect, end_rect), which is only
+    called when one of the two endpoint rectangles actually changed.
+    """
+
+    def init_edge(self, start_node, end_node):
+        self._geometry_dirty = True
+        self._endpoint_key = None
+        start_node.add_edge(self)
+        end_node.add_edge(self)
+
+    def mark_geometry_dirty(self):
+        if not self._geometry_dirty:
+            self._geometry_dirty = True
+            _dirty_edges.add(self)
+            _schedule_flush()
+
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged:
+            if value is None:
+                _dirty_edges.discard(self)
+            elif getattr(self, "_geometry_dirty", False):
+                # Moved while out of a scene: recompute once it is shown again
+                _dirty_edges.add(self)
+                _schedule_flush()
+        return super().itemChange(change, value)
+
+    def ensure_geometry(self):
+        """Bring the line, head and label up to date if an endpoint moved"""
+        if not self._geometry_dirty:
+            return
+        self._geometry_dirty = False
+        _dirty_edges.discard(self)
+
+        start_rect = self.start_rect()
+        end_rect = self.end_rect()
+        key = (rect_key(start_rect), rect_key(end_rect))
+        if key == self._endpoint_key:
+            return
+        self._endpoint_key = key
+        self.compute_geometry(start_rect, end_rect)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Cached environment probe for the visualizer launch scripts
+Finding out whether PyQt6 is usable means importing QtCore, which costs a
+noticeable part of a cold launch on a shared machine. probe() does that once
+in a subprocess and stores the resolved interpreter, the PyQt6 and Qt versions
+and the Qt plugin paths in a small per-user state file. Later launches only
+stat() the files the answer depends on (the interpreter, the site-packages
+directories, the PyQt6 package and its plugin directory) and reuse the stored
+result while none of their mtimes changed, so installing, upgrading or
+removing PyQt6 invalidates it automatically.
+
+The state file lives in $XDG_CACHE_HOME/singleton_visualizer/ (~/.cache by
+default); SINGLETON_VIZ_ENV_CACHE points it elsewhere.
+
+Usage:
+    from env_probe import probe
+    env = probe()                      # {"pyqt6": "6.7.1", "qt": "6.7.2", "plugins": "...", ...}
+    if env["pyqt6"] is None: ...
+
+    python env_probe.py                # show the cached (or freshly probed) environment
+    python env_probe.py --refresh      # probe again regardless of the cache
+    python env_probe.py --clear
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tempfile
+from typing import Dict, Optional
+
+STATE_VERSION = 2               # 2: failed probes are no longer stored
+PROBE_TIMEOUT = 60.0
+
+# Run in the target interpreter on a cache miss; prints one JSON line
+PROBE_SCRIPT = """
+import json, os, site, sys, sysconfig
+# Installing or removing a package changes the mtime of one of these directories
+site_dirs = {sysconfig.get_path("purelib"), sysconfig.get_path("platlib"), site.getusersitepackages()}
+info = {"python_version": sys.version.split()[0], "pyqt6": None, "qt": None, "pyqt6_path": None,
+        "qtcore_path": None, "plugins": None, "error": None, "site_dirs": sorted(filter(None, site_dirs))}
+try:
+    from PyQt6 import QtCore
+except Exception as e:
+    info["error"] = f"{type(e).__name__}: {e}"
+else:
+    import PyQt6
+    info.update(pyqt6=QtCore.PYQT_VERSION_STR, qt=QtCore.QT_VERSION_STR,
+                pyqt6_path=os.path.dirname(PyQt6.__file__), qtcore_path=QtCore.__file__,
+                plugins=QtCore.QLibraryInfo.path(QtCore.QLibraryInfo.LibraryPath.PluginsPath))
+print(json.dumps(info))
+"""
+
+
+def state_path():
+    override = os.environ.get("SINGLETON_VIZ_ENV_CACHE")
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "singleton_visualizer", "env.json")
+
+
+def cache_key(python):
+    # The plugin path Qt resolves depends on these as well as on the interpreter
+    return "|".join([os.path.realpath(python), os.environ.get("QT_PLUGIN_PATH", ""),
+                     os.environ.get("PYTHONPATH", "")])
+
+
+def stamp(paths) -> Dict[str, Optional[int]]:
+    """mtime_ns of each path, None for the ones that do not exist"""
+    stamps = {}
+    for path in paths:
+        try:
+            stamps[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+
+def load_state(path=None):
+    try:
+        with open(path or state_path(), encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) and state.get("version") == STATE_VERSION else {}
+
+
+def save_state(state, path=None):
+    path = path or state_path()
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Several launches can finish probing at once; replace the file atomically
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".env-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=1)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only home: every launch probes, as before
+
+
+def run_probe(python):
+    """Import PyQt6 in python and report what was found (the slow path)
+
+    failed is True when the probe itself did not run to the end (as opposed
+    to PyQt6 failing to import); such results are not cached.
+    """
+    started = time.perf_counter()
+    error = None
+    try:
+        result = subprocess.run([python, "-c", PROBE_SCRIPT], capture_output=True, text=True,
+                                timeout=PROBE_TIMEOUT)
+        info = json.loads(result.stdout.strip().splitlines()[-1])
+    except subprocess.TimeoutExpired:
+        error = f"probe timed out after {PROBE_TIMEOUT:.0f} s"
+    except OSError as e:
+        error = f"probe could not run {python}: {e.strerror or e}"
+    except (ValueError, IndexError):
+        last = (result.stderr.strip().splitlines() or [f"exit code {result.returncode}"])[-1]
+        error = f"probe printed no result ({last})"
+    if error is not None:
+        info = {"python_version": None, "pyqt6": None, "qt": None, "pyqt6_path": None,
+                "qtcore_path": None, "plugins": None, "error": error, "site_dirs": []}
+    info["failed"] = error is not None
+    info["python"] = os.path.realpath(python)
+    info["probe_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    info["probed_at"] = time.time()
+    watched = [info["python"]] + info["site_dirs"]
+    watched += [path for path in (info["pyqt6_path"], info["qtcore_path"], info["plugins"]) if path]
+    info["stamps"] = stamp(watched)
+    return info
+
+
+def is_valid(entry):
+    stamps = entry.get("stamps")
+    return bool(stamps) and stamp(stamps) == stamps
+
+
+def probe(python=sys.executable, refresh=False, path=None):
+    """Environment info for python: cached while the watched files are unchanged
+
+    The returned dict has python, python_version, pyqt6 (version or None), qt,
+    pyqt6_path, plugins (Qt plugin directory), error, and cached (True when no
+    probe subprocess was needed).
+    """
+    state = load_state(path)
+    key = cache_key(python)
+    entry = state.get("entries", {}).get(key)
+    if entry is not None and not refresh and is_valid(entry):
+        return {**entry, "cached": True}
+    entry = run_probe(python)
+    if entry["failed"]:
+        # A timeout or crash may be transient; the next launch probes again
+        return {**entry, "cached": False}
+    state = load_state(path) or {"version": STATE_VERSION}   # re-read: another launch may have written it
+    state.setdefault("entries", {})[key] = entry
+    save_state(state, path)
+    return {**entry, "cached": False}
+
+
+def invalidate(python=sys.executable, path=None):
+    """Forget the cached result for python (after installing or removing packages)"""
+    state = load_state(path)
+    if state.get("entries", {}).pop(cache_key(python), None) is not None:
+        save_state(state, path)
+
+
+def platform_plugins(env):
+    """Names of the Qt platform plugins that env's plugin directory provides"""
+    directory = os.path.join(env.get("plugins") or "", "platforms")
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    plugins = set()
+    for name in names:
+        base = name.split(".")[0]
+        base = base[3:] if base.startswith("lib") else base
+        plugins.add(base[1:] if base.startswith("q") else base)
+    return sorted(plugins)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the cached Python / PyQt6 environment of the visualizers")
+    parser.add_argument("--python", default=sys.executable, help="interpreter to probe")
+    parser.add_argument("--refresh", action="store_true", help="probe again even if the cache is valid")
+    parser.add_argument("--clear", action="store_true", help="delete the state file")
+    parser.add_argument("--json", action="store_true", help="print the raw entry")
+    args = parser.parse_args()
+
+    if args.clear:
+        try:
+            os.remove(state_path())
+            print(f"Removed {state_path()}")
+        except FileNotFoundError:
+            print("No state file")
+        return
+
+    started = time.perf_counter()
+    env = probe(args.python, refresh=args.refresh)
+    elapsed = (time.perf_counter() - started) * 1000
+    if args.json:
+        print(json.dumps(env, indent=1))
+        return
+    print(f"State file:  {state_path()}")
+    print(f"Python:      {env['python']} ({env['python_version']})")
+    if env["pyqt6"]:
+        print(f"PyQt6:       {env['pyqt6']} (Qt {env['qt']}) in {env['pyqt6_path']}")
+        print(f"Qt plugins:  {env['plugins']}")
+        print(f"Platforms:   {', '.join(platform_plugins(env)) or 'none found'}")
+    else:
+        print(f"PyQt6:       not available ({env['error']})")
+    source = "cache" if env["cached"] else f"probe ({env['probe_ms']:.0f} ms subprocess)"
+    print(f"Resolved in {elapsed:.1f} ms from {source}")
+
+
+if __name__ == "__main__":
+    main()
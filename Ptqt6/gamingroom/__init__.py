@@ -0,0 +1,35 @@
+"""
+Python mirror of the com.gamingroom model
+GameService, Game, Team, Player and Entity with the same method names and
+duplicate-name rules as the Java classes, backed by hash indexes so the
+visualizers and capacity planning can simulate millions of entities
+without a JVM.
+
+Usage (from Ptqt6):
+    from gamingroom import GameService
+    service = GameService.getInstance()
+    team = service.addGame("Game #1").addTeam("Team Alpha")
+    team.addPlayer("Justin")
+
+    python -m gamingroom.benchmark      # indexed vs Java-style linear scans
+    python -m gamingroom.store          # columnar store for millions of players
+    python -m gamingroom.snapshot world.grsnap   # save and mmap-load a large world
+"""
+
+# game_service first: Game and Team reach the singleton through that module at call time
+from .game_service import GameService
+from .game import Game
+from .team import Team
+from .player import Player
+from .entity import Entity, ignore_case_key, equals_ignore_case
+
+__all__ = ["Entity", "Game", "Team", "Player", "GameService", "ignore_case_key", "equals_ignore_case",
+           "EntityStore"]
+
+
+def __getattr__(name):
+    # Imported on first use, so `python -m gamingroom.store` does not find itself already imported
+    if name == "EntityStore":
+        from .store import EntityStore
+        return EntityStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
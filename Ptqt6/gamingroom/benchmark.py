@@ -0,0 +1,158 @@
+"""
+Indexed vs linear-scan GameService benchmark
+Builds the same games x teams x players graph twice: once with the hash
+indexed gamingroom classes and once with subclasses that search for
+duplicates the way the Java code does (a for-each over every existing
+game, team or player). Every name is requested `repeat` times, so both
+the create path and the duplicate-return path are measured, and the
+growth exponent shows the O(n^2) cost of the Java design.
+
+Usage (from Ptqt6):
+    python -m gamingroom.benchmark
+    python -m gamingroom.benchmark --games 1000 2000 4000 --teams 20 --players 20
+    python -m gamingroom.benchmark --throughput 3000000
+"""
+
+import math
+import time
+import argparse
+
+from .entity import equals_ignore_case
+from .game import Game
+from .game_service import GameService
+from .team import Team
+
+
+class LinearTeam(Team):
+    """Team.addPlayer() as written in Java: scan every player"""
+    __slots__ = ()
+
+    def addPlayer(self, name):
+        for player in self._players:
+            if equals_ignore_case(player.getName(), name):
+                return player
+        player = self.player_class(GameService.getInstance().getNextPlayerId(), name)
+        self._players.append(player)
+        return player
+
+
+class LinearGame(Game):
+    """Game.addTeam() as written in Java: scan every team"""
+    __slots__ = ()
+
+    team_class = LinearTeam
+
+    def addTeam(self, name):
+        for team in self._teams:
+            if equals_ignore_case(team.getName(), name):
+                return team
+        team = self.team_class(GameService.getInstance().getNextTeamId(), name)
+        self._teams.append(team)
+        return team
+
+
+class LinearGameService(GameService):
+    """GameService.addGame()/getGame() as written in Java: scan every game"""
+
+    game_class = LinearGame
+
+    def addGame(self, name):
+        for game in self._games:
+            if game.getName() == name:
+                return game
+        game = self.game_class(self.getNextGameId(), name)
+        self._games.append(game)
+        return game
+
+    def getGame(self, key):
+        for game in self._games:
+            if (game.getName() if isinstance(key, str) else game.getId()) == key:
+                return game
+        return None
+
+
+VARIANTS = {"indexed": GameService, "linear": LinearGameService}
+
+
+def make_names(games, teams, players):
+    """Name lists built up front so that string formatting is not timed"""
+    return ([f"Game #{i}" for i in range(1, games + 1)],
+            [f"Team {i}" for i in range(1, teams + 1)],
+            [f"Player {i}" for i in range(1, players + 1)])
+
+
+def build_graph(service_class, names, repeat=2):
+    """Install a fresh service_class singleton and populate it; returns (calls, seconds)"""
+    game_names, team_names, player_names = names
+    service = service_class()
+    GameService.resetInstance(service)
+
+    calls = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for game_name in game_names:
+            game = service.addGame(game_name)
+            for team_name in team_names:
+                team = game.addTeam(team_name)
+                for player_name in player_names:
+                    team.addPlayer(player_name)
+        calls += len(game_names) * (1 + len(team_names) * (1 + len(player_names)))
+    elapsed = time.perf_counter() - started
+    GameService.resetInstance()
+    return calls, elapsed
+
+
+def growth_exponent(sizes, times):
+    """k in time ~ n^k between the smallest and largest run"""
+    if len(sizes) < 2 or times[0] <= 0:
+        return float("nan")
+    return math.log(times[-1] / times[0]) / math.log(sizes[-1] / sizes[0])
+
+
+def compare(game_counts, teams, players, repeat):
+    print(f"{teams} teams/game, {players} players/team, every name requested {repeat}x")
+    print(f"{'games':>8s} {'entities':>10s} {'indexed':>10s} {'linear':>10s} {'speedup':>8s} {'indexed/min':>14s}")
+    results = {name: [] for name in VARIANTS}
+    for games in game_counts:
+        names = make_names(games, teams, players)
+        entities = games * (1 + teams * (1 + players))
+        row = {}
+        for variant, service_class in VARIANTS.items():
+            _, row[variant] = build_graph(service_class, names, repeat)
+            results[variant].append(row[variant])
+        print(f"{games:8,d} {entities:10,d} {row['indexed']:9.3f}s {row['linear']:9.3f}s "
+              f"{row['linear'] / row['indexed']:7.1f}x {entities / row['indexed'] * 60:14,.0f}")
+
+    for variant, times in results.items():
+        print(f"{variant:>8s}: time grows as n^{growth_exponent(game_counts, times):.2f}")
+
+
+def throughput(players, players_per_team=100, teams_per_game=10):
+    """Creations per minute for a graph with this many players (indexed only)"""
+    games = max(players // (players_per_team * teams_per_game), 1)
+    names = make_names(games, teams_per_game, players_per_team)
+    entities = games * (1 + teams_per_game * (1 + players_per_team))
+    _, elapsed = build_graph(GameService, names, repeat=1)
+    print(f"Created {entities:,} entities ({games:,} games) in {elapsed:.2f} s "
+          f"= {entities / elapsed * 60:,.0f} per minute")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare hash-indexed and Java-style linear GameService lookups")
+    parser.add_argument("--games", type=int, nargs="+", default=[1000, 2000, 4000, 8000],
+                        help="game counts to run (ascending)")
+    parser.add_argument("--teams", type=int, default=4, help="teams per game")
+    parser.add_argument("--players", type=int, default=4, help="players per team")
+    parser.add_argument("--repeat", type=int, default=2, help="times each name is requested")
+    parser.add_argument("--throughput", type=int, metavar="PLAYERS",
+                        help="only measure indexed creation rate for this many players")
+    args = parser.parse_args()
+
+    if args.throughput:
+        throughput(args.throughput)
+    else:
+        compare(sorted(args.games), args.teams, args.players, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Entity base class (mirrors com.gamingroom.Entity)
+An immutable id and name shared by Game, Team and Player, plus the
+case-insensitive name key used by the hash indexes in place of
+String.equalsIgnoreCase().
+"""
+
+
+def ignore_case_key(name):
+    """Dictionary key under which names that equalsIgnoreCase() each other collide
+
+    Java compares character by character (upper-cased, then lower-cased) and
+    never changes the length, so "straße" and "STRASSE" differ; str.casefold()
+    would merge them. ASCII names, the common case, just use lower().
+    """
+    if name.isascii():
+        return name.lower()
+    chars = []
+    for char in name:
+        upper = char.upper()
+        if len(upper) != 1:
+            upper = char
+        # Only "İ" lower-cases to two chars; Java's simple mapping keeps the first ("i")
+        chars.append(upper.lower()[0])
+    return "".join(chars)
+
+
+def equals_ignore_case(a, b):
+    """String.equalsIgnoreCase() for two Python strings"""
+    return a == b or (len(a) == len(b) and ignore_case_key(a) == ignore_case_key(b))
+
+
+class Entity:
+    """Abstract base for game entities: a unique id and a display name"""
+    __slots__ = ("_id", "_name")
+
+    def __init__(self, id, name):
+        self._id = id
+        self._name = name
+
+    def getId(self):
+        return self._id
+
+    def getName(self):
+        return self._name
+
+    def toString(self):
+        return f"{type(self).__name__} [id={self._id}, name={self._name}]"
+
+    def __str__(self):
+        return self.toString()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} id={self._id} name={self._name!r}>"
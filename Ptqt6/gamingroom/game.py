@@ -0,0 +1,55 @@
+"""
+Game (mirrors com.gamingroom.Game)
+Game.addTeam() returns the existing team whose name equalsIgnoreCase() the
+new one, looked up in a dict keyed by ignore_case_key() instead of a scan
+over every team.
+"""
+
+from . import game_service
+from .entity import Entity, ignore_case_key
+from .team import Team
+
+
+class Game(Entity):
+    """One game session; holds its teams in insertion order"""
+    __slots__ = ("_teams", "_teams_by_key")
+
+    team_class = Team
+
+    def __init__(self, id, name):
+        super().__init__(id, name)
+        self._teams = []
+        self._teams_by_key = {}
+
+    def addTeam(self, name):
+        """Existing team with this name (ignoring case), or a new one with the next team id"""
+        key = ignore_case_key(name)
+        team = self._teams_by_key.get(key)
+        if team is not None:
+            return team
+
+        service = game_service.GameService.getInstance()
+        with game_service.REGISTRY_LOCK:
+            team = self._teams_by_key.get(key)
+            if team is None:
+                team = self.team_class(service.getNextTeamId(), name)
+                self._teams.append(team)
+                self._teams_by_key[key] = team
+        return team
+
+    def restore_team(self, id, name):
+        """Append a team that already has an id (snapshot restore; no counter, no lock)"""
+        team = self.team_class(id, name)
+        self._teams.append(team)
+        self._teams_by_key.setdefault(ignore_case_key(name), team)
+        return team
+
+    def getTeams(self):
+        return self._teams
+
+    def toString(self):
+        # Nested team listings are not re-indented, exactly as the Java StringBuilder prints them
+        text = f"Game [id={self._id}, name={self._name}]"
+        if self._teams:
+            text += "\n  Teams:" + "".join(f"\n    {team}" for team in self._teams)
+        return text
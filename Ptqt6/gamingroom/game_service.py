@@ -0,0 +1,101 @@
+"""
+GameService singleton (mirrors com.gamingroom.GameService)
+Hands out game, team and player ids and owns the games. Games are indexed
+by id and by exact name, so addGame() and both getGame() lookups are O(1)
+instead of a walk over the list, and getInstance() is safe to call from
+several threads at once.
+"""
+
+import itertools
+import threading
+
+from .game import Game
+
+# Guards check-then-insert in addGame/addTeam/addPlayer; lookups of existing entities never take it
+REGISTRY_LOCK = threading.RLock()
+_INSTANCE_LOCK = threading.Lock()
+
+
+class GameService:
+    """The one GameService: id counters plus the games list and its indexes"""
+
+    _instance = None
+    # How many times getInstance() has had to construct one (stays 1 unless reset)
+    instances_created = 0
+
+    game_class = Game
+
+    def __init__(self, ids=None):
+        # ids: an IdService to share id blocks between threads or worker processes
+        if ids is None:
+            self._next_game_id = itertools.count(1)
+            self._next_team_id = itertools.count(1)
+            self._next_player_id = itertools.count(1)
+        else:
+            self._next_game_id, self._next_team_id, self._next_player_id = ids.games, ids.teams, ids.players
+        self._games = []
+        self._games_by_id = {}
+        self._games_by_name = {}
+
+    @staticmethod
+    def getInstance():
+        """The shared instance, created on first use (double-checked locking)"""
+        instance = GameService._instance
+        if instance is None:
+            with _INSTANCE_LOCK:
+                instance = GameService._instance
+                if instance is None:
+                    instance = GameService._instance = GameService()
+                    GameService.instances_created += 1
+        return instance
+
+    @staticmethod
+    def resetInstance(instance=None):
+        """Drop (or replace) the singleton - for tests, benchmarks and simulations"""
+        with _INSTANCE_LOCK:
+            GameService._instance = instance
+
+    # next() on itertools.count (or an IdBlockAllocator) is thread-safe, so ids stay unique without the lock
+    def getNextGameId(self):
+        return next(self._next_game_id)
+
+    def getNextTeamId(self):
+        return next(self._next_team_id)
+
+    def getNextPlayerId(self):
+        return next(self._next_player_id)
+
+    def addGame(self, name):
+        """Existing game with exactly this name, or a new one with the next game id
+
+        Game names are compared with equals(), not equalsIgnoreCase(), as in
+        the Java service.
+        """
+        game = self._games_by_name.get(name)
+        if game is not None:
+            return game
+
+        with REGISTRY_LOCK:
+            game = self._games_by_name.get(name)
+            if game is None:
+                game = self.game_class(self.getNextGameId(), name)
+                self._games.append(game)
+                self._games_by_id[game.getId()] = game
+                self._games_by_name[name] = game
+        return game
+
+    def getGame(self, key):
+        """Game by id (int) or by exact name (str); None if there is none"""
+        if isinstance(key, str):
+            return self._games_by_name.get(key)
+        return self._games_by_id.get(key)
+
+    def getGameAt(self, index):
+        """Game at a list position (Java's package-private getGame(int index))"""
+        return self._games[index]
+
+    def getGames(self):
+        return self._games
+
+    def getGameCount(self):
+        return len(self._games)
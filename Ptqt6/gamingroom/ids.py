@@ -0,0 +1,207 @@
+"""
+Block-reserving id allocators
+The Java GameService hands out ids with nextPlayerId++ - a read, an add and
+a write that two threads can interleave into duplicate ids. Here a shared
+counter only moves a block at a time (one locked add per block_size ids),
+and each thread draws from its own block with no lock at all. Backed by a
+multiprocessing.Value the same counter is shared by worker processes, so
+adding workers adds throughput instead of contention.
+
+Ids are unique but only ordered within a block: two threads interleave
+their ranges, and ids left in a block when a thread or process exits are
+skipped.
+
+Usage (from Ptqt6):
+    from gamingroom.ids import IdService
+    ids = IdService(shared=True)            # before starting worker processes
+    service = GameService(ids)              # GameService.getNext*Id() draw blocks
+
+    python -m gamingroom.ids --workers 1 2 4 --ids 2000000
+"""
+
+import os
+import re
+import time
+import weakref
+import argparse
+import threading
+import multiprocessing
+from array import array
+
+
+class ThreadCounter:
+    """Next free id for threads of one process"""
+
+    def __init__(self, start=1):
+        self.value = start
+        self.lock = threading.Lock()
+
+    def reserve(self, count):
+        with self.lock:
+            start = self.value
+            self.value = start + count
+        return range(start, start + count)
+
+
+class ProcessCounter:
+    """Next free id in shared memory; pass it to workers when they are started"""
+
+    def __init__(self, start=1, context=None):
+        self.shared = (context or multiprocessing).Value("q", start)
+
+    @property
+    def value(self):
+        return self.shared.value
+
+    def reserve(self, count):
+        with self.shared.get_lock():
+            start = self.shared.value
+            self.shared.value = start + count
+        return range(start, start + count)
+
+
+class IdBlockAllocator:
+    """Iterator of unique ids; each thread takes block_size ids per trip to the counter
+
+    Usable anywhere itertools.count() was: next(allocator).
+    """
+
+    def __init__(self, counter=None, block_size=1024):
+        self.counter = counter if counter is not None else ThreadCounter()
+        self.block_size = block_size
+        self._local = threading.local()
+        _allocators.add(self)
+
+    def __getstate__(self):
+        # Blocks belong to the thread that reserved them: a pickled copy starts
+        # without one, and so does a forked child (_forget_blocks)
+        return {"counter": self.counter, "block_size": self.block_size}
+
+    def __setstate__(self, state):
+        self.__init__(state["counter"], state["block_size"])
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        local = self._local
+        try:
+            return next(local.ids)
+        except (AttributeError, StopIteration):
+            local.ids = iter(self.counter.reserve(self.block_size))
+            return next(local.ids)
+
+    next_id = __next__
+
+    def reserve(self, count):
+        """A contiguous range of count ids for bulk creation (e.g. EntityStore.add_many)"""
+        return self.counter.reserve(count)
+
+
+# A forked child inherits the forking thread's block without pickling anything;
+# it must not keep drawing from it, or parent and children hand out the same ids
+_allocators = weakref.WeakSet()
+
+
+def _forget_blocks():
+    for allocator in list(_allocators):
+        allocator._local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_blocks)
+
+
+def peek_next_id(allocator):
+    """The next id allocator would hand out, without drawing it
+
+    For an IdBlockAllocator this is the counter's next unreserved id, so ids
+    still sitting in thread blocks are skipped by whoever continues from it.
+    """
+    if isinstance(allocator, IdBlockAllocator):
+        return allocator.counter.value
+    # itertools.count has no accessor for its position; its repr is count(n)
+    match = re.fullmatch(r"count\((-?\d+)\)", repr(allocator))
+    if match is None:
+        raise TypeError(f"cannot read the next id of {allocator!r}")
+    return int(match.group(1))
+
+
+class IdService:
+    """Game, team and player id allocators with the GameService method names"""
+
+    def __init__(self, block_size=1024, shared=False, context=None):
+        def allocator():
+            counter = ProcessCounter(context=context) if shared else ThreadCounter()
+            return IdBlockAllocator(counter, block_size)
+
+        self.games = allocator()
+        self.teams = allocator()
+        self.players = allocator()
+
+    def getNextGameId(self):
+        return next(self.games)
+
+    def getNextTeamId(self):
+        return next(self.teams)
+
+    def getNextPlayerId(self):
+        return next(self.players)
+
+
+# Benchmark workers: the allocator arrives once through the pool initializer
+_worker_ids = None
+
+
+def _init_worker(ids):
+    global _worker_ids
+    _worker_ids = ids
+
+
+def _allocate(count):
+    """Draw count player ids in this worker; returns them with the elapsed time"""
+    draw = _worker_ids.players.__next__
+    started = time.perf_counter()
+    ids = array("q", [draw() for _ in range(count)])
+    return ids.tobytes(), time.perf_counter() - started
+
+
+def run_workers(workers, total, block_size):
+    """Allocate total ids across worker processes; checks they are unique"""
+    context = multiprocessing.get_context()
+    ids = IdService(block_size, shared=True, context=context)
+    per_worker = total // workers
+    with context.Pool(workers, initializer=_init_worker, initargs=(ids,)) as pool:
+        started = time.perf_counter()
+        results = pool.map(_allocate, [per_worker] * workers)
+        elapsed = time.perf_counter() - started
+
+    seen = bytearray(ids.players.counter.value)
+    for data, _ in results:
+        for value in array("q", data):
+            if seen[value]:
+                raise AssertionError(f"id {value} handed out twice")
+            seen[value] = 1
+    busy = max(seconds for _, seconds in results)
+    return per_worker * workers, elapsed, busy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure block-reserving id allocation across worker processes")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="worker process counts")
+    parser.add_argument("--ids", type=int, default=2000000, help="ids to allocate per run")
+    parser.add_argument("--block", type=int, nargs="+", default=[1, 1024],
+                        help="block sizes (1 = take the shared lock for every id)")
+    args = parser.parse_args()
+
+    print(f"{'block':>6s} {'workers':>8s} {'ids':>11s} {'wall':>8s} {'ids/s':>13s} {'ids/s/worker':>13s}")
+    for block_size in args.block:
+        for workers in args.workers:
+            count, elapsed, busy = run_workers(workers, args.ids, block_size)
+            print(f"{block_size:6d} {workers:8d} {count:11,d} {elapsed:7.2f}s "
+                  f"{count / elapsed:13,.0f} {count / workers / busy:13,.0f}")
+    print("All ids unique.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""
+Player (mirrors com.gamingroom.Player)
+"""
+
+from .entity import Entity
+
+
+class Player(Entity):
+    """A player on a team; id and name are fixed at creation"""
+    __slots__ = ()
+
+    def toString(self):
+        return f"Player [id={self._id}, name={self._name}]"
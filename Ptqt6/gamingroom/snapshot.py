@@ -0,0 +1,417 @@
+"""
+Binary snapshots of a GameService world
+A snapshot stores the whole game/team/player tree plus the id counters as
+a few flat columns (kind, id, parent row, first child row, subtree size,
+name offset) and one UTF-8 name blob. Rows are written breadth-first under
+a GameService root row, so every node's children are a contiguous run of
+rows and no child index has to be built when loading.
+
+SnapshotWriter streams rows to temporary column files and assembles the
+snapshot on close, so a world can be saved while it is being generated.
+Snapshot maps the file read-only and reads the columns in place: opening a
+world with millions of players costs a few page faults instead of millions
+of objects, and the same GameView/TeamView/PlayerView API as EntityStore
+is available immediately. restore_service() rebuilds a mutable GameService
+when one is needed.
+
+File layout (little endian, sections 8-byte aligned):
+    header   magic, version, rows, games, teams, players, next game/team/player id
+    table    (offset, length) of each section in SECTIONS order
+    kinds B, ids q, parents i, first_child q, subtree_sizes q, name_offsets q, names
+
+Usage (from Ptqt6):
+    from gamingroom.snapshot import save_service, load_snapshot, restore_service
+    save_service(GameService.getInstance(), "world.grsnap")
+    world = load_snapshot("world.grsnap")
+    world.getGame("Game #1").getTeams()[0].getPlayers()
+
+    python -m gamingroom.snapshot --players 10000000 world.grsnap
+"""
+
+import os
+import mmap
+import time
+import shutil
+import struct
+import argparse
+import itertools
+import tempfile
+from array import array
+
+from .ids import peek_next_id
+from .store import GAME, TEAM, PLAYER, VIEW_CLASSES, RowList
+
+SERVICE = 0
+MAGIC = b"GRSNAP\r\n"
+VERSION = 1
+HEADER = struct.Struct("<8sIIqqqqqqq")
+SECTIONS = (("kinds", "B"), ("ids", "q"), ("parents", "i"), ("first_child", "q"),
+            ("subtree_sizes", "q"), ("name_offsets", "q"), ("names", "B"))
+TABLE = struct.Struct("<" + "qq" * len(SECTIONS))
+# Rows buffered per column before they are appended to the spool files
+FLUSH_ROWS = 65536
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+class SnapshotWriter:
+    """Appends rows breadth-first and writes the snapshot file on close()
+
+    Row 0 is the GameService root. Every other row names its parent row and
+    how many children it will have; rows must arrive grouped by parent, in
+    parent order (all games, then the teams of each game in game order, then
+    the players of each team), which is checked when the file is assembled.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        self.spools = {name: tempfile.TemporaryFile(dir=directory)
+                       for name in ("kinds", "ids", "parents", "child_counts", "name_ends", "names")}
+        self.buffers = {"kinds": array("B"), "ids": array("q"), "parents": array("i"),
+                        "child_counts": array("i"), "name_ends": array("q")}
+        self.names = bytearray()
+        self.name_end = 0
+        self.rows = 0
+        self.last_parent = 0
+        self.counts = {GAME: 0, TEAM: 0, PLAYER: 0}
+        self.max_ids = {GAME: 0, TEAM: 0, PLAYER: 0}
+        self.next_ids = None
+        self._append(SERVICE, 0, "GameService", -1, 0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def add(self, kind, entity_id, name, parent, child_count=0):
+        """Append one entity; returns its row"""
+        if not 0 <= parent < self.rows or parent < self.last_parent:
+            raise ValueError("rows must be added breadth-first, grouped by parent")
+        self.last_parent = parent
+        self.counts[kind] += 1
+        if entity_id > self.max_ids[kind]:
+            self.max_ids[kind] = entity_id
+        return self._append(kind, entity_id, name, parent, child_count)
+
+    def set_next_ids(self, game, team, player):
+        """Id counters to restore; never below one past the largest id of each kind (the default)"""
+        self.next_ids = (game, team, player)
+
+    def _append(self, kind, entity_id, name, parent, child_count):
+        buffers = self.buffers
+        buffers["kinds"].append(kind)
+        buffers["ids"].append(entity_id)
+        buffers["parents"].append(parent)
+        buffers["child_counts"].append(child_count)
+        data = name.encode("utf-8")
+        self.names += data
+        self.name_end += len(data)
+        buffers["name_ends"].append(self.name_end)
+        self.rows += 1
+        if len(buffers["kinds"]) >= FLUSH_ROWS:
+            self._flush()
+        return self.rows - 1
+
+    def _flush(self):
+        for name, buffer in self.buffers.items():
+            buffer.tofile(self.spools[name])
+            del buffer[:]
+        self.spools["names"].write(self.names)
+        self.names = bytearray()
+
+    def _read_column(self, name, typecode):
+        spool = self.spools[name]
+        spool.seek(0)
+        column = array(typecode)
+        column.frombytes(spool.read())
+        return column
+
+    def _derived_columns(self):
+        """first_child and subtree_sizes from the parent and child-count columns"""
+        parents = self._read_column("parents", "i")
+        child_counts = self._read_column("child_counts", "i")
+        seen = array("i", [0]) * self.rows
+        for parent in itertools.islice(parents, 1, None):
+            seen[parent] += 1
+        # The root's children (the games) are only known now
+        child_counts[0] = seen[0]
+
+        first_child = array("q", [0]) * (self.rows + 1)
+        running = 1
+        for row in range(self.rows):
+            first_child[row] = running
+            running += child_counts[row]
+        first_child[self.rows] = running
+        if seen != child_counts:
+            raise ValueError("child counts do not match the rows added under each parent")
+        del child_counts, seen
+
+        sizes = array("q", [1]) * self.rows
+        for row in range(self.rows - 1, 0, -1):
+            sizes[parents[row]] += sizes[row]
+        return first_child, sizes
+
+    def close(self):
+        """Assemble the snapshot file (replacing path atomically)"""
+        self._flush()
+        first_child, sizes = self._derived_columns()
+        next_ids = tuple(max(self.max_ids[kind] + 1, self.next_ids[index] if self.next_ids else 0)
+                         for index, kind in enumerate((GAME, TEAM, PLAYER)))
+
+        sources = {
+            "kinds": self.spools["kinds"], "ids": self.spools["ids"], "parents": self.spools["parents"],
+            "first_child": first_child, "subtree_sizes": sizes,
+            "name_offsets": (array("q", [0]), self.spools["name_ends"]), "names": self.spools["names"],
+        }
+        lengths = {"kinds": self.rows, "ids": 8 * self.rows, "parents": 4 * self.rows,
+                   "first_child": 8 * (self.rows + 1), "subtree_sizes": 8 * self.rows,
+                   "name_offsets": 8 * (self.rows + 1), "names": self.name_end}
+        table = []
+        offset = _align(HEADER.size + TABLE.size)
+        for name, _ in SECTIONS:
+            table += [offset, lengths[name]]
+            offset = _align(offset + lengths[name])
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as out:
+            out.write(HEADER.pack(MAGIC, VERSION, 0, self.rows, self.counts[GAME], self.counts[TEAM],
+                                  self.counts[PLAYER], *next_ids))
+            out.write(TABLE.pack(*table))
+            for (name, _), section_offset in zip(SECTIONS, table[::2]):
+                out.write(bytes(section_offset - out.tell()))
+                parts = sources[name] if isinstance(sources[name], tuple) else (sources[name],)
+                for part in parts:
+                    if isinstance(part, array):
+                        part.tofile(out)
+                    else:
+                        part.seek(0)
+                        shutil.copyfileobj(part, out, 1 << 20)
+            out.write(bytes(_align(out.tell()) - out.tell()))
+        os.replace(temp_path, self.path)
+        self.discard()
+
+    def discard(self):
+        for spool in self.spools.values():
+            spool.close()
+
+
+class Snapshot:
+    """A snapshot file mapped read-only; columns are memoryviews into the map
+
+    Implements the EntityStore row protocol, so store views (getGames(),
+    getTeams(), getPlayers(), getId(), getName()) work on it directly.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, _, self.rows, games, teams, players,
+             next_game, next_team, next_player) = HEADER.unpack_from(self.map, 0)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self.map.close()
+            raise ValueError(f"{path} is not a GameService snapshot")
+        self.counts = {GAME: games, TEAM: teams, PLAYER: players}
+        self.next_ids = {GAME: next_game, TEAM: next_team, PLAYER: next_player}
+
+        table = TABLE.unpack_from(self.map, HEADER.size)
+        data = memoryview(self.map)
+        self._views = [data]
+        for (name, typecode), offset, length in zip(SECTIONS, table[::2], table[1::2]):
+            column = data[offset:offset + length]
+            if typecode != "B":
+                column = column.cast(typecode)
+            self._views.append(column)
+            setattr(self, name, column)
+        self._games_by_name = None
+        self._games_by_id = None
+
+    def __len__(self):
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Unmap the file (views and lists taken from it become unusable)"""
+        for view in reversed(self._views):
+            view.release()
+        self.map.close()
+
+    @property
+    def nbytes(self):
+        return len(self.map)
+
+    def count(self, kind):
+        return self.counts[kind]
+
+    # Row protocol
+
+    def entity_id(self, row):
+        return self.ids[row]
+
+    def entity_name(self, row):
+        return str(self.names[self.name_offsets[row]:self.name_offsets[row + 1]], "utf-8")
+
+    def children(self, row):
+        return range(self.first_child[row], self.first_child[row + 1])
+
+    def view(self, row):
+        return VIEW_CLASSES[self.kinds[row]](self, row)
+
+    def _find_or_add(self, kind, name, parent):
+        raise TypeError("snapshots are read-only; use restore_service() for a mutable GameService")
+
+    # GameService-style lookups
+
+    def getGames(self):
+        return RowList(self, self.children(0))
+
+    def getGameCount(self):
+        return self.counts[GAME]
+
+    def getGame(self, key):
+        """Game by id (int) or exact name (str); None if there is none"""
+        if self._games_by_id is None:
+            # Games only - teams and players are never indexed
+            self._games_by_id, self._games_by_name = {}, {}
+            for row in self.children(0):
+                self._games_by_id[self.ids[row]] = row
+                self._games_by_name.setdefault(self.entity_name(row), row)
+        row = (self._games_by_name if isinstance(key, str) else self._games_by_id).get(key)
+        return self.view(row) if row is not None else None
+
+
+def load_snapshot(path):
+    return Snapshot(path)
+
+
+def is_snapshot(path):
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def save_service(service, path):
+    """Write a GameService (or any object with its API) breadth-first, with its id counters"""
+    with SnapshotWriter(path) as writer:
+        counters = [getattr(service, name, None) for name in ("_next_game_id", "_next_team_id", "_next_player_id")]
+        if None not in counters:
+            # Ids already handed out by getNext*Id() must not be issued again after a restore
+            writer.set_next_ids(*map(peek_next_id, counters))
+        games = service.getGames()
+        for game in games:
+            writer.add(GAME, game.getId(), game.getName(), 0, len(game.getTeams()))
+        row = 1 + len(games)
+        for game_row, game in enumerate(games, 1):
+            for team in game.getTeams():
+                writer.add(TEAM, team.getId(), team.getName(), game_row, len(team.getPlayers()))
+        team_row = row
+        for game in games:
+            for team in game.getTeams():
+                for player in team.getPlayers():
+                    writer.add(PLAYER, player.getId(), player.getName(), team_row)
+                team_row += 1
+
+
+def save_store(store, path):
+    """Write an EntityStore, reordering its rows breadth-first"""
+    with SnapshotWriter(path) as writer:
+        level = list(store.rows_by_id[GAME])
+        parent_rows = [0] * len(level)
+        while level:
+            next_level, next_parents = [], []
+            for row, parent in zip(level, parent_rows):
+                children = store.children(row) if store.kinds[row] != PLAYER else ()
+                new_row = writer.add(store.kinds[row], store.ids[row], store.entity_name(row), parent, len(children))
+                next_level.extend(children)
+                next_parents.extend([new_row] * len(children))
+            level, parent_rows = next_level, next_parents
+        writer.set_next_ids(*(store.count(kind) + 1 for kind in (GAME, TEAM, PLAYER)))
+
+
+def restore_service(snapshot, service_class=None, install=True):
+    """A GameService holding real Game/Team/Player objects, with its id counters restored
+
+    Game.addTeam() and Team.addPlayer() draw ids from GameService.getInstance(),
+    so the restored service replaces the singleton unless install is False.
+    """
+    from .game_service import GameService
+
+    service = (service_class or GameService)()
+    service._next_game_id = itertools.count(snapshot.next_ids[GAME])
+    service._next_team_id = itertools.count(snapshot.next_ids[TEAM])
+    service._next_player_id = itertools.count(snapshot.next_ids[PLAYER])
+
+    entities = [None] * len(snapshot)
+    kinds, ids, parents = snapshot.kinds, snapshot.ids, snapshot.parents
+    for row in range(1, len(snapshot)):
+        kind, name = kinds[row], snapshot.entity_name(row)
+        if kind == GAME:
+            entity = service.game_class(ids[row], name)
+            service._games.append(entity)
+            service._games_by_id[entity.getId()] = entity
+            service._games_by_name.setdefault(name, entity)
+        elif kind == TEAM:
+            entity = entities[parents[row]].restore_team(ids[row], name)
+        else:
+            entity = entities[parents[row]].restore_player(ids[row], name)
+        entities[row] = entity if kind != PLAYER else None
+    if install:
+        GameService.resetInstance(service)
+    return service
+
+
+def main():
+    from .game_service import GameService
+    from .store import EntityStore, fill_store
+
+    parser = argparse.ArgumentParser(description="Save a generated world as a snapshot and time loading it")
+    parser.add_argument("path", help="snapshot file to write")
+    parser.add_argument("--players", type=int, default=1000000, help="total players")
+    parser.add_argument("--teams", type=int, default=10, help="teams per game")
+    parser.add_argument("--team-size", type=int, default=10, help="players per team")
+    parser.add_argument("--restore", action="store_true", help="also time restore_service()")
+    args = parser.parse_args()
+
+    games = max(args.players // (args.teams * args.team_size), 1)
+    started = time.perf_counter()
+    store = fill_store(EntityStore(), games, args.teams, args.team_size)
+    print(f"Generated {len(store):,} entities in {time.perf_counter() - started:.1f} s")
+
+    started = time.perf_counter()
+    save_store(store, args.path)
+    size = os.path.getsize(args.path)
+    print(f"Saved {args.path}: {size / 1024 / 1024:,.1f} MB ({size / len(store):.1f} bytes per entity) "
+          f"in {time.perf_counter() - started:.1f} s")
+    del store
+
+    started = time.perf_counter()
+    world = load_snapshot(args.path)
+    game = world.getGame(games)
+    player = game.getTeams()[-1].getPlayers()[-1]
+    print(f"Opened and looked up {player} in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    if args.restore:
+        started = time.perf_counter()
+        service = restore_service(world)
+        print(f"Restored a GameService with {service.getGameCount():,} games in "
+              f"{time.perf_counter() - started:.1f} s; next player id {service.getNextPlayerId():,}")
+        GameService.resetInstance()
+    world.close()
+
+
+if __name__ == "__main__":
+    main()
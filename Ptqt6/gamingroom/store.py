@@ -0,0 +1,445 @@
+"""
+Columnar entity store
+Keeps every Game, Team and Player as one row across a few typed arrays
+(kind tag, id, parent row, name reference) with all names interned once
+in a single string table, instead of a Python object, a str and a list per
+entity. Lightweight views expose the Java-style getId()/getName()/
+getTeams()/getPlayers() API over the rows, so tens of millions of players
+fit in a few hundred MB for memory-visualizer and load-test scenarios.
+
+Per entity: 21 bytes of columns (29 once children have been listed), plus
+~26 bytes for each distinct name; the object mirror measures ~240 bytes.
+Checked adds (addGame/addTeam/addPlayer, with the Java duplicate rules)
+also keep a name index of ~100 bytes per entity; bulk add_many() does not.
+
+Usage (from Ptqt6):
+    from gamingroom.store import EntityStore
+    store = EntityStore()
+    team = store.addGame("Game #1").addTeam("Team Alpha")
+    team.addPlayer("Justin")
+    store.add_many(PLAYER, ["Ann", "Bob"] * 1000, parent=team.row)
+
+    python -m gamingroom.store --players 10000000
+"""
+
+import time
+import argparse
+import tracemalloc
+from array import array
+from collections.abc import Sequence
+
+from .entity import ignore_case_key
+
+# Same kind numbering as object_graph (0 is the GameService root there)
+GAME, TEAM, PLAYER = 1, 2, 3
+KIND_NAMES = {GAME: "Game", TEAM: "Team", PLAYER: "Player"}
+CHILD_KIND = {GAME: TEAM, TEAM: PLAYER}
+
+# Rows appended after the child index was built are kept aside until they
+# reach this fraction of the indexed rows, then the index is rebuilt
+PENDING_FRACTION = 8
+
+
+class StringTable:
+    """Interned strings: one UTF-8 blob, an offset per string and an
+    open-addressing hash of string numbers (no per-string Python objects)"""
+
+    def __init__(self):
+        self.blob = bytearray()
+        self.offsets = array("q", [0])
+        self.slots = array("i", [-1]) * 16
+        self.mask = 15
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self):
+        return len(self.blob) + self.offsets.itemsize * len(self.offsets) + self.slots.itemsize * len(self.slots)
+
+    def get(self, ref):
+        return self.blob[self.offsets[ref]:self.offsets[ref + 1]].decode("utf-8")
+
+    def _probe(self, data):
+        """(slot, ref) of data; ref is -1 and slot the free slot for it if absent"""
+        blob, offsets, slots, mask = self.blob, self.offsets, self.slots, self.mask
+        slot = hash(data) & mask
+        while True:
+            ref = slots[slot]
+            if ref < 0:
+                return slot, -1
+            start = offsets[ref]
+            if offsets[ref + 1] - start == len(data) and blob[start:start + len(data)] == data:
+                return slot, ref
+            slot = (slot + 1) & mask
+
+    def find(self, text):
+        """Number of text in the table, or -1; never adds it (for lookups)"""
+        return self._probe(text.encode("utf-8"))[1]
+
+    def intern(self, text):
+        """Number of text in the table, adding it if new"""
+        data = text.encode("utf-8")
+        slot, ref = self._probe(data)
+        if ref >= 0:
+            return ref
+
+        offsets = self.offsets
+        ref = len(offsets) - 1
+        self.blob += data
+        offsets.append(len(self.blob))
+        self.slots[slot] = ref
+        if 2 * (ref + 1) > self.mask:
+            self._grow()
+        return ref
+
+    def _grow(self):
+        # Keep the table at most half full so probe runs stay short
+        self.mask = 2 * self.mask + 1
+        self.slots = slots = array("i", [-1]) * (self.mask + 1)
+        blob, offsets, mask = self.blob, self.offsets, self.mask
+        for ref in range(len(offsets) - 1):
+            slot = hash(bytes(blob[offsets[ref]:offsets[ref + 1]])) & mask
+            while slots[slot] >= 0:
+                slot = (slot + 1) & mask
+            slots[slot] = ref
+
+
+class EntityStore:
+    """All entities of one GameService as rows of typed arrays
+
+    A parent is always an earlier row. Ids are handed out per kind in
+    creation order like the GameService counters, so rows_by_id[kind]
+    maps an id straight to its row.
+    """
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.ids = array("q")
+        self.parents = array("i")
+        self.name_refs = array("i")
+        self.strings = StringTable()
+        self.rows_by_id = {GAME: array("i"), TEAM: array("i"), PLAYER: array("i")}
+
+        # Child index (CSR over the first indexed_rows rows) and later appends
+        self.indexed_rows = 0
+        self.first_child = None
+        self.child_rows = None
+        self.pending = {}
+        self.pending_count = 0
+
+        # (parent row, name key) -> row, created by the first checked add; team and
+        # player keys are refs into folded_names (ignore_case_key), game keys into strings
+        self.name_index = None
+        self.folded_names = None
+
+    def __len__(self):
+        return len(self.kinds)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the arrays and string table (the checked-add index is extra)"""
+        columns = [self.kinds, self.ids, self.parents, self.name_refs] + list(self.rows_by_id.values())
+        if self.first_child is not None:
+            columns += [self.first_child, self.child_rows]
+        return sum(column.itemsize * len(column) for column in columns) + self.strings.nbytes
+
+    def count(self, kind):
+        return len(self.rows_by_id[kind])
+
+    # Appending rows
+
+    def add(self, kind, name, parent=-1):
+        """Append one entity without a duplicate check; returns its row"""
+        row = len(self.kinds)
+        if parent >= row:
+            raise ValueError("parent must be an existing row")
+        rows = self.rows_by_id[kind]
+        self.kinds.append(kind)
+        self.ids.append(len(rows) + 1)
+        self.parents.append(parent)
+        self.name_refs.append(self.strings.intern(name))
+        rows.append(row)
+        self._appended(row, row + 1, parent)
+        return row
+
+    def add_many(self, kind, names, parent=-1):
+        """Append one entity per name under the same parent; returns the range of new rows"""
+        first = len(self.kinds)
+        if parent >= first:
+            raise ValueError("parent must be an existing row")
+        intern = self.strings.intern
+        self.name_refs.extend(intern(name) for name in names)
+        count = len(self.name_refs) - first
+        rows = self.rows_by_id[kind]
+        self.kinds.extend(array("B", [kind]) * count)
+        self.ids.extend(range(len(rows) + 1, len(rows) + count + 1))
+        self.parents.extend(array("i", [parent]) * count)
+        rows.extend(range(first, first + count))
+        self._appended(first, first + count, parent)
+        return range(first, first + count)
+
+    def _appended(self, first, stop, parent):
+        if self.first_child is not None:
+            self.pending.setdefault(parent, []).extend(range(first, stop))
+            self.pending_count += stop - first
+            if self.pending_count * PENDING_FRACTION > self.indexed_rows:
+                self.first_child = self.child_rows = None
+        if self.name_index is not None:
+            for row in range(first, stop):
+                self.name_index.setdefault(self._name_key(row), row)
+
+    # Children
+
+    def build_child_index(self):
+        """Counting sort of all rows by parent (CSR), dropping pending appends"""
+        n = len(self.parents)
+        first_child = array("i", bytes(4 * (n + 1)))
+        for parent in self.parents:
+            if parent >= 0:
+                first_child[parent + 1] += 1
+        total = 0
+        for i in range(n + 1):
+            total += first_child[i]
+            first_child[i] = total
+        cursor = array("i", first_child)
+        child_rows = array("i", bytes(4 * total))
+        for row, parent in enumerate(self.parents):
+            if parent >= 0:
+                child_rows[cursor[parent]] = row
+                cursor[parent] += 1
+        self.first_child, self.child_rows = first_child, child_rows
+        self.indexed_rows = n
+        self.pending = {}
+        self.pending_count = 0
+
+    def children(self, row):
+        """Child rows of row in insertion order"""
+        if self.first_child is None:
+            self.build_child_index()
+        rows = self.child_rows[self.first_child[row]:self.first_child[row + 1]] if row < self.indexed_rows else array("i")
+        later = self.pending.get(row)
+        if later:
+            rows = rows + array("i", later)
+        return rows
+
+    # Java-style API with duplicate checks
+
+    def _name_key(self, row):
+        # Games match by exact name, teams and players ignoring case
+        name_ref = self.name_refs[row]
+        if self.kinds[row] != GAME:
+            name_ref = self.folded_names.intern(ignore_case_key(self.strings.get(name_ref)))
+        return (self.parents[row], name_ref)
+
+    def _lookup(self, kind, name, parent):
+        """Row of the entity a checked add of name would return, or None (adds no strings)"""
+        if kind == GAME:
+            name_ref = self.strings.find(name)
+        else:
+            name_ref = self.folded_names.find(ignore_case_key(name))
+        return self.name_index.get((parent, name_ref)) if name_ref >= 0 else None
+
+    def _find_or_add(self, kind, name, parent):
+        if self.name_index is None:
+            self.name_index = {}
+            self.folded_names = StringTable()
+            for row in range(len(self.kinds)):
+                self.name_index.setdefault(self._name_key(row), row)
+        row = self._lookup(kind, name, parent)
+        if row is None:
+            row = self.add(kind, name, parent)
+        return self.view(row)
+
+    def addGame(self, name):
+        return self._find_or_add(GAME, name, -1)
+
+    def getGame(self, key):
+        """Game by id (int) or exact name (str); None if there is none"""
+        if isinstance(key, str):
+            if self.name_index is None:
+                return next((game for game in self.getGames() if game.getName() == key), None)
+            row = self._lookup(GAME, key, -1)
+            return self.view(row) if row is not None else None
+        rows = self.rows_by_id[GAME]
+        return self.view(rows[key - 1]) if 0 < key <= len(rows) else None
+
+    def getGames(self):
+        return RowList(self, self.rows_by_id[GAME])
+
+    def getGameCount(self):
+        return self.count(GAME)
+
+    # Row protocol used by the views (also implemented by gamingroom.snapshot.Snapshot)
+
+    def entity_id(self, row):
+        return self.ids[row]
+
+    def entity_name(self, row):
+        return self.strings.get(self.name_refs[row])
+
+    def view(self, row):
+        return VIEW_CLASSES[self.kinds[row]](self, row)
+
+
+class RowList(Sequence):
+    """Read-only list of entity views over an array of rows (views made on access)"""
+    __slots__ = ("store", "rows")
+
+    def __init__(self, store, rows):
+        self.store = store
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RowList(self.store, self.rows[index])
+        return self.store.view(self.rows[index])
+
+    def __iter__(self):
+        view = self.store.view
+        return (view(row) for row in self.rows)
+
+
+class EntityView:
+    """A row of an EntityStore seen as an Entity"""
+    __slots__ = ("store", "row")
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def getId(self):
+        return self.store.entity_id(self.row)
+
+    def getName(self):
+        return self.store.entity_name(self.row)
+
+    def toString(self):
+        return f"{type(self).__name__[:-4]} [id={self.getId()}, name={self.getName()}]"
+
+    def __str__(self):
+        return self.toString()
+
+    def __eq__(self, other):
+        return isinstance(other, EntityView) and other.store is self.store and other.row == self.row
+
+    def __hash__(self):
+        return hash((id(self.store), self.row))
+
+
+class PlayerView(EntityView):
+    __slots__ = ()
+
+
+class TeamView(EntityView):
+    __slots__ = ()
+
+    def addPlayer(self, name):
+        return self.store._find_or_add(PLAYER, name, self.row)
+
+    def getPlayers(self):
+        return RowList(self.store, self.store.children(self.row))
+
+    def toString(self):
+        text = super().toString()
+        players = self.getPlayers()
+        if players:
+            text += "\n  Players:" + "".join(f"\n    {player}" for player in players)
+        return text
+
+
+class GameView(EntityView):
+    __slots__ = ()
+
+    def addTeam(self, name):
+        return self.store._find_or_add(TEAM, name, self.row)
+
+    def getTeams(self):
+        return RowList(self.store, self.store.children(self.row))
+
+    def toString(self):
+        text = super().toString()
+        teams = self.getTeams()
+        if teams:
+            text += "\n  Teams:" + "".join(f"\n    {team}" for team in teams)
+        return text
+
+
+VIEW_CLASSES = {GAME: GameView, TEAM: TeamView, PLAYER: PlayerView}
+
+
+def fill_store(store, games, teams_per_game, players_per_team, name_pool=0):
+    """Bulk-load a uniform graph; player names cycle through name_pool names (0 = all unique)"""
+    pool = [f"Player {i}" for i in range(1, name_pool + 1)]
+    player_number = 0
+    for g in range(games):
+        game = store.add(GAME, f"Game #{g + 1}")
+        for team in store.add_many(TEAM, [f"Team {t + 1}" for t in range(teams_per_game)], game):
+            if pool:
+                names = [pool[(player_number + p) % name_pool] for p in range(players_per_team)]
+            else:
+                names = [f"Player {player_number + p + 1}" for p in range(players_per_team)]
+            player_number += players_per_team
+            store.add_many(PLAYER, names, team)
+    return store
+
+
+def object_mirror_bytes(games, teams_per_game, players_per_team):
+    """Traced bytes of the same graph built from gamingroom objects (one object per entity)"""
+    from .game_service import GameService
+
+    tracemalloc.start()
+    service = GameService()
+    GameService.resetInstance(service)
+    before = tracemalloc.get_traced_memory()[0]
+    player_number = 0
+    for g in range(games):
+        game = service.addGame(f"Game #{g + 1}")
+        for t in range(teams_per_game):
+            team = game.addTeam(f"Team {t + 1}")
+            for _ in range(players_per_team):
+                player_number += 1
+                team.addPlayer(f"Player {player_number}")
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    GameService.resetInstance()
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a large GameService graph in a columnar EntityStore")
+    parser.add_argument("--players", type=int, default=1000000, help="total players")
+    parser.add_argument("--teams", type=int, default=10, help="teams per game")
+    parser.add_argument("--team-size", type=int, default=10, help="players per team")
+    parser.add_argument("--name-pool", type=int, default=0,
+                        help="distinct player names to cycle through (default: all unique)")
+    args = parser.parse_args()
+
+    games = max(args.players // (args.teams * args.team_size), 1)
+    started = time.perf_counter()
+    store = fill_store(EntityStore(), games, args.teams, args.team_size, args.name_pool)
+    elapsed = time.perf_counter() - started
+    store.build_child_index()
+
+    mb = 1024 * 1024
+    print(f"{len(store):,} entities ({store.count(GAME):,} games, {store.count(TEAM):,} teams, "
+          f"{store.count(PLAYER):,} players) in {elapsed:.1f} s")
+    print(f"Store: {store.nbytes / mb:,.1f} MB = {store.nbytes / len(store):.1f} bytes per entity "
+          f"({len(store.strings):,} distinct names)")
+
+    # Measure the object mirror on a small slice and scale it up
+    sample_games = max(min(games, 10000 // (args.teams * args.team_size)), 1)
+    sample = object_mirror_bytes(sample_games, args.teams, args.team_size)
+    per_entity = sample / (sample_games * (1 + args.teams * (1 + args.team_size)))
+    print(f"Object mirror: ~{per_entity:.0f} bytes per entity = ~{per_entity * len(store) / mb:,.0f} MB "
+          f"for the same graph")
+
+    game = store.getGame(1)
+    print(game.getTeams()[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Team (mirrors com.gamingroom.Team)
+Team.addPlayer() returns the existing player whose name equalsIgnoreCase()
+the new one. The Java loop compares against every player; here the
+lookup is a dict keyed by ignore_case_key(), so it costs the same for the
+first player and the ten-thousandth.
+"""
+
+from . import game_service
+from .entity import Entity, ignore_case_key
+from .player import Player
+
+
+class Team(Entity):
+    """A team in a game; holds its players in insertion order"""
+    __slots__ = ("_players", "_players_by_key")
+
+    player_class = Player
+
+    def __init__(self, id, name):
+        super().__init__(id, name)
+        self._players = []
+        self._players_by_key = {}
+
+    def addPlayer(self, name):
+        """Existing player with this name (ignoring case), or a new one with the next player id"""
+        key = ignore_case_key(name)
+        player = self._players_by_key.get(key)
+        if player is not None:
+            return player
+
+        service = game_service.GameService.getInstance()
+        with game_service.REGISTRY_LOCK:
+            # Another thread may have added it while we waited
+            player = self._players_by_key.get(key)
+            if player is None:
+                player = self.player_class(service.getNextPlayerId(), name)
+                self._players.append(player)
+                self._players_by_key[key] = player
+        return player
+
+    def restore_player(self, id, name):
+        """Append a player that already has an id (snapshot restore; no counter, no lock)"""
+        player = self.player_class(id, name)
+        self._players.append(player)
+        self._players_by_key.setdefault(ignore_case_key(name), player)
+        return player
+
+    def getPlayers(self):
+        return self._players
+
+    def toString(self):
+        text = f"Team [id={self._id}, name={self._name}]"
+        if self._players:
+            text += "\n  Players:" + "".join(f"\n    {player}" for player in self._players)
+        return text
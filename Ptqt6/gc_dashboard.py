@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+GC pause dashboard
+Tails a JVM GC log with gc_log.GcLogTail and shows a log-scale pause-time
+histogram (stacked by pause kind, with p50/p99 markers) next to percentile,
+cause and heap statistics. Existing logs are read a couple of MB per event
+loop turn, so opening a multi-GB log never freezes the window, and new
+pauses appear while the JVM is still writing.
+
+Usage:
+    python gc_dashboard.py                     # pick a log from the window
+    python gc_dashboard.py gc.log
+    java -Xlog:gc:file=gc.log -jar GamingRoom.jar
+"""
+
+import os
+import sys
+import time
+import math
+import argparse
+
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                             QPushButton, QCheckBox, QTextEdit, QFileDialog, QGroupBox)
+from PyQt6.QtGui import QPainter, QColor, QFont, QPen
+from PyQt6.QtCore import Qt, QTimer, QRectF
+
+from gc_log import GcLogTail, PauseHistogram, PauseStats, format_ms
+from heap_histogram import format_bytes
+
+# Bytes read per event loop turn while catching up on an existing log (~50 ms)
+READ_PER_STEP = 2 << 20
+# Stats and chart are refreshed at most this often during catch-up
+REFRESH_SECONDS = 0.25
+KIND_COLORS = ["#4a90e2", "#e74c3c", "#f39c12", "#2ecc71", "#b05bc4", "#1abc9c", "#95a5a6"]
+BACKGROUND = "#1e1e1e"
+
+
+class PauseHistogramChart(QWidget):
+    """Pause-time histogram: log-scale buckets, one stacked colour per pause kind"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stats = None
+        self.setMinimumHeight(220)
+
+    def set_stats(self, stats):
+        self.stats = stats
+        self.update()
+
+    def kind_color(self, index):
+        return QColor(KIND_COLORS[index % len(KIND_COLORS)])
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(BACKGROUND))
+        painter.setFont(QFont("Consolas", 8))
+        stats = self.stats
+        if stats is None or not stats.pauses.count:
+            painter.setPen(QColor("#888"))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "No pauses yet")
+            painter.end()
+            return
+
+        # Only the occupied bucket range (at least one decade) is shown
+        pauses = stats.pauses
+        first = pauses.bucket(pauses.min_ms)
+        last = max(pauses.bucket(pauses.max_ms), first + PauseHistogram.BUCKETS_PER_DECADE - 1)
+        last = min(last, PauseHistogram.BUCKETS - 1)
+        buckets = last - first + 1
+        peak = max(pauses.counts[first:last + 1])
+
+        left, top, bottom = 40, 24, 20
+        plot = QRectF(left, top, self.width() - left - 10, self.height() - top - bottom)
+        bar_width = plot.width() / buckets
+
+        # Bars: stack every pause kind in the same bucket
+        kinds = sorted(stats.by_kind.items(), key=lambda item: -item[1].count)
+        for i in range(buckets):
+            y = plot.bottom()
+            for k, (_, histogram) in enumerate(kinds):
+                count = histogram.counts[first + i]
+                if count:
+                    h = plot.height() * count / peak
+                    painter.fillRect(QRectF(plot.left() + i * bar_width + 1, y - h, bar_width - 2, h),
+                                     self.kind_color(k))
+                    y -= h
+
+        # Axes: count on the left, pause time at each decade along the bottom
+        painter.setPen(QColor("#666"))
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+        painter.setPen(QColor("#aaa"))
+        painter.drawText(4, int(plot.top()) + 8, f"{peak:,}")
+        painter.drawText(4, int(plot.bottom()), "0")
+        for i in range(buckets + 1):
+            if (first + i) % PauseHistogram.BUCKETS_PER_DECADE == 0:
+                x = plot.left() + i * bar_width
+                painter.drawLine(int(x), int(plot.bottom()), int(x), int(plot.bottom()) + 4)
+                low, _ = PauseHistogram.bucket_bounds(first + i)
+                painter.drawText(int(x) - 20, self.height() - 4, format_ms(low))
+
+        # Percentile markers at their position on the log axis
+        for p, color in ((50, "#2ecc71"), (99, "#f39c12")):
+            # Sub-resolution pauses (down to 0 ms) sit at the left edge rather than at log10(0)
+            ms = max(pauses.percentile(p), PauseHistogram.LOW_MS)
+            offset = math.log10(ms / PauseHistogram.LOW_MS) * PauseHistogram.BUCKETS_PER_DECADE - first
+            x = plot.left() + min(max(offset, 0), buckets) * bar_width
+            painter.setPen(QPen(QColor(color), 1, Qt.PenStyle.DashLine))
+            painter.drawLine(int(x), int(plot.top()), int(x), int(plot.bottom()))
+            painter.drawText(int(x) + 3, int(plot.top()) + 10, f"p{p} {format_ms(ms)}")
+
+        # Legend
+        x = left
+        for k, (kind, histogram) in enumerate(kinds):
+            painter.fillRect(x, 6, 10, 10, self.kind_color(k))
+            painter.setPen(QColor("#ccc"))
+            text = f"{kind} ({histogram.count:,})"
+            painter.drawText(x + 14, 15, text)
+            x += 28 + painter.fontMetrics().horizontalAdvance(text)
+        painter.end()
+
+
+class GcDashboardWidget(QWidget):
+    """Open/follow a GC log; histogram chart plus percentile and cause tables"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tail = None
+        self.stats = PauseStats()
+        self.last_refresh = 0.0
+        self.timer = QTimer(self)
+        self.timer.setInterval(500)
+        self.timer.timeout.connect(self.read_step)
+
+        layout = QVBoxLayout()
+
+        title = QLabel("GC Pause Analysis")
+        title.setStyleSheet("font-size: 16px; font-weight: bold; color: #4a90e2;")
+        layout.addWidget(title)
+
+        controls = QHBoxLayout()
+        open_btn = QPushButton("📂 Open GC Log...")
+        open_btn.clicked.connect(self.open_log)
+        controls.addWidget(open_btn)
+
+        self.follow_check = QCheckBox("Follow")
+        self.follow_check.setChecked(True)
+        self.follow_check.setToolTip("Keep reading pauses as the JVM appends them")
+        self.follow_check.toggled.connect(self.set_follow)
+        controls.addWidget(self.follow_check)
+
+        self.status = QLabel("No GC log loaded - run java -Xlog:gc:file=gc.log -jar GamingRoom.jar")
+        self.status.setStyleSheet("color: #888;")
+        controls.addWidget(self.status)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.chart = PauseHistogramChart()
+        layout.addWidget(self.chart)
+
+        stats_group = QGroupBox("Pause Statistics")
+        stats_layout = QVBoxLayout()
+        self.stats_text = QTextEdit()
+        self.stats_text.setReadOnly(True)
+        self.stats_text.setMaximumHeight(200)
+        stats_layout.addWidget(self.stats_text)
+        stats_group.setLayout(stats_layout)
+        layout.addWidget(stats_group)
+
+        self.setLayout(layout)
+        self.refresh()
+
+    def open_log(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open GC Log", "", "GC Logs (*.log *.txt *.log.*);;All Files (*)")
+        if path:
+            self.set_log(path)
+
+    def set_log(self, path):
+        """Start reading path from the beginning"""
+        self.tail = GcLogTail(path)
+        self.stats = PauseStats()
+        self.read_step()
+
+    def set_follow(self, follow):
+        if follow and self.tail is not None:
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    def read_step(self):
+        """Read one bounded chunk; keep going from the event loop while behind"""
+        if self.tail is None:
+            return
+        self.stats.add_all(self.tail.poll(READ_PER_STEP))
+        behind = self.tail.backlog > 0
+
+        now = time.perf_counter()
+        if not behind or now - self.last_refresh >= REFRESH_SECONDS:
+            self.last_refresh = now
+            self.refresh()
+
+        if behind:
+            self.timer.stop()
+            QTimer.singleShot(0, self.read_step)
+        elif self.follow_check.isChecked() and not self.timer.isActive():
+            self.timer.start()
+
+    def refresh(self):
+        self.chart.set_stats(self.stats)
+        self.update_status()
+        self.stats_text.setHtml(self.stats_html())
+
+    def update_status(self):
+        if self.tail is None:
+            return
+        name = os.path.basename(self.tail.path)
+        if self.tail.backlog:
+            done = self.tail.offset / max(self.tail.size, 1)
+            self.status.setText(f"Reading {name}... {done:.0%} of {format_bytes(self.tail.size)}")
+        else:
+            following = " - following" if self.follow_check.isChecked() else ""
+            self.status.setText(f"{name}: {self.stats.pauses.count:,} pauses in "
+                                f"{format_bytes(self.tail.size)}{following}")
+
+    def stats_html(self):
+        stats = self.stats
+        pauses = stats.pauses
+        if not pauses.count:
+            return "<p style='color:#888'>No pauses parsed yet.</p>"
+
+        header = "".join(f"<th>p{p:g}</th>" for p in stats.PERCENTILES)
+        rows = []
+        kinds = sorted(stats.by_kind.items(), key=lambda item: -item[1].count)
+        for kind, histogram in [("All pauses", pauses)] + kinds:
+            cells = "".join(f"<td>{format_ms(histogram.percentile(p))}</td>" for p in stats.PERCENTILES)
+            rows.append(f"<tr><td><b>{kind}</b></td><td>{histogram.count:,}</td><td>{format_ms(histogram.mean_ms)}</td>"
+                        f"{cells}<td>{format_ms(histogram.max_ms)}</td><td>{format_ms(histogram.total_ms)}</td></tr>")
+
+        causes = sorted(stats.causes.items(), key=lambda item: -item[1][1])[:6]
+        cause_text = ", ".join(f"{cause} {count:,}x / {format_ms(total_ms)}" for cause, (count, total_ms) in causes)
+
+        heap = ""
+        if stats.heap_after is not None:
+            heap = (f"<br><b>Heap after last GC:</b> {format_bytes(stats.heap_after)} of "
+                    f"{format_bytes(stats.heap_capacity)} (peak {format_bytes(stats.peak_heap_after)})")
+        return (f"<table cellspacing='0' cellpadding='3'>"
+                f"<tr><th align='left'>Kind</th><th>Count</th><th>Mean</th>{header}<th>Max</th><th>Total</th></tr>"
+                f"{''.join(rows)}</table>"
+                f"<p><b>Time paused:</b> {stats.pause_fraction:.2%} of run time"
+                f"<br><b>Top causes:</b> {cause_text}{heap}</p>")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GC pause dashboard for GamingRoom JVM logs")
+    parser.add_argument("file", nargs="?", help="GC log to open")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    widget = GcDashboardWidget()
+    widget.setWindowTitle("GamingRoom GC Pauses")
+    widget.setStyleSheet("background-color: #2a2a2a; color: #ccc;")
+    widget.resize(900, 560)
+    widget.show()
+    if args.file:
+        widget.set_log(args.file)
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Streaming GC log parser
+Reads the GC logs written by `java -Xlog:gc...` (JDK 9+ unified logging) or
+`-XX:+PrintGC[Details]` (JDK 8) and extracts one GcEvent per pause: kind,
+cause, pause time and heap before/after. Logs are read in chunks from a
+saved offset, so a growing file is tailed with constant memory and multi-GB
+logs are never loaded whole. PauseStats keeps fixed log-scale buckets, so
+percentiles cost the same after ten pauses or ten million.
+
+Usage:
+    python gc_log.py gc.log                    # pause summary for a saved log
+    python gc_log.py gc.log --follow           # keep tailing and reprint
+    java -Xlog:gc:file=gc.log -jar GamingRoom.jar
+"""
+
+import os
+import re
+import sys
+import time
+import math
+import argparse
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+# Only lines containing the marker are decoded and parsed; the rest are skipped at C speed.
+# Unified logs are found by a plain literal, which is ~10x faster than any alternation.
+UNIFIED_FINDER_RE = re.compile(rb"Pause ")
+LEGACY_FINDER_RE = re.compile(rb"\[(?:Full )?GC[ (]")
+# Pause lines end with their duration; "[gc,start]" lines with the same text do not
+PAUSE_LINE_ENDS = (b"ms", b"s]")
+
+# "[0.512s][info][gc] GC(3) Pause Young (Normal) (G1 Evacuation Pause) 24M->3M(256M) 2.345ms"
+UNIFIED_RE = re.compile(
+    r"GC\((\d+)\) (?:[YO]: )?(Pause .*?)"
+    r"(?: (\d+)([BKMGT])->(\d+)([BKMGT])\((\d+)([BKMGT])\))?"
+    r" (\d+(?:[.,]\d+)?)ms\s*$")
+UPTIME_RE = re.compile(r"\[(\d+(?:[.,]\d+)?)(s|ms)\]")
+
+# "1.234: [GC (Allocation Failure) [PSYoungGen: ...] 33280K->5112K(125952K), 0.0051234 secs]"
+LEGACY_RE = re.compile(r"\[(Full GC|GC)(?: pause)? ")
+LEGACY_UPTIME_RE = re.compile(r"(?:^|: )(\d+\.\d+): \[")
+# Whole-heap transition: per-generation ones follow a "Name: " label
+LEGACY_HEAP_RE = re.compile(r"(?<!: )\b(\d+)([KMG])->(\d+)([KMG])\((\d+)([KMG])\)")
+LEGACY_PAUSE_RE = re.compile(r", (\d+\.\d+) secs\]")
+# Cause and phase groups end where the generation details or sizes begin
+LEGACY_CAUSE_END_RE = re.compile(r"\[|\s\d")
+PAREN_GROUP_RE = re.compile(r"\(((?:[^()]|\([^()]*\))*)\)")
+
+UNITS = {"B": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+CHUNK_SIZE = 1 << 20
+# A "line" longer than this without a newline is not a GC log line; drop it
+MAX_LINE = 64 * 1024
+RECENT_EVENTS = 500
+
+
+@dataclass
+class GcEvent:
+    """One stop-the-world pause"""
+    kind: str                      # "Pause Young", "Pause Full", "Pause Remark", ...
+    cause: str                     # "G1 Evacuation Pause", "Allocation Failure", "System.gc()", ...
+    pause_ms: float
+    uptime: Optional[float] = None
+    gc_id: Optional[int] = None
+    heap_before: Optional[int] = None
+    heap_after: Optional[int] = None
+    heap_capacity: Optional[int] = None
+    phase: str = ""                # G1 young phase: "Normal", "Concurrent Start", "Mixed", ...
+
+
+def _paren_groups(text):
+    """Top-level "(...)" groups in text, allowing nesting as in "(System.gc())" """
+    return PAREN_GROUP_RE.findall(text)
+
+
+def _size(number, unit):
+    return int(number) * UNITS[unit]
+
+
+def _uptime(line):
+    match = UPTIME_RE.search(line)
+    if match:
+        value = float(match.group(1).replace(",", "."))
+        return value / 1000 if match.group(2) == "ms" else value
+    match = LEGACY_UPTIME_RE.search(line)
+    return float(match.group(1)) if match else None
+
+
+def parse_line(line: str) -> Optional[GcEvent]:
+    """The pause logged on line, or None for any other line"""
+    match = UNIFIED_RE.search(line)
+    if match:
+        description = match.group(2)
+        kind = description.split(" (", 1)[0].strip()
+        groups = _paren_groups(description[len(kind):])
+        event = GcEvent(kind, groups[-1] if groups else "",
+                        float(match.group(9).replace(",", ".")),
+                        uptime=_uptime(line), gc_id=int(match.group(1)),
+                        phase=groups[0] if len(groups) > 1 else "")
+        if match.group(3):
+            event.heap_before = _size(match.group(3), match.group(4))
+            event.heap_after = _size(match.group(5), match.group(6))
+            event.heap_capacity = _size(match.group(7), match.group(8))
+        return event
+
+    match = LEGACY_RE.search(line)
+    if match is None:
+        return None
+    pauses = LEGACY_PAUSE_RE.findall(line)
+    if not pauses:
+        return None
+    # The last ", x secs]" is the whole collection (ParNew/CMS print their own first)
+    groups = _paren_groups(LEGACY_CAUSE_END_RE.split(line[match.end():], 1)[0])
+    event = GcEvent("Pause Full" if match.group(1) == "Full GC" else "Pause Young",
+                    groups[0] if groups else "", float(pauses[-1]) * 1000,
+                    uptime=_uptime(line), phase=groups[1] if len(groups) > 1 else "")
+    heap = LEGACY_HEAP_RE.search(line, match.end())
+    if heap:
+        event.heap_before = _size(heap.group(1), heap.group(2))
+        event.heap_after = _size(heap.group(3), heap.group(4))
+        event.heap_capacity = _size(heap.group(5), heap.group(6))
+    return event
+
+
+def scan_events(data: bytes) -> Iterator[GcEvent]:
+    """Pauses in a block of complete lines, skipping every other line unparsed"""
+    finder = LEGACY_FINDER_RE if b"[GC " in data or b"[Full GC " in data else UNIFIED_FINDER_RE
+    line_end = -1
+    for match in finder.finditer(data):
+        if match.start() < line_end:
+            continue  # second hit on a line already parsed
+        line_end = data.find(b"\n", match.end())
+        if line_end < 0:
+            line_end = len(data)
+        if not data[max(line_end - 4, 0):line_end].rstrip().endswith(PAUSE_LINE_ENDS):
+            continue
+        start = data.rfind(b"\n", 0, match.start()) + 1
+        event = parse_line(data[start:line_end].decode("utf-8", errors="replace"))
+        if event is not None:
+            yield event
+
+
+class GcLogTail:
+    """Reads new complete lines of a GC log from the last offset
+
+    poll() reads at most max_bytes, so a UI can catch up on a large log a
+    few MB per tick while backlog counts what is still unread. A truncated
+    or replaced file (log rotation) is re-read from the start.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.size = 0
+        self.inode = None
+        self.partial = b""
+
+    @property
+    def backlog(self):
+        return max(self.size - self.offset, 0)
+
+    def reset(self):
+        self.offset = 0
+        self.partial = b""
+
+    def poll(self, max_bytes=CHUNK_SIZE) -> List[GcEvent]:
+        try:
+            with open(self.path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_ino != self.inode or stat.st_size < self.offset:
+                    if self.inode is not None:
+                        self.reset()  # rotated or truncated
+                    self.inode = stat.st_ino
+                self.size = stat.st_size
+                f.seek(self.offset)
+                data = f.read(max_bytes)
+        except OSError:
+            return []
+        self.offset += len(data)
+
+        data = self.partial + data
+        cut = data.rfind(b"\n") + 1
+        self.partial = data[cut:]
+        if len(self.partial) > MAX_LINE:
+            self.partial = b""
+        return list(scan_events(data[:cut]))
+
+
+class PauseHistogram:
+    """Pause times in fixed log-scale buckets from 10 us to 100 s
+
+    Memory is constant however many pauses are added. Percentiles are read
+    from the bucket counts, so they are accurate to one bucket (~12%),
+    except min and max which are exact.
+    """
+    LOW_MS = 0.01
+    BUCKETS_PER_DECADE = 10
+    DECADES = 7
+    BUCKETS = BUCKETS_PER_DECADE * DECADES
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    @classmethod
+    def bucket(cls, ms):
+        if ms <= cls.LOW_MS:
+            return 0
+        index = int(math.log10(ms / cls.LOW_MS) * cls.BUCKETS_PER_DECADE)
+        return min(index, cls.BUCKETS - 1)
+
+    @classmethod
+    def bucket_bounds(cls, index):
+        """(low, high) pause in ms covered by bucket index"""
+        low = cls.LOW_MS * 10 ** (index / cls.BUCKETS_PER_DECADE)
+        return low, low * 10 ** (1 / cls.BUCKETS_PER_DECADE)
+
+    def add(self, ms):
+        self.counts[self.bucket(ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def merge(self, other):
+        """Add another histogram's counts (e.g. one per worker process)"""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    @property
+    def mean_ms(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """Estimated pause (ms) below which p percent of pauses fall"""
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(self.count * p / 100), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                low, high = self.bucket_bounds(index)
+                return min(max(math.sqrt(low * high), self.min_ms), self.max_ms)
+        return self.max_ms
+
+
+class PauseStats:
+    """Running summary of every pause seen so far"""
+    PERCENTILES = (50, 90, 99, 99.9)
+
+    def __init__(self, recent=RECENT_EVENTS):
+        self.pauses = PauseHistogram()
+        self.by_kind: Dict[str, PauseHistogram] = {}
+        self.causes: Dict[str, List[float]] = {}   # cause -> [count, total ms]
+        self.recent = deque(maxlen=recent)
+        self.first_uptime = None
+        self.last_uptime = None
+        self.heap_after = None
+        self.heap_capacity = None
+        self.peak_heap_after = 0
+
+    def add(self, event: GcEvent):
+        self.pauses.add(event.pause_ms)
+        self.by_kind.setdefault(event.kind, PauseHistogram()).add(event.pause_ms)
+        cause = self.causes.setdefault(event.cause or "-", [0, 0.0])
+        cause[0] += 1
+        cause[1] += event.pause_ms
+        self.recent.append(event)
+
+        if event.uptime is not None:
+            if self.first_uptime is None:
+                self.first_uptime = event.uptime
+            self.last_uptime = event.uptime
+        if event.heap_after is not None:
+            self.heap_after = event.heap_after
+            self.heap_capacity = event.heap_capacity
+            self.peak_heap_after = max(self.peak_heap_after, event.heap_after)
+
+    def add_all(self, events):
+        for event in events:
+            self.add(event)
+
+    @property
+    def pause_fraction(self):
+        """Share of wall time spent paused between the first and last pause"""
+        if self.first_uptime is None or self.last_uptime <= self.first_uptime:
+            return 0.0
+        return self.pauses.total_ms / 1000 / (self.last_uptime - self.first_uptime)
+
+
+def format_ms(ms):
+    if ms >= 1000:
+        return f"{ms / 1000:.2f} s"
+    if ms >= 10:
+        return f"{ms:.0f} ms"
+    return f"{ms:.2f} ms"
+
+
+def print_stats(stats, source=""):
+    from heap_histogram import format_bytes
+
+    pauses = stats.pauses
+    if source:
+        print(f"Source: {source}")
+    print(f"Pauses: {pauses.count:,}  total {format_ms(pauses.total_ms)}  "
+          f"({stats.pause_fraction:.2%} of run time)")
+    if not pauses.count:
+        return
+    print("  " + "  ".join(f"p{p:g} {format_ms(pauses.percentile(p))}" for p in stats.PERCENTILES)
+          + f"  max {format_ms(pauses.max_ms)}")
+    for kind, histogram in sorted(stats.by_kind.items(), key=lambda item: -item[1].total_ms):
+        print(f"  {kind:22s} {histogram.count:8,d}  mean {format_ms(histogram.mean_ms):>9s}  "
+              f"p99 {format_ms(histogram.percentile(99)):>9s}  max {format_ms(histogram.max_ms):>9s}")
+    print("Causes:")
+    for cause, (count, total_ms) in sorted(stats.causes.items(), key=lambda item: -item[1][1])[:10]:
+        print(f"  {cause:30s} {count:8,d}  {format_ms(total_ms):>9s}")
+    if stats.heap_after is not None:
+        print(f"Heap after last GC: {format_bytes(stats.heap_after)} of {format_bytes(stats.heap_capacity)} "
+              f"(peak {format_bytes(stats.peak_heap_after)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise GC pauses in a JVM GC log")
+    parser.add_argument("file", help="GC log (-Xlog:gc... or -XX:+PrintGCDetails)")
+    parser.add_argument("--follow", action="store_true", help="keep tailing the log")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between reports with --follow")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.file):
+        print(f"Error: {args.file} not found")
+        sys.exit(1)
+
+    tail = GcLogTail(args.file)
+    stats = PauseStats()
+    started = time.perf_counter()
+    while True:
+        stats.add_all(tail.poll())
+        if not tail.backlog:
+            break
+    print_stats(stats, f"{args.file} ({tail.offset / 1024 ** 2:,.1f} MB in {time.perf_counter() - started:.1f} s)")
+
+    try:
+        while args.follow:
+            time.sleep(args.interval)
+            count = stats.pauses.count
+            stats.add_all(tail.poll())
+            while tail.backlog:
+                stats.add_all(tail.poll())
+            if stats.pauses.count > count:
+                print()
+                print_stats(stats)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
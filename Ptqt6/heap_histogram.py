@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Heap class-histogram ingestion for the memory visualizer
+Parses the text printed by `jmap -histo <pid>` or `jcmd <pid> GC.class_histogram`
+(live from a running GamingRoom JVM or from a saved file) one line at a time and
+reports instance counts and shallow bytes for the GamingRoom classes.
+
+Usage:
+    python heap_histogram.py histo.txt         # summarise a saved dump
+    python heap_histogram.py --pid 12345       # capture from a running JVM
+    python heap_histogram.py --list            # list running GamingRoom JVMs
+"""
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from trace_capture import find_jdk_tool
+
+# Classes shown in the visualizer: fully qualified name -> display name
+WATCHED_CLASSES = {
+    "com.gamingroom.GameService": "GameService",
+    "com.gamingroom.Game": "Game",
+    "com.gamingroom.Team": "Team",
+    "com.gamingroom.Player": "Player",
+}
+
+# Whole-file fast path: find watched class names, then parse just those lines
+WATCHED_NAME_RE = re.compile(rb"com\.gamingroom\.(?:GameService|Game|Team|Player)\b")
+LAST_ROW_RE = re.compile(rb"^[ \t]*(\d+):[ \t]+\d+[ \t]+\d+[ \t]+\S", re.M)
+TOTAL_RE = re.compile(rb"^Total[ \t]+(\d+)[ \t]+(\d+)", re.M)
+CHUNK_SIZE = 1 << 20
+
+
+@dataclass
+class HistogramEntry:
+    """One row of a class histogram"""
+    rank: int
+    instances: int
+    bytes: int
+    class_name: str
+    module: str = ""
+
+    @property
+    def display_name(self):
+        return WATCHED_CLASSES.get(self.class_name, self.class_name)
+
+
+@dataclass
+class HeapHistogram:
+    """Watched rows plus heap-wide totals from one histogram dump"""
+    entries: Dict[str, HistogramEntry] = field(default_factory=dict)
+    total_instances: int = 0
+    total_bytes: int = 0
+    class_count: int = 0
+    source: str = ""
+
+    def get(self, display_name) -> Optional[HistogramEntry]:
+        for entry in self.entries.values():
+            if entry.display_name == display_name:
+                return entry
+        return None
+
+
+class HistogramParser:
+    """Streaming parser: feed lines as they arrive, call finish() at the end
+
+    Every data row counts towards the totals (used when the trailing "Total"
+    line is missing, e.g. a truncated dump), but only rows mentioning a
+    GamingRoom class become entries.
+    """
+
+    def __init__(self, source=""):
+        self.source = source
+        self.reset()
+
+    def reset(self):
+        self.histogram = HeapHistogram(source=self.source)
+        self.summed_instances = 0
+        self.summed_bytes = 0
+        self.reported_total = None
+
+    def feed(self, line: str) -> Optional[HistogramEntry]:
+        """Parse one line; returns the entry if it is a watched class"""
+        stripped = line.strip()
+        if not stripped:
+            return None
+
+        # "   12:     3     96  com.gamingroom.Game" - rank, instances, bytes, class [module]
+        if stripped[0].isdigit():
+            parts = stripped.split(None, 4)
+            if len(parts) < 4 or not parts[0].endswith(":"):
+                return None  # jcmd prints "<pid>:" on its first line
+            try:
+                instances = int(parts[1])
+                size = int(parts[2])
+            except ValueError:
+                return None
+            self.histogram.class_count += 1
+            self.summed_instances += instances
+            self.summed_bytes += size
+
+            if parts[3] not in WATCHED_CLASSES:
+                return None
+            module = parts[4].strip("() ") if len(parts) > 4 else ""
+            entry = HistogramEntry(int(parts[0][:-1]), instances, size, parts[3], module)
+            self.histogram.entries[entry.class_name] = entry
+            return entry
+
+        if stripped.startswith("Total"):
+            parts = stripped.split()
+            if len(parts) >= 3:
+                try:
+                    self.reported_total = (int(parts[1]), int(parts[2]))
+                except ValueError:
+                    pass
+        return None
+
+    def finish(self) -> HeapHistogram:
+        """Fill in the totals and return the histogram"""
+        if self.reported_total is not None:
+            self.histogram.total_instances, self.histogram.total_bytes = self.reported_total
+        else:
+            self.histogram.total_instances = self.summed_instances
+            self.histogram.total_bytes = self.summed_bytes
+        return self.histogram
+
+
+def parse_histogram(lines: Iterable[str], source="") -> HeapHistogram:
+    """Parse any iterable of lines (file object, pipe, list)"""
+    parser = HistogramParser(source)
+    for line in lines:
+        parser.feed(line)
+    return parser.finish()
+
+
+def load_histogram(path) -> HeapHistogram:
+    """Load a saved histogram file
+
+    Complete dumps end with a "Total" line, so the totals and class count come
+    from the tail and the body is scanned in 1 MB chunks for the watched rows
+    only. Truncated dumps fall back to the line-by-line parser.
+    """
+    source = os.path.basename(path)
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 64 * 1024))
+        tail = f.read()
+        total = TOTAL_RE.search(tail)
+        rows = LAST_ROW_RE.findall(tail)
+        if total is None or not rows:
+            f.seek(0)
+            return parse_histogram((line.decode("utf-8", errors="replace") for line in f), source)
+
+        histogram = HeapHistogram(total_instances=int(total.group(1)), total_bytes=int(total.group(2)),
+                                  class_count=int(rows[-1]), source=source)
+        f.seek(0)
+        carry = b""
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            # Scan whole lines only; the partial last line is carried over
+            chunk = carry + chunk
+            cut = chunk.rfind(b"\n") + 1
+            carry = chunk[cut:]
+            _scan_rows(chunk[:cut], histogram)
+        _scan_rows(carry, histogram)
+    return histogram
+
+
+def _scan_rows(data, histogram):
+    parser = HistogramParser()
+    for match in WATCHED_NAME_RE.finditer(data):
+        start = data.rfind(b"\n", 0, match.start()) + 1
+        end = data.find(b"\n", match.end())
+        entry = parser.feed(data[start:end if end >= 0 else len(data)].decode("utf-8", errors="replace"))
+        if entry is not None:
+            histogram.entries[entry.class_name] = entry
+
+
+def histogram_command(pid) -> List[str]:
+    """Command that prints a class histogram for pid (jcmd, falling back to jmap)"""
+    jcmd = find_jdk_tool("jcmd")
+    if jcmd:
+        return [jcmd, str(pid), "GC.class_histogram"]
+    jmap = find_jdk_tool("jmap")
+    if jmap:
+        return [jmap, "-histo", str(pid)]
+    raise FileNotFoundError("jcmd/jmap not found (install a JDK or set JAVA_HOME)")
+
+
+def capture_histogram(pid) -> HeapHistogram:
+    """Capture from a running JVM, parsing stdout while jcmd is still writing"""
+    parser = HistogramParser(source=f"pid {pid}")
+    process = subprocess.Popen(histogram_command(pid), stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, bufsize=1 << 16)
+    try:
+        for line in process.stdout:
+            parser.feed(line)
+    finally:
+        process.stdout.close()
+        process.wait()
+    return parser.finish()
+
+
+def find_gamingroom_jvms() -> List[Tuple[int, str]]:
+    """(pid, description) for running JVMs whose main class or JAR is GamingRoom"""
+    jcmd = find_jdk_tool("jcmd")
+    if jcmd is None:
+        return []
+    try:
+        output = subprocess.run([jcmd, "-l"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+
+    jvms = []
+    for line in output.splitlines():
+        pid, _, description = line.strip().partition(" ")
+        if pid.isdigit() and ("GamingRoom" in description or "com.gamingroom" in description):
+            jvms.append((int(pid), description))
+    return jvms
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+try:
+    from PyQt6.QtCore import QObject, QProcess, pyqtSignal
+except ImportError:  # the command-line mode works without PyQt6
+    QObject = None
+
+if QObject is not None:
+    class HistogramCapture(QObject):
+        """Runs jcmd/jmap with QProcess and parses rows as they are printed
+
+        entry_parsed fires for each GamingRoom class as soon as its row
+        arrives, so the scene can update before the (possibly multi-MB) dump
+        has finished streaming.
+        """
+        entry_parsed = pyqtSignal(object)
+        histogram_ready = pyqtSignal(object)
+        error = pyqtSignal(str)
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self.parser = None
+            self.process = None
+
+        def start(self, pid):
+            """Start capturing pid; returns False if no JDK tool was found"""
+            self.stop()
+            try:
+                command = histogram_command(pid)
+            except FileNotFoundError as e:
+                self.error.emit(str(e))
+                return False
+
+            self.parser = HistogramParser(source=f"pid {pid}")
+            self.process = QProcess(self)
+            self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+            self.process.readyReadStandardOutput.connect(self._read_lines)
+            self.process.finished.connect(self._on_finished)
+            self.process.errorOccurred.connect(self._on_error)
+            self.process.start(command[0], command[1:])
+            return True
+
+        def stop(self):
+            if self.process is not None:
+                self.process.readyReadStandardOutput.disconnect()
+                self.process.finished.disconnect()
+                self.process.errorOccurred.disconnect()
+                if self.process.state() != QProcess.ProcessState.NotRunning:
+                    self.process.kill()
+                    self.process.waitForFinished(1000)
+                self.process.deleteLater()
+                self.process = None
+
+        def _read_lines(self):
+            while self.process.canReadLine():
+                entry = self.parser.feed(bytes(self.process.readLine()).decode("utf-8", errors="replace"))
+                if entry is not None:
+                    self.entry_parsed.emit(entry)
+
+        def _on_finished(self, exit_code, exit_status):
+            self._read_lines()
+            self.parser.feed(bytes(self.process.readAllStandardOutput()).decode("utf-8", errors="replace"))
+            histogram = self.parser.finish()
+            # A tool that died part-way through printed a truncated table, not a histogram
+            if exit_status == QProcess.ExitStatus.CrashExit:
+                self.error.emit("Histogram capture crashed")
+            elif exit_code != 0:
+                self.error.emit(f"Histogram capture failed (exit code {exit_code})")
+            else:
+                self.histogram_ready.emit(histogram)
+            self.stop()
+
+        def _on_error(self, process_error):
+            if process_error == QProcess.ProcessError.FailedToStart:
+                self.error.emit("Failed to start jcmd/jmap - is a JDK installed?")
+                self.stop()
+
+
+def print_histogram(histogram):
+    print(f"Source: {histogram.source}")
+    print(f"Heap:   {histogram.total_instances:,} instances, {format_bytes(histogram.total_bytes)} "
+          f"in {histogram.class_count:,} classes")
+    for display_name in WATCHED_CLASSES.values():
+        entry = histogram.get(display_name)
+        if entry is None:
+            print(f"  {display_name:12s} not in histogram")
+        else:
+            print(f"  {display_name:12s} {entry.instances:8,d} instances  {format_bytes(entry.bytes):>10s}  (#{entry.rank})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise GamingRoom classes in a JVM class histogram")
+    parser.add_argument("file", nargs="?", help="saved jmap -histo / jcmd GC.class_histogram output")
+    parser.add_argument("--pid", type=int, help="capture from a running JVM")
+    parser.add_argument("--list", action="store_true", help="list running GamingRoom JVMs")
+    args = parser.parse_args()
+
+    try:
+        if args.list:
+            for pid, description in find_gamingroom_jvms():
+                print(f"{pid:8d}  {description}")
+        elif args.pid is not None:
+            print_histogram(capture_histogram(args.pid))
+        elif args.file:
+            print_histogram(load_histogram(args.file))
+        else:
+            parser.error("give a histogram file, --pid or --list")
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
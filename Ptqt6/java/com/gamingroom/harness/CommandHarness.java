@@ -0,0 +1,132 @@
+package com.gamingroom.harness;
+
+import java.io.BufferedReader;
+import java.io.BufferedWriter;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.OutputStreamWriter;
+import java.util.HashMap;
+import java.util.Map;
+
+import com.gamingroom.Game;
+import com.gamingroom.GameService;
+import com.gamingroom.Player;
+import com.gamingroom.Team;
+
+/**
+ * Line-oriented command harness for load testing GameService.
+ * <p>
+ * Reads one tab-separated command per line from stdin and answers each with
+ * one line: result, created (1/0) and the nanoseconds spent inside the
+ * GameService call. Commands can be pipelined; output is flushed whenever
+ * stdin has no more buffered input.
+ * </p>
+ * <pre>
+ * G name            addGame(name)                   -> game id
+ * T gameId name     getGame(gameId).addTeam(name)   -> team id
+ * P teamId name     team.addPlayer(name)            -> player id
+ * I id              getGame(id)                     -> game id or 0
+ * N name            getGame(name)                   -> game id or 0
+ * M                 heap used, committed, max       -> bytes
+ * Q                 exit
+ * </pre>
+ */
+public class CommandHarness {
+	private final GameService service = GameService.getInstance();
+	// Routing tables so that T and P do not add a lookup to the timed call
+	private final Map<Long, Game> games = new HashMap<Long, Game>();
+	private final Map<Long, Team> teams = new HashMap<Long, Team>();
+
+	public static void main(String[] args) throws IOException {
+		new CommandHarness().run();
+	}
+
+	private void run() throws IOException {
+		BufferedReader in = new BufferedReader(new InputStreamReader(System.in, "UTF-8"), 1 << 16);
+		BufferedWriter out = new BufferedWriter(new OutputStreamWriter(System.out, "UTF-8"), 1 << 16);
+		String line;
+		while ((line = in.readLine()) != null) {
+			if (line.equals("Q")) {
+				break;
+			}
+			out.write(execute(line.split("\t", 3)));
+			out.newLine();
+			if (!in.ready()) {
+				out.flush();
+			}
+		}
+		out.flush();
+	}
+
+	private String execute(String[] command) {
+		long started;
+		long id = 0;
+		boolean created = false;
+
+		switch (command[0]) {
+		case "G": {
+			int before = service.getGameCount();
+			started = System.nanoTime();
+			Game game = service.addGame(command[1]);
+			long elapsed = System.nanoTime() - started;
+			created = service.getGameCount() > before;
+			games.put(game.getId(), game);
+			return reply(game.getId(), created, elapsed);
+		}
+		case "T": {
+			Game game = games.get(Long.parseLong(command[1]));
+			if (game == null) {
+				return "ERR\tunknown game " + command[1];
+			}
+			int before = game.getTeams().size();
+			started = System.nanoTime();
+			Team team = game.addTeam(command[2]);
+			long elapsed = System.nanoTime() - started;
+			created = game.getTeams().size() > before;
+			teams.put(team.getId(), team);
+			return reply(team.getId(), created, elapsed);
+		}
+		case "P": {
+			Team team = teams.get(Long.parseLong(command[1]));
+			if (team == null) {
+				return "ERR\tunknown team " + command[1];
+			}
+			int before = team.getPlayers().size();
+			started = System.nanoTime();
+			Player player = team.addPlayer(command[2]);
+			long elapsed = System.nanoTime() - started;
+			created = team.getPlayers().size() > before;
+			return reply(player.getId(), created, elapsed);
+		}
+		case "I": {
+			long key = Long.parseLong(command[1]);
+			started = System.nanoTime();
+			Game game = service.getGame(key);
+			long elapsed = System.nanoTime() - started;
+			if (game != null) {
+				id = game.getId();
+			}
+			return reply(id, false, elapsed);
+		}
+		case "N": {
+			started = System.nanoTime();
+			Game game = service.getGame(command[1]);
+			long elapsed = System.nanoTime() - started;
+			if (game != null) {
+				id = game.getId();
+			}
+			return reply(id, false, elapsed);
+		}
+		case "M": {
+			Runtime runtime = Runtime.getRuntime();
+			return (runtime.totalMemory() - runtime.freeMemory()) + "\t" + runtime.totalMemory() + "\t" + runtime.maxMemory();
+		}
+		default:
+			return "ERR\tunknown command " + command[0];
+		}
+	}
+
+	private static String reply(long id, boolean created, long nanos) {
+		return id + "\t" + (created ? 1 : 0) + "\t" + nanos;
+	}
+}
@@ -0,0 +1,78 @@
+package com.gamingroom.harness;
+
+import java.io.BufferedReader;
+import java.io.File;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.PrintStream;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.URL;
+import java.net.URLClassLoader;
+
+/**
+ * Keeps a JVM warm and runs a jar's main class on request.
+ * <p>
+ * Each run loads the jar in a fresh class loader, so statics such as the
+ * GameService singleton start from scratch exactly as in a cold
+ * {@code java -jar}, while the JVM, the JDK classes and the JIT stay warm.
+ * Program output (stdout and stderr) is written to stdout, followed by an end
+ * marker carrying the exit status. The marker ends a line but may share it
+ * with output that was not terminated by a newline, so readers look for it
+ * anywhere in the line. Arguments cannot contain tabs or line breaks.
+ * </p>
+ * <pre>
+ * args: jarPath mainClass
+ * stdin:  RUN [arg\targ...]      run mainClass.main(args)
+ *         Q                      exit
+ * stdout: READY                  once, when the JVM is up
+ *         ...program output...
+ *         \0END\tstatus          after each run (0, or 1 if main threw)
+ * </pre>
+ */
+public class WarmRunner {
+	static final String END_MARKER = "\0END\t";
+
+	public static void main(String[] args) throws IOException {
+		URL jar = new File(args[0]).toURI().toURL();
+		String mainClass = args[1];
+		PrintStream out = System.out;
+		BufferedReader in = new BufferedReader(new InputStreamReader(System.in, "UTF-8"));
+
+		out.println("READY");
+		out.flush();
+		String line;
+		while ((line = in.readLine()) != null) {
+			if (line.equals("Q")) {
+				break;
+			}
+			if (line.startsWith("RUN")) {
+				String[] runArgs = line.length() > 4 ? line.substring(4).split("\t") : new String[0];
+				int status = run(jar, mainClass, runArgs, out);
+				System.setOut(out);
+				out.println(END_MARKER + status);
+				out.flush();
+			}
+		}
+	}
+
+	private static int run(URL jar, String mainClass, String[] args, PrintStream out) {
+		PrintStream err = System.err;
+		System.setErr(out);
+		// Parent is the platform/extension loader, so the jar's classes are never shared between runs
+		try (URLClassLoader loader = new URLClassLoader(new URL[] { jar }, WarmRunner.class.getClassLoader().getParent())) {
+			Method main = loader.loadClass(mainClass).getMethod("main", String[].class);
+			main.invoke(null, (Object) args);
+			return 0;
+		} catch (InvocationTargetException e) {
+			e.getCause().printStackTrace();
+			return 1;
+		} catch (ReflectiveOperationException | IOException e) {
+			e.printStackTrace();
+			return 1;
+		} finally {
+			out.flush();
+			System.setErr(err);
+		}
+	}
+}
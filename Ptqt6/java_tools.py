@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Build and run the Java helpers in Ptqt6/java
+The helpers (the load-test CommandHarness and the launcher's WarmRunner) are
+compiled against GamingRoom.jar on first use and again whenever a source file
+is newer than its class file, so no build step is needed before running the
+tools. cds_options() adds a class-data-sharing archive, created on the first
+run, so later JVM starts map the loaded classes instead of parsing them again.
+
+Usage:
+    python java_tools.py                  # compile and print the harness command line
+"""
+
+import os
+import re
+import sys
+import subprocess
+from functools import lru_cache
+
+from trace_capture import JAR_PATH, MAIN_CLASS, find_jdk_tool, find_java
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+JAVA_DIR = os.path.join(BASE_DIR, "java")
+BUILD_DIR = os.path.join(JAVA_DIR, "build")
+HARNESS_CLASS = "com.gamingroom.harness.CommandHarness"
+WARM_RUNNER_CLASS = "com.gamingroom.harness.WarmRunner"
+# cds logging off: a missing or stale archive is expected on the first run
+QUIET_CDS = ["-Xlog:cds=off", "-Xlog:cds+dynamic=off"]
+
+
+def java_sources(source_dir=JAVA_DIR):
+    sources = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != BUILD_DIR]
+        sources += [os.path.join(root, name) for name in files if name.endswith(".java")]
+    return sorted(sources)
+
+
+def class_file(source, source_dir=JAVA_DIR, build_dir=BUILD_DIR):
+    relative = os.path.relpath(source, source_dir)
+    return os.path.join(build_dir, os.path.splitext(relative)[0] + ".class")
+
+
+def ensure_compiled(jar_path=JAR_PATH):
+    """Compile the helpers if any class file is missing or stale; returns the class path"""
+    sources = java_sources()
+    stale = [source for source in sources
+             if not os.path.exists(class_file(source))
+             or os.path.getmtime(class_file(source)) < os.path.getmtime(source)]
+    if stale:
+        javac = find_jdk_tool("javac")
+        if javac is None:
+            raise FileNotFoundError("javac not found (install a JDK or set JAVA_HOME)")
+        os.makedirs(BUILD_DIR, exist_ok=True)
+        result = subprocess.run([javac, "-cp", jar_path, "-d", BUILD_DIR] + sources,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"javac failed:\n{result.stderr.strip()}")
+    return os.pathsep.join([jar_path, BUILD_DIR])
+
+
+def harness_command(jar_path=JAR_PATH, jvm_options=()):
+    """Command line that starts the CommandHarness against jar_path"""
+    java = find_java()
+    if java is None:
+        raise FileNotFoundError("java executable not found (install a JDK or set JAVA_HOME)")
+    return [java, *jvm_options, "-cp", ensure_compiled(jar_path), HARNESS_CLASS]
+
+
+@lru_cache(maxsize=None)
+def java_version(java):
+    """Feature release of a java executable (8, 11, 17, ...), or 0 if it cannot be determined"""
+    try:
+        result = subprocess.run([java, "-version"], capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return 0
+    match = re.search(r'version "(\d+)(?:\.(\d+))?', result.stderr + result.stdout)
+    if match is None:
+        return 0
+    major = int(match.group(1))
+    return int(match.group(2) or 0) if major == 1 else major
+
+
+def cds_options(java, name, jar_path=JAR_PATH):
+    """JVM options that create (first run) or use a dynamic CDS archive named name
+
+    JDK 19+ maintains the archive itself; JDK 13-18 write it at exit and use it
+    while it is newer than the jar; older JVMs get no options.
+    """
+    archive = os.path.join(BUILD_DIR, name + ".jsa")
+    version = java_version(java)
+    if version >= 19:
+        os.makedirs(BUILD_DIR, exist_ok=True)
+        return ["-XX:+AutoCreateSharedArchive", f"-XX:SharedArchiveFile={archive}"] + QUIET_CDS
+    if version >= 13:
+        os.makedirs(BUILD_DIR, exist_ok=True)
+        if os.path.exists(archive) and os.path.getmtime(archive) >= os.path.getmtime(jar_path):
+            return [f"-XX:SharedArchiveFile={archive}"] + QUIET_CDS
+        return [f"-XX:ArchiveClassesAtExit={archive}"] + QUIET_CDS
+    return []
+
+
+def cold_command(jar_path=JAR_PATH, main_class=MAIN_CLASS, jvm_options=(), use_cds=True):
+    """Command line that runs main_class from the jar in a new JVM"""
+    java = find_java()
+    if java is None:
+        raise FileNotFoundError("java executable not found (install a JDK or set JAVA_HOME)")
+    cds = cds_options(java, "gamingroom", jar_path) if use_cds else []
+    return [java, *cds, *jvm_options, "-cp", jar_path, main_class]
+
+
+def warm_runner_command(jar_path=JAR_PATH, main_class=MAIN_CLASS, jvm_options=(), use_cds=True):
+    """Command line that starts a WarmRunner for main_class in the jar"""
+    java = find_java()
+    if java is None:
+        raise FileNotFoundError("java executable not found (install a JDK or set JAVA_HOME)")
+    ensure_compiled(jar_path)
+    cds = cds_options(java, "warm-runner", jar_path) if use_cds else []
+    # The runner's class path leaves the jar out; each run loads it in its own class loader
+    return [java, *cds, *jvm_options, "-cp", BUILD_DIR, WARM_RUNNER_CLASS, jar_path, main_class]
+
+
+def main():
+    try:
+        print(" ".join(harness_command()))
+    except (FileNotFoundError, RuntimeError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Warm JVM pool for the launcher's "java" target
+Instead of opening a terminal that pays a full cold `java -jar` per click,
+the launcher keeps WarmRunner JVMs (java/com/gamingroom/harness) running and
+asks one to execute ProgramDriver.main. Each run gets a fresh class loader,
+so the GameService singleton starts from scratch, but JVM start-up, JDK class
+loading and JIT warm-up are paid once. Output is collected per run and can be
+followed while it is produced. Without javac the pool falls back to cold
+runs, still sped up by a CDS archive (see java_tools.cds_options).
+
+Usage:
+    from jvm_pool import JvmPool
+    pool = JvmPool(size=1)
+    await pool.start()
+    run = pool.run()
+    async for line in run.follow():
+        print(line)
+
+    python jvm_pool.py                    # one cold run, then warm runs, with timings
+    python jvm_pool.py --runs 10 --size 2
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+from collections import OrderedDict
+from typing import List, Optional
+
+from trace_capture import JAR_PATH, MAIN_CLASS
+from java_tools import cold_command, warm_runner_command
+from output_capture import OutputBuffer, add_line, read_lines
+
+END_MARKER = b"\0END\t"
+DEFAULT_SIZE = 1
+RUN_HISTORY = 20
+START_TIMEOUT = 60.0
+STOP_TIMEOUT = 3.0
+
+
+class JavaRun:
+    """One execution of the main class and its output"""
+
+    def __init__(self, run_id, args):
+        """Raises ValueError for args the tab-separated RUN line cannot carry"""
+        self.id = run_id
+        self.args = list(args)
+        for arg in self.args:
+            if any(c in arg for c in "\t\r\n"):
+                raise ValueError(f"Program arguments cannot contain tabs or line breaks: {arg!r}")
+        self.mode = None             # "warm" or "cold" once it starts
+        self.output = OutputBuffer()
+        self.status = None
+        self.error = None
+        self.requested = time.perf_counter()
+        self.first_output = None
+        self.elapsed = None
+
+    @property
+    def done(self):
+        return self.elapsed is not None
+
+    def append(self, line):
+        if self.first_output is None:
+            self.first_output = time.perf_counter() - self.requested
+        add_line(self.output, "stdout", line)
+
+    def finish(self, status, error=None):
+        self.status = status
+        self.error = error
+        self.elapsed = time.perf_counter() - self.requested
+        self.output.close()
+
+    async def follow(self, start=0):
+        """Yield the output lines from start on, waiting for new ones until the run ends"""
+        async for entries, _ in self.output.follow(start):
+            for _, _, text in entries:
+                yield text
+
+    async def wait(self):
+        await self.output.wait_closed()
+        return self.status
+
+    def as_dict(self, since=None):
+        info = {"run": self.id, "args": self.args, "mode": self.mode, "done": self.done,
+                "status": self.status, "error": self.error,
+                "first_output_ms": None if self.first_output is None else round(self.first_output * 1000, 1),
+                "elapsed_ms": None if self.elapsed is None else round(self.elapsed * 1000, 1),
+                "line_count": self.output.next_seq, "dropped": self.output.evicted}
+        if since is not None:
+            entries, skipped = self.output.since(since)
+            info["lines"] = [text for _, _, text in entries]
+            info["skipped"] = skipped
+            info["next"] = entries[-1][0] + 1 if entries else since + skipped
+        return info
+
+
+class WarmJvm:
+    """One WarmRunner process"""
+
+    def __init__(self, command):
+        self.command = command
+        self.process = None
+        self.lines = None            # one line reader for the process's lifetime, shared by its runs
+        self.runs = 0
+
+    async def start(self):
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT)
+        self.lines = read_lines(self.process.stdout)
+        output = []
+        while True:
+            try:
+                line = await asyncio.wait_for(self.lines.__anext__(), START_TIMEOUT)
+            except StopAsyncIteration:
+                await self.process.wait()
+                raise RuntimeError("warm JVM exited during start-up:\n" + "\n".join(output).strip())
+            line = line.rstrip(b"\r")
+            if line == b"READY":
+                return
+            output.append(line.decode("utf-8", "replace"))
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.returncode is None
+
+    async def run(self, run: JavaRun):
+        """Execute one run, streaming its lines into run; returns the exit status"""
+        self.runs += 1
+        self.process.stdin.write(("\t".join(["RUN"] + run.args) + "\n").encode())
+        await self.process.stdin.drain()
+        async for line in self.lines:
+            line = line.rstrip(b"\r")
+            # Output that did not end with a newline puts the marker mid-line
+            marker = line.find(END_MARKER)
+            if marker >= 0:
+                if marker:
+                    run.append(line[:marker])
+                return int(line[marker + len(END_MARKER):])
+            run.append(line)
+        raise ConnectionError(f"warm JVM exited with code {await self.process.wait()}")
+
+    async def close(self):
+        if not self.alive:
+            return
+        try:
+            self.process.stdin.write(b"Q\n")
+            await self.process.stdin.drain()
+            await asyncio.wait_for(self.process.wait(), STOP_TIMEOUT)
+        except (ConnectionError, asyncio.TimeoutError):
+            self.process.kill()
+            await self.process.wait()
+
+
+class JvmPool:
+    """Warm JVMs shared by the launcher's java runs, with a cold fallback"""
+
+    def __init__(self, size=DEFAULT_SIZE, jar_path=JAR_PATH, main_class=MAIN_CLASS, jvm_options=(),
+                 use_cds=True):
+        self.size = size
+        self.jar_path = jar_path
+        self.main_class = main_class
+        self.jvm_options = list(jvm_options)
+        self.use_cds = use_cds
+        self.idle: Optional[asyncio.Queue] = None
+        self.workers: List[WarmJvm] = []
+        self.error = None            # why warm runs are unavailable, once a worker failed to start
+        self.runs = OrderedDict()
+        self.next_id = 1
+        self.tasks = set()
+        self.finished_callbacks = []     # called with each JavaRun when it ends
+
+    def _spawn_task(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    async def start(self):
+        """Start warming the workers in the background"""
+        self.idle = asyncio.Queue()
+        for _ in range(self.size):
+            self._spawn_task(self.add_worker())
+
+    async def add_worker(self):
+        try:
+            # May run javac and java -version; keep that off the event loop
+            command = await asyncio.get_running_loop().run_in_executor(
+                None, warm_runner_command, self.jar_path, self.main_class, self.jvm_options, self.use_cds)
+            jvm = WarmJvm(command)
+            await jvm.start()
+        except (OSError, RuntimeError, asyncio.TimeoutError) as e:
+            self.error = str(e) or type(e).__name__
+            print(f"Warm JVM unavailable, java runs will start cold: {self.error}")
+            self.idle.put_nowait(None)   # wakes waiting runs; they fall back to cold
+            return
+        self.workers.append(jvm)
+        self.idle.put_nowait(jvm)
+
+    def run(self, args=()) -> JavaRun:
+        """Start a run; the returned JavaRun fills in as the program prints
+
+        Raises ValueError for arguments containing tabs or line breaks.
+        """
+        run = JavaRun(self.next_id, args)
+        self.next_id += 1
+        self.runs[run.id] = run
+        while len(self.runs) > RUN_HISTORY:
+            self.runs.popitem(last=False)
+        self._spawn_task(self.execute(run))
+        return run
+
+    async def execute(self, run):
+        try:
+            await self.execute_run(run)
+        except Exception as e:
+            # Followers wait for the run to finish; it must, whatever went wrong
+            if not run.done:
+                run.finish(None, f"{type(e).__name__}: {e}")
+        for callback in self.finished_callbacks:
+            callback(run)
+
+    async def execute_run(self, run):
+        jvm = None
+        if self.size and self.error is None:
+            jvm = await self.idle.get()
+            if jvm is None:
+                self.idle.put_nowait(None)
+        if jvm is None:
+            await self.run_cold(run)
+            return
+        run.mode = "warm"
+        try:
+            status = await jvm.run(run)
+        except Exception as e:
+            # main() called System.exit, the JVM died or its output broke the protocol; replace it
+            self.workers.remove(jvm)
+            self._spawn_task(self.replace_worker(jvm))
+            run.finish(None, str(e) or type(e).__name__)
+            return
+        self.idle.put_nowait(jvm)
+        run.finish(status)
+
+    async def replace_worker(self, jvm):
+        await jvm.close()
+        await self.add_worker()
+
+    async def run_cold(self, run):
+        run.mode = "cold"
+        try:
+            command = await asyncio.get_running_loop().run_in_executor(
+                None, cold_command, self.jar_path, self.main_class, self.jvm_options, self.use_cds)
+            process = await asyncio.create_subprocess_exec(*command, *run.args, stdout=asyncio.subprocess.PIPE,
+                                                           stderr=asyncio.subprocess.STDOUT)
+        except OSError as e:
+            run.finish(None, str(e))
+            return
+        async for line in read_lines(process.stdout):
+            run.append(line.rstrip(b"\r"))
+        run.finish(await process.wait())
+
+    def get(self, run_id) -> Optional[JavaRun]:
+        return self.runs.get(run_id)
+
+    def status(self):
+        return {"size": self.size, "warm": len(self.workers),
+                "idle": self.idle.qsize() if self.idle is not None else 0,
+                "error": self.error, "runs": [run.as_dict() for run in self.runs.values()]}
+
+    async def close(self):
+        await asyncio.gather(*(jvm.close() for jvm in self.workers))
+        self.workers.clear()
+
+
+async def compare(runs, size):
+    cold = JvmPool(size=0)
+    await cold.start()
+    run = cold.run()
+    await run.wait()
+    print(f"cold  run: {run.elapsed * 1000:8.1f} ms  status {run.status}  {run.output.next_seq} lines"
+          + (f"  ({run.error})" if run.error else ""))
+    if run.error:
+        return
+
+    pool = JvmPool(size=size)
+    started = time.perf_counter()
+    await pool.start()
+    try:
+        for _ in range(runs):
+            run = pool.run()
+            await run.wait()
+            print(f"{run.mode:>5} run: {run.elapsed * 1000:8.1f} ms  status {run.status}  {run.output.next_seq} lines"
+                  + (f"  ({run.error})" if run.error else ""))
+        print(f"pool warm-up + {runs} runs: {(time.perf_counter() - started) * 1000:.0f} ms")
+    finally:
+        await pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cold and warm runs of GamingRoom.jar")
+    parser.add_argument("--runs", type=int, default=5, help="runs on the warm pool")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="warm JVMs in the pool")
+    args = parser.parse_args()
+    try:
+        asyncio.run(compare(args.runs, args.size))
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Launch request coalescing and rate limiting for the launcher server
+A double-click on a launcher card, or several open tabs polling the same
+button, used to start one full PyQt6 process per request. Coalescer hands
+every identical request from the same client within a short window the
+result of the first one (the same pid or run id). RateLimiter then puts a
+token bucket in front of each app, so even distinct requests cannot start
+processes faster than the configured rate.
+
+Usage:
+    from launch_control import Coalescer, RateLimiter
+    coalescer = Coalescer(window=2.0)
+    limiter = RateLimiter(rate=0.5, burst=3)
+    result, coalesced = await coalescer.run((client, app), launch)
+    allowed, retry_after = limiter.acquire(app)
+
+    python launch_control.py              # simulate a burst of clicks against the defaults
+"""
+
+import time
+import asyncio
+import argparse
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, Tuple
+
+COALESCE_WINDOW = 2.0            # seconds an identical request reuses the first one's result
+LAUNCH_RATE = 0.5                # sustained launches per second per app
+LAUNCH_BURST = 3                 # launches per app allowed back to back
+
+
+class TokenBucket:
+    """Classic token bucket: burst tokens, refilled at rate per second"""
+    __slots__ = ("rate", "burst", "tokens", "updated", "clock")
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.clock = clock
+        self.updated = clock()
+
+    def refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens=1) -> Tuple[bool, float]:
+        """(True, 0) and take the tokens, or (False, seconds until they would be available)"""
+        self.refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True, 0.0
+        if self.rate <= 0:
+            return False, float("inf")
+        return False, (tokens - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """One token bucket per key (app name); rate 0 disables limiting"""
+
+    def __init__(self, rate=LAUNCH_RATE, burst=LAUNCH_BURST, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.buckets: Dict[Hashable, TokenBucket] = {}
+
+    def acquire(self, key) -> Tuple[bool, float]:
+        if not self.rate:
+            return True, 0.0
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket(self.rate, self.burst, self.clock)
+        return bucket.acquire()
+
+
+class Coalescer:
+    """Share one in-flight (or just finished) result between identical requests"""
+
+    def __init__(self, window=COALESCE_WINDOW, clock=time.monotonic):
+        self.window = window
+        self.clock = clock
+        # key -> (first request time, future); insertion order is also expiry order
+        self.entries: "OrderedDict[Hashable, Tuple[float, asyncio.Future]]" = OrderedDict()
+
+    def expire(self, now):
+        while self.entries:
+            key, (started, future) = next(iter(self.entries.items()))
+            if now - started < self.window or not future.done():
+                break
+            del self.entries[key]
+
+    async def run(self, key, launch: Callable[[], Awaitable], keep: Callable[[object], bool] = lambda result: True):
+        """(result, coalesced): launch() for the first request of key, its result for the duplicates
+
+        keep(result) decides whether a finished result is reused for the rest of the
+        window; requests that arrive while launch() is still running always share it.
+        """
+        now = self.clock()
+        self.expire(now)
+        entry = self.entries.get(key)
+        if entry is not None and self.window:
+            return await asyncio.shield(entry[1]), True
+        future = asyncio.get_running_loop().create_future()
+        self.entries[key] = (now, future)
+        try:
+            result = await launch()
+        except BaseException as e:
+            self.entries.pop(key, None)
+            future.set_exception(e)
+            future.exception()   # mark retrieved; waiting duplicates re-raise it themselves
+            raise
+        future.set_result(result)
+        if not keep(result):
+            self.entries.pop(key, None)
+        return result, False
+
+
+async def simulate(clicks, interval, window, rate, burst):
+    coalescer = Coalescer(window)
+    limiter = RateLimiter(rate, burst)
+    launched = 0
+
+    async def launch():
+        nonlocal launched
+        allowed, retry_after = limiter.acquire("flowchart")
+        if not allowed:
+            return f"rate limited, retry in {retry_after:.1f}s"
+        launched += 1
+        await asyncio.sleep(0.05)   # spawning a process
+        return f"launched #{launched}"
+
+    started = time.monotonic()
+    for click in range(clicks):
+        result, coalesced = await coalescer.run(("127.0.0.1", "flowchart"), launch)
+        print(f"{time.monotonic() - started:5.2f}s click {click + 1:2}: {result}{' (coalesced)' if coalesced else ''}")
+        await asyncio.sleep(interval)
+    print(f"{clicks} clicks -> {launched} processes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate repeated launch clicks")
+    parser.add_argument("--clicks", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.3, help="seconds between clicks")
+    parser.add_argument("--window", type=float, default=COALESCE_WINDOW)
+    parser.add_argument("--rate", type=float, default=LAUNCH_RATE)
+    parser.add_argument("--burst", type=int, default=LAUNCH_BURST)
+    args = parser.parse_args()
+    asyncio.run(simulate(args.clicks, args.interval, args.window, args.rate, args.burst))
+
+
+if __name__ == "__main__":
+    main()
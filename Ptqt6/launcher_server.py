@@ -0,0 +1,856 @@
+#!/usr/bin/env python3
+"""
+Asyncio launcher server for the Singleton Pattern Visualizer Suite
+One event loop serves launcher.html and the other static files (preloaded and
+pre-compressed by static_assets.py, anything else via sendfile), answers
+/launch?app=... (including the app=status check) and supervises the launched
+visualizers with asyncio.create_subprocess_exec. Exit codes are collected by
+the loop itself (pidfd where the kernel has it), so there is no thread per
+request or per child and hundreds of browser connections share one core.
+
+Launched processes are owned by a process_supervisor.Supervisor:
+    /processes                   running and recently exited children with RSS, CPU time, start latency
+    /processes/kill?pid=N        POST: terminate one (SIGKILL after a grace period)
+    /processes/restart?pid=N     POST: stop it if needed and start the same command again
+The two POST routes send no CORS headers and refuse requests whose Origin is
+another site, so a web page cannot trigger them from a visitor's browser.
+
+Identical launch requests from one client within --coalesce-window seconds get
+the first request's result (same pid or run), and each app has a token bucket
+(--launch-rate, --launch-burst); see launch_control.py.
+
+app=java runs GamingRoom.jar on a warm JVM from jvm_pool.py instead of opening
+a terminal (app=java-terminal still does that):
+    /java/run[?arg=...]          start a run and stream its output
+    /java/output?run=N&since=K   output collected so far, for polling
+    /java/status                 warm workers and recent runs
+
+stdout/stderr of every launched process and java run is kept in a bounded
+ring (output_capture.py) and streamed to launcher.html's console over a
+WebSocket (ws_protocol.py):
+    /ws/output?pid=N[&since=K]   {"type": "lines", "lines": [[seq, stream, text], ...], "skipped": n}
+    /ws/output?run=N[&since=K]   ... then {"type": "exit", ...} and a close frame
+A client that reads too slowly is told how many lines it missed, or is
+dropped; it never holds up the process writing the output.
+
+/metrics exposes request, launch and child-process metrics for Prometheus
+(see metrics.py).
+
+--remote-viewer adds the shared offscreen renderer from remote_viewer.py for
+browsers without a local PyQt6 (viewer.html):
+    /viewer/targets              scenes that can be viewed
+    /ws/viewer?target=NAME       step through a scene; only changed tiles are sent
+    /viewer/tile?id=ID           tile PNGs by content id (immutable, cacheable)
+
+Clients on other machines (when --host is not a loopback address) only get
+the static files and the /viewer routes; launching, the process and java
+routes, /ws/output and /metrics answer them 403 unless --allow-remote-control
+is given. Browsers may only upgrade /ws/output, or POST to kill and restart,
+from a page served by the launcher itself (same Origin as Host).
+
+Usage:
+    python launcher_server.py                       # serve on 8080 (or the next free port), open the launcher
+    python launcher_server.py --port 9000 --no-browser --verbose
+    python launcher_server.py --max-instances 1 --max-total 4
+    python launcher_server.py --remote-viewer --host 0.0.0.0   # serve rendered scenes to a classroom
+                                                    # (launching stays limited to this machine)
+    python launcher_server.py --bench 500           # concurrent status requests against a running server
+"""
+
+import os
+import sys
+import json
+import time
+import math
+import errno
+import asyncio
+import ipaddress
+import argparse
+import webbrowser
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlsplit, parse_qs, unquote
+
+from trace_capture import JAR_PATH
+from static_assets import AssetCache
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, Registry
+from jvm_pool import DEFAULT_SIZE as DEFAULT_JAVA_WORKERS, JvmPool
+from ws_protocol import WebSocket, accept_headers, is_upgrade
+from remote_viewer import SceneRenderer, serve_viewer
+from launch_control import COALESCE_WINDOW, LAUNCH_BURST, LAUNCH_RATE, Coalescer, RateLimiter
+from process_supervisor import (DEFAULT_MAX_PER_APP, DEFAULT_MAX_TOTAL, LimitReached,
+                                Supervisor, install_child_watcher)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_PORT = 8080
+PORT_ATTEMPTS = 10
+BACKLOG = 1024                   # pending connections; the default of 100 drops bursts of page loads
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+KEEPALIVE_TIMEOUT = 15.0         # seconds an idle keep-alive connection is held open
+
+# Python visualizers, by the app names launcher.html sends
+SCRIPTS = {
+    "flowchart": "singleton_flowchart_complete.py",
+    "architecture": "singleton_flowchart_complete.py",
+    "analyzer": "singleton_visualizer_integrated.py",
+}
+
+REASONS = {
+    101: "Switching Protocols", 200: "OK", 204: "No Content", 301: "Moved Permanently", 304: "Not Modified", 400: "Bad Request",
+    403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 429: "Too Many Requests", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+
+def java_terminal_command(jar_path=JAR_PATH):
+    """Command that opens GamingRoom.jar in a terminal window on this platform"""
+    if sys.platform == "darwin":
+        apple_script = f'''
+        tell application "Terminal"
+            activate
+            do script "cd '{os.path.dirname(jar_path)}' && java -jar GamingRoom.jar; echo; echo 'Press any key to close...'; read -n 1"
+        end tell
+        '''
+        return ["osascript", "-e", apple_script]
+    if sys.platform == "win32":
+        return ["cmd", "/c", "start", "cmd", "/k", "java", "-jar", jar_path]
+    return ["gnome-terminal", "--", "java", "-jar", jar_path]
+
+
+def app_command(app):
+    """Command line for a launcher app name, or None if the name is unknown"""
+    if app in SCRIPTS:
+        return [sys.executable, os.path.join(BASE_DIR, SCRIPTS[app])]
+    if app == "java-terminal":
+        return java_terminal_command()
+    return None
+
+
+def is_loopback(address):
+    """True for 127.0.0.0/8, ::1 and IPv4-mapped loopback addresses"""
+    try:
+        ip = ipaddress.ip_address(address.partition("%")[0])
+    except ValueError:
+        return False
+    if getattr(ip, "ipv4_mapped", None) is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_loopback
+
+
+def is_cross_origin(request):
+    """True when a browser sent request from a page of another origin
+
+    Browsers send Origin with every POST and WebSocket upgrade (and apply no
+    CORS to WebSockets); tools like curl send none and are let through.
+    """
+    origin = request.headers.get("origin")
+    return origin is not None and urlsplit(origin).netloc != request.headers.get("host")
+
+
+def app_label(app):
+    """Metric label for an app name; anything unknown is folded into one label"""
+    return app if app == "java" or app_command(app) is not None else "unknown"
+
+
+@dataclass
+class Request:
+    method: str
+    target: str
+    version: str
+    headers: Dict[str, str]
+    path: str = ""
+    query: Dict[str, List[str]] = field(default_factory=dict)
+    client: str = ""                 # peer address, set by the connection handler
+
+    def __post_init__(self):
+        parts = urlsplit(self.target)
+        self.path = unquote(parts.path) or "/"
+        self.query = parse_qs(parts.query)
+
+    def param(self, name, default=""):
+        return self.query.get(name, [default])[0]
+
+    @property
+    def keep_alive(self):
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+
+@dataclass
+class Response:
+    status: int = 200
+    body: bytes = b""
+    content_type: str = "application/json"
+    headers: Dict[str, str] = field(default_factory=dict)
+    file: Optional[str] = None       # sent with sendfile instead of body
+    file_size: int = 0
+    stream: Optional[AsyncIterator[bytes]] = None    # sent chunked instead of body
+    upgrade: Optional[Callable[..., Awaitable]] = None   # takes over (reader, writer) after a 101
+    cors: bool = True                # Access-Control-Allow-Origin: * (readable by any page)
+
+    def head(self, keep_alive):
+        lines = [f"HTTP/1.1 {self.status} {REASONS.get(self.status, '')}"]
+        if self.upgrade is not None:
+            lines += [f"{name}: {value}" for name, value in self.headers.items()]
+            return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        if self.stream is not None:
+            lines += [f"Content-Type: {self.content_type}", "Transfer-Encoding: chunked"]
+        elif self.status not in (204, 304):
+            lines += [f"Content-Type: {self.content_type}",
+                      f"Content-Length: {self.file_size if self.file else len(self.body)}"]
+        if self.cors:
+            lines.append("Access-Control-Allow-Origin: *")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        lines += [f"{name}: {value}" for name, value in self.headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def json_response(payload, status=200):
+    return Response(status, json.dumps(payload).encode())
+
+
+def error_response(status, message=""):
+    return Response(status, (message or REASONS.get(status, "")).encode(), "text/plain; charset=utf-8")
+
+
+class LauncherServer:
+    """HTTP/1.1 launcher service on an asyncio event loop"""
+
+    def __init__(self, root=BASE_DIR, verbose=False, max_per_app=DEFAULT_MAX_PER_APP,
+                 max_total=DEFAULT_MAX_TOTAL, java_workers=DEFAULT_JAVA_WORKERS,
+                 launch_rate=LAUNCH_RATE, launch_burst=LAUNCH_BURST, coalesce_window=COALESCE_WINDOW,
+                 viewer_workers=0, remote_control=False):
+        self.assets = AssetCache(root)
+        self.verbose = verbose
+        self.remote_control = remote_control     # let non-loopback clients launch and manage processes
+        self.supervisor = Supervisor(max_per_app, max_total, verbose=verbose)
+        self.jvm_pool = JvmPool(size=java_workers)
+        self.coalescer = Coalescer(coalesce_window)
+        self.rate_limiter = RateLimiter(launch_rate, launch_burst)
+        self.routes = {"/launch": self.handle_launch,
+                       "/processes": self.handle_processes,
+                       "/processes/kill": self.handle_kill,
+                       "/processes/restart": self.handle_restart,
+                       "/metrics": self.handle_metrics,
+                       "/java/run": self.handle_java_run,
+                       "/java/output": self.handle_java_output,
+                       "/java/status": self.handle_java_status,
+                       "/ws/output": self.handle_ws_output}
+        self.public_routes = set()   # routes (besides static files) that answer non-loopback clients
+        # Destructive routes: POST from the launcher's own origin only
+        self.control_routes = {"/processes/kill", "/processes/restart"}
+        # Remote viewer (0 workers = off): offscreen renders shared by every browser
+        self.viewer = SceneRenderer(viewer_workers) if viewer_workers else None
+        if self.viewer is not None:
+            self.routes.update({"/viewer/targets": self.handle_viewer_targets,
+                                "/viewer/tile": self.handle_viewer_tile,
+                                "/ws/viewer": self.handle_ws_viewer})
+            self.public_routes.update(("/viewer/targets", "/viewer/tile", "/ws/viewer"))
+        self.started = time.time()
+        self.server = None
+        self.port = None
+        self.connections = 0
+        self.subscribers = 0
+        self.register_metrics()
+
+    def register_metrics(self):
+        self.metrics = registry = Registry()
+        self.requests_total = registry.counter(
+            "launcher_http_requests_total", "HTTP requests handled", ("path", "method", "status"))
+        self.request_seconds = registry.histogram(
+            "launcher_http_request_duration_seconds", "Time from parsed request to response sent", ("path",))
+        self.connections_total = registry.counter("launcher_http_connections_total", "Accepted connections")
+        self.launches_total = registry.counter(
+            "launcher_launches_total", "Launch requests by outcome (ok, failed, limited, rate_limited, coalesced)",
+            ("app", "result"))
+        self.launch_seconds = registry.histogram(
+            "launcher_launch_duration_seconds", "Time to spawn a launched process", ("app",))
+        self.java_run_seconds = registry.histogram(
+            "launcher_java_run_duration_seconds", "GamingRoom.jar runs from request to exit", ("mode",))
+        self.jvm_pool.finished_callbacks.append(
+            lambda run: self.java_run_seconds.observe(run.elapsed, run.mode or "cold"))
+        registry.gauge("launcher_open_connections", "Connections currently open", (),
+                       lambda: [((), self.connections)])
+        registry.gauge("launcher_output_subscribers", "WebSocket consoles currently following output", (),
+                       lambda: [((), self.subscribers)])
+        registry.gauge("launcher_children", "Launched processes currently running", ("app",),
+                       lambda: [((app,), count) for app, count in
+                                sorted(Counter(child.app for child in self.supervisor.children.values()).items())])
+        registry.gauge("launcher_child_rss_bytes", "Resident set size of each running child", ("app", "pid"),
+                       lambda: [((child.app, child.pid), child.rss) for child in self.supervisor.children.values()
+                                if child.rss is not None])
+        registry.gauge("launcher_child_cpu_seconds", "CPU time of each running child", ("app", "pid"),
+                       lambda: [((child.app, child.pid), child.cpu_time)
+                                for child in self.supervisor.children.values() if child.cpu_time is not None])
+        if self.viewer is not None:
+            viewer_frames = registry.counter(
+                "launcher_viewer_frames_total", "Remote viewer frames served, by source (rendered, cached, shared)",
+                ("target", "source"))
+            viewer_render_seconds = registry.histogram(
+                "launcher_viewer_render_duration_seconds", "Offscreen render of one remote viewer frame", ("target",))
+
+            def count_frame(frame, source):
+                viewer_frames.inc(frame.target, source)
+                if source == "rendered":
+                    viewer_render_seconds.observe(frame.render_ms / 1000, frame.target)
+            self.viewer.frame_callbacks.append(count_frame)
+            registry.gauge("launcher_viewers", "Remote viewers currently connected", (),
+                           lambda: [((), self.viewer.viewers)])
+            registry.gauge("launcher_viewer_tile_cache_bytes", "Bytes of rendered tiles cached", (),
+                           lambda: [((), self.viewer.tiles.size)])
+        registry.gauge("launcher_uptime_seconds", "Seconds since the server started", (),
+                       lambda: [((), round(time.time() - self.started, 3))])
+        registry.gauge("launcher_start_time_seconds", "Server start time since the epoch", (),
+                       lambda: [((), self.started)])
+
+    def route_label(self, request):
+        # Static paths are folded into one label so arbitrary URLs cannot grow the series count
+        return request.path if request.path in self.routes else "static"
+
+    # -- serving --------------------------------------------------------
+
+    async def start(self, host="localhost", port=DEFAULT_PORT, attempts=PORT_ATTEMPTS):
+        """Listen on port, or the next free one; returns the port in use"""
+        install_child_watcher()
+        self.assets.preload()
+        await self.jvm_pool.start()
+        if self.viewer is not None:
+            self.viewer.start()
+        for attempt in range(attempts):
+            try:
+                self.server = await asyncio.start_server(self.handle_client, host, port + attempt,
+                                                         limit=MAX_HEADER_BYTES, backlog=BACKLOG)
+            except OSError as e:
+                if e.errno != errno.EADDRINUSE or attempt == attempts - 1:
+                    raise
+                print(f"⚠️  Port {port + attempt} in use, trying port {port + attempt + 1}...")
+                continue
+            self.port = self.server.sockets[0].getsockname()[1]    # the real one when port is 0
+            return self.port
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def stop(self):
+        """Stop listening and shut down the children that are still running"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.jvm_pool.close()
+        if self.viewer is not None:
+            await self.viewer.close()
+        await self.supervisor.shutdown()
+
+    async def handle_client(self, reader, writer):
+        peer = writer.get_extra_info("peername")
+        client = str(peer[0]) if peer else ""
+        self.connections += 1
+        self.connections_total.inc()
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+                except asyncio.LimitOverrunError:
+                    await self.send(writer, error_response(431), False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+                request = self.parse_request(head)
+                if request is None:
+                    await self.send(writer, error_response(400), False)
+                    break
+                request.client = client
+                length = int(request.headers.get("content-length", "0") or 0)
+                if length > MAX_BODY_BYTES:
+                    await self.send(writer, error_response(413), False)
+                    break
+                if length:
+                    await reader.readexactly(length)
+                started = time.perf_counter()
+                response = await self.dispatch(request)
+                keep_alive = request.keep_alive
+                await self.send(writer, response, keep_alive, request.method != "HEAD")
+                route = self.route_label(request)
+                self.request_seconds.observe(time.perf_counter() - started, route)
+                self.requests_total.inc(route, request.method, str(response.status))
+                if self.verbose:
+                    print(f"{request.method} {request.target} {response.status}")
+                if response.upgrade is not None:
+                    await response.upgrade(reader, writer)
+                    break
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    @staticmethod
+    def parse_request(head):
+        try:
+            lines = head.decode("latin-1").split("\r\n")
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            return None
+        if not version.startswith("HTTP/1."):
+            return None
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        return Request(method, target, version, headers)
+
+    @staticmethod
+    async def send(writer, response, keep_alive, include_body=True):
+        data = response.head(keep_alive)
+        if include_body and response.file is None and response.stream is None:
+            data += response.body
+        writer.write(data)
+        await writer.drain()
+        if response.stream is not None:
+            try:
+                if include_body:
+                    async for chunk in response.stream:
+                        if chunk:
+                            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                            await writer.drain()
+                    writer.write(b"0\r\n\r\n")
+            finally:
+                await response.stream.aclose()
+        if include_body and response.file is not None:
+            with open(response.file, "rb") as f:
+                sent = await asyncio.get_running_loop().sendfile(writer.transport, f, 0, response.file_size)
+            if sent < response.file_size:
+                raise ConnectionError(f"{response.file} shrank while it was being sent")
+
+    async def dispatch(self, request):
+        if request.method == "OPTIONS":
+            if request.path in self.control_routes:
+                return Response(204, cors=False)     # no preflight approval for other origins
+            return Response(204, headers={"Access-Control-Allow-Methods": "GET, HEAD, POST, OPTIONS",
+                                          "Access-Control-Allow-Headers": "*"})
+        handler = self.routes.get(request.path)
+        if request.method not in ("GET", "HEAD") and not (handler and request.method == "POST"):
+            return error_response(405)
+        if (handler is not None and request.path not in self.public_routes and not self.remote_control
+                and not is_loopback(request.client)):
+            return error_response(403, f"{request.path} is only available from the server's own machine "
+                                       f"(start it with --allow-remote-control to change that)")
+        if request.path in self.control_routes:
+            response = self.refuse_control(request) or await self.call(handler, request)
+            response.cors = False
+            return response
+        return await self.call(handler, request)
+
+    async def call(self, handler, request):
+        try:
+            if handler is not None:
+                return await handler(request)
+            return self.serve_static(request)
+        except Exception as e:
+            print(f"Error handling {request.target}: {e}")
+            return error_response(500, str(e))
+
+    @staticmethod
+    def refuse_control(request):
+        """Error response for a control request that is not a same-origin POST, else None"""
+        if request.method != "POST":
+            response = error_response(405, f"{request.path} only accepts POST")
+            response.headers["Allow"] = "POST"
+            return response
+        if is_cross_origin(request):
+            return error_response(403, "Cross-origin requests are not accepted")
+        return None
+
+    def serve_static(self, request):
+        asset = self.assets.get(request.path)
+        if asset is None:
+            return error_response(404, f"File not found: {request.path}")
+        encoding, body = asset.select(request.headers.get("accept-encoding", ""))
+        if asset.not_modified(request.headers):
+            return Response(304, headers=asset.headers(encoding))
+        if not asset.preloaded:
+            return Response(200, content_type=asset.content_type, headers=asset.headers(),
+                            file=asset.path, file_size=asset.size)
+        return Response(200, body, asset.content_type, asset.headers(encoding))
+
+    # -- launching ------------------------------------------------------
+
+    async def handle_launch(self, request):
+        app = request.param("app")
+        if app == "status":
+            return json_response(self.status())
+        # Identical requests from one client (double-clicks, several tabs) share one launch
+        key = (request.client, app, tuple(request.query.get("arg", [])))
+        (payload, status), coalesced = await self.coalescer.run(
+            key, lambda: self.launch(app, request), keep=lambda result: result[1] == 200)
+        if coalesced:
+            self.launches_total.inc(app_label(app), "coalesced")
+            payload = {**payload, "coalesced": True, "message": f"{app} was just launched (duplicate request)"}
+        response = json_response(payload, status)
+        if "retry_after" in payload:
+            response.headers["Retry-After"] = str(math.ceil(payload["retry_after"]))
+        return response
+
+    async def launch(self, app, request):
+        """(payload, HTTP status) for one launch that got past coalescing"""
+        label = app_label(app)
+        allowed, retry_after = self.rate_limiter.acquire(label)
+        if not allowed:
+            self.launches_total.inc(label, "rate_limited")
+            return {"success": False, "app": app, "pid": None, "retry_after": round(retry_after, 2),
+                    "message": f"Too many {app} launches, try again in {math.ceil(retry_after)}s"}, 429
+        if app == "java":
+            try:
+                return self.launch_java(request), 200
+            except ValueError as e:
+                return {"success": False, "app": app, "pid": None, "message": str(e)}, 400
+        try:
+            child = await self.launch_app(app)
+        except LimitReached as e:
+            self.launches_total.inc(label, "limited")
+            return {"success": False, "app": app, "pid": None, "message": f"Not launching {app}: {e}"}, 429
+        success = child is not None
+        self.launches_total.inc(label, "ok" if success else "failed")
+        if success:
+            self.launch_seconds.observe(child.start_latency, label)
+        return ({"success": success, "app": app, "pid": child.pid if success else None,
+                 "stream": f"/ws/output?pid={child.pid}" if success else None,
+                 "message": f'{"Launched" if success else "Failed to launch"} {app}'},
+                200 if success else 500)
+
+    async def launch_app(self, app):
+        """Start app under the supervisor; returns its Child, None on failure, raises LimitReached"""
+        command = app_command(app)
+        if command is None:
+            print(f"Unknown app: {app}")
+            return None
+        print(f"🚀 Launching {app}...")
+        try:
+            return await self.supervisor.start(app, command, cwd=BASE_DIR)
+        except OSError as e:
+            print(f"Error launching {app}: {e}")
+            return None
+
+    def status(self):
+        return {"success": True, "status": "running", "pid": os.getpid(),
+                "uptime": round(time.time() - self.started, 3), **self.supervisor.summary()}
+
+    # -- java ---------------------------------------------------------------
+
+    def start_java_run(self, request):
+        """Run the jar on the warm pool with the request's arg=... values as program arguments
+
+        Raises ValueError for arguments the pool cannot pass on.
+        """
+        run = self.jvm_pool.run(request.query.get("arg", []))
+        self.launches_total.inc("java", "ok")
+        return run
+
+    def launch_java(self, request):
+        print("🚀 Launching java...")
+        run = self.start_java_run(request)
+        return {"success": True, "app": "java", "pid": None, "run": run.id,
+                "output": f"/java/output?run={run.id}", "stream": f"/ws/output?run={run.id}",
+                "message": "Launched java"}
+
+    async def handle_java_run(self, request):
+        """Start a run and stream its output as it is printed (chunked text)"""
+        try:
+            run = self.start_java_run(request)
+        except ValueError as e:
+            return error_response(400, str(e))
+
+        async def lines():
+            async for line in run.follow():
+                yield (line + "\n").encode("utf-8")
+            if run.error:
+                yield f"[{run.error}]\n".encode("utf-8")
+            yield f"[exit {run.status}, {run.mode}, {run.elapsed * 1000:.0f} ms]\n".encode("utf-8")
+        return Response(200, content_type="text/plain; charset=utf-8", stream=lines(),
+                        headers={"X-Java-Run": str(run.id), "Cache-Control": "no-store"})
+
+    async def handle_java_output(self, request):
+        """Output of a run collected so far; since=N skips the lines a poller already has"""
+        try:
+            run = self.jvm_pool.get(int(request.param("run")))
+            since = int(request.param("since", "0"))
+        except ValueError:
+            run = None
+        if run is None:
+            return json_response({"success": False, "message": "Unknown run"}, 404)
+        return json_response({"success": True, **run.as_dict(since=max(0, since))})
+
+    async def handle_java_status(self, request):
+        return json_response({"success": True, **self.jvm_pool.status()})
+
+    # -- output streaming -----------------------------------------------------
+
+    def output_source(self, request):
+        """(hello message, OutputBuffer, exit message callable) for pid=N or run=N, or None"""
+        try:
+            if request.param("pid"):
+                child = self.supervisor.get(int(request.param("pid")))
+                if child is not None:
+                    return ({"app": child.app, "pid": child.pid}, child.output,
+                            lambda: {"returncode": child.returncode, "stopped": child.stopped})
+            elif request.param("run"):
+                run = self.jvm_pool.get(int(request.param("run")))
+                if run is not None:
+                    return ({"app": "java", "run": run.id, "mode": run.mode}, run.output,
+                            lambda: {"returncode": run.status, "error": run.error, "mode": run.mode,
+                                     "elapsed_ms": round(run.elapsed * 1000, 1)})
+        except ValueError:
+            pass
+        return None
+
+    async def handle_ws_output(self, request):
+        """Upgrade to a WebSocket that follows a process's or run's output from since=K"""
+        if not is_upgrade(request.headers):
+            return error_response(400, "WebSocket upgrade required")
+        # Process output is private to the launcher's own page
+        if is_cross_origin(request):
+            return error_response(403, "Cross-origin WebSocket connections are not accepted")
+        source = self.output_source(request)
+        if source is None:
+            return error_response(404, "Unknown process or run")
+        try:
+            since = max(0, int(request.param("since", "0")))
+        except ValueError:
+            since = 0
+        return Response(101, headers=accept_headers(request.headers),
+                        upgrade=lambda reader, writer: self.stream_output(WebSocket(reader, writer), since, *source))
+
+    async def stream_output(self, ws, seq, hello, output, exit_info):
+        ws.start()
+        self.subscribers += 1
+        try:
+            await ws.send_json({"type": "hello", **hello, **output.stats()})
+            while not ws.closed.is_set():
+                entries, skipped = output.since(seq)
+                if entries or skipped:
+                    seq = entries[-1][0] + 1 if entries else seq + skipped
+                    await ws.send_json({"type": "lines", "lines": entries, "skipped": skipped})
+                    continue
+                if output.closed:
+                    await ws.send_json({"type": "exit", **exit_info()})
+                    break
+                # Sleep until new output or until the browser goes away, whichever is first
+                waiters = [asyncio.ensure_future(output.wait(seq)), asyncio.ensure_future(ws.closed.wait())]
+                try:
+                    await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    for waiter in waiters:
+                        waiter.cancel()
+            await ws.finish()
+        except ConnectionError:
+            pass
+        finally:
+            self.subscribers -= 1
+            if ws.receiver is not None:
+                ws.receiver.cancel()
+
+    # -- remote viewer --------------------------------------------------------
+
+    async def handle_viewer_targets(self, request):
+        return json_response({"success": True, "targets": self.viewer.targets, **self.viewer.stats()})
+
+    async def handle_viewer_tile(self, request):
+        tile_id = request.param("id")
+        png = self.viewer.tiles.get(tile_id)
+        if png is None:
+            return error_response(404, "Unknown tile")
+        # A tile id is the hash of its content, so it never changes
+        headers = {"ETag": f'"{tile_id}"', "Cache-Control": "public, max-age=31536000, immutable"}
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(304, headers=headers)
+        return Response(200, png, "image/png", headers)
+
+    async def handle_ws_viewer(self, request):
+        """Upgrade to a WebSocket that steps one viewer through a target's frames"""
+        if not is_upgrade(request.headers):
+            return error_response(400, "WebSocket upgrade required")
+        target = request.param("target")
+        if target not in self.viewer.targets:
+            return error_response(404, f"Unknown target: {target}")
+        return Response(101, headers=accept_headers(request.headers),
+                        upgrade=lambda reader, writer: self.run_viewer(WebSocket(reader, writer), target))
+
+    async def run_viewer(self, ws, target):
+        ws.start()
+        try:
+            await serve_viewer(ws, self.viewer, target)
+            await ws.finish()
+        except ConnectionError:
+            pass
+        except Exception as e:
+            # Typically the render workers could not start (no PyQt6 on the server)
+            print(f"Remote viewer error ({target}): {e}")
+            try:
+                await ws.send_json({"type": "error", "message": str(e) or type(e).__name__})
+                await ws.finish()
+            except ConnectionError:
+                pass
+        finally:
+            if ws.receiver is not None:
+                ws.receiver.cancel()
+
+    async def handle_metrics(self, request):
+        return Response(200, self.metrics.render().encode(), METRICS_CONTENT_TYPE)
+
+    # -- process management -----------------------------------------------
+
+    @staticmethod
+    def pid_param(request):
+        try:
+            return int(request.param("pid"))
+        except ValueError:
+            return None
+
+    async def handle_processes(self, request):
+        return json_response({"success": True, "processes": self.supervisor.list(),
+                              **self.supervisor.summary()})
+
+    async def handle_kill(self, request):
+        pid = self.pid_param(request)
+        child = await self.supervisor.stop(pid) if pid is not None else None
+        if child is None:
+            return json_response({"success": False, "pid": pid, "message": "No running launched process"}, 404)
+        return json_response({"success": True, "pid": pid, "process": child.as_dict(),
+                              "message": f"Stopped {child.app}"})
+
+    async def handle_restart(self, request):
+        pid = self.pid_param(request)
+        try:
+            child = await self.supervisor.restart(pid) if pid is not None else None
+        except LimitReached as e:
+            return json_response({"success": False, "pid": pid, "message": str(e)}, 429)
+        except OSError as e:
+            return json_response({"success": False, "pid": pid, "message": str(e)}, 500)
+        if child is None:
+            return json_response({"success": False, "pid": pid, "message": "Not a launched process"}, 404)
+        return json_response({"success": True, "pid": child.pid, "process": child.as_dict(),
+                              "message": f"Restarted {child.app}"})
+
+
+async def run_server(host="localhost", port=DEFAULT_PORT, open_browser=True, verbose=False, on_ready=None,
+                     **options):
+    """Serve until cancelled; on_ready(port) runs once the socket is listening
+
+    options are passed on to LauncherServer (max_per_app, max_total, java_workers,
+    launch_rate, launch_burst, coalesce_window, viewer_workers, remote_control).
+    """
+    server = LauncherServer(verbose=verbose, **options)
+    try:
+        port = await server.start(host, port)
+    except OSError as e:
+        print(f"❌ Error: Could not find an available port after {PORT_ATTEMPTS} attempts")
+        print(f"   Last error: {e}")
+        sys.exit(1)
+    if on_ready is not None:
+        on_ready(port)
+    if open_browser:
+        asyncio.get_running_loop().call_later(0.5, webbrowser.open, f"http://{host}:{port}/launcher.html")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.stop()
+
+
+def serve(host="localhost", port=DEFAULT_PORT, open_browser=True, verbose=False, on_ready=None, **options):
+    """Blocking entry point used by start_visualizer.py and launcher_backend.py"""
+    try:
+        asyncio.run(run_server(host, port, open_browser, verbose, on_ready, **options))
+    except KeyboardInterrupt:
+        pass
+
+
+# -- benchmark ------------------------------------------------------------
+
+async def bench_client(host, port, requests, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    message = f"GET /launch?app=status HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            writer.write(message)
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+
+
+async def bench(host, port, clients, requests):
+    """Open clients keep-alive connections at once and time requests status calls on each"""
+    latencies = []
+    started = time.perf_counter()
+    results = await asyncio.gather(*(bench_client(host, port, requests, latencies) for _ in range(clients)),
+                                   return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    failed = sum(isinstance(result, Exception) for result in results)
+    latencies.sort()
+    print(f"{clients} clients x {requests} requests: {len(latencies)} ok, {failed} clients failed, "
+          f"{len(latencies) / elapsed:,.0f} req/s")
+    if latencies:
+        for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+            print(f"  {name}: {latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000:.2f} ms")
+        print(f"  max: {latencies[-1] * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Asyncio launcher server for the visualizer suite")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--no-browser", action="store_true", help="do not open launcher.html")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    parser.add_argument("--max-instances", type=int, default=DEFAULT_MAX_PER_APP,
+                        help="concurrent instances allowed per app (0 = no limit)")
+    parser.add_argument("--max-total", type=int, default=DEFAULT_MAX_TOTAL,
+                        help="concurrent launched processes allowed overall (0 = no limit)")
+    parser.add_argument("--java-workers", type=int, default=DEFAULT_JAVA_WORKERS,
+                        help="warm JVMs kept for the java app (0 = cold runs only)")
+    parser.add_argument("--launch-rate", type=float, default=LAUNCH_RATE,
+                        help="sustained launches per second per app (0 = no rate limit)")
+    parser.add_argument("--launch-burst", type=int, default=LAUNCH_BURST,
+                        help="launches per app allowed back to back")
+    parser.add_argument("--coalesce-window", type=float, default=COALESCE_WINDOW,
+                        help="seconds identical launch requests from one client share a result")
+    parser.add_argument("--remote-viewer", action="store_true",
+                        help="render scenes on the server for browsers (viewer.html)")
+    parser.add_argument("--viewer-workers", type=int, default=1,
+                        help="offscreen render processes for --remote-viewer")
+    parser.add_argument("--allow-remote-control", action="store_true",
+                        help="let other machines launch, list and stop processes (not only view)")
+    parser.add_argument("--bench", type=int, metavar="CLIENTS",
+                        help="benchmark a running server with this many concurrent clients")
+    parser.add_argument("--requests", type=int, default=20, help="requests per benchmark client")
+    args = parser.parse_args()
+
+    if args.bench:
+        asyncio.run(bench(args.host, args.port, args.bench, args.requests))
+        return
+    print("Press Ctrl+C to stop the server")
+    serve(args.host, args.port, not args.no_browser, args.verbose,
+          on_ready=lambda port: print(f"Server started at http://{args.host}:{port}"),
+          max_per_app=args.max_instances, max_total=args.max_total, java_workers=args.java_workers,
+          launch_rate=args.launch_rate, launch_burst=args.launch_burst, coalesce_window=args.coalesce_window,
+          viewer_workers=max(1, args.viewer_workers) if args.remote_viewer else 0,
+          remote_control=args.allow_remote_control)
+
+
+if __name__ == "__main__":
+    main()
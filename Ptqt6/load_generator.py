@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Load generator for GameService workloads
+Runs a weighted mix of addGame / addTeam / addPlayer / getGame(id) /
+getGame(name) calls in a pool of worker processes, against either the
+in-process Python mirror (gamingroom, ids shared across workers) or
+GamingRoom.jar driven through the Java CommandHarness (one JVM per worker,
+latency timed inside the JVM). Reports throughput, latency percentiles per
+operation and memory growth, and writes a JSON-lines recording that the
+memory tab (timeline source) and the flowchart (Replay mode) can play back.
+
+Recording records, one JSON object per line:
+    {"type": "run", ...}       configuration
+    {"type": "op", ...}        the first --trace-ops calls of every worker
+    {"type": "sample", ...}    per-worker entity counts and memory over time
+    {"type": "summary", ...}   throughput, percentiles, memory growth
+
+Usage:
+    python load_generator.py                                  # Python mirror, 4 workers
+    python load_generator.py --target jar --workers 2 --ops 50000
+    python load_generator.py --mix addPlayer=10,getGameByName=5 --duration 30
+    python load_generator.py --record loadtest.jsonl
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import subprocess
+import multiprocessing
+from array import array
+from collections import deque
+
+from gamingroom import GameService
+from gamingroom.ids import IdService
+from gc_log import PauseHistogram
+from heap_histogram import format_bytes
+from trace_capture import JAR_PATH, TraceEvent
+
+OPS = ("addGame", "addTeam", "addPlayer", "getGameById", "getGameByName")
+DEFAULT_MIX = "addGame=1,addTeam=4,addPlayer=40,getGameById=10,getGameByName=5"
+# Calls sent to a target at a time (one pipe round trip for the JAR harness)
+BATCH_SIZE = 256
+DEFAULT_TRACE_OPS = 200
+DEFAULT_SAMPLE_SECONDS = 0.5
+PERCENTILES = (50, 90, 99, 99.9)
+RECORDING_VERSION = 1
+
+
+class LatencyHistogram(PauseHistogram):
+    """Call latency in log buckets from 100 ns to 1 s"""
+    LOW_MS = 0.0001
+
+
+def parse_mix(text):
+    """{"addGame": 1.0, ...} from "addGame=1,addPlayer=40"; unknown names raise ValueError"""
+    mix = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPS:
+            raise ValueError(f"unknown operation {name!r} (expected one of {', '.join(OPS)})")
+        mix[name] = float(weight or 1)
+    if not any(mix.values()):
+        raise ValueError("the operation mix is empty")
+    return mix
+
+
+def process_rss(pid=None):
+    """Resident set size in bytes, or None where /proc is not available"""
+    try:
+        with open(f"/proc/{pid or 'self'}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class PythonTarget:
+    """The gamingroom mirror inside the worker process"""
+    label = "Python mirror"
+
+    def __init__(self, ids=None):
+        self.service = GameService(ids)
+        GameService.resetInstance(self.service)
+        self.games = {}
+        self.teams = {}
+
+    def run(self, batch):
+        """(result id, created, ns) for each (op, parent id, name) call"""
+        service, games, teams = self.service, self.games, self.teams
+        clock = time.perf_counter_ns
+        results = []
+        for op, parent, name in batch:
+            created = False
+            if op == "addGame":
+                before = service.getGameCount()
+                started = clock()
+                entity = service.addGame(name)
+                elapsed = clock() - started
+                created = service.getGameCount() > before
+                games[entity.getId()] = entity
+            elif op == "addTeam":
+                game = games[parent]
+                before = len(game.getTeams())
+                started = clock()
+                entity = game.addTeam(name)
+                elapsed = clock() - started
+                created = len(game.getTeams()) > before
+                teams[entity.getId()] = entity
+            elif op == "addPlayer":
+                team = teams[parent]
+                before = len(team.getPlayers())
+                started = clock()
+                entity = team.addPlayer(name)
+                elapsed = clock() - started
+                created = len(team.getPlayers()) > before
+            else:
+                started = clock()
+                entity = service.getGame(name if op == "getGameByName" else parent)
+                elapsed = clock() - started
+            results.append((entity.getId() if entity is not None else 0, created, elapsed))
+        return results
+
+    def memory(self):
+        return process_rss(), None
+
+    def close(self):
+        GameService.resetInstance()
+
+
+class JarTarget:
+    """GamingRoom.jar behind the CommandHarness, one JVM per worker"""
+    label = "GamingRoom.jar"
+    CODES = {"addGame": "G", "addTeam": "T", "addPlayer": "P", "getGameById": "I", "getGameByName": "N"}
+
+    def __init__(self, jar_path=JAR_PATH, jvm_options=()):
+        from java_tools import harness_command
+        self.process = subprocess.Popen(harness_command(jar_path, jvm_options), stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, text=True, encoding="utf-8", bufsize=1 << 16)
+
+    def request(self, lines):
+        self.process.stdin.write("".join(lines))
+        self.process.stdin.flush()
+        replies = []
+        for _ in lines:
+            reply = self.process.stdout.readline()
+            if not reply or reply.startswith("ERR"):
+                raise RuntimeError(f"harness error: {reply.strip() or 'JVM exited'}")
+            replies.append(reply.rstrip("\n").split("\t"))
+        return replies
+
+    def run(self, batch):
+        lines = []
+        for op, parent, name in batch:
+            code = self.CODES[op]
+            if op in ("addGame", "getGameByName"):
+                lines.append(f"{code}\t{name}\n")
+            elif op == "getGameById":
+                lines.append(f"{code}\t{parent}\n")
+            else:
+                lines.append(f"{code}\t{parent}\t{name}\n")
+        return [(int(result), created == "1", int(ns)) for result, created, ns in self.request(lines)]
+
+    def memory(self):
+        used, _, _ = self.request(["M\n"])[0]
+        return process_rss(self.process.pid), int(used)
+
+    def close(self):
+        try:
+            self.process.stdin.write("Q\n")
+            self.process.stdin.close()
+        except OSError:
+            pass
+        self.process.wait(timeout=10)
+
+
+# Worker processes receive the shared IdService once, through the pool initializer
+_worker_ids = None
+
+
+def _init_worker(ids):
+    global _worker_ids
+    _worker_ids = ids
+
+
+def next_batch(rng, ops, weights, count, games, teams, name_space):
+    """count calls drawn from the mix; parents are picked from ids created so far"""
+    batch = []
+    for op in rng.choices(ops, cum_weights=weights, k=count):
+        # Nothing to attach to yet: create the missing parent instead
+        if op == "addPlayer" and not teams:
+            op = "addTeam"
+        if op in ("addTeam", "getGameById") and not games:
+            op = "addGame"
+        if op == "addGame":
+            batch.append((op, 0, f"Game #{rng.randrange(name_space)}"))
+        elif op == "addTeam":
+            batch.append((op, games[rng.randrange(len(games))], f"Team {rng.randrange(name_space)}"))
+        elif op == "addPlayer":
+            batch.append((op, teams[rng.randrange(len(teams))], f"Player {rng.randrange(name_space)}"))
+        elif op == "getGameById":
+            batch.append((op, games[rng.randrange(len(games))], ""))
+        else:
+            batch.append((op, 0, f"Game #{rng.randrange(name_space)}"))
+    return batch
+
+
+def run_worker(config):
+    """One worker's share of the load; returns its counts, histograms, trace and samples"""
+    worker = config["worker"]
+    if config["target"] == "jar":
+        target = JarTarget(config["jar"], config["jvm_options"])
+    else:
+        target = PythonTarget(_worker_ids)
+
+    rng = random.Random(config["seed"] + worker)
+    ops = list(config["mix"])
+    weights, total = [], 0.0
+    for op in ops:
+        total += config["mix"][op]
+        weights.append(total)
+
+    games, teams = array("q"), array("q")
+    histograms = {op: LatencyHistogram() for op in OPS}
+    counts = dict.fromkeys(OPS, 0)
+    created = {"addGame": 0, "addTeam": 0, "addPlayer": 0}
+    trace, samples = [], []
+    epoch = config["epoch"]
+
+    def sample():
+        rss, heap = target.memory()
+        samples.append({"type": "sample", "t": round(time.time() - epoch, 4), "worker": worker,
+                        "ops": done, "games": created["addGame"], "teams": created["addTeam"],
+                        "players": created["addPlayer"], "rss": rss, "heap": heap})
+
+    done = 0
+    started = time.perf_counter()
+    deadline = started + config["duration"] if config["duration"] else None
+    sample()
+    next_sample = time.perf_counter() + config["sample_seconds"]
+    try:
+        while done < config["ops"] and (deadline is None or time.perf_counter() < deadline):
+            batch = next_batch(rng, ops, weights, min(BATCH_SIZE, config["ops"] - done),
+                               games, teams, config["name_space"])
+            results = target.run(batch)
+            for (op, parent, name), (result, is_new, ns) in zip(batch, results):
+                histograms[op].add(ns / 1e6)
+                counts[op] += 1
+                if is_new:
+                    created[op] += 1
+                    if op == "addGame":
+                        games.append(result)
+                    elif op == "addTeam":
+                        teams.append(result)
+                if len(trace) < config["trace_ops"]:
+                    trace.append({"type": "op", "t": round(time.time() - epoch, 6), "worker": worker, "op": op,
+                                  "parent": parent, "name": name, "result": result, "created": is_new, "ns": ns})
+            done += len(batch)
+            if time.perf_counter() >= next_sample:
+                sample()
+                next_sample = time.perf_counter() + config["sample_seconds"]
+        elapsed = time.perf_counter() - started
+        sample()
+    finally:
+        target.close()
+
+    return {"worker": worker, "elapsed": elapsed, "counts": counts, "created": created,
+            "histograms": {op: vars(h) for op, h in histograms.items()},
+            "trace": trace, "samples": samples}
+
+
+def run_load(config, workers):
+    """Run every worker to completion; returns (worker results, wall seconds)"""
+    context = multiprocessing.get_context()
+    ids = IdService(shared=True, context=context) if config["target"] == "python" else None
+    config = dict(config, epoch=time.time())
+    with context.Pool(workers, initializer=_init_worker, initargs=(ids,)) as pool:
+        started = time.perf_counter()
+        results = pool.map(run_worker, [dict(config, worker=i) for i in range(workers)])
+        wall = time.perf_counter() - started
+    return results, wall
+
+
+def summarize(results, wall):
+    """Throughput, latency percentiles (us) and memory growth over all workers"""
+    merged = {op: LatencyHistogram() for op in OPS}
+    created = {"addGame": 0, "addTeam": 0, "addPlayer": 0}
+    for result in results:
+        for op, state in result["histograms"].items():
+            histogram = LatencyHistogram()
+            vars(histogram).update(state)
+            merged[op].merge(histogram)
+        for op, count in result["created"].items():
+            created[op] += count
+
+    latency = {}
+    for op, histogram in merged.items():
+        if histogram.count:
+            latency[op] = {"count": histogram.count, "mean_us": round(histogram.mean_ms * 1000, 3),
+                           "max_us": round(histogram.max_ms * 1000, 3)}
+            for p in PERCENTILES:
+                latency[op][f"p{p:g}_us"] = round(histogram.percentile(p) * 1000, 3)
+
+    first_rss = sum(r["samples"][0]["rss"] or 0 for r in results)
+    last_rss = sum(r["samples"][-1]["rss"] or 0 for r in results)
+    heaps = [r["samples"][-1]["heap"] for r in results if r["samples"][-1]["heap"] is not None]
+    entities = sum(created.values())
+    ops = sum(h.count for h in merged.values())
+    return {"type": "summary", "workers": len(results), "ops": ops, "wall_seconds": round(wall, 3),
+            "ops_per_second": round(ops / wall, 1) if wall else 0.0, "created": created,
+            "latency": latency, "rss_start": first_rss, "rss_end": last_rss,
+            "bytes_per_entity": round((last_rss - first_rss) / entities, 1) if entities else None,
+            "heap_end": sum(heaps) if heaps else None}
+
+
+def write_recording(path, run, results, summary):
+    """Write the JSON-lines recording; returns the number of records"""
+    records = [run]
+    records += sorted((op for r in results for op in r["trace"]), key=lambda record: record["t"])
+    records += sorted((s for r in results for s in r["samples"]), key=lambda record: record["t"])
+    records.append(summary)
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+    return len(records)
+
+
+def load_recording(path):
+    """(run, ops, samples, summary) from a recording file"""
+    run, summary, ops, samples = None, None, [], []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                raise ValueError(f"{path} is not a load-test recording") from None
+            kind = record.get("type") if isinstance(record, dict) else None
+            if kind == "run":
+                run = record
+            elif kind == "op":
+                ops.append(record)
+            elif kind == "sample":
+                samples.append(record)
+            elif kind == "summary":
+                summary = record
+    if run is None:
+        raise ValueError(f"{path} is not a load-test recording")
+    return run, ops, samples, summary
+
+
+def recording_events(path):
+    """Flowchart events for the calls traced in a recording"""
+    run, ops, _, summary = load_recording(path)
+    mix = ", ".join(f"{op}={weight:g}" for op, weight in run["mix"].items())
+    events = [TraceEvent("start", f"Load test: {run['workers']} {run['target']} workers, mix {mix}"),
+              TraceEvent("get_instance", "GameService.getInstance() in every worker")]
+    for op in ops:
+        who = f"[worker {op['worker']}] "
+        name, result = op["name"], op["result"]
+        if op["op"] == "addGame":
+            events.append(TraceEvent("add_game", f"{who}addGame(\"{name}\")"))
+            events.append(TraceEvent("check_game", f"{who}Searching games list for \"{name}\""))
+            if op["created"]:
+                events.append(TraceEvent("create_game", f"{who}new Game(id={result}, name={name})"))
+                events.append(TraceEvent("games_list", f"{who}Game #{result} stored in games list"))
+            else:
+                events.append(TraceEvent("return_game", f"{who}Returned existing Game id={result}"))
+        elif op["op"] == "addTeam":
+            state = "new" if op["created"] else "existing"
+            events.append(TraceEvent("add_team", f"{who}game {op['parent']}.addTeam(\"{name}\") -> {state} id={result}"))
+            if op["created"]:
+                events.append(TraceEvent("id_counters", f"{who}getNextTeamId() -> {result}"))
+        elif op["op"] == "addPlayer":
+            state = "new" if op["created"] else "existing"
+            events.append(TraceEvent("add_player", f"{who}team {op['parent']}.addPlayer(\"{name}\") -> {state} id={result}"))
+            if op["created"]:
+                events.append(TraceEvent("id_counters", f"{who}getNextPlayerId() -> {result}"))
+        else:
+            key = f"\"{name}\"" if op["op"] == "getGameByName" else op["parent"]
+            found = f"Game id={result}" if result else "null"
+            events.append(TraceEvent("check_game", f"{who}getGame({key}) -> {found} in {op['ns'] / 1000:.1f} us"))
+    if summary is not None:
+        events.append(TraceEvent("verify", f"Recorded run: {summary['ops']:,} calls at "
+                                           f"{summary['ops_per_second']:,.0f}/s"))
+    return events
+
+
+class RecordingReplay:
+    """A recording played back through the flowchart's live-trace interface"""
+
+    def __init__(self, path):
+        self.path = path
+        self.pending = deque()
+        self.dropped = 0
+        self.error_message = None
+
+    def start(self):
+        try:
+            self.pending = deque(recording_events(self.path))
+        except (OSError, ValueError, KeyError) as e:
+            self.error_message = str(e)
+            return False
+        return True
+
+    def stop(self):
+        self.pending.clear()
+
+    def next_event(self):
+        return self.pending.popleft() if self.pending else None
+
+    def is_done(self):
+        return not self.pending
+
+
+def format_us(us):
+    if us >= 1000:
+        return f"{us / 1000:.2f} ms"
+    return f"{us:.1f} us"
+
+
+def print_summary(summary, label):
+    print(f"{label}: {summary['workers']} workers, {summary['ops']:,} calls in {summary['wall_seconds']:.2f} s "
+          f"= {summary['ops_per_second']:,.0f} calls/s")
+    created = summary["created"]
+    print(f"Created {created['addGame']:,} games, {created['addTeam']:,} teams, {created['addPlayer']:,} players")
+    print(f"{'operation':15s} {'calls':>10s} {'mean':>10s} " + " ".join(f"{f'p{p:g}':>10s}" for p in PERCENTILES)
+          + f" {'max':>10s}")
+    for op, stats in summary["latency"].items():
+        cells = [format_us(stats[f"p{p:g}_us"]) for p in PERCENTILES]
+        print(f"{op:15s} {stats['count']:10,d} {format_us(stats['mean_us']):>10s} "
+              + " ".join(f"{cell:>10s}" for cell in cells) + f" {format_us(stats['max_us']):>10s}")
+    if summary["rss_end"]:
+        growth = summary["rss_end"] - summary["rss_start"]
+        line = (f"Memory (RSS, all workers): {format_bytes(summary['rss_start'])} -> "
+                f"{format_bytes(summary['rss_end'])} ({'+' if growth >= 0 else '-'}{format_bytes(abs(growth))}")
+        if summary["bytes_per_entity"] is not None:
+            line += f", {summary['bytes_per_entity']:,.0f} bytes per created entity"
+        print(line + ")")
+    if summary["heap_end"] is not None:
+        print(f"Java heap in use at the end: {format_bytes(summary['heap_end'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive GameService-style workloads from a process pool")
+    parser.add_argument("--target", choices=["python", "jar"], default="python",
+                        help="gamingroom Python mirror or GamingRoom.jar via the CommandHarness")
+    parser.add_argument("--workers", type=int, default=4, help="worker processes")
+    parser.add_argument("--ops", type=int, default=200000, help="calls per worker")
+    parser.add_argument("--duration", type=float, default=0, help="stop each worker after this many seconds")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"operation weights (default {DEFAULT_MIX})")
+    parser.add_argument("--name-space", type=int, default=10000,
+                        help="distinct names per kind; smaller values mean more duplicate adds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--trace-ops", type=int, default=DEFAULT_TRACE_OPS, help="calls recorded per worker for replay")
+    parser.add_argument("--sample-interval", type=float, default=DEFAULT_SAMPLE_SECONDS, help="seconds between memory samples")
+    parser.add_argument("--jar", default=JAR_PATH, help="path to GamingRoom.jar")
+    parser.add_argument("--jvm-option", action="append", default=[], help="extra JVM option (repeatable)")
+    parser.add_argument("--record", help="write a JSON-lines recording for the memory and flowchart tabs")
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    config = {"type": "run", "version": RECORDING_VERSION, "target": args.target, "workers": args.workers,
+              "ops": args.ops, "duration": args.duration, "mix": mix, "name_space": args.name_space,
+              "seed": args.seed, "trace_ops": args.trace_ops, "sample_seconds": args.sample_interval,
+              "jar": args.jar, "jvm_options": args.jvm_option}
+    try:
+        results, wall = run_load(config, args.workers)
+    except (FileNotFoundError, RuntimeError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    summary = summarize(results, wall)
+    print_summary(summary, PythonTarget.label if args.target == "python" else JarTarget.label)
+    if args.record:
+        count = write_recording(args.record, dict(config, started=time.time() - wall), results, summary)
+        print(f"Recording: {args.record} ({count:,} records)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+JVM object-layout estimator for the GamingRoom classes
+Reads the field declarations from the Java sources, lays the fields out the way
+HotSpot does (object header, superclass fields first, larger fields first,
+gaps back-filled, size rounded up to the object alignment) and derives
+per-object and whole-graph footprints for Game/Team/Player/GameService.
+
+Graph estimates accept numpy arrays of per-game / per-team counts, so
+millions of hypothetical objects are evaluated in a few vectorised passes.
+Plain Python ints work everywhere without numpy.
+
+Usage:
+    python memory_layout.py                        # layouts + a sample graph
+    python memory_layout.py --jvm large-heap       # 64-bit without compressed oops
+    python memory_layout.py --games 1000 --teams 8 --players 12
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # scalar estimates work without numpy
+    np = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(os.path.dirname(BASE_DIR), "src", "com", "gamingroom")
+
+PRIMITIVE_SIZES = {
+    "long": 8, "double": 8,
+    "int": 4, "float": 4,
+    "short": 2, "char": 2,
+    "byte": 1, "boolean": 1,
+}
+
+# Typical display name length ("Game 1", "Team Alpha", "Player 12")
+DEFAULT_NAME_LENGTH = 8
+
+
+@dataclass(frozen=True)
+class JvmLayout:
+    """64-bit HotSpot layout parameters"""
+    name: str
+    compressed_oops: bool = True
+    compressed_class_pointers: bool = True
+    object_alignment: int = 8
+
+    @property
+    def header_size(self):
+        # 8-byte mark word + class pointer
+        return 8 + (4 if self.compressed_class_pointers else 8)
+
+    @property
+    def reference_size(self):
+        return 4 if self.compressed_oops else 8
+
+    @property
+    def array_base(self):
+        # Header + 4-byte length, elements start 8-byte aligned
+        return align(self.header_size + 4, 8)
+
+    def field_size(self, java_type):
+        return PRIMITIVE_SIZES.get(java_type, self.reference_size)
+
+    def align(self, size):
+        return align(size, self.object_alignment)
+
+
+JVM_LAYOUTS = {
+    "compressed": JvmLayout("64-bit, compressed oops (heap < 32 GB)"),
+    "large-heap": JvmLayout("64-bit, heap >= 32 GB (no compressed oops)", compressed_oops=False),
+    "uncompressed": JvmLayout("64-bit, -XX:-UseCompressedOops -XX:-UseCompressedClassPointers",
+                              compressed_oops=False, compressed_class_pointers=False),
+}
+
+
+def align(size, alignment):
+    """Round size up to a multiple of alignment (ints or numpy arrays)"""
+    return (size + alignment - 1) // alignment * alignment
+
+
+@dataclass
+class JavaField:
+    name: str
+    type: str
+    static: bool = False
+
+
+@dataclass
+class JavaClass:
+    """Field-level view of a class definition"""
+    name: str
+    extends: Optional[str] = None
+    fields: List[JavaField] = field(default_factory=list)
+
+
+# JDK classes the GamingRoom objects point to (JDK 9+ compact strings)
+LIBRARY_CLASSES = [
+    JavaClass("String", None, [JavaField("value", "byte[]"), JavaField("hash", "int"),
+                               JavaField("coder", "byte"), JavaField("hashIsZero", "boolean")]),
+    JavaClass("AbstractList", None, [JavaField("modCount", "int")]),
+    JavaClass("ArrayList", "AbstractList", [JavaField("size", "int"), JavaField("elementData", "Object[]")]),
+]
+
+# ArrayList grows 10, 15, 22, 33, ... (old + old >> 1); an empty list shares one static array
+ARRAYLIST_CAPACITIES = [10]
+while ARRAYLIST_CAPACITIES[-1] < 2 ** 31:
+    ARRAYLIST_CAPACITIES.append(ARRAYLIST_CAPACITIES[-1] + (ARRAYLIST_CAPACITIES[-1] >> 1))
+
+
+CLASS_RE = re.compile(r"\bclass\s+(\w+)(?:\s+extends\s+(\w+))?")
+FIELD_RE = re.compile(
+    r"^\s*((?:(?:private|protected|public|static|final|transient|volatile)\s+)*)"
+    r"([\w.]+(?:\s*<[^;=()]*>)?(?:\s*\[\s*\])*)\s+(\w+)\s*(?:=[^;]*)?;")
+ALLOCATION_RE = re.compile(r"\bnew\s+(\w+)\s*(?:<[^>]*>)?\s*\(")
+
+
+def _strip_comments(source):
+    source = re.sub(r"/\*.*?\*/", lambda m: "\n" * m.group(0).count("\n"), source, flags=re.S)
+    source = re.sub(r'"(?:\\.|[^"\\])*"', '""', source)
+    return re.sub(r"//[^\n]*", "", source)
+
+
+def parse_java_source(source) -> Optional[JavaClass]:
+    """Top-level class name, superclass and field declarations of one source file"""
+    java_class = None
+    depth = 0
+    for line in _strip_comments(source).split("\n"):
+        if java_class is None:
+            match = CLASS_RE.search(line)
+            if match:
+                java_class = JavaClass(match.group(1), match.group(2))
+        elif depth == 1:
+            # Only declarations directly in the class body are fields
+            match = FIELD_RE.match(line)
+            if match and match.group(2) not in ("return", "new"):
+                modifiers = match.group(1).split()
+                java_class.fields.append(JavaField(match.group(3), re.sub(r"\s+", "", match.group(2)),
+                                                   "static" in modifiers))
+        depth += line.count("{") - line.count("}")
+    return java_class
+
+
+def load_project_classes(source_dir=SOURCE_DIR) -> List[JavaClass]:
+    """Parse every .java file in the GamingRoom package"""
+    classes = []
+    for filename in sorted(os.listdir(source_dir)):
+        if filename.endswith(".java"):
+            with open(os.path.join(source_dir, filename), "r", encoding="utf-8") as f:
+                java_class = parse_java_source(f.read())
+            if java_class is not None:
+                classes.append(java_class)
+    return classes
+
+
+@dataclass
+class FieldSlot:
+    name: str
+    type: str
+    offset: int
+    size: int
+    owner: str
+
+
+@dataclass
+class ClassLayout:
+    """Computed instance layout of one class"""
+    name: str
+    header_size: int
+    fields: List[FieldSlot]
+    statics: List[JavaField]
+    field_end: int
+    instance_size: int
+    gaps: List[tuple] = field(default_factory=list)
+
+    @property
+    def padding(self):
+        return self.instance_size - self.header_size - sum(slot.size for slot in self.fields)
+
+    def slot(self, name) -> Optional[FieldSlot]:
+        for slot in self.fields:
+            if slot.name == name:
+                return slot
+        return None
+
+
+def _place(size, gaps, end):
+    """First gap that fits size at its natural alignment, else append; returns (offset, end)"""
+    for i, (start, stop) in enumerate(gaps):
+        offset = align(start, size)
+        if offset + size <= stop:
+            del gaps[i]
+            if start < offset:
+                gaps.insert(i, (start, offset))
+            if offset + size < stop:
+                gaps.append((offset + size, stop))
+            return offset, end
+    offset = align(end, size)
+    if end < offset:
+        gaps.append((end, offset))
+    return offset, offset + size
+
+
+def layout_classes(classes, jvm=JVM_LAYOUTS["compressed"]) -> Dict[str, ClassLayout]:
+    """Lay out every class, superclasses first (gaps are inherited and back-filled)"""
+    by_name = {java_class.name: java_class for java_class in classes}
+    layouts = {}
+
+    def build(name):
+        if name in layouts:
+            return layouts[name]
+        java_class = by_name[name]
+        parent = build(java_class.extends) if java_class.extends in by_name else None
+
+        slots = list(parent.fields) if parent else []
+        gaps = list(parent.gaps) if parent else []
+        end = parent.field_end if parent else jvm.header_size
+
+        # Larger fields first so smaller ones can fill the alignment holes
+        own = [f for f in java_class.fields if not f.static]
+        for java_field in sorted(own, key=lambda f: -jvm.field_size(f.type)):
+            size = jvm.field_size(java_field.type)
+            offset, end = _place(size, gaps, end)
+            slots.append(FieldSlot(java_field.name, java_field.type, offset, size, name))
+
+        layouts[name] = ClassLayout(name, jvm.header_size, sorted(slots, key=lambda s: s.offset),
+                                    [f for f in java_class.fields if f.static], end,
+                                    jvm.align(end), sorted(gaps))
+        return layouts[name]
+
+    for java_class in classes:
+        build(java_class.name)
+    return layouts
+
+
+def _is_list(java_type):
+    return java_type.split("<")[0] in ("List", "ArrayList")
+
+
+class FootprintEstimator:
+    """Per-object and per-graph byte counts for a given JVM layout"""
+
+    def __init__(self, classes=None, jvm=JVM_LAYOUTS["compressed"]):
+        self.jvm = jvm
+        self.classes = classes if classes is not None else load_project_classes()
+        self.layouts = layout_classes(LIBRARY_CLASSES + self.classes, jvm)
+        self.string_size = self.layouts["String"].instance_size
+        self.list_size = self.layouts["ArrayList"].instance_size
+
+    def instance_size(self, class_name):
+        return self.layouts[class_name].instance_size
+
+    def list_fields(self, class_name):
+        return [slot for slot in self.layouts[class_name].fields if _is_list(slot.type)]
+
+    def array_bytes(self, lengths, element_size):
+        return self.jvm.align(self.jvm.array_base + lengths * element_size)
+
+    def string_bytes(self, lengths):
+        """String object + Latin-1 byte[] for strings of the given lengths"""
+        return self.string_size + self.array_bytes(lengths, 1)
+
+    def list_capacity(self, sizes):
+        if np is not None and not isinstance(sizes, int):
+            capacities = np.asarray(ARRAYLIST_CAPACITIES, dtype=np.int64)
+            sizes = np.asarray(sizes, dtype=np.int64)
+            return np.where(sizes > 0, capacities[np.searchsorted(capacities, sizes)], 0)
+        return ARRAYLIST_CAPACITIES[bisect_left(ARRAYLIST_CAPACITIES, sizes)] if sizes > 0 else 0
+
+    def list_bytes(self, sizes):
+        """ArrayList object + its backing array (none until the first add)"""
+        capacity = self.list_capacity(sizes)
+        backing = self.array_bytes(capacity, self.jvm.reference_size)
+        if np is not None and not isinstance(capacity, int):
+            return self.list_size + np.where(capacity > 0, backing, 0)
+        return self.list_size + (backing if capacity else 0)
+
+    def entity_bytes(self, class_name, name_lengths=DEFAULT_NAME_LENGTH, child_counts=0):
+        """Object + its own name String + its own child list (children not included)"""
+        size = self.instance_size(class_name) + self.string_bytes(name_lengths)
+        if self.list_fields(class_name):
+            size = size + self.list_bytes(child_counts)
+        return size
+
+    def graph_footprint(self, teams_per_game, players_per_team, name_length=DEFAULT_NAME_LENGTH):
+        """Retained bytes of a whole GameService graph
+
+        teams_per_game has one entry per game and players_per_team one entry
+        per team (in game order). Both may be lists, numpy arrays or, for a
+        uniform graph, (count, per_item) tuples such as (1000, 8).
+        """
+        game_count, team_count = self._count(teams_per_game), self._count(players_per_team)
+        player_count = self._sum_of(players_per_team, lambda counts: counts)
+
+        footprint = {
+            "GameService": self.instance_size("GameService") + self.list_bytes(game_count),
+            "Game": self._sum_of(teams_per_game, lambda counts: self.entity_bytes("Game", name_length, counts)),
+            "Team": self._sum_of(players_per_team, lambda counts: self.entity_bytes("Team", name_length, counts)),
+            "Player": player_count * self.entity_bytes("Player", name_length),
+        }
+        footprint["total"] = sum(footprint.values())
+        footprint["objects"] = {"Game": game_count, "Team": team_count, "Player": player_count}
+        return footprint
+
+    @staticmethod
+    def _count(counts):
+        return counts[0] if isinstance(counts, tuple) else len(counts)
+
+    @staticmethod
+    def _sum_of(counts, per_item):
+        """Sum per_item(c) over counts: one multiply for a uniform tuple, one
+        vectorised pass for arrays, a plain loop without numpy"""
+        if isinstance(counts, tuple):
+            count, value = counts
+            return count * per_item(value)
+        if np is not None:
+            return int(np.sum(per_item(np.asarray(counts, dtype=np.int64))))
+        return sum(per_item(c) for c in counts)
+
+
+def describe_layout(layout):
+    """Multi-line field table for one class"""
+    lines = [f"{layout.name}: {layout.instance_size} bytes per instance "
+             f"(header {layout.header_size}, fields {sum(s.size for s in layout.fields)}, padding {layout.padding})"]
+    for slot in layout.fields:
+        owner = f"  [{slot.owner}]" if slot.owner != layout.name else ""
+        lines.append(f"  @{slot.offset:<3d} {slot.size}  {slot.type} {slot.name}{owner}")
+    for static in layout.statics:
+        lines.append(f"  static {static.type} {static.name} (in the Class object, not per instance)")
+    return "\n".join(lines)
+
+
+def describe_line(estimator, class_name, line):
+    """Computed memory note for one source line of class_name, or None"""
+    layout = estimator.layouts.get(class_name)
+    if layout is None:
+        return None
+    code = _strip_comments(line)
+    jvm = estimator.jvm
+
+    if CLASS_RE.search(code):
+        if "abstract" in code.split("class")[0]:
+            return (f"Abstract - never instantiated itself. Subclasses start with its "
+                    f"{layout.field_end - layout.header_size} bytes of fields after the "
+                    f"{layout.header_size}-byte header.\n\n" + describe_layout(layout))
+        return describe_layout(layout)
+
+    match = FIELD_RE.match(code)
+    if match:
+        name = match.group(3)
+        if "static" in match.group(1).split():
+            note = (f"Static field: one {jvm.field_size(re.sub(r'[ ]+', '', match.group(2)))}-byte slot "
+                    f"in the {class_name} Class object, shared by all instances.")
+            if _is_list(match.group(2)):
+                note += (f"\nThe list itself: {estimator.list_size} bytes empty, "
+                         f"{estimator.list_bytes(10)} bytes once the first element is added (capacity 10).")
+            return note
+        slot = layout.slot(name)
+        if slot is not None:
+            note = (f"{slot.size}-byte {'reference' if slot.type not in PRIMITIVE_SIZES else slot.type} "
+                    f"at offset {slot.offset} of every {class_name} ({layout.instance_size} bytes per instance).")
+            if slot.type == "String":
+                note += (f"\nThe String it points to: {estimator.string_bytes(DEFAULT_NAME_LENGTH)} bytes "
+                         f"for a {DEFAULT_NAME_LENGTH}-character Latin-1 name.")
+            elif _is_list(slot.type):
+                note += (f"\nArrayList: {estimator.list_size} bytes while empty (shared empty array), "
+                         f"{estimator.list_bytes(1)} bytes after the first add.")
+            return note
+
+    allocations = ALLOCATION_RE.findall(code)
+    if allocations:
+        notes = []
+        for allocated in allocations:
+            if allocated in ("ArrayList",):
+                notes.append(f"new ArrayList: {estimator.list_size} bytes (backing array allocated on first add)")
+            elif allocated in estimator.layouts:
+                size = estimator.instance_size(allocated)
+                lists = len(estimator.list_fields(allocated)) * estimator.list_size
+                note = f"new {allocated}: {size} bytes"
+                if lists:
+                    note += f" + {lists}-byte empty ArrayList = {size + lists} bytes"
+                if estimator.layouts[allocated].slot("name") is not None:
+                    note += " (name String shared with the caller)"
+                notes.append(note)
+            elif allocated == "StringBuilder":
+                notes.append("new StringBuilder: temporary, grows while the text is built")
+        if notes:
+            return "\n".join(notes)
+    return None
+
+
+_estimator = None
+
+
+def default_estimator():
+    """Estimator for the project sources with compressed oops (built once)"""
+    global _estimator
+    if _estimator is None:
+        _estimator = FootprintEstimator()
+    return _estimator
+
+
+def print_report(estimator, games, teams, players):
+    print(f"JVM layout: {estimator.jvm.name}\n")
+    for name in ("Entity", "GameService", "Game", "Team", "Player", "String", "ArrayList"):
+        if name in estimator.layouts:
+            print(describe_layout(estimator.layouts[name]))
+            print()
+
+    started = time.perf_counter()
+    footprint = estimator.graph_footprint((games, teams), (games * teams, players))
+    elapsed = time.perf_counter() - started
+    objects = footprint["objects"]
+    print(f"Graph: {objects['Game']:,} games, {objects['Team']:,} teams, {objects['Player']:,} players "
+          f"(evaluated in {elapsed * 1000:.1f} ms{'' if np is not None else ', numpy not installed'})")
+    for name in ("GameService", "Game", "Team", "Player"):
+        print(f"  {name:12s} {footprint[name]:>14,d} bytes")
+    print(f"  {'total':12s} {footprint['total']:>14,d} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate JVM memory footprints of the GamingRoom classes")
+    parser.add_argument("--jvm", choices=list(JVM_LAYOUTS), default="compressed", help="layout parameters")
+    parser.add_argument("--games", type=int, default=2, help="games in the sample graph")
+    parser.add_argument("--teams", type=int, default=2, help="teams per game")
+    parser.add_argument("--players", type=int, default=2, help="players per team")
+    args = parser.parse_args()
+
+    try:
+        estimator = FootprintEstimator(jvm=JVM_LAYOUTS[args.jvm])
+    except OSError as e:
+        print(f"Error: could not read the Java sources: {e}")
+        sys.exit(1)
+    print_report(estimator, args.games, args.teams, args.players)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+Memory timeline for the memory tab
+Samples a memory source at a fixed interval into a fixed-size NumPy ring
+buffer and plots heap bytes per GamingRoom class as a scrolling stacked strip
+chart. The buffer never grows (10 hours at 1 s per sample is under 3 MB), and
+each new sample only draws its own pixel columns: the chart pixmap is scrolled
+and the exposed strip painted, instead of re-plotting the whole history.
+
+Sources:
+    histogram file   - re-read whenever the file changes (e.g. a jmap -histo loop)
+    running JVM      - jcmd GC.class_histogram on every sample
+    GamingRoom.jar   - object counts from the program output x layout estimates
+    GC log           - heap occupancy after each collection (-Xlog:gc)
+    load-test replay - entity counts recorded by load_generator.py, one per sample
+
+Usage:
+    python memory_timeline.py                      # standalone timeline window
+    python memory_timeline.py --gc-log gc.log
+    python memory_timeline.py --recording loadtest.jsonl --interval 200
+"""
+
+import os
+import sys
+import time
+import argparse
+from collections import deque
+
+import numpy as np
+
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                             QComboBox, QPushButton, QSpinBox, QCheckBox, QFileDialog)
+from PyQt6.QtGui import QPainter, QPixmap, QColor, QFont
+from PyQt6.QtCore import Qt, QTimer, QRect
+
+from heap_histogram import (WATCHED_CLASSES, HistogramCapture, load_histogram,
+                            find_gamingroom_jvms, format_bytes)
+from memory_layout import default_estimator
+from gc_log import GcLogTail
+from trace_capture import TraceCapture, JAR_PATH
+from load_generator import load_recording
+
+# Stacked bottom to top; "other" is everything else on the heap
+SERIES = tuple(WATCHED_CLASSES.values()) + ("other",)
+SERIES_COLORS = {
+    "GameService": "#4a90e2",
+    "Game": "#c4933f",
+    "Team": "#2ecc71",
+    "Player": "#b05bc4",
+    "other": "#555555",
+}
+
+# 10 hours at one sample per second
+DEFAULT_CAPACITY = 36000
+BACKGROUND = "#1e1e1e"
+
+
+class RingBuffer:
+    """Fixed-capacity time series: one timestamp and one row of values per sample
+
+    total counts every sample ever appended, so a reader can ask for
+    "everything after sample k" without the buffer keeping more than
+    capacity rows.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, width=len(SERIES)):
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros((capacity, width), dtype=np.float64)
+        self.total = 0
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    @property
+    def nbytes(self):
+        return self.times.nbytes + self.values.nbytes
+
+    def clear(self):
+        self.total = 0
+
+    def append(self, timestamp, row):
+        slot = self.total % self.capacity
+        self.times[slot] = timestamp
+        self.values[slot] = row
+        self.total += 1
+
+    def last(self, count):
+        """The newest count samples, oldest first (copies)"""
+        count = min(count, len(self))
+        index = np.arange(self.total - count, self.total) % self.capacity
+        return self.times[index], self.values[index]
+
+    def since(self, total):
+        """Samples appended after the reader had seen total of them"""
+        return self.last(self.total - total)
+
+
+def downsample(times, values, buckets):
+    """Keep the sample with the largest stacked total in each of buckets groups"""
+    count = len(times)
+    if count <= buckets:
+        return times, values
+    per_bucket = -(-count // buckets)
+    groups = -(-count // per_bucket)
+    totals = np.full(groups * per_bucket, -np.inf)
+    totals[:count] = values.sum(axis=1)
+    index = totals.reshape(groups, per_bucket).argmax(axis=1) + np.arange(groups) * per_bucket
+    return times[index], values[index]
+
+
+def histogram_row(histogram):
+    """Series row (bytes) from a HeapHistogram"""
+    row = [0.0] * len(SERIES)
+    watched = 0
+    for i, name in enumerate(SERIES[:-1]):
+        entry = histogram.get(name)
+        if entry is not None:
+            row[i] = entry.bytes
+            watched += entry.bytes
+    row[-1] = max(histogram.total_bytes - watched, 0)
+    return row
+
+
+class HistogramFileSource:
+    """Re-reads a histogram file whenever its modification time changes"""
+    label = "Histogram file"
+
+    def __init__(self, path):
+        self.path = path
+        self.mtime = None
+        self.row = None
+
+    def start(self):
+        return os.path.exists(self.path)
+
+    def stop(self):
+        pass
+
+    def sample(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return self.row
+        if mtime != self.mtime:
+            self.mtime = mtime
+            self.row = histogram_row(load_histogram(self.path))
+        return self.row
+
+
+class JvmHistogramSource:
+    """Captures a class histogram from a running JVM for every sample"""
+    label = "Running JVM"
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.capture = HistogramCapture()
+        self.capture.histogram_ready.connect(self._on_histogram)
+        self.capture.error.connect(self._on_error)
+        self.busy = False
+        self.row = None
+        self.error = None        # why the last capture failed, shown next to the sample count
+
+    def start(self):
+        return True
+
+    def stop(self):
+        self.capture.stop()
+
+    def sample(self):
+        # One capture in flight at a time; slow JVMs just produce fewer updates
+        if not self.busy:
+            self.busy = self.capture.start(self.pid)
+        return self.row
+
+    def _on_histogram(self, histogram):
+        self.busy = False
+        self.error = None
+        self.row = histogram_row(histogram)
+
+    def _on_error(self, message):
+        # The next sample tries again rather than waiting forever on a dead capture
+        self.busy = False
+        self.error = message
+
+
+class ProgramOutputSource:
+    """Runs GamingRoom.jar and converts the objects it reports into estimated bytes"""
+    label = "GamingRoom.jar output"
+
+    def __init__(self, jar_path=JAR_PATH):
+        self.capture = TraceCapture(jar_path)
+        # Only the mapper's counters are needed; drop the queued animation events
+        self.capture.events_available.connect(self.capture.pending.clear)
+        self.estimator = default_estimator()
+
+    def start(self):
+        return self.capture.start()
+
+    def stop(self):
+        self.capture.stop()
+
+    def sample(self):
+        mapper = self.capture.mapper
+        return estimated_row(self.estimator, mapper.instances_created,
+                             mapper.max_game_id, mapper.max_team_id, mapper.max_player_id)
+
+
+def estimated_row(estimator, services, games, teams, players, heap=None):
+    """Series row from object counts and layout estimates (leftover heap goes to "other")"""
+    row = [
+        services * estimator.instance_size("GameService"),
+        games * estimator.entity_bytes("Game", child_counts=teams // max(games, 1)),
+        teams * estimator.entity_bytes("Team", child_counts=players // max(teams, 1)),
+        players * estimator.entity_bytes("Player"),
+        0.0,
+    ]
+    if heap is not None:
+        row[-1] = max(heap - sum(row), 0)
+    return row
+
+
+class RecordingSource:
+    """Replays the samples of a load_generator.py recording, one per timeline sample
+
+    Workers are sampled separately, so each step adds up the latest sample of
+    every worker. JAR runs also recorded the Java heap in use, which fills the
+    "other" band.
+    """
+    label = "Load-test recording"
+
+    def __init__(self, path):
+        self.path = path
+        self.samples = deque()
+        self.latest = {}
+        self.estimator = default_estimator()
+
+    def start(self):
+        try:
+            _, _, samples, _ = load_recording(self.path)
+        except (OSError, ValueError):
+            return False
+        self.samples = deque(samples)
+        self.latest = {}
+        return bool(self.samples)
+
+    def stop(self):
+        pass
+
+    def sample(self):
+        if not self.samples:
+            return None
+        record = self.samples.popleft()
+        self.latest[record["worker"]] = record
+        heaps = [r["heap"] for r in self.latest.values() if r.get("heap") is not None]
+        return estimated_row(self.estimator, len(self.latest),
+                             sum(r["games"] for r in self.latest.values()),
+                             sum(r["teams"] for r in self.latest.values()),
+                             sum(r["players"] for r in self.latest.values()),
+                             sum(heaps) if heaps else None)
+
+
+class GcLogSource:
+    """Tails a GC log and reports heap occupancy after the latest collection"""
+    label = "GC log"
+
+    def __init__(self, path):
+        self.tail = GcLogTail(path)
+        self.row = None
+
+    def start(self):
+        return os.path.exists(self.tail.path)
+
+    def stop(self):
+        pass
+
+    def sample(self):
+        # poll() reads at most 1 MB, so a huge existing log cannot stall the UI
+        for event in self.tail.poll():
+            if event.heap_after is not None:
+                self.row = [0.0] * (len(SERIES) - 1) + [float(event.heap_after)]
+        return self.row
+
+
+class TimelineChart(QWidget):
+    """Scrolling stacked strip chart backed by a RingBuffer"""
+
+    def __init__(self, buffer, parent=None):
+        super().__init__(parent)
+        self.buffer = buffer
+        self.px_per_sample = 2
+        self.overview = False
+        self.y_max = 1.0
+        self.drawn_total = 0
+        self.pixmap = QPixmap()
+        self.colors = [QColor(SERIES_COLORS[name]) for name in SERIES]
+        self.setMinimumHeight(220)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def set_overview(self, overview):
+        self.overview = overview
+        self.redraw_all()
+
+    def samples_added(self):
+        """Draw whatever was appended since the last call"""
+        if self.pixmap.isNull() or self.overview:
+            self.redraw_all()
+            return
+
+        new_count = self.buffer.total - self.drawn_total
+        if new_count <= 0:
+            return
+        times, values = self.buffer.since(self.drawn_total)
+        shift = new_count * self.px_per_sample
+        peak = values.sum(axis=1).max() if len(values) else 0
+        if shift >= self.pixmap.width() or peak > self.y_max:
+            self.redraw_all()
+            return
+
+        # Move the existing history left and paint only the exposed strip
+        width = self.pixmap.width()
+        self.pixmap.scroll(-shift, 0, self.pixmap.rect())
+        painter = QPainter(self.pixmap)
+        painter.fillRect(QRect(width - shift, 0, shift, self.pixmap.height()), QColor(BACKGROUND))
+        self.draw_columns(painter, values, width - shift)
+        painter.end()
+        self.drawn_total = self.buffer.total
+        self.update()
+
+    def redraw_all(self):
+        """Full repaint: after a resize, a rescale, or in overview mode"""
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        self.pixmap = QPixmap(self.size())
+        self.pixmap.fill(QColor(BACKGROUND))
+        self.drawn_total = self.buffer.total
+
+        if self.overview:
+            times, values = self.buffer.last(len(self.buffer))
+            times, values = downsample(times, values, self.width())
+            px = self.width() / max(len(values), 1)
+        else:
+            times, values = self.buffer.last(self.width() // self.px_per_sample)
+            px = self.px_per_sample
+
+        if len(values):
+            # Leave headroom so steady growth does not force a rescale every sample
+            self.y_max = max(values.sum(axis=1).max() * 1.25, 1.0)
+        painter = QPainter(self.pixmap)
+        x0 = self.width() - len(values) * px
+        self.draw_columns(painter, values, x0, px)
+        painter.end()
+        self.update()
+
+    def draw_columns(self, painter, values, x0, px=None):
+        px = px or self.px_per_sample
+        height = self.pixmap.height() - 18
+        scale = height / self.y_max
+        # Stack series bottom-up, one vectorised cumulative sum per call
+        tops = np.cumsum(values, axis=1) * scale
+        bottoms = tops - values * scale
+        for column in range(len(values)):
+            x = int(x0 + column * px)
+            w = max(int(x0 + (column + 1) * px) - x, 1)
+            for s in range(values.shape[1]):
+                y_top, y_bottom = int(height - tops[column, s]), int(height - bottoms[column, s])
+                if y_bottom > y_top:
+                    painter.fillRect(x, y_top, w, y_bottom - y_top, self.colors[s])
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.redraw_all()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.pixmap.isNull():
+            painter.fillRect(self.rect(), QColor(BACKGROUND))
+        else:
+            painter.drawPixmap(event.rect(), self.pixmap, event.rect())
+
+        # Scale and legend are drawn on top, never into the history pixmap
+        painter.setFont(QFont("Consolas", 8))
+        painter.setPen(QColor("#aaa"))
+        painter.drawText(6, 14, f"max {format_bytes(self.y_max)}")
+        x = 110
+        for name, color in zip(SERIES, self.colors):
+            painter.fillRect(x, 5, 10, 10, color)
+            painter.setPen(QColor("#ccc"))
+            painter.drawText(x + 14, 14, name)
+            x += 24 + painter.fontMetrics().horizontalAdvance(name)
+        painter.end()
+
+
+class MemoryTimelineWidget(QWidget):
+    """Source selection, sampling timer and the strip chart"""
+
+    SOURCES = ["Histogram file...", "Running GamingRoom JVM", "GamingRoom.jar output", "GC log file...",
+               "Load-test recording..."]
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, parent=None):
+        super().__init__(parent)
+        self.buffer = RingBuffer(capacity)
+        self.source = None
+        self.started_at = None
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.take_sample)
+
+        layout = QVBoxLayout()
+        controls = QHBoxLayout()
+
+        controls.addWidget(QLabel("Source:"))
+        self.source_combo = QComboBox()
+        self.source_combo.addItems(self.SOURCES)
+        controls.addWidget(self.source_combo)
+
+        controls.addWidget(QLabel("Every:"))
+        self.interval_spin = QSpinBox()
+        self.interval_spin.setRange(100, 60000)
+        self.interval_spin.setSingleStep(100)
+        self.interval_spin.setValue(1000)
+        self.interval_spin.setSuffix(" ms")
+        self.interval_spin.valueChanged.connect(self.timer.setInterval)
+        controls.addWidget(self.interval_spin)
+
+        self.start_btn = QPushButton("▶ Start")
+        self.start_btn.clicked.connect(self.toggle_sampling)
+        controls.addWidget(self.start_btn)
+
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(self.clear)
+        controls.addWidget(clear_btn)
+
+        self.overview_check = QCheckBox("Whole history")
+        controls.addWidget(self.overview_check)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.chart = TimelineChart(self.buffer)
+        self.overview_check.toggled.connect(self.chart.set_overview)
+        layout.addWidget(self.chart)
+
+        self.status = QLabel()
+        self.status.setStyleSheet("color: #888;")
+        layout.addWidget(self.status)
+        self.setLayout(layout)
+        self.update_status()
+
+    def make_source(self, index):
+        """Build the selected source (asks for a file where needed)"""
+        if index == 0:
+            path, _ = QFileDialog.getOpenFileName(self, "Histogram File", "", "Class Histogram (*.txt *.histo);;All Files (*)")
+            return HistogramFileSource(path) if path else None
+        if index == 1:
+            jvms = find_gamingroom_jvms()
+            if not jvms:
+                self.status.setText("No running GamingRoom JVM found (jcmd -l)")
+                return None
+            return JvmHistogramSource(jvms[0][0])
+        if index == 2:
+            return ProgramOutputSource()
+        if index == 3:
+            path, _ = QFileDialog.getOpenFileName(self, "GC Log", "", "GC Logs (*.log *.txt);;All Files (*)")
+            return GcLogSource(path) if path else None
+        path, _ = QFileDialog.getOpenFileName(self, "Load-Test Recording", "", "Recordings (*.jsonl);;All Files (*)")
+        return RecordingSource(path) if path else None
+
+    def set_source(self, source):
+        self.stop()
+        self.source = source
+
+    def toggle_sampling(self):
+        if self.timer.isActive():
+            self.stop()
+            return
+        self.source = self.make_source(self.source_combo.currentIndex())
+        self.start()
+
+    def start(self):
+        if self.source is None:
+            return
+        if not self.source.start():
+            self.status.setText(f"Could not start {self.source.label}")
+            self.source = None
+            return
+        self.started_at = self.started_at or time.monotonic()
+        self.timer.start(self.interval_spin.value())
+        self.start_btn.setText("⏸ Stop")
+        self.take_sample()
+
+    def stop(self):
+        self.timer.stop()
+        if self.source is not None:
+            self.source.stop()
+        self.start_btn.setText("▶ Start")
+
+    def clear(self):
+        self.buffer.clear()
+        self.started_at = time.monotonic() if self.timer.isActive() else None
+        self.chart.redraw_all()
+        self.update_status()
+
+    def take_sample(self):
+        row = self.source.sample() if self.source is not None else None
+        if row is None:
+            self.update_status()
+            return
+        self.buffer.append(time.monotonic() - self.started_at, row)
+        self.chart.samples_added()
+        self.update_status()
+
+    def update_status(self):
+        latest = ""
+        if len(self.buffer):
+            _, values = self.buffer.last(1)
+            latest = f" | latest {format_bytes(values[0].sum())}"
+        error = getattr(self.source, "error", None)
+        if error:
+            latest += f" | {error}"
+        self.status.setText(f"{len(self.buffer):,} of {self.buffer.capacity:,} samples "
+                            f"({format_bytes(self.buffer.nbytes)} ring buffer){latest}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sample GamingRoom memory into a scrolling timeline")
+    parser.add_argument("--histogram", help="histogram file to watch")
+    parser.add_argument("--gc-log", help="GC log file to tail")
+    parser.add_argument("--recording", help="load_generator.py recording to replay")
+    parser.add_argument("--interval", type=int, default=1000, help="sampling interval in ms")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    widget = MemoryTimelineWidget()
+    widget.setWindowTitle("GamingRoom Memory Timeline")
+    widget.setStyleSheet("background-color: #2a2a2a; color: #ccc;")
+    widget.interval_spin.setValue(args.interval)
+    widget.resize(900, 360)
+    widget.show()
+
+    if args.histogram:
+        widget.set_source(HistogramFileSource(args.histogram))
+        widget.start()
+    elif args.gc_log:
+        widget.set_source(GcLogSource(args.gc_log))
+        widget.start()
+    elif args.recording:
+        widget.set_source(RecordingSource(args.recording))
+        widget.start()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Prometheus-style metrics for the launcher server
+Counters and histograms keep one shard of values per thread: recording only
+touches the calling thread's own dict, with no lock and no shared cache line,
+and a scrape merges the shards. Gauges that describe current state (running
+children, RSS, uptime) are produced by collector callbacks at scrape time.
+The text output follows the Prometheus exposition format (version 0.0.4).
+
+Usage:
+    from metrics import Registry
+    registry = Registry()
+    requests = registry.counter("launcher_http_requests_total", "HTTP requests", ("path", "status"))
+    requests.inc("/launch", "200")
+    latency = registry.histogram("launcher_http_request_duration_seconds", "Request latency", ("path",))
+    latency.observe(0.0012, "/launch")
+    text = registry.render()
+
+    python metrics.py                      # record a few samples and print the exposition text
+"""
+
+import time
+import bisect
+import threading
+from typing import Callable, Dict, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Launcher requests take well under a millisecond, launches tens of milliseconds
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names, values, extra=()):
+    pairs = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    pairs += [f'{name}="{value}"' for name, value in extra]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+class Shards:
+    """One dict per recording thread; the lock is only taken when a thread records for the first time"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._lock = threading.Lock()
+
+    def local(self):
+        try:
+            return self._local.values
+        except AttributeError:
+            values = self._local.values = {}
+            with self._lock:
+                self._shards.append(values)
+            return values
+
+    def snapshot(self):
+        """Copies of every shard (dict.copy() is atomic under the GIL)"""
+        with self._lock:
+            shards = list(self._shards)
+        return [shard.copy() for shard in shards]
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.shards = Shards()
+
+    def inc(self, *labelvalues, amount=1):
+        values = self.shards.local()
+        values[labelvalues] = values.get(labelvalues, 0) + amount
+
+    def merged(self) -> Dict[tuple, float]:
+        totals = {}
+        for shard in self.shards.snapshot():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def samples(self):
+        for key, value in sorted(self.merged().items()):
+            yield self.name + format_labels(self.labelnames, key), value
+
+
+class Histogram:
+    """Fixed-bucket histogram; each shard counts per bucket and the scrape makes them cumulative"""
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.shards = Shards()
+
+    def observe(self, value, *labelvalues):
+        values = self.shards.local()
+        cells = values.get(labelvalues)
+        if cells is None:
+            # One cell per bucket, one for +Inf, then the sum
+            cells = values[labelvalues] = [0] * (len(self.buckets) + 2)
+        cells[bisect.bisect_left(self.buckets, value)] += 1
+        cells[-1] += value
+
+    def merged(self) -> Dict[tuple, list]:
+        totals = {}
+        for shard in self.shards.snapshot():
+            for key, cells in shard.items():
+                merged = totals.get(key)
+                if merged is None:
+                    totals[key] = list(cells)
+                else:
+                    for i, cell in enumerate(cells):
+                        merged[i] += cell
+        return totals
+
+    def samples(self):
+        for key, cells in sorted(self.merged().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), cells):
+                cumulative += count
+                yield (self.name + "_bucket" + format_labels(self.labelnames, key, (("le", format_value(bound)),)),
+                       cumulative)
+            yield self.name + "_sum" + format_labels(self.labelnames, key), cells[-1]
+            yield self.name + "_count" + format_labels(self.labelnames, key), cumulative
+
+
+class Gauges:
+    """Gauge family whose samples come from a callback at scrape time"""
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames: Sequence[str],
+                 collect: Callable[[], List[Tuple[tuple, float]]]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+
+    def samples(self):
+        for key, value in self.collect():
+            yield self.name + format_labels(self.labelnames, key), value
+
+
+class Registry:
+    """Named metric families rendered together"""
+
+    def __init__(self):
+        self.families = []
+        self.created = time.time()
+
+    def _add(self, family):
+        if any(existing.name == family.name for existing in self.families):
+            raise ValueError(f"metric {family.name} already registered")
+        self.families.append(family)
+        return family
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._add(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._add(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name, documentation, labelnames, collect):
+        """collect() returns [(label values, value), ...]"""
+        return self._add(Gauges(name, documentation, labelnames, collect))
+
+    def render(self):
+        lines = []
+        for family in self.families:
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            lines += [f"{sample} {format_value(value)}" for sample, value in family.samples()]
+        return "\n".join(lines) + "\n"
+
+
+def main():
+    registry = Registry()
+    requests = registry.counter("demo_requests_total", "Requests by path", ("path",))
+    latency = registry.histogram("demo_latency_seconds", "Request latency", ("path",), (0.001, 0.01, 0.1))
+    registry.gauge("demo_uptime_seconds", "Seconds since start", (),
+                   lambda: [((), round(time.time() - registry.created, 3))])
+
+    def work(path, count):
+        for i in range(count):
+            requests.inc(path)
+            latency.observe((i % 50) / 1000, path)
+
+    threads = [threading.Thread(target=work, args=(path, 10000)) for path in ("/a", "/b", "/a")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(registry.render(), end="")
+
+
+if __name__ == "__main__":
+    main()
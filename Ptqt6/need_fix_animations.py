@@ -8,13 +8,38 @@ from PyQt6.QtGui import (QBrush, QColor, QPen, QFont, QPainter, QPolygonF,
                        QPainterPath, QLinearGradient, QRadialGradient)
 from PyQt6.QtCore import (QRectF, Qt, QPointF, QTimer, pyqtSignal,
                         QSequentialAnimationGroup, QParallelAnimationGroup,
-                        pyqtProperty, QLineF)
+                        pyqtProperty, QLineF, QEasingCurve)
 
-class FlowchartNode(QGraphicsRectItem):
+from animation_engine import animator
+from edge_geometry import EdgeEndpointMixin, CachedEdgeMixin, arrow_head_polygon
+from render_profile import ProfiledGraphicsView
+
+# Step sequence for the singleton flow: (node key, status description)
+ANIMATION_SEQUENCE = [
+    ("start", "Starting program execution"),
+    ("main", "Entering main method"),
+    ("get_instance", "Calling getInstance() - first time"),
+    ("check_null", "Checking if instance exists"),
+    ("create_new", "Instance is null, creating new GameService"),
+    ("instance_ready", "Singleton instance created and ready"),
+    ("test_start", "Starting singleton test"),
+    ("get_service1", "Getting first reference to GameService"),
+    ("check_null", "Instance already exists"),
+    ("return_existing", "Returning existing instance"),
+    ("get_service2", "Getting second reference to GameService"),
+    ("compare", "Comparing hashCodes of both references"),
+    ("verify", "Verifying both references point to same object"),
+    ("result", "Test complete: Singleton verified!")
+]
+
+class FlowchartNode(EdgeEndpointMixin, QGraphicsRectItem):
     """Enhanced flowchart node with animations"""
     def __init__(self, text, x, y, width=200, height=60, node_type="process"):
         super().__init__(QRectF(x, y, width, height))
         
+        # Draggable; incident arrows are told when the node moves
+        self.init_endpoint()
+        
         self.node_type = node_type
         self.is_active = False
         
@@ -67,7 +92,7 @@ class FlowchartNode(QGraphicsRectItem):
         self.is_active = False
         self.set_node_style(self.node_type)
 
-class FlowchartArrow(QGraphicsLineItem):
+class FlowchartArrow(CachedEdgeMixin, QGraphicsLineItem):
     """Animated arrow between nodes"""
     def __init__(self, start_node, end_node, label="", arrow_type="straight"):
         super().__init__()
@@ -90,22 +115,26 @@ class FlowchartArrow(QGraphicsLineItem):
             self.label_item.setDefaultTextColor(QColor("#888"))
             self.label_item.setFont(QFont("Arial", 9))
         
-        self.update_position()
+        # Register with both endpoints and compute the initial geometry
+        self.init_edge(start_node, end_node)
+        self.ensure_geometry()
         
+    def start_rect(self):
+        return self.start_node.scene_rect()
+    
+    def end_rect(self):
+        return self.end_node.scene_rect()
+    
     def update_position(self):
         """Update arrow position based on connected nodes"""
-        start_rect = self.start_node.rect()
-        end_rect = self.end_node.rect()
-        
+        self.mark_geometry_dirty()
+        self.ensure_geometry()
+    
+    def compute_geometry(self, start_rect, end_rect):
+        """Recompute line, arrow head and label after an endpoint changed"""
         # Calculate connection points
-        start_point = QPointF(
-            start_rect.x() + start_rect.width() / 2,
-            start_rect.y() + start_rect.height()
-        )
-        end_point = QPointF(
-            end_rect.x() + end_rect.width() / 2,
-            end_rect.y()
-        )
+        start_point = QPointF(start_rect.center().x(), start_rect.bottom())
+        end_point = QPointF(end_rect.center().x(), end_rect.top())
         
         # Set line
         self.setLine(QLineF(start_point, end_point))
@@ -123,37 +152,7 @@ class FlowchartArrow(QGraphicsLineItem):
     
     def update_arrow_head(self):
         """Update arrow head polygon"""
-        line = self.line()
-        angle = line.angle()
-        
-        # Arrow head size
-        arrow_length = 12
-        arrow_degrees = 25
-        
-        # Calculate arrow points
-        end_point = line.p2()
-        
-        # Convert angle to radians
-        import math
-        angle_rad = math.radians(angle)
-        
-        # Calculate arrow wings
-        wing1_angle = math.radians(angle - 180 - arrow_degrees)
-        wing2_angle = math.radians(angle - 180 + arrow_degrees)
-        
-        point1 = end_point
-        point2 = QPointF(
-            end_point.x() + arrow_length * math.cos(wing1_angle),
-            end_point.y() + arrow_length * math.sin(wing1_angle)
-        )
-        point3 = QPointF(
-            end_point.x() + arrow_length * math.cos(wing2_angle),
-            end_point.y() + arrow_length * math.sin(wing2_angle)
-        )
-        
-        # Create arrow polygon
-        arrow_polygon = QPolygonF([point1, point2, point3])
-        self.arrow_head.setPolygon(arrow_polygon)
+        self.arrow_head.setPolygon(arrow_head_polygon(self.line(), length=12, degrees=25))
     
     def animate_flow(self):
         """Animate data flow along the arrow"""
@@ -164,31 +163,18 @@ class FlowchartArrow(QGraphicsLineItem):
         
         # Add to scene
         if self.scene():
+            self.ensure_geometry()
             self.scene().addItem(flow_item)
             
-            # Animate along the line
+            # Animate along the line on the shared tick; the dot is removed when it arrives
             line = self.line()
             
-            # Create a timer to move the item along the path
-            steps = 20
-            current_step = 0
+            def remove_flow():
+                if flow_item.scene():
+                    flow_item.scene().removeItem(flow_item)
             
-            def move_flow():
-                nonlocal current_step
-                if current_step <= steps:
-                    t = current_step / steps
-                    x = line.p1().x() + t * (line.p2().x() - line.p1().x())
-                    y = line.p1().y() + t * (line.p2().y() - line.p1().y())
-                    flow_item.setPos(x - 5, y - 5)
-                    current_step += 1
-                else:
-                    timer.stop()
-                    if self.scene():
-                        self.scene().removeItem(flow_item)
-            
-            timer = QTimer()
-            timer.timeout.connect(move_flow)
-            timer.start(50)  # 50ms interval for smooth animation
+            animator().animate(flow_item, "pos", line.p2(), duration=1000, start=line.p1(),
+                               easing=QEasingCurve.Type.Linear, on_finished=remove_flow)
 
 class AnimatedFlowchartWidget(QWidget):
     """Widget containing the animated flowchart"""
@@ -238,8 +224,7 @@ class AnimatedFlowchartWidget(QWidget):
         self.scene = QGraphicsScene()
         self.scene.setSceneRect(0, 0, 1000, 800)
         
-        self.view = QGraphicsView(self.scene)
-        self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.view = ProfiledGraphicsView(self.scene)
         layout.addWidget(self.view)
         
         # Status label
@@ -304,28 +289,16 @@ class AnimatedFlowchartWidget(QWidget):
         explanation.setDefaultTextColor(QColor("#888"))
         explanation.setFont(QFont("Arial", 10))
         self.scene.addItem(explanation)
+        
+        # Cache the new items according to the view's rendering profile
+        self.view.refresh_item_cache()
     
     def play_full_animation(self):
         """Play the complete animation sequence"""
         self.reset_animation()
         
         # Define animation sequence
-        self.animation_sequence = [
-            ("start", "Starting program execution"),
-            ("main", "Entering main method"),
-            ("get_instance", "Calling getInstance() - first time"),
-            ("check_null", "Checking if instance exists"),
-            ("create_new", "Instance is null, creating new GameService"),
-            ("instance_ready", "Singleton instance created and ready"),
-            ("test_start", "Starting singleton test"),
-            ("get_service1", "Getting first reference to GameService"),
-            ("check_null", "Instance already exists"),
-            ("return_existing", "Returning existing instance"),
-            ("get_service2", "Getting second reference to GameService"),
-            ("compare", "Comparing hashCodes of both references"),
-            ("verify", "Verifying both references point to same object"),
-            ("result", "Test complete: Singleton verified!")
-        ]
+        self.animation_sequence = list(ANIMATION_SEQUENCE)
         
         # Create timer for sequential animation
         self.animation_timer = QTimer()
@@ -388,11 +361,7 @@ class AnimatedFlowchartWidget(QWidget):
     def next_step(self):
         """Execute next step manually"""
         if not hasattr(self, 'animation_sequence'):
-            self.animation_sequence = [
-                ("start", "Starting program execution"),
-                ("main", "Entering main method"),
-                # ... (same as in play_full_animation)
-            ]
+            self.animation_sequence = list(ANIMATION_SEQUENCE)
             self.current_step = 0
         
         if self.current_step < len(self.animation_sequence):
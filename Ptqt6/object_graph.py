@@ -0,0 +1,658 @@
+#!/usr/bin/env python3
+"""
+Object-graph view of GameService -> Game -> Team -> Player
+Builds the containment tree from program output, a roster CSV, a heap
+histogram or a synthetic size, stores it in flat typed arrays (kind, id,
+parent, name offset, CSR child index) and draws only what has been opened:
+each expanded node shows its first few children followed by one aggregate
+"+N more" node, and children are laid out when clicked. A service holding
+100k games and millions of players costs under 40 bytes per object and a
+few hundred scene items.
+
+Sources:
+    program output  - Game/Team/Player toString() lines printed by GamingRoom.jar
+    roster CSV      - game,team,player rows (one player per row)
+    snapshot        - a gamingroom.snapshot file, mapped and shown without copying
+    histogram       - jmap -histo / jcmd GC.class_histogram counts only
+    synthetic       - uniform graph of a given size for capacity checks
+
+Usage:
+    python object_graph.py                              # run GamingRoom.jar and show its objects
+    python object_graph.py roster.csv
+    python object_graph.py --games 100000 --teams 10 --players 3
+"""
+
+import os
+import sys
+import csv
+import time
+import argparse
+import subprocess
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QSpinBox, QFileDialog, QGraphicsScene, QGraphicsRectItem,
+                             QGraphicsSimpleTextItem, QGraphicsPathItem)
+from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QFontMetrics, QPainterPath
+from PyQt6.QtCore import Qt, QPointF
+
+from animation_engine import animator
+from heap_histogram import load_histogram, format_bytes
+from render_profile import ProfiledGraphicsView
+from trace_capture import GAME_RE, TEAM_RE, PLAYER_RE, jar_command
+from gamingroom.snapshot import is_snapshot, load_snapshot
+
+# Node kinds (one byte per node); GROUP holds objects whose owner the source does not show
+SERVICE, GAME, TEAM, PLAYER, GROUP = range(5)
+KIND_NAMES = ("GameService", "Game", "Team", "Player", "Group")
+KIND_COLORS = ("#4a90e2", "#c4933f", "#2ecc71", "#b05bc4", "#555555")
+
+# Children drawn when a node is first opened, and per click on its "+N more" node
+PAGE_SIZE = 8
+ROW_HEIGHT = 34
+COLUMN_WIDTH = 230
+NODE_WIDTH = 190
+NODE_HEIGHT = 26
+# Largest synthetic graph (~40 bytes per node, so about 1 GB of arrays)
+MAX_SYNTHETIC_NODES = 25_000_000
+
+
+class ObjectTree:
+    """Array-backed containment tree
+
+    Nodes are numbered in insertion order and a parent is always added
+    before its children, so subtree sizes come from one reverse pass.
+    Children are kept in CSR form: the children of node i are
+    child_index[first_child[i]:first_child[i + 1]].
+    """
+
+    def __init__(self, kinds, ids, parents, name_blob=b"", name_offsets=None, counts=None, index=None):
+        self.kinds = kinds
+        self.ids = ids
+        self.parents = parents
+        # A memoryview (e.g. into a mapped snapshot) is used in place
+        self.name_blob = name_blob if isinstance(name_blob, (bytes, memoryview)) else bytes(name_blob)
+        self.name_offsets = name_offsets if name_offsets is not None else array("q", bytes(8 * (len(kinds) + 1)))
+        # Aggregate nodes standing for many objects (e.g. histogram counts): node -> count
+        self.counts = counts or {}
+        if index is None:
+            self.build_index()
+        else:
+            self.roots, self.first_child, self.child_index, self.subtree_sizes = index
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def build_index(self):
+        """CSR child index (counting sort by parent) and subtree sizes"""
+        n = len(self.parents)
+        first_child = array("i", bytes(4 * (n + 1)))
+        roots = []
+        for node, parent in enumerate(self.parents):
+            if parent >= 0:
+                first_child[parent + 1] += 1
+            else:
+                roots.append(node)
+        total = 0
+        for i in range(n + 1):
+            total += first_child[i]
+            first_child[i] = total
+
+        cursor = array("i", first_child)
+        child_index = array("i", bytes(4 * total))
+        for node, parent in enumerate(self.parents):
+            if parent >= 0:
+                child_index[cursor[parent]] = node
+                cursor[parent] += 1
+
+        sizes = array("q", [1]) * n
+        for node, count in self.counts.items():
+            sizes[node] = count
+        for node in range(n - 1, 0, -1):
+            parent = self.parents[node]
+            if parent >= 0:
+                sizes[parent] += sizes[node]
+
+        self.roots = roots
+        self.first_child = first_child
+        self.child_index = child_index
+        self.subtree_sizes = sizes
+
+    @property
+    def nbytes(self):
+        arrays = (self.kinds, self.ids, self.parents, self.name_offsets,
+                  self.first_child, self.child_index, self.subtree_sizes)
+        # range child indexes (level-ordered trees) take no memory
+        return sum(getattr(a, "itemsize", 0) * len(a) for a in arrays) + len(self.name_blob)
+
+    def child_count(self, node):
+        return self.first_child[node + 1] - self.first_child[node]
+
+    def children(self, node, start=0, stop=None):
+        begin = self.first_child[node]
+        end = self.first_child[node + 1]
+        stop = end if stop is None else min(begin + stop, end)
+        return self.child_index[begin + start:stop]
+
+    def name(self, node):
+        return str(self.name_blob[self.name_offsets[node]:self.name_offsets[node + 1]], "utf-8")
+
+    def label(self, node):
+        kind = KIND_NAMES[self.kinds[node]]
+        if node in self.counts:
+            return f"{kind} x {self.counts[node]:,}"
+        name = self.name(node)
+        if self.kinds[node] in (SERVICE, GROUP):
+            return name or kind
+        return f"{name or kind} [id={self.ids[node]}]"
+
+    def objects_below(self, node, start=0):
+        """Objects in the subtrees of node's children from start on"""
+        return sum(self.subtree_sizes[child] for child in self.children(node, start))
+
+
+class TreeBuilder:
+    """Appends nodes into the flat arrays an ObjectTree is built from"""
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.ids = array("q")
+        self.parents = array("i")
+        self.names = bytearray()
+        self.name_offsets = array("q", [0])
+        self.counts = {}
+
+    def add(self, kind, entity_id=0, name="", parent=-1, count=None):
+        """Add a node under an existing parent; returns its index"""
+        node = len(self.kinds)
+        if parent >= node:
+            raise ValueError("parent must be added before its children")
+        self.kinds.append(kind)
+        self.ids.append(entity_id)
+        self.parents.append(parent)
+        if name:
+            self.names += name.encode("utf-8")
+        self.name_offsets.append(len(self.names))
+        if count is not None:
+            self.counts[node] = count
+        return node
+
+    def build(self) -> ObjectTree:
+        return ObjectTree(self.kinds, self.ids, self.parents, self.names, self.name_offsets, self.counts)
+
+
+def tree_from_output(lines: Iterable[str]) -> ObjectTree:
+    """Tree from ProgramDriver output (Game/Team/Player toString() listings)
+
+    Containment is only known where the output nests it: the "Teams:" list
+    of a printed Game and the "Players:" list of a printed Team. Teams and
+    players printed on their own are kept under a group node.
+    """
+    games: Dict[int, str] = {}
+    teams: Dict[int, Tuple[str, Optional[int]]] = {}
+    players: Dict[int, Tuple[str, Optional[int]]] = {}
+    # Objects whose nested "Teams:" / "Players:" listing is being read
+    listing_game = listing_team = None
+    current_game = current_team = None
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        stripped = line.strip()
+        nested = line[:1].isspace()
+        if stripped == "Teams:":
+            listing_game = current_game
+            continue
+        if stripped == "Players:":
+            listing_team = current_team
+            continue
+
+        match = GAME_RE.match(stripped)
+        if match:
+            current_game, current_team = int(match.group(1)), None
+            listing_game = listing_team = None
+            games[current_game] = match.group(2)
+            continue
+
+        match = TEAM_RE.match(stripped)
+        if match:
+            team_id = int(match.group(1))
+            if not nested:
+                current_game = listing_game = None
+            owner = listing_game if listing_game is not None else teams.get(team_id, (None, None))[1]
+            teams[team_id] = (match.group(2), owner)
+            current_team, listing_team = team_id, None
+            continue
+
+        match = PLAYER_RE.match(stripped)
+        if match:
+            player_id = int(match.group(1))
+            if not nested:
+                listing_team = None
+            owner = listing_team if listing_team is not None else players.get(player_id, (None, None))[1]
+            players[player_id] = (match.group(2), owner)
+
+    builder = TreeBuilder()
+    root = builder.add(SERVICE, name="GameService")
+    game_nodes = {game_id: builder.add(GAME, game_id, name, root) for game_id, name in sorted(games.items())}
+
+    groups = {}
+
+    def group(kind_name):
+        if kind_name not in groups:
+            groups[kind_name] = builder.add(GROUP, name=f"{kind_name} (owner not printed)", parent=root)
+        return groups[kind_name]
+
+    team_nodes = {}
+    for team_id, (name, game_id) in sorted(teams.items()):
+        parent = game_nodes.get(game_id)
+        team_nodes[team_id] = builder.add(TEAM, team_id, name, parent if parent is not None else group("Teams"))
+    for player_id, (name, team_id) in sorted(players.items()):
+        parent = team_nodes.get(team_id)
+        builder.add(PLAYER, player_id, name, parent if parent is not None else group("Players"))
+    return builder.build()
+
+
+def tree_from_roster(path) -> ObjectTree:
+    """Tree from a game,team,player CSV (one player per row, header optional)
+
+    Games and teams are matched by name ignoring case, as addGame() and
+    addTeam() do, and numbered in first-seen order like the Java ID counters.
+    """
+    builder = TreeBuilder()
+    root = builder.add(SERVICE, name="GameService")
+    games: Dict[str, int] = {}
+    teams: Dict[Tuple[int, str], int] = {}
+    next_ids = {GAME: 1, TEAM: 1, PLAYER: 1}
+
+    def add(kind, name, parent):
+        node = builder.add(kind, next_ids[kind], name, parent)
+        next_ids[kind] += 1
+        return node
+
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if len(row) < 3 or not row[0].strip():
+                continue
+            game_name, team_name, player_name = (cell.strip() for cell in row[:3])
+            if (game_name.lower(), team_name.lower(), player_name.lower()) == ("game", "team", "player"):
+                continue  # header
+
+            game = games.get(game_name.lower())
+            if game is None:
+                game = games[game_name.lower()] = add(GAME, game_name, root)
+            team = teams.get((game, team_name.lower()))
+            if team is None:
+                team = teams[(game, team_name.lower())] = add(TEAM, team_name, game)
+            if player_name:
+                add(PLAYER, player_name, team)
+    return builder.build()
+
+
+def tree_from_histogram(histogram) -> ObjectTree:
+    """Aggregate nodes from class counts (a histogram has no references, so no nesting)"""
+    builder = TreeBuilder()
+    service = histogram.get("GameService")
+    root = builder.add(SERVICE, name="GameService",
+                       count=service.instances if service is not None and service.instances != 1 else None)
+    for kind in (GAME, TEAM, PLAYER):
+        entry = histogram.get(KIND_NAMES[kind])
+        if entry is not None:
+            builder.add(kind, parent=root, count=entry.instances)
+    return builder.build()
+
+
+def synthetic_tree(games, teams_per_game, players_per_team) -> ObjectTree:
+    """Uniform graph numbered like the Java ID counters (names are left empty)
+
+    Nodes are laid out level by level, so every parent's children are
+    already contiguous and the CSR index is written directly instead of sorted.
+    """
+    team_count = games * teams_per_game
+    player_count = team_count * players_per_team
+    n = 1 + games + team_count + player_count
+    if n > MAX_SYNTHETIC_NODES:
+        raise ValueError(f"{n:,} nodes is more than the synthetic graph limit of {MAX_SYNTHETIC_NODES:,}")
+    first_team = 1 + games
+    first_player = first_team + team_count
+
+    kinds = array("B", [SERVICE]) + array("B", [GAME]) * games + array("B", [TEAM]) * team_count \
+        + array("B", [PLAYER]) * player_count
+    ids = array("q", [0])
+    ids.extend(range(1, games + 1))
+    ids.extend(range(1, team_count + 1))
+    ids.extend(range(1, player_count + 1))
+
+    parents = array("i", [-1]) + array("i", [0]) * games
+    for game in range(1, first_team):
+        parents.extend(array("i", [game]) * teams_per_game)
+    for team in range(first_team, first_player):
+        parents.extend(array("i", [team]) * players_per_team)
+
+    # Offsets into child_index, whose entries are simply nodes 1..n-1
+    first_child = array("i", [0])
+    first_child.extend(range(first_team - 1, first_player - 1, teams_per_game) if teams_per_game
+                       else [first_team - 1] * games)
+    first_child.extend(range(first_player - 1, n - 1, players_per_team) if players_per_team
+                       else [first_player - 1] * team_count)
+    first_child.extend(array("i", [n - 1]) * (player_count + 1))
+    child_index = array("i", range(1, n))
+
+    team_size = 1 + players_per_team
+    game_size = 1 + teams_per_game * team_size
+    sizes = array("q", [n]) + array("q", [game_size]) * games + array("q", [team_size]) * team_count \
+        + array("q", [1]) * player_count
+    return ObjectTree(kinds, ids, parents, name_offsets=array("q", bytes(8 * (n + 1))),
+                      index=([0], first_child, child_index, sizes))
+
+
+def tree_from_snapshot(path) -> ObjectTree:
+    """Tree over a mapped gamingroom snapshot: its columns are used in place, nothing is copied
+
+    Snapshot rows are node numbers already (row 0 is the GameService root,
+    same kind codes) and children are contiguous rows, so the CSR child
+    index is the identity.
+    """
+    world = load_snapshot(path)
+    index = ([0], world.first_child, range(len(world) + 1), world.subtree_sizes)
+    return ObjectTree(world.kinds, world.ids, world.parents, world.names, world.name_offsets, index=index)
+
+
+def looks_like_histogram(path):
+    with open(path, "rb") as f:
+        head = f.read(4096)
+    return b"#instances" in head or b"#bytes" in head
+
+
+def load_tree(path) -> ObjectTree:
+    """Pick the loader from the file: snapshot, CSV roster, class histogram or program output"""
+    if is_snapshot(path):
+        return tree_from_snapshot(path)
+    if path.lower().endswith(".csv"):
+        return tree_from_roster(path)
+    if looks_like_histogram(path):
+        return tree_from_histogram(load_histogram(path))
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return tree_from_output(f)
+
+
+def run_program_output() -> List[str]:
+    """Run GamingRoom.jar and return its output lines"""
+    result = subprocess.run(jar_command(), capture_output=True, text=True, timeout=60)
+    return result.stdout.splitlines()
+
+
+class TreeNodeItem(QGraphicsRectItem):
+    """One visible tree row: a real node or a "+N more" aggregate"""
+
+    def __init__(self, key, text, color, on_click):
+        super().__init__(0, 0, NODE_WIDTH, NODE_HEIGHT)
+        self.key = key
+        self.on_click = on_click
+        self.press_pos = None
+        self.setBrush(QBrush(QColor(color)))
+        self.setPen(QPen(QColor("#ddd"), 1))
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.text = QGraphicsSimpleTextItem(self)
+        self.text.setBrush(QBrush(QColor("white")))
+        self.text.setFont(QFont("Consolas", 8))
+        self.text.setPos(6, 6)
+        self.set_text(text)
+
+    def set_text(self, text):
+        # Elide long names; the full label is in the tooltip
+        metrics = QFontMetrics(self.text.font())
+        self.text.setText(metrics.elidedText(text, Qt.TextElideMode.ElideRight, NODE_WIDTH - 12))
+
+    def mousePressEvent(self, event):
+        self.press_pos = event.scenePos()
+        event.accept()
+
+    def mouseReleaseEvent(self, event):
+        # Treat as a click only when the mouse has not been dragged
+        if self.press_pos is not None and (event.scenePos() - self.press_pos).manhattanLength() < 3:
+            self.on_click(self.key, event.modifiers())
+        self.press_pos = None
+
+
+class ObjectGraphView(ProfiledGraphicsView):
+    """Lazily expanded tree: only opened nodes and their first pages of children are items"""
+
+    def __init__(self, parent=None):
+        self.graph_scene = QGraphicsScene()
+        super().__init__(self.graph_scene, parent)
+        self.setBackgroundBrush(QBrush(QColor("#1e1e1e")))
+        self.tree = None
+        self.expanded = set()
+        self.shown: Dict[int, int] = {}
+        self.items: Dict[tuple, TreeNodeItem] = {}
+        self.more_sizes: Dict[Tuple[int, int], int] = {}
+        self.edges = QGraphicsPathItem()
+        self.edges.setPen(QPen(QColor("#666"), 1))
+        self.edges.setZValue(-1)
+        self.graph_scene.addItem(self.edges)
+
+    def set_tree(self, tree):
+        for item in self.items.values():
+            animator().stop(item)
+            self.graph_scene.removeItem(item)
+        self.items.clear()
+        self.more_sizes.clear()
+        self.tree = tree
+        self.expanded = set()
+        self.shown = {}
+        for root in tree.roots:
+            self.expand(root)
+        self.relayout()
+
+    def expand(self, node):
+        self.expanded.add(node)
+        self.shown.setdefault(node, min(PAGE_SIZE, self.tree.child_count(node)))
+
+    def visible_rows(self):
+        """(key, depth) in display order: depth-first over expanded nodes only"""
+        tree = self.tree
+        rows = []
+        stack = [(("node", root), 0) for root in reversed(tree.roots)]
+        while stack:
+            key, depth = stack.pop()
+            rows.append((key, depth))
+            kind, node = key
+            if kind == "more" or node not in self.expanded:
+                continue
+            shown = self.shown[node]
+            if tree.child_count(node) > shown:
+                stack.append((("more", node), depth + 1))
+            for child in reversed(tree.children(node, 0, shown)):
+                stack.append((("node", child), depth + 1))
+        return rows
+
+    def row_text(self, key):
+        tree = self.tree
+        kind, node = key
+        if kind == "more":
+            shown = self.shown[node]
+            remaining = tree.child_count(node) - shown
+            # The sum covers up to every sibling once, so cache it per page
+            if (node, shown) not in self.more_sizes:
+                self.more_sizes[(node, shown)] = tree.objects_below(node, shown)
+            return f"+{remaining:,} more ({self.more_sizes[(node, shown)]:,} objects)"
+        count = tree.child_count(node)
+        marker = "" if not count else ("▾ " if node in self.expanded else "▸ ")
+        return marker + tree.label(node)
+
+    def tooltip(self, key):
+        tree = self.tree
+        kind, node = key
+        if kind == "more":
+            return "Click to show more, Shift+click to show all (up to 500 at a time)"
+        lines = [f"{KIND_NAMES[tree.kinds[node]]}: {tree.label(node)}", f"{tree.child_count(node):,} children",
+                 f"{tree.subtree_sizes[node]:,} objects in subtree"]
+        return "\n".join(lines)
+
+    def relayout(self):
+        rows = self.visible_rows()
+        seen = set()
+        path = QPainterPath()
+        positions = {}
+        for row, (key, depth) in enumerate(rows):
+            seen.add(key)
+            pos = QPointF(depth * COLUMN_WIDTH, row * ROW_HEIGHT)
+            positions[key] = pos
+            item = self.items.get(key)
+            color = "#333333" if key[0] == "more" else KIND_COLORS[self.tree.kinds[key[1]]]
+            if item is None:
+                item = TreeNodeItem(key, self.row_text(key), color, self.on_item_clicked)
+                item.setPos(pos)
+                self.graph_scene.addItem(item)
+                self.items[key] = item
+                animator().animate(item, "opacity", 1.0, start=0.0, duration=200)
+            else:
+                item.set_text(self.row_text(key))
+                if item.pos() != pos:
+                    animator().animate(item, "pos", pos, duration=200)
+            item.setToolTip(self.tooltip(key))
+
+            # Elbow from the parent's left edge down and across to this row
+            if depth:
+                parent_key = ("node", key[1] if key[0] == "more" else self.tree.parents[key[1]])
+                parent_pos = positions[parent_key]
+                x = parent_pos.x() + 12
+                path.moveTo(x, parent_pos.y() + NODE_HEIGHT)
+                path.lineTo(x, pos.y() + NODE_HEIGHT / 2)
+                path.lineTo(pos.x(), pos.y() + NODE_HEIGHT / 2)
+
+        for key in [key for key in self.items if key not in seen]:
+            item = self.items.pop(key)
+            animator().stop(item)
+            self.graph_scene.removeItem(item)
+
+        self.edges.setPath(path)
+        self.graph_scene.setSceneRect(self.graph_scene.itemsBoundingRect().adjusted(-20, -20, 20, 20))
+        self.refresh_item_cache()
+
+    def on_item_clicked(self, key, modifiers):
+        kind, node = key
+        if kind == "more":
+            step = 500 if modifiers & Qt.KeyboardModifier.ShiftModifier else PAGE_SIZE * 4
+            self.shown[node] = min(self.shown[node] + step, self.tree.child_count(node))
+        elif node in self.expanded:
+            self.expanded.discard(node)
+        elif self.tree.child_count(node):
+            self.expand(node)
+        else:
+            return
+        self.relayout()
+
+
+class ObjectGraphWidget(QWidget):
+    """Source buttons above an ObjectGraphView"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout()
+        controls = QHBoxLayout()
+
+        run_btn = QPushButton("▶ From GamingRoom.jar")
+        run_btn.clicked.connect(self.load_program_output)
+        controls.addWidget(run_btn)
+
+        open_btn = QPushButton("📂 Open...")
+        open_btn.setToolTip("Roster CSV (game,team,player), saved program output or a class histogram")
+        open_btn.clicked.connect(self.open_file)
+        controls.addWidget(open_btn)
+
+        controls.addWidget(QLabel("Synthetic:"))
+        self.games_spin = self.make_spin(1, 1000000, 100000, " games")
+        self.teams_spin = self.make_spin(0, 1000, 10, " teams/game")
+        self.players_spin = self.make_spin(0, 1000, 3, " players/team")
+        for spin in (self.games_spin, self.teams_spin, self.players_spin):
+            controls.addWidget(spin)
+        build_btn = QPushButton("Build")
+        build_btn.clicked.connect(self.build_synthetic)
+        controls.addWidget(build_btn)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.view = ObjectGraphView()
+        layout.addWidget(self.view)
+
+        self.status = QLabel("Click a node to expand it, \"+N more\" to page through its children")
+        self.status.setStyleSheet("color: #888;")
+        layout.addWidget(self.status)
+        self.setLayout(layout)
+
+    def make_spin(self, low, high, value, suffix):
+        spin = QSpinBox()
+        spin.setRange(low, high)
+        spin.setValue(value)
+        spin.setSuffix(suffix)
+        return spin
+
+    def set_tree(self, tree, source, elapsed=None):
+        self.view.set_tree(tree)
+        timing = f" in {elapsed * 1000:.0f} ms" if elapsed is not None else ""
+        self.status.setText(f"{source}: {len(tree):,} nodes, {format_bytes(tree.nbytes)} of arrays{timing}")
+
+    def load_program_output(self):
+        try:
+            lines = run_program_output()
+        except (OSError, subprocess.SubprocessError) as e:
+            self.status.setText(f"Could not run GamingRoom.jar: {e}")
+            return
+        self.set_tree(tree_from_output(lines), "GamingRoom.jar output")
+
+    def open_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open Object Source", "",
+                                              "Snapshots, rosters and dumps (*.grsnap *.csv *.txt *.log *.histo);;"
+                                              "All Files (*)")
+        if path:
+            self.load_file(path)
+
+    def load_file(self, path):
+        started = time.perf_counter()
+        try:
+            tree = load_tree(path)
+        except (OSError, ValueError, csv.Error) as e:
+            self.status.setText(f"Could not load {os.path.basename(path)}: {e}")
+            return
+        self.set_tree(tree, os.path.basename(path), time.perf_counter() - started)
+
+    def build_synthetic(self):
+        started = time.perf_counter()
+        try:
+            tree = synthetic_tree(self.games_spin.value(), self.teams_spin.value(), self.players_spin.value())
+        except (ValueError, MemoryError, OverflowError) as e:
+            self.status.setText(f"Could not build the synthetic graph: {str(e) or type(e).__name__}")
+            return
+        self.set_tree(tree, "Synthetic graph", time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Browse a GameService object graph")
+    parser.add_argument("file", nargs="?", help="roster CSV, saved program output or class histogram")
+    parser.add_argument("--games", type=int, help="build a synthetic graph with this many games")
+    parser.add_argument("--teams", type=int, default=10, help="teams per game (synthetic)")
+    parser.add_argument("--players", type=int, default=3, help="players per team (synthetic)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    widget = ObjectGraphWidget()
+    widget.setWindowTitle("GamingRoom Object Graph")
+    widget.resize(1000, 700)
+    widget.show()
+
+    if args.games is not None:
+        widget.games_spin.setValue(args.games)
+        widget.teams_spin.setValue(args.teams)
+        widget.players_spin.setValue(args.players)
+        widget.build_synthetic()
+    elif args.file:
+        widget.load_file(args.file)
+    else:
+        widget.load_program_output()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
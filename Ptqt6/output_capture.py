@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Bounded output capture for processes started by the launcher
+Each launched visualizer (and each JAR run) writes into an OutputBuffer: a
+ring of numbered lines capped in bytes, so a chatty child cannot grow the
+launcher's memory. pump() drains a child's pipe into the buffer as fast as
+the child writes - it never waits for readers - and readers follow the
+buffer with their own sequence cursor. A reader that falls behind the ring
+is told how many lines it skipped instead of slowing anything down.
+
+Usage:
+    from output_capture import OutputBuffer, pump, read_lines
+    buffer = OutputBuffer(max_bytes=256 * 1024)
+    asyncio.ensure_future(pump(process.stdout, buffer, "stdout"))
+    async for entries, skipped in buffer.follow():
+        ...                                  # entries: [(seq, stream, text), ...]
+
+    python output_capture.py                 # fill a small buffer and show what a late reader sees
+"""
+
+import sys
+import asyncio
+import argparse
+from collections import deque
+from itertools import islice
+from typing import List, Tuple
+
+DEFAULT_MAX_BYTES = 256 * 1024   # per process
+MAX_LINE = 4096                  # longer lines are split
+READ_CHUNK = 16 * 1024
+ENTRY_OVERHEAD = 64              # rough per-line bookkeeping cost counted against max_bytes
+MAX_BATCH = 500                  # lines handed to a reader at once
+
+Entry = Tuple[int, str, str]     # (sequence number, stream name, text)
+
+
+class OutputBuffer:
+    """Ring of numbered output lines, capped at max_bytes"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = deque()
+        self.size = 0
+        self.next_seq = 0
+        self.evicted = 0
+        self.closed = False
+        self._changed = asyncio.Event()
+
+    def _wake(self):
+        # Waiters hold the old event; swapping in a new one avoids a clear() race
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    @property
+    def first_seq(self):
+        return self.entries[0][0] if self.entries else self.next_seq
+
+    def append(self, stream, text):
+        self.entries.append((self.next_seq, stream, text))
+        self.next_seq += 1
+        self.size += len(text) + ENTRY_OVERHEAD
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            _, _, dropped = self.entries.popleft()
+            self.size -= len(dropped) + ENTRY_OVERHEAD
+            self.evicted += 1
+        self._wake()
+
+    def close(self):
+        self.closed = True
+        self._wake()
+
+    def since(self, seq, limit=MAX_BATCH) -> Tuple[List[Entry], int]:
+        """(up to limit entries from seq on, number of lines before them that were evicted)"""
+        first = self.first_seq
+        start = max(seq, first)
+        return list(islice(self.entries, start - first, start - first + limit)), start - seq
+
+    def tail(self, count) -> List[Entry]:
+        return list(islice(self.entries, max(0, len(self.entries) - count), None))
+
+    async def wait(self, seq):
+        """Return once there is a line numbered seq or later, or the buffer is closed"""
+        while self.next_seq <= seq and not self.closed:
+            await self._changed.wait()
+
+    async def wait_closed(self):
+        while not self.closed:
+            await self._changed.wait()
+
+    async def follow(self, seq=0):
+        """Yield (entries, skipped) batches from seq on until the buffer is closed and read"""
+        while True:
+            await self.wait(seq)
+            entries, skipped = self.since(seq)
+            if not entries and not skipped:
+                if self.closed:
+                    return
+                continue
+            seq = entries[-1][0] + 1 if entries else seq + skipped
+            yield entries, skipped
+
+    def stats(self):
+        return {"lines": len(self.entries), "bytes": self.size, "max_bytes": self.max_bytes,
+                "next_seq": self.next_seq, "evicted": self.evicted, "closed": self.closed}
+
+
+async def read_lines(reader: asyncio.StreamReader):
+    """Lines of a pipe without their newline, read in chunks until EOF
+
+    Unlike StreamReader.readline() there is no line length limit: a line
+    longer than MAX_LINE bytes arrives in MAX_LINE pieces.
+    """
+    pending = b""
+    while True:
+        chunk = await reader.read(READ_CHUNK)
+        if not chunk:
+            break
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            for start in range(0, max(len(line), 1), MAX_LINE):
+                yield line[start:start + MAX_LINE]
+        while len(pending) > MAX_LINE:
+            yield pending[:MAX_LINE]
+            pending = pending[MAX_LINE:]
+    if pending:
+        yield pending
+
+
+async def pump(reader: asyncio.StreamReader, buffer: OutputBuffer, stream="stdout"):
+    """Copy a pipe into buffer line by line until EOF"""
+    async for line in read_lines(reader):
+        add_line(buffer, stream, line)
+
+
+def add_line(buffer, stream, raw):
+    text = raw.decode("utf-8", "replace").rstrip("\r")
+    for start in range(0, max(len(text), 1), MAX_LINE):
+        buffer.append(stream, text[start:start + MAX_LINE])
+
+
+async def demo(lines, max_bytes):
+    buffer = OutputBuffer(max_bytes)
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", f"import sys\nfor i in range({lines}): print('line', i); print('err', i, file=sys.stderr)",
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+    await asyncio.gather(pump(process.stdout, buffer, "stdout"), pump(process.stderr, buffer, "stderr"))
+    await process.wait()
+    buffer.close()
+    print(buffer.stats())
+    async for entries, skipped in buffer.follow(0):
+        print(f"late reader: skipped {skipped}, then {len(entries)} lines, first {entries[0] if entries else None}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show how the launcher's output ring behaves")
+    parser.add_argument("--lines", type=int, default=20000, help="lines per stream the demo child prints")
+    parser.add_argument("--max-bytes", type=int, default=64 * 1024)
+    args = parser.parse_args()
+    asyncio.run(demo(args.lines, args.max_bytes))
+
+
+if __name__ == "__main__":
+    main()
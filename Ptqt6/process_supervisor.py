@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Process supervisor for the launcher server
+Every visualizer or JAR started from the launcher becomes a Child that the
+supervisor owns: its exit is reaped on the event loop (no zombies on a
+long-running server), its spawn latency is recorded, and a sampler reads its
+RSS and CPU time from /proc. Children can be listed, stopped and restarted,
+and the number of concurrent instances per app and overall is capped.
+stdout and stderr of each child are captured into a bounded OutputBuffer
+(output_capture.py) that the launcher streams to the browser.
+
+Usage:
+    from process_supervisor import Supervisor
+    supervisor = Supervisor(max_per_app=3, max_total=12)
+    child = await supervisor.start("flowchart", [sys.executable, "singleton_flowchart_complete.py"])
+    await supervisor.restart(child.pid)
+
+    python process_supervisor.py sleep 2             # supervise one command and print its record
+    python process_supervisor.py --show-output ls -l
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+from collections import Counter, deque
+from typing import Dict, List, Optional
+
+from output_capture import DEFAULT_MAX_BYTES as DEFAULT_OUTPUT_BYTES, OutputBuffer, pump
+
+DEFAULT_MAX_PER_APP = 3
+DEFAULT_MAX_TOTAL = 12
+SAMPLE_INTERVAL = 2.0            # seconds between RSS / CPU samples of running children
+STOP_TIMEOUT = 3.0               # seconds a child gets after SIGTERM before it is killed
+EXIT_HISTORY = 50
+PUMP_DRAIN_TIMEOUT = 1.0         # grandchildren can keep a pipe open after the child exits
+
+try:
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+except (AttributeError, ValueError, OSError):
+    PAGE_SIZE = CLOCK_TICKS = None
+
+
+def install_child_watcher():
+    """Reap children through pidfds on the running loop instead of a waiter thread per child"""
+    # 3.12+ picks the pidfd watcher by itself; before that the default starts a thread per process
+    if sys.version_info >= (3, 12) or sys.platform == "win32" or not hasattr(os, "pidfd_open"):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return  # kernel older than 5.3 or pidfd blocked; keep the default watcher
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(asyncio.get_running_loop())
+    asyncio.set_child_watcher(watcher)
+
+
+class LimitReached(Exception):
+    """Raised when starting another instance would exceed the configured limit"""
+
+
+def process_stats(pid):
+    """(rss bytes, cpu seconds) of a running process, or None where /proc is not available"""
+    if PAGE_SIZE is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # The command name can contain spaces and parentheses; fields resume after the last ')'
+            fields = f.read().rpartition(")")[2].split()
+        return int(fields[21]) * PAGE_SIZE, (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class Child:
+    """One supervised process and what is known about it"""
+    __slots__ = ("app", "command", "cwd", "process", "started", "start_latency", "ended",
+                 "returncode", "stopped", "rss", "peak_rss", "cpu_time", "restarted_from", "reaper",
+                 "output", "pumps")
+
+    def __init__(self, app, command, cwd, process, start_latency, restarted_from=None, output=None):
+        self.app = app
+        self.command = command
+        self.cwd = cwd
+        self.process = process
+        self.started = time.time()
+        self.start_latency = start_latency
+        self.ended = None
+        self.returncode = None
+        self.stopped = False         # set when the supervisor stopped it, so -15 is not a crash
+        self.rss = None
+        self.peak_rss = None
+        self.cpu_time = None
+        self.restarted_from = restarted_from
+        self.reaper = None           # task that waits for the exit and files the child away
+        self.output = output or OutputBuffer()
+        self.pumps = ()
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    @property
+    def running(self):
+        return self.returncode is None
+
+    def sample(self):
+        stats = process_stats(self.pid)
+        if stats is not None:
+            self.rss, self.cpu_time = stats
+            self.peak_rss = max(self.peak_rss or 0, self.rss)
+
+    def as_dict(self):
+        end = self.ended or time.time()
+        return {"app": self.app, "pid": self.pid, "running": self.running,
+                "returncode": self.returncode, "stopped": self.stopped,
+                "uptime": round(end - self.started, 3),
+                "start_latency_ms": round(self.start_latency * 1000, 2),
+                "rss": self.rss, "peak_rss": self.peak_rss,
+                "cpu_time": None if self.cpu_time is None else round(self.cpu_time, 3),
+                "restarted_from": self.restarted_from,
+                "output_lines": self.output.next_seq, "output_dropped": self.output.evicted}
+
+
+class Supervisor:
+    """Starts, reaps, samples and stops the launcher's child processes"""
+
+    def __init__(self, max_per_app=DEFAULT_MAX_PER_APP, max_total=DEFAULT_MAX_TOTAL,
+                 sample_interval=SAMPLE_INTERVAL, output_bytes=DEFAULT_OUTPUT_BYTES, verbose=False):
+        self.max_per_app = max_per_app
+        self.max_total = max_total
+        self.sample_interval = sample_interval
+        self.output_bytes = output_bytes
+        self.verbose = verbose
+        self.children: Dict[int, Child] = {}
+        self.pending = Counter()     # app -> spawns in flight, counted against the limits
+        self.exited = deque(maxlen=EXIT_HISTORY)
+        self.tasks = set()           # strong references; the loop only keeps weak ones to tasks
+        self.sampler = None
+
+    def _spawn_task(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def instances(self, app):
+        return sum(child.app == app for child in self.children.values()) + self.pending[app]
+
+    def check_limits(self, app):
+        total = len(self.children) + sum(self.pending.values())
+        if self.max_total and total >= self.max_total:
+            raise LimitReached(f"{total} processes already running (limit {self.max_total})")
+        if self.max_per_app and self.instances(app) >= self.max_per_app:
+            raise LimitReached(f"{self.instances(app)} instances of {app} already running "
+                               f"(limit {self.max_per_app})")
+
+    async def start(self, app, command, cwd=None, restarted_from=None):
+        """Start command as app; raises LimitReached or OSError"""
+        # The slot is taken before the first await so concurrent starts cannot all pass the check
+        self.check_limits(app)
+        self.pending[app] += 1
+        requested = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(*command, cwd=cwd, stdin=asyncio.subprocess.DEVNULL,
+                                                           stdout=asyncio.subprocess.PIPE,
+                                                           stderr=asyncio.subprocess.PIPE)
+        finally:
+            self.pending[app] -= 1
+            if not self.pending[app]:
+                del self.pending[app]
+        child = Child(app, command, cwd, process, time.perf_counter() - requested, restarted_from,
+                      OutputBuffer(self.output_bytes))
+        self.children[child.pid] = child
+        child.sample()
+        # Pipes are drained as fast as the child writes, whoever is (or is not) watching
+        child.pumps = (self._spawn_task(pump(process.stdout, child.output, "stdout")),
+                       self._spawn_task(pump(process.stderr, child.output, "stderr")))
+        child.reaper = self._spawn_task(self.reap(child))
+        if self.sampler is None and self.sample_interval:
+            self.sampler = self._spawn_task(self.sample_forever())
+        return child
+
+    async def reap(self, child):
+        # The pid may be reused once reaped, so the last live sample is kept rather than re-read
+        returncode = await child.process.wait()
+        _, pending = await asyncio.wait(child.pumps, timeout=PUMP_DRAIN_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        child.returncode = returncode
+        child.ended = time.time()
+        child.output.close()
+        self.children.pop(child.pid, None)
+        self.exited.append(child)
+        if returncode != 0 and not child.stopped and self.verbose:
+            print(f"{child.app} (pid {child.pid}) exited with code {returncode}")
+
+    async def sample_forever(self):
+        try:
+            while self.children:
+                for child in list(self.children.values()):
+                    child.sample()
+                await asyncio.sleep(self.sample_interval)
+        finally:
+            self.sampler = None
+
+    def get(self, pid) -> Optional[Child]:
+        return self.children.get(pid) or next((child for child in reversed(self.exited) if child.pid == pid), None)
+
+    async def stop(self, pid, timeout=STOP_TIMEOUT) -> Optional[Child]:
+        """Terminate a running child, killing it if it outlives timeout; None if pid is not ours"""
+        child = self.children.get(pid)
+        if child is None:
+            return None
+        child.stopped = True
+        if child.process.returncode is None:
+            child.process.terminate()
+        try:
+            await asyncio.wait_for(asyncio.shield(child.reaper), timeout)
+        except asyncio.TimeoutError:
+            child.process.kill()
+            await child.reaper
+        return child
+
+    async def restart(self, pid) -> Optional[Child]:
+        """Stop a child (if still running) and start its command again; None if pid is unknown"""
+        old = self.get(pid)
+        if old is None:
+            return None
+        if old.running:
+            await self.stop(pid)
+        return await self.start(old.app, old.command, old.cwd, restarted_from=old.pid)
+
+    async def shutdown(self, timeout=STOP_TIMEOUT):
+        """Stop every running child"""
+        await asyncio.gather(*(self.stop(pid, timeout) for pid in list(self.children)))
+
+    def list(self) -> List[dict]:
+        return [child.as_dict() for child in list(self.children.values()) + list(self.exited)]
+
+    def summary(self):
+        running = list(self.children.values())
+        return {"running": len(running), "exited": len(self.exited),
+                "rss": sum(child.rss or 0 for child in running),
+                "limits": {"per_app": self.max_per_app, "total": self.max_total}}
+
+
+async def supervise(command, interval, show_output):
+    install_child_watcher()
+    supervisor = Supervisor(sample_interval=interval, verbose=True)
+    child = await supervisor.start(os.path.basename(command[0]), command)
+    if show_output:
+        async for entries, skipped in child.output.follow():
+            if skipped:
+                print(f"[{skipped} lines skipped]")
+            for _, stream, text in entries:
+                print(f"{stream}: {text}")
+    await child.reaper
+    for key, value in child.as_dict().items():
+        print(f"{key:>16}: {value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run one command under the launcher's process supervisor")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="command line to run")
+    parser.add_argument("--interval", type=float, default=0.2, help="seconds between RSS / CPU samples")
+    parser.add_argument("--show-output", action="store_true", help="print the captured stdout/stderr lines")
+    args = parser.parse_args()
+    if not args.command:
+        parser.error("a command is required")
+    try:
+        asyncio.run(supervise(args.command, args.interval, args.show_output))
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Remote viewer: the visualizer scenes rendered once on the server for many browsers
+Instead of a PyQt6 desktop process per user, the launcher server (started with
+--remote-viewer) renders the flowchart, UML and memory scenes offscreen in
+render_frames' worker processes, frame by frame along the same step sequences
+the desktop apps animate. Each frame is cut into PNG tiles named by their
+content hash. A viewer (viewer.html) steps through a target over a WebSocket
+and is sent only the tiles that changed since the frame it shows, which it
+fetches as immutable, browser-cacheable URLs.
+
+Frames and tiles are cached in the server process and shared by every viewer:
+a step that any viewer has seen is not rendered again, concurrent requests
+for the same step share one render, and identical tiles (the unchanged parts
+of consecutive steps) are stored once.
+
+Usage:
+    python launcher_server.py --remote-viewer --host 0.0.0.0    # then open /viewer.html
+    python remote_viewer.py --target uml                        # render every step through the cache
+    python remote_viewer.py --target complete:full --viewers 20 # simulate viewers on the same steps
+"""
+
+import sys
+import json
+import time
+import hashlib
+import asyncio
+import argparse
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from render_frames import BACKGROUND, build_target, init_worker, prepare_frame
+
+VIEWER_TARGETS = ["complete:full", "complete:singleton", "complete:entity", "animated", "uml", "memory"]
+TILE_SIZE = 256
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+FRAME_HISTORY = 2048             # cached frame layouts (a few hundred bytes each)
+ENCODED_HISTORY = 4096           # per-worker pixel hash -> PNG, so unchanged tiles are not re-encoded
+
+# Per-worker state (render processes only)
+_targets = {}
+_encoded: "OrderedDict[bytes, Tuple[str, bytes]]" = OrderedDict()
+
+
+# -- worker side --------------------------------------------------------------------
+
+def worker_target(name):
+    target = _targets.get(name)
+    if target is None:
+        target = _targets[name] = build_target(name)
+    return target
+
+
+def describe_target(name):
+    """Frame count and step labels of a target (runs in a worker)"""
+    target = worker_target(name)
+    count = target.frame_count()
+    return {"target": name, "frames": count, "labels": [target.describe(frame) for frame in range(count)]}
+
+
+def encode_tile(image):
+    """(content id, PNG bytes) of a tile image"""
+    from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+    pixels = (hashlib.sha1(image.constBits().asstring(image.sizeInBytes())).digest()
+              + b"%dx%d" % (image.width(), image.height()))
+    cached = _encoded.get(pixels)
+    if cached is not None:
+        _encoded.move_to_end(pixels)
+        return cached
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    png = bytes(data)
+    cached = _encoded[pixels] = (hashlib.sha1(png).hexdigest()[:24], png)
+    while len(_encoded) > ENCODED_HISTORY:
+        _encoded.popitem(last=False)
+    return cached
+
+
+def render_tiles(name, frame, scale, tile_size):
+    """Render one step of a target and cut it into tiles (runs in a worker)
+
+    Returns (width, height, label, [(column, row, tile id, PNG bytes), ...]).
+    """
+    from render_frames import render_scene
+    target = worker_target(name)
+    prepare_frame(target, frame)
+    image = render_scene(target.scene, scale)
+    width, height = image.width(), image.height()
+    tiles = []
+    for row, y in enumerate(range(0, height, tile_size)):
+        for column, x in enumerate(range(0, width, tile_size)):
+            tile_id, png = encode_tile(image.copy(x, y, min(tile_size, width - x), min(tile_size, height - y)))
+            tiles.append((column, row, tile_id, png))
+    return width, height, target.describe(frame), tiles
+
+
+# -- server side --------------------------------------------------------------------
+
+@dataclass
+class Frame:
+    """Layout of one rendered step: which tile goes in which cell"""
+    target: str
+    index: int
+    width: int
+    height: int
+    label: str
+    cells: Dict[Tuple[int, int], str]
+    render_ms: float
+
+    def changed_since(self, previous: Optional["Frame"]) -> List[list]:
+        """[column, row, tile id] for every cell that differs from previous (all of them if None)"""
+        if previous is None or (previous.width, previous.height) != (self.width, self.height):
+            return [[column, row, tile_id] for (column, row), tile_id in self.cells.items()]
+        return [[column, row, tile_id] for (column, row), tile_id in self.cells.items()
+                if previous.cells.get((column, row)) != tile_id]
+
+
+class TileStore:
+    """Tile PNGs by content id, least recently used evicted past max_bytes"""
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.tiles: "OrderedDict[str, bytes]" = OrderedDict()
+        self.size = 0
+        self.evicted = 0
+
+    def put(self, tile_id, png):
+        if tile_id in self.tiles:
+            self.tiles.move_to_end(tile_id)
+            return
+        self.tiles[tile_id] = png
+        self.size += len(png)
+        while self.size > self.max_bytes and len(self.tiles) > 1:
+            _, dropped = self.tiles.popitem(last=False)
+            self.size -= len(dropped)
+            self.evicted += 1
+
+    def get(self, tile_id) -> Optional[bytes]:
+        png = self.tiles.get(tile_id)
+        if png is not None:
+            self.tiles.move_to_end(tile_id)
+        return png
+
+    def __contains__(self, tile_id):
+        return tile_id in self.tiles
+
+
+class SceneRenderer:
+    """Offscreen render pool plus the frame and tile caches shared by all viewers"""
+
+    def __init__(self, workers=1, scale=1.0, tile_size=TILE_SIZE, cache_bytes=DEFAULT_CACHE_BYTES,
+                 targets=VIEWER_TARGETS):
+        self.workers = max(1, workers)
+        self.scale = scale
+        self.tile_size = tile_size
+        self.targets = list(targets)
+        self.tiles = TileStore(cache_bytes)
+        self.frames: "OrderedDict[Tuple[str, int], Frame]" = OrderedDict()
+        self.pending: Dict[Tuple[str, int], asyncio.Future] = {}
+        self.descriptions: Dict[str, asyncio.Future] = {}
+        self.pool = None
+        self.viewers = 0
+        self.renders = 0
+        self.render_seconds = 0.0
+        self.hits = 0
+        self.shared = 0              # requests that joined a render already in flight
+        self.frame_callbacks = []    # called with (frame, "rendered" | "cached" | "shared") per request
+
+    def start(self):
+        # spawn keeps every worker's Qt state independent of the server process
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                                        initializer=init_worker)
+
+    async def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    async def _in_worker(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.pool, function, *args)
+
+    async def describe(self, target):
+        """{"target", "frames", "labels"}; raises ValueError for unknown targets"""
+        if target not in self.targets:
+            raise ValueError(f"Unknown target: {target}")
+        future = self.descriptions.get(target)
+        if future is None:
+            future = self.descriptions[target] = asyncio.ensure_future(self._in_worker(describe_target, target))
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            self.descriptions.pop(target, None)   # let the next viewer try again
+            raise
+
+    def cached(self, target, index) -> Optional[Frame]:
+        frame = self.frames.get((target, index))
+        if frame is None:
+            return None
+        if not all(tile_id in self.tiles for tile_id in frame.cells.values()):
+            del self.frames[(target, index)]   # some tiles were evicted; render it again
+            return None
+        self.frames.move_to_end((target, index))
+        return frame
+
+    async def frame(self, target, index) -> Tuple[Frame, bool]:
+        """(frame, cached) for step index of target, rendering it at most once at a time"""
+        frame = self.cached(target, index)
+        if frame is not None:
+            self.hits += 1
+            self.notify(frame, "cached")
+            return frame, True
+        key = (target, index)
+        future = self.pending.get(key)
+        if future is not None:
+            self.shared += 1
+            frame = await asyncio.shield(future)
+            self.notify(frame, "shared")
+            return frame, True
+        future = self.pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            frame = await self.render(target, index)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()   # mark retrieved; the viewers waiting on it re-raise it themselves
+            raise
+        finally:
+            self.pending.pop(key, None)
+        future.set_result(frame)
+        self.notify(frame, "rendered")
+        return frame, False
+
+    def notify(self, frame, source):
+        for callback in self.frame_callbacks:
+            callback(frame, source)
+
+    async def render(self, target, index) -> Frame:
+        started = time.perf_counter()
+        width, height, label, tiles = await self._in_worker(render_tiles, target, index, self.scale, self.tile_size)
+        elapsed = time.perf_counter() - started
+        self.renders += 1
+        self.render_seconds += elapsed
+        for _, _, tile_id, png in tiles:
+            self.tiles.put(tile_id, png)
+        frame = Frame(target, index, width, height, label,
+                      {(column, row): tile_id for column, row, tile_id, _ in tiles}, round(elapsed * 1000, 1))
+        self.frames[(target, index)] = frame
+        while len(self.frames) > FRAME_HISTORY:
+            self.frames.popitem(last=False)
+        return frame
+
+    def stats(self):
+        return {"viewers": self.viewers, "workers": self.workers, "renders": self.renders,
+                "render_seconds": round(self.render_seconds, 3), "hits": self.hits, "shared": self.shared,
+                "frames": len(self.frames), "tiles": len(self.tiles.tiles), "tile_bytes": self.tiles.size,
+                "tile_max_bytes": self.tiles.max_bytes, "tiles_evicted": self.tiles.evicted}
+
+
+async def serve_viewer(ws, renderer: SceneRenderer, target):
+    """One viewer connection: answer {"type": "step", "frame": k} with the tiles that changed
+
+    ws is a started ws_protocol.WebSocket. Steps requested faster than they can be
+    sent are skipped to the latest one, so a viewer playing quickly never queues
+    up stale frames.
+    """
+    description = await renderer.describe(target)
+    renderer.viewers += 1
+    try:
+        await ws.send_json({"type": "hello", "background": BACKGROUND, "tile": renderer.tile_size,
+                            "viewers": renderer.viewers, **description})
+        await follow_steps(ws, renderer, target, description["frames"])
+    finally:
+        renderer.viewers -= 1
+
+
+async def follow_steps(ws, renderer, target, frames):
+    shown = None
+    while not ws.closed.is_set():
+        receive = asyncio.ensure_future(ws.messages.get())
+        closed = asyncio.ensure_future(ws.closed.wait())
+        try:
+            await asyncio.wait([receive, closed], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            closed.cancel()
+        if not receive.done():
+            receive.cancel()
+            break
+        messages = [receive.result()]
+        while not ws.messages.empty():
+            messages.append(ws.messages.get_nowait())
+        request = parse_step(messages[-1], frames)
+        if request is None:
+            continue
+        index, full = request
+        frame, cached = await renderer.frame(target, index)
+        await ws.send_json({"type": "frame", "frame": frame.index, "label": frame.label,
+                            "width": frame.width, "height": frame.height, "cached": cached,
+                            "render_ms": frame.render_ms, "viewers": renderer.viewers,
+                            "tiles": frame.changed_since(None if full else shown)})
+        shown = frame
+
+
+def parse_step(message, frames):
+    """(frame index, full redraw) from a viewer message, or None if it is not a valid step"""
+    try:
+        payload = json.loads(message)
+        if payload.get("type") != "step":
+            return None
+        return max(0, min(frames - 1, int(payload["frame"]))), bool(payload.get("full"))
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+async def simulate(target, viewers, workers):
+    renderer = SceneRenderer(workers=workers)
+    renderer.start()
+    try:
+        started = time.perf_counter()
+        description = await renderer.describe(target)
+        print(f"{target}: {description['frames']} steps (pool start + describe "
+              f"{(time.perf_counter() - started) * 1000:.0f} ms)")
+
+        async def viewer():
+            shown, sent = None, 0
+            for index in range(description["frames"]):
+                frame, _ = await renderer.frame(target, index)
+                sent += len(frame.changed_since(shown))
+                shown = frame
+            return sent
+
+        started = time.perf_counter()
+        sent = await asyncio.gather(*(viewer() for _ in range(viewers)))
+        elapsed = time.perf_counter() - started
+        stats = renderer.stats()
+        cells = len(renderer.frames[(target, 0)].cells) * description["frames"]
+        print(f"{viewers} viewers stepped through every frame in {elapsed * 1000:.0f} ms")
+        print(f"  renders {stats['renders']} ({stats['render_seconds'] * 1000 / max(stats['renders'], 1):.0f} ms "
+              f"each), cache hits {stats['hits']}, joined in-flight renders {stats['shared']}")
+        print(f"  tiles sent per viewer {sent[0]} of {cells} cells "
+              f"({100 * sent[0] / max(cells, 1):.0f}%), {stats['tiles']} distinct tiles, "
+              f"{stats['tile_bytes'] / 1024:.0f} KB cached")
+    finally:
+        await renderer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a target's steps through the shared viewer cache")
+    parser.add_argument("--target", default="complete:full", choices=VIEWER_TARGETS)
+    parser.add_argument("--viewers", type=int, default=1, help="simulated viewers stepping through at once")
+    parser.add_argument("--workers", type=int, default=1, help="render worker processes")
+    args = parser.parse_args()
+    try:
+        asyncio.run(simulate(args.target, args.viewers, args.workers))
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
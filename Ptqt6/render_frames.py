@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Headless batch renderer for the Singleton visualizer animations
+Steps through the flowchart and UML animations without a display and writes
+every step as a PNG frame (and optionally an animated GIF).
+
+Usage:
+    python render_frames.py                          # regenerate everything in flowcharts/animations
+    python render_frames.py --target complete:full --gif
+    python render_frames.py --workers 4 --scale 0.5 --out /tmp/frames
+    python render_frames.py --target complete:trace --trace-log run.txt
+    python render_frames.py --target memory
+
+Frames are rendered with Qt's offscreen platform. Each worker process owns its
+own QApplication and rasterises a contiguous slice of the frames, so a target
+with N steps is split across the pool instead of being drawn one by one.
+"""
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUT_DIR = os.path.join(os.path.dirname(BASE_DIR), "flowcharts", "animations")
+
+# Scene background used by the desktop apps (QGraphicsView stylesheet)
+BACKGROUND = "#1e1e1e"
+
+TARGETS = ["complete:full", "complete:singleton", "complete:entity", "animated", "uml", "memory"]
+
+# Steps of the memory target: which instance each step of the full run allocates
+MEMORY_ALLOCATIONS = {"create_new": "GameService", "create_game": "Game", "add_team": "Team", "add_player": "Player"}
+
+# Per-process state set up by init_worker()
+_app = None
+_trace_lines = None
+
+
+def init_worker(trace_lines=None):
+    """Create the offscreen QApplication for this process"""
+    global _app, _trace_lines
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+
+    from PyQt6.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([])
+    _trace_lines = trace_lines
+
+
+class FlowchartTarget:
+    """Frames for a flowchart widget: frame k has the first k steps active"""
+
+    def __init__(self, widget, sequence):
+        self.widget = widget
+        self.scene = widget.scene
+        self.sequence = sequence
+
+    def frame_count(self):
+        return len(self.sequence) + 1
+
+    def apply(self, frame):
+        for node in self.widget.nodes.values():
+            node.deactivate()
+        for node_name, _ in self.sequence[:frame]:
+            if node_name in self.widget.nodes:
+                self.widget.nodes[node_name].activate()
+
+    def describe(self, frame):
+        return self.sequence[frame - 1][1] if frame else "Ready"
+
+
+class UMLTarget:
+    """Frames for the UML diagram: classes appear, relationships appear, classes expand"""
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.scene = widget.scene
+        self.nodes = list(widget.nodes.values())
+        self.relationships = widget.relationships
+
+    def frame_count(self):
+        return 1 + len(self.nodes) + len(self.relationships) + len(self.nodes)
+
+    def apply(self, frame):
+        visible_nodes = min(frame, len(self.nodes))
+        visible_rels = min(max(frame - len(self.nodes), 0), len(self.relationships))
+        expanded = max(frame - len(self.nodes) - len(self.relationships), 0)
+
+        for i, node in enumerate(self.nodes):
+            node.setOpacity(1 if i < visible_nodes else 0)
+            should_expand = i < expanded
+            if should_expand and not node.expanded:
+                node.expand(animate=False)
+            elif not should_expand and node.expanded:
+                node.collapse(animate=False)
+        for i, rel in enumerate(self.relationships):
+            rel.setOpacity(1 if i < visible_rels else 0)
+
+    def describe(self, frame):
+        if frame == 0:
+            return "Empty diagram"
+        if frame <= len(self.nodes):
+            return f"Class {frame} of {len(self.nodes)}"
+        if frame <= len(self.nodes) + len(self.relationships):
+            return f"Relationship {frame - len(self.nodes)} of {len(self.relationships)}"
+        return f"Expanded {frame - len(self.nodes) - len(self.relationships)} of {len(self.nodes)} classes"
+
+
+class MemoryTarget:
+    """Frames for the memory scene: instance bars grow as the full run's steps allocate objects"""
+
+    def __init__(self, widget, sequence):
+        self.widget = widget
+        self.scene = widget.scene
+        self.sequence = sequence
+        try:
+            from memory_layout import default_estimator
+            self.estimator = default_estimator()
+        except OSError:
+            self.estimator = None
+
+    def frame_count(self):
+        return len(self.sequence) + 1
+
+    def apply(self, frame):
+        counts = dict.fromkeys(MEMORY_ALLOCATIONS.values(), 0)
+        for node_name, _ in self.sequence[:frame]:
+            if node_name in MEMORY_ALLOCATIONS:
+                counts[MEMORY_ALLOCATIONS[node_name]] += 1
+        for name, instances in counts.items():
+            size = instances * self.estimator.instance_size(name) if self.estimator else 0
+            self.widget.set_class_bar(name, instances, size)
+
+    def describe(self, frame):
+        return self.sequence[frame - 1][1] if frame else "Empty heap"
+
+
+def build_target(name):
+    """Construct the widget for a target name (worker process only)"""
+    if name.startswith("complete:"):
+        from singleton_flowchart_complete import CompleteFlowchartWidget, ANIMATION_SEQUENCES
+        mode = name.split(":", 1)[1]
+        widget = CompleteFlowchartWidget()
+        if mode == "trace":
+            from trace_capture import TraceMapper, iter_trace
+            mapper = TraceMapper()
+            events = mapper.start_events() + list(iter_trace(_trace_lines or [], mapper))
+            sequence = [(e.node, e.description) for e in events]
+        else:
+            sequence = ANIMATION_SEQUENCES[mode]
+        return FlowchartTarget(widget, sequence)
+
+    if name == "animated":
+        from need_fix_animations import AnimatedFlowchartWidget, ANIMATION_SEQUENCE
+        return FlowchartTarget(AnimatedFlowchartWidget(), ANIMATION_SEQUENCE)
+
+    if name == "uml":
+        from singleton_visualizer_integrated import UMLDiagramWidget
+        return UMLTarget(UMLDiagramWidget())
+
+    if name == "memory":
+        from singleton_flowchart_complete import ANIMATION_SEQUENCES
+        from working_code_viz import MemoryVisualizerWidget
+        return MemoryTarget(MemoryVisualizerWidget(), ANIMATION_SEQUENCES["full"])
+
+    raise ValueError(f"Unknown target: {name}")
+
+
+def render_scene(scene, scale):
+    """Rasterise the full scene rect into a QImage"""
+    from PyQt6.QtGui import QImage, QPainter, QColor
+    from PyQt6.QtCore import QRectF
+
+    source = scene.sceneRect()
+    width = max(1, int(source.width() * scale))
+    height = max(1, int(source.height() * scale))
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(BACKGROUND))
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    scene.render(painter, QRectF(0, 0, width, height), source)
+    painter.end()
+    return image
+
+
+def frame_path(out_dir, target, frame):
+    return os.path.join(out_dir, target.replace(":", "_"), f"frame_{frame:03d}.png")
+
+
+def count_frames(target):
+    """Number of frames a target produces (runs in a worker)"""
+    return build_target(target).frame_count()
+
+
+def prepare_frame(target, frame):
+    """Put target's scene in the state of frame, with every transition settled"""
+    from animation_engine import animator
+    from edge_geometry import flush_dirty_edges
+    target.apply(frame)
+    # Settle any transitions started by apply(); this also recomputes moved arrows
+    animator().finish_all()
+    flush_dirty_edges()
+
+
+def render_slice(job):
+    """Render frames [start, stop) of one target; returns the written paths"""
+    target_name, start, stop, out_dir, scale = job
+    target = build_target(target_name)
+    paths = []
+    for frame in range(start, stop):
+        prepare_frame(target, frame)
+        path = frame_path(out_dir, target_name, frame)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if not render_scene(target.scene, scale).save(path, "PNG"):
+            raise IOError(f"Could not write {path}")
+        paths.append(path)
+    return paths
+
+
+def split_jobs(target, frame_total, workers, out_dir, scale):
+    """Split a target's frames into contiguous slices, one or more per worker"""
+    chunk = max(1, -(-frame_total // workers))
+    return [(target, start, min(start + chunk, frame_total), out_dir, scale)
+            for start in range(0, frame_total, chunk)]
+
+
+def write_gif(paths, gif_path, frame_ms):
+    """Assemble PNG frames into an animated GIF (needs Pillow)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        print("  ! Pillow not installed - skipping GIF (pip install Pillow)")
+        return False
+
+    frames = [Image.open(path).convert("P", palette=Image.Palette.ADAPTIVE) for path in paths]
+    frames[0].save(gif_path, save_all=True, append_images=frames[1:],
+                   duration=frame_ms, loop=0, optimize=True)
+    return True
+
+
+def render_targets(targets, out_dir, workers, scale, gif=False, frame_ms=800, trace_lines=None):
+    """Render all targets, spreading frame slices across a process pool"""
+    started = time.perf_counter()
+    results = {}
+
+    # spawn keeps every worker's Qt state independent of the parent
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=init_worker, initargs=(trace_lines,)) as pool:
+        totals = dict(zip(targets, pool.map(count_frames, targets)))
+
+        jobs = []
+        for target in targets:
+            jobs.extend(split_jobs(target, totals[target], workers, out_dir, scale))
+
+        for (target, *_), paths in zip(jobs, pool.map(render_slice, jobs)):
+            results.setdefault(target, []).extend(paths)
+
+    for target in targets:
+        paths = sorted(results.get(target, []))
+        print(f"  {target:20s} {len(paths):3d} frames -> {os.path.dirname(paths[0]) if paths else out_dir}")
+        if gif and paths:
+            gif_path = os.path.join(out_dir, target.replace(":", "_") + ".gif")
+            if write_gif(paths, gif_path, frame_ms):
+                print(f"  {'':20s} gif -> {gif_path}")
+
+    print(f"Rendered {sum(len(p) for p in results.values())} frames in "
+          f"{time.perf_counter() - started:.1f}s using {workers} worker(s)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render visualizer animations to PNG frames / GIFs without a display")
+    parser.add_argument("--target", action="append", choices=TARGETS + ["complete:trace"],
+                        help="target to render (repeatable, default: all)")
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="output directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--scale", type=float, default=1.0, help="scale factor for frame size")
+    parser.add_argument("--gif", action="store_true", help="also write an animated GIF per target")
+    parser.add_argument("--frame-ms", type=int, default=800, help="GIF frame duration in milliseconds")
+    parser.add_argument("--trace-log", help="saved GamingRoom.jar output for the complete:trace target")
+    args = parser.parse_args()
+
+    targets = args.target or TARGETS
+    trace_lines = None
+    if "complete:trace" in targets:
+        if not args.trace_log:
+            parser.error("complete:trace needs --trace-log (save it with: java -jar GamingRoom.jar > run.txt)")
+        with open(args.trace_log, "r", encoding="utf-8", errors="replace") as f:
+            trace_lines = f.read().splitlines()
+
+    print(f"Rendering {len(targets)} target(s) to {args.out}")
+    render_targets(targets, args.out, max(1, args.workers), args.scale,
+                   gif=args.gif, frame_ms=args.frame_ms, trace_lines=trace_lines)
+
+
+if __name__ == "__main__":
+    main()
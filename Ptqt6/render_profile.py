@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Rendering profiles for the diagram views
+Every QGraphicsView in the suite is a ProfiledGraphicsView, so the update mode,
+caching and render hints can be switched in one place and measured with the
+built-in fps / paint-time overlay.
+
+Profiles:
+    default  - Qt defaults with antialiasing (what the views always used)
+    fast     - cached items, pre-rasterised text, plain raster viewport
+               (no OpenGL) and no painter state saving
+Both repaint with minimal viewport updates, the mode the views always used.
+
+Select a profile with SINGLETON_VIZ_PROFILE=fast, show the overlay with
+SINGLETON_VIZ_FPS=1, or press F3 (overlay) / F4 (next profile) in any view.
+
+Benchmark on a large synthetic scene:
+    python render_profile.py --nodes 2000 --frames 60
+"""
+
+import os
+import sys
+import time
+import argparse
+from collections import deque
+from dataclasses import dataclass
+
+from PyQt6.QtWidgets import QGraphicsView, QGraphicsItem, QWidget
+from PyQt6.QtGui import QPainter, QColor, QFont
+from PyQt6.QtCore import Qt, QRect, QTimer, pyqtSignal
+
+from edge_geometry import flush_dirty_edges
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    name: str
+    antialiasing: bool
+    item_cache: QGraphicsItem.CacheMode
+    cache_background: bool
+    optimization_flags: QGraphicsView.OptimizationFlag
+
+
+RENDER_PROFILES = {
+    "default": RenderProfile(
+        name="default",
+        antialiasing=True,
+        item_cache=QGraphicsItem.CacheMode.NoCache,
+        cache_background=False,
+        optimization_flags=QGraphicsView.OptimizationFlag(0),
+    ),
+    "fast": RenderProfile(
+        name="fast",
+        antialiasing=False,
+        item_cache=QGraphicsItem.CacheMode.DeviceCoordinateCache,
+        cache_background=True,
+        optimization_flags=(QGraphicsView.OptimizationFlag.DontSavePainterState |
+                            QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing),
+    ),
+}
+
+PROFILE_ENV = "SINGLETON_VIZ_PROFILE"
+OVERLAY_ENV = "SINGLETON_VIZ_FPS"
+
+
+def default_profile_name():
+    """Profile selected through the environment, falling back to default"""
+    name = os.environ.get(PROFILE_ENV, "default")
+    return name if name in RENDER_PROFILES else "default"
+
+
+def apply_item_cache(scene, cache_mode):
+    """Set the cache mode on every item in a scene
+
+    Text items get the same mode, which turns them into cached pixmaps instead
+    of re-laying out their QTextDocument on every repaint.
+    """
+    for item in scene.items():
+        item.setCacheMode(cache_mode)
+
+
+class ProfiledGraphicsView(QGraphicsView):
+    """QGraphicsView with a switchable rendering profile and fps overlay"""
+
+    # F3 was pressed in this view; windows with an overlay menu action follow it
+    overlay_toggled = pyqtSignal(bool)
+
+    def __init__(self, scene=None, parent=None):
+        super().__init__(scene, parent)
+        self.profile = None
+        self.show_overlay = os.environ.get(OVERLAY_ENV, "") not in ("", "0")
+        self.frame_times = deque(maxlen=120)
+        self.paint_times = deque(maxlen=120)
+
+        # Repaints only the overlay corner; those paints are not counted as frames
+        self.overlay_rect = QRect(6, 6, 210, 42)
+        self.overlay_timer = QTimer(self)
+        self.overlay_timer.timeout.connect(lambda: self.viewport().update(self.overlay_rect))
+
+        self.set_profile(default_profile_name())
+        self.set_overlay_visible(self.show_overlay)
+
+    def set_profile(self, name):
+        """Apply a named profile to this view and its current scene items"""
+        profile = RENDER_PROFILES[name]
+        self.profile = profile
+
+        # Plain raster viewport - never an OpenGL widget
+        if type(self.viewport()) is not QWidget:
+            self.setViewport(QWidget())
+
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, profile.antialiasing)
+        self.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground if profile.cache_background
+                          else QGraphicsView.CacheModeFlag.CacheNone)
+        self.setOptimizationFlags(profile.optimization_flags)
+        self.refresh_item_cache()
+        self.frame_times.clear()
+        self.paint_times.clear()
+        self.viewport().update()
+
+    def refresh_item_cache(self):
+        """Re-apply the profile's item cache mode after the scene was rebuilt"""
+        if self.scene() is not None and self.profile is not None:
+            apply_item_cache(self.scene(), self.profile.item_cache)
+
+    def set_overlay_visible(self, visible):
+        self.show_overlay = visible
+        if visible:
+            self.overlay_timer.start(500)
+        else:
+            self.overlay_timer.stop()
+        self.viewport().update()
+
+    def stats(self):
+        """Return (fps, average paint ms) over the recent frames"""
+        fps = 0.0
+        if len(self.frame_times) > 1:
+            span = self.frame_times[-1] - self.frame_times[0]
+            if span > 0:
+                fps = (len(self.frame_times) - 1) / span
+        paint_ms = sum(self.paint_times) / len(self.paint_times) * 1000 if self.paint_times else 0.0
+        return fps, paint_ms
+
+    def paintEvent(self, event):
+        started = time.perf_counter()
+        # Arrows moved since the last frame are recomputed once, right before drawing
+        flush_dirty_edges()
+        super().paintEvent(event)
+        finished = time.perf_counter()
+
+        if event.rect() != self.overlay_rect:
+            self.frame_times.append(finished)
+            self.paint_times.append(finished - started)
+
+        if self.show_overlay:
+            self.draw_overlay()
+
+    def draw_overlay(self):
+        fps, paint_ms = self.stats()
+        painter = QPainter(self.viewport())
+        painter.fillRect(self.overlay_rect, QColor(0, 0, 0, 170))
+        painter.setPen(QColor("#2ecc71"))
+        painter.setFont(QFont("Consolas", 9))
+        text = (f"{self.profile.name} | {len(self.scene().items()) if self.scene() else 0} items\n"
+                f"{fps:5.1f} fps | paint {paint_ms:6.2f} ms")
+        painter.drawText(self.overlay_rect.adjusted(6, 4, -4, -4), Qt.AlignmentFlag.AlignLeft, text)
+        painter.end()
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_F3:
+            self.set_overlay_visible(not self.show_overlay)
+            self.overlay_toggled.emit(self.show_overlay)
+        elif event.key() == Qt.Key.Key_F4:
+            names = list(RENDER_PROFILES)
+            self.set_profile(names[(names.index(self.profile.name) + 1) % len(names)])
+        else:
+            super().keyPressEvent(event)
+
+
+def build_benchmark_scene(node_count):
+    """Large synthetic flowchart: a grid of nodes chained by arrows"""
+    from PyQt6.QtWidgets import QGraphicsScene
+    from singleton_flowchart_complete import FlowchartNode, FlowchartArrow
+
+    scene = QGraphicsScene()
+    columns = max(1, int(node_count ** 0.5))
+    previous = None
+    for i in range(node_count):
+        x, y = (i % columns) * 240, (i // columns) * 110
+        node = FlowchartNode(f"Game #{i + 1}\naddTeam(name)", x, y, node_type="collection")
+        scene.addItem(node)
+        if previous is not None:
+            scene.addItem(FlowchartArrow(previous, node))
+        previous = node
+    return scene
+
+
+def run_benchmark(node_count, frames):
+    """Paint the same large scene with each profile and report paint times"""
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    scene = build_benchmark_scene(node_count)
+    print(f"Scene: {node_count} nodes, {len(scene.items())} items, {frames} frames per profile")
+
+    for name in RENDER_PROFILES:
+        view = ProfiledGraphicsView(scene)
+        view.set_profile(name)
+        view.resize(1400, 900)
+        view.show()
+        view.fitInView(scene.itemsBoundingRect(), Qt.AspectRatioMode.KeepAspectRatio)
+        app.processEvents()
+
+        # Zoomed out so every item is on screen; toggle a node each frame
+        nodes = [item for item in scene.items() if hasattr(item, "activate")]
+        started = time.perf_counter()
+        for frame in range(frames):
+            node = nodes[frame % len(nodes)]
+            node.activate() if frame % 2 == 0 else node.deactivate()
+            view.viewport().repaint()
+        elapsed = time.perf_counter() - started
+
+        fps, paint_ms = view.stats()
+        print(f"  {name:8s} {elapsed / frames * 1000:7.2f} ms/frame  (paint {paint_ms:6.2f} ms)")
+        view.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare rendering profiles on a large scene")
+    parser.add_argument("--nodes", type=int, default=1500, help="flowchart nodes in the benchmark scene")
+    parser.add_argument("--frames", type=int, default=60, help="frames painted per profile")
+    args = parser.parse_args()
+    run_benchmark(args.nodes, args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,25 @@
 #!/usr/bin/env python3
 """
 Launch script for the Singleton Pattern Visualizer
-Ensures all dependencies are available and runs the main application
+Ensures all dependencies are available and runs the main application.
+The PyQt6 check is answered from env_probe's cached state file, so a launch
+only imports PyQt6 to test it when the environment changed.
 """
 
 import sys
 import subprocess
 import os
 
-def check_pyqt6():
-    """Check if PyQt6 is installed"""
-    try:
-        import PyQt6
-        print("✓ PyQt6 is installed")
+from env_probe import probe
+
+def check_pyqt6(refresh=False):
+    """Check if PyQt6 is installed (cached by env_probe)"""
+    env = probe(refresh=refresh)
+    if env["pyqt6"]:
+        print(f"✓ PyQt6 {env['pyqt6']} is installed (Qt {env['qt']})")
         return True
-    except ImportError:
-        print("✗ PyQt6 is not installed")
-        return False
+    print("✗ PyQt6 is not installed")
+    return False
 
 def install_pyqt6():
     """Attempt to install PyQt6"""
@@ -28,7 +31,7 @@ def install_pyqt6():
         try:
             subprocess.check_call([sys.executable, "-m", "pip", "install", "PyQt6"])
             print("✓ PyQt6 installed successfully")
-            return True
+            return check_pyqt6(refresh=True)
         except subprocess.CalledProcessError:
             print("✗ Failed to install PyQt6")
             print("Please install manually with: pip install PyQt6")
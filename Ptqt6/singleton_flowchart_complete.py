@@ -3,16 +3,79 @@ from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
                            QGraphicsScene, QGraphicsView, QGraphicsRectItem,
                            QGraphicsTextItem, QGraphicsLineItem, QGraphicsEllipseItem,
                            QPushButton, QSlider, QLabel, QCheckBox, QGroupBox,
-                           QGraphicsPolygonItem, QGraphicsPathItem, QComboBox)
+                           QGraphicsPolygonItem, QGraphicsPathItem, QComboBox, QFileDialog)
 from PyQt6.QtGui import (QBrush, QColor, QPen, QFont, QPainter, QPolygonF,
                        QPainterPath, QLinearGradient, QRadialGradient)
-from PyQt6.QtCore import (QRectF, Qt, QPointF, QTimer, QLineF)
+from PyQt6.QtCore import (QRectF, Qt, QPointF, QTimer, QLineF, QEasingCurve)
 
-class FlowchartNode(QGraphicsRectItem):
+from animation_engine import animator
+from edge_geometry import EdgeEndpointMixin, CachedEdgeMixin, arrow_head_polygon
+from render_profile import ProfiledGraphicsView
+from trace_capture import TraceCapture
+from load_generator import RecordingReplay
+
+# Step sequences for each animation mode: (node key, status description)
+ANIMATION_SEQUENCES = {
+    "full": [
+        ("start", "Starting program execution"),
+        ("main", "Entering ProgramDriver.main()"),
+        ("entity_class", "Entity abstract class defines base structure"),
+        ("game_class", "Game extends Entity with team list"),
+        ("team_class", "Team extends Entity with player list"),
+        ("player_class", "Player extends Entity"),
+        ("get_instance", "Calling GameService.getInstance()"),
+        ("check_null", "Checking if singleton instance exists"),
+        ("create_new", "Creating new GameService instance"),
+        ("id_counters", "Initializing ID counters"),
+        ("instance_ready", "GameService singleton ready"),
+        ("add_game", "Adding a new game"),
+        ("check_game", "Checking if game already exists"),
+        ("create_game", "Creating new Game with unique ID"),
+        ("games_list", "Storing game in games list"),
+        ("add_team", "Adding team to game"),
+        ("add_player", "Adding player to team"),
+        ("test_start", "Running singleton verification test"),
+        ("get_service1", "Getting first GameService reference"),
+        ("get_service2", "Getting second GameService reference"),
+        ("compare", "Comparing both references"),
+        ("verify", "Confirmed: Both references point to same instance!")
+    ],
+    "singleton": [
+        ("start", "Starting program execution"),
+        ("main", "Entering main method"),
+        ("get_instance", "Calling getInstance() - first time"),
+        ("check_null", "Checking if instance exists"),
+        ("create_new", "Instance is null, creating new GameService"),
+        ("instance_ready", "Singleton instance created"),
+        ("test_start", "Starting singleton test"),
+        ("get_service1", "Getting first reference"),
+        ("check_null", "Instance already exists"),
+        ("return_existing", "Returning existing instance"),
+        ("get_service2", "Getting second reference"),
+        ("compare", "Comparing references"),
+        ("verify", "Test complete: Singleton verified!")
+    ],
+    "entity": [
+        ("entity_class", "Entity abstract base class"),
+        ("game_class", "Game extends Entity"),
+        ("team_class", "Team extends Entity"),
+        ("player_class", "Player extends Entity"),
+        ("add_game", "Creating a game instance"),
+        ("create_game", "New Game with unique ID from GameService"),
+        ("add_team", "Adding teams to game"),
+        ("add_player", "Adding players to team"),
+        ("games_list", "All games stored in GameService")
+    ]
+}
+
+class FlowchartNode(EdgeEndpointMixin, QGraphicsRectItem):
     """Enhanced flowchart node with animations and different shapes"""
     def __init__(self, text, x, y, width=200, height=60, node_type="process", shape="rect"):
         super().__init__(QRectF(x, y, width, height))
         
+        # Draggable; incident arrows are told when the node moves
+        self.init_endpoint()
+        
         self.node_type = node_type
         self.shape = shape
         self.is_active = False
@@ -72,7 +135,7 @@ class FlowchartNode(QGraphicsRectItem):
         # Create glow effect
         glow_color = QColor(self.original_brush.color())
         glow_color.setAlpha(200)
-        self.setBrush(QBrush(glow_color))
+        animator().animate(self, "brush_color", glow_color, duration=250)
         pen = QPen(QColor("#fff"), 4)
         pen.setStyle(Qt.PenStyle.DashLine)
         self.setPen(pen)
@@ -80,10 +143,11 @@ class FlowchartNode(QGraphicsRectItem):
     def deactivate(self):
         """Deactivate node"""
         self.is_active = False
+        animator().stop(self)
         self.setBrush(self.original_brush)
         self.setPen(self.original_pen)
 
-class FlowchartArrow(QGraphicsLineItem):
+class FlowchartArrow(CachedEdgeMixin, QGraphicsLineItem):
     """Animated arrow between nodes"""
     def __init__(self, start_node, end_node, label="", arrow_type="straight", style="solid"):
         super().__init__()
@@ -111,22 +175,26 @@ class FlowchartArrow(QGraphicsLineItem):
             self.label_item.setDefaultTextColor(QColor("#888"))
             self.label_item.setFont(QFont("Arial", 9))
         
-        self.update_position()
+        # Register with both endpoints and compute the initial geometry
+        self.init_edge(start_node, end_node)
+        self.ensure_geometry()
         
+    def start_rect(self):
+        return self.start_node.scene_rect()
+    
+    def end_rect(self):
+        return self.end_node.scene_rect()
+    
     def update_position(self):
         """Update arrow position based on connected nodes"""
-        start_rect = self.start_node.rect()
-        end_rect = self.end_node.rect()
-        
+        self.mark_geometry_dirty()
+        self.ensure_geometry()
+    
+    def compute_geometry(self, start_rect, end_rect):
+        """Recompute line, arrow head and label after an endpoint changed"""
         # Calculate connection points
-        start_point = QPointF(
-            start_rect.x() + start_rect.width() / 2,
-            start_rect.y() + start_rect.height()
-        )
-        end_point = QPointF(
-            end_rect.x() + end_rect.width() / 2,
-            end_rect.y()
-        )
+        start_point = QPointF(start_rect.center().x(), start_rect.bottom())
+        end_point = QPointF(end_rect.center().x(), end_rect.top())
         
         # Set line
         self.setLine(QLineF(start_point, end_point))
@@ -144,37 +212,7 @@ class FlowchartArrow(QGraphicsLineItem):
     
     def update_arrow_head(self):
         """Update arrow head polygon"""
-        line = self.line()
-        angle = line.angle()
-        
-        # Arrow head size
-        arrow_length = 12
-        arrow_degrees = 25
-        
-        # Calculate arrow points
-        end_point = line.p2()
-        
-        # Convert angle to radians
-        import math
-        angle_rad = math.radians(angle)
-        
-        # Calculate arrow wings
-        wing1_angle = math.radians(angle - 180 - arrow_degrees)
-        wing2_angle = math.radians(angle - 180 + arrow_degrees)
-        
-        point1 = end_point
-        point2 = QPointF(
-            end_point.x() + arrow_length * math.cos(wing1_angle),
-            end_point.y() + arrow_length * math.sin(wing1_angle)
-        )
-        point3 = QPointF(
-            end_point.x() + arrow_length * math.cos(wing2_angle),
-            end_point.y() + arrow_length * math.sin(wing2_angle)
-        )
-        
-        # Create arrow polygon
-        arrow_polygon = QPolygonF([point1, point2, point3])
-        self.arrow_head.setPolygon(arrow_polygon)
+        self.arrow_head.setPolygon(arrow_head_polygon(self.line(), length=12, degrees=25))
     
     def animate_flow(self):
         """Animate data flow along the arrow"""
@@ -185,31 +223,18 @@ class FlowchartArrow(QGraphicsLineItem):
         
         # Add to scene
         if self.scene():
+            self.ensure_geometry()
             self.scene().addItem(flow_item)
             
-            # Animate along the line
+            # Animate along the line on the shared tick; the dot is removed when it arrives
             line = self.line()
             
-            # Create a timer to move the item along the path
-            steps = 20
-            current_step = 0
-            
-            def move_flow():
-                nonlocal current_step
-                if current_step <= steps:
-                    t = current_step / steps
-                    x = line.p1().x() + t * (line.p2().x() - line.p1().x())
-                    y = line.p1().y() + t * (line.p2().y() - line.p1().y())
-                    flow_item.setPos(x - 5, y - 5)
-                    current_step += 1
-                else:
-                    timer.stop()
-                    if self.scene():
-                        self.scene().removeItem(flow_item)
+            def remove_flow():
+                if flow_item.scene():
+                    flow_item.scene().removeItem(flow_item)
             
-            timer = QTimer()
-            timer.timeout.connect(move_flow)
-            timer.start(50)  # 50ms interval for smooth animation
+            animator().animate(flow_item, "pos", line.p2(), duration=1000, start=line.p1(),
+                               easing=QEasingCurve.Type.Linear, on_finished=remove_flow)
 
 class CompleteFlowchartWidget(QWidget):
     """Widget containing the complete singleton pattern flowchart with Entity hierarchy"""
@@ -219,7 +244,9 @@ class CompleteFlowchartWidget(QWidget):
         self.arrows = []
         self.animation_group = None
         self.current_step = 0
-        self.animation_mode = "full"  # full, singleton, entity
+        self.animation_mode = "full"  # full, singleton, entity, trace, replay
+        self.trace_capture = None
+        self.live_capture = None
         self.init_ui()
         
     def init_ui(self):
@@ -232,7 +259,8 @@ class CompleteFlowchartWidget(QWidget):
         # Animation mode selector
         controls_layout.addWidget(QLabel("Mode:"))
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems(["Full Program Flow", "Singleton Pattern Only", "Entity Hierarchy Only"])
+        self.mode_combo.addItems(["Full Program Flow", "Singleton Pattern Only", "Entity Hierarchy Only",
+                                  "Live Trace (GamingRoom.jar)", "Replay Load Test..."])
         self.mode_combo.currentTextChanged.connect(self.change_animation_mode)
         controls_layout.addWidget(self.mode_combo)
         
@@ -267,8 +295,7 @@ class CompleteFlowchartWidget(QWidget):
         self.scene = QGraphicsScene()
         self.scene.setSceneRect(0, 0, 1500, 1200)
         
-        self.view = QGraphicsView(self.scene)
-        self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.view = ProfiledGraphicsView(self.scene)
         layout.addWidget(self.view)
         
         # Status label
@@ -379,6 +406,9 @@ class CompleteFlowchartWidget(QWidget):
         explanation.setDefaultTextColor(QColor("#888"))
         explanation.setFont(QFont("Arial", 10))
         self.scene.addItem(explanation)
+        
+        # Cache the new items according to the view's rendering profile
+        self.view.refresh_item_cache()
     
     def change_animation_mode(self, mode_text):
         """Change animation mode based on selection"""
@@ -388,66 +418,22 @@ class CompleteFlowchartWidget(QWidget):
             self.animation_mode = "singleton"
         elif "Entity" in mode_text:
             self.animation_mode = "entity"
+        elif "Trace" in mode_text:
+            self.animation_mode = "trace"
+        elif "Replay" in mode_text:
+            self.animation_mode = "replay"
         self.reset_animation()
     
     def play_animation(self):
         """Play animation based on selected mode"""
         self.reset_animation()
         
-        # Define animation sequences for different modes
-        if self.animation_mode == "full":
-            self.animation_sequence = [
-                ("start", "Starting program execution"),
-                ("main", "Entering ProgramDriver.main()"),
-                ("entity_class", "Entity abstract class defines base structure"),
-                ("game_class", "Game extends Entity with team list"),
-                ("team_class", "Team extends Entity with player list"),
-                ("player_class", "Player extends Entity"),
-                ("get_instance", "Calling GameService.getInstance()"),
-                ("check_null", "Checking if singleton instance exists"),
-                ("create_new", "Creating new GameService instance"),
-                ("id_counters", "Initializing ID counters"),
-                ("instance_ready", "GameService singleton ready"),
-                ("add_game", "Adding a new game"),
-                ("check_game", "Checking if game already exists"),
-                ("create_game", "Creating new Game with unique ID"),
-                ("games_list", "Storing game in games list"),
-                ("add_team", "Adding team to game"),
-                ("add_player", "Adding player to team"),
-                ("test_start", "Running singleton verification test"),
-                ("get_service1", "Getting first GameService reference"),
-                ("get_service2", "Getting second GameService reference"),
-                ("compare", "Comparing both references"),
-                ("verify", "Confirmed: Both references point to same instance!")
-            ]
-        elif self.animation_mode == "singleton":
-            self.animation_sequence = [
-                ("start", "Starting program execution"),
-                ("main", "Entering main method"),
-                ("get_instance", "Calling getInstance() - first time"),
-                ("check_null", "Checking if instance exists"),
-                ("create_new", "Instance is null, creating new GameService"),
-                ("instance_ready", "Singleton instance created"),
-                ("test_start", "Starting singleton test"),
-                ("get_service1", "Getting first reference"),
-                ("check_null", "Instance already exists"),
-                ("return_existing", "Returning existing instance"),
-                ("get_service2", "Getting second reference"),
-                ("compare", "Comparing references"),
-                ("verify", "Test complete: Singleton verified!")
-            ]
-        elif self.animation_mode == "entity":
-            self.animation_sequence = [
-                ("entity_class", "Entity abstract base class"),
-                ("game_class", "Game extends Entity"),
-                ("team_class", "Team extends Entity"),
-                ("player_class", "Player extends Entity"),
-                ("add_game", "Creating a game instance"),
-                ("create_game", "New Game with unique ID from GameService"),
-                ("add_team", "Adding teams to game"),
-                ("add_player", "Adding players to team"),
-                ("games_list", "All games stored in GameService")
-            ]
+        if self.animation_mode in ("trace", "replay"):
+            self.play_trace()
+            return
+        
+        # Look up the step sequence for the selected mode
+        self.animation_sequence = list(ANIMATION_SEQUENCES[self.animation_mode])
         
         # Create timer for sequential animation
         self.animation_timer = QTimer()
@@ -459,6 +445,62 @@ class CompleteFlowchartWidget(QWidget):
         
         self.current_step = 0
         self.play_btn.setEnabled(False)
+    
+    def play_trace(self):
+        """Run GamingRoom.jar (or replay a load-test recording) and animate its events"""
+        if self.animation_mode == "replay":
+            path, _ = QFileDialog.getOpenFileName(self, "Load-Test Recording", "",
+                                                  "Recordings (*.jsonl);;All Files (*)")
+            if not path:
+                return
+            self.trace_capture = RecordingReplay(path)
+        else:
+            if self.live_capture is None:
+                self.live_capture = TraceCapture(parent=self)
+                self.live_capture.error.connect(self.on_trace_error)
+            self.trace_capture = self.live_capture
+        
+        self.animation_sequence = []
+        self.current_step = 0
+        if not self.trace_capture.start():
+            if self.animation_mode == "replay":
+                self.on_trace_error(self.trace_capture.error_message or "not a load-test recording")
+            return
+        
+        self.animation_timer = QTimer()
+        self.animation_timer.timeout.connect(self.animate_next_trace_event)
+        self.animation_timer.start(2000 // self.speed_slider.value())
+        self.play_btn.setEnabled(False)
+        self.status_label.setText("Replaying load test..." if self.animation_mode == "replay"
+                                  else "Running GamingRoom.jar...")
+    
+    def animate_next_trace_event(self):
+        """Animate the next buffered event from the running program"""
+        event = self.trace_capture.next_event()
+        if event is None:
+            if self.trace_capture.is_done():
+                self.animation_timer.stop()
+                self.play_btn.setEnabled(True)
+                dropped = self.trace_capture.dropped
+                suffix = f" ({dropped} events skipped to keep up)" if dropped else ""
+                self.status_label.setText(f"Trace complete: {self.current_step} steps{suffix}")
+            return
+        
+        # Only the most recent node stays highlighted while following a live run
+        for node in self.nodes.values():
+            if node.is_active:
+                node.deactivate()
+        if event.node in self.nodes:
+            self.nodes[event.node].activate()
+        self.current_step += 1
+        self.status_label.setText(f"Step {self.current_step}: {event.description}")
+    
+    def on_trace_error(self, message):
+        """Show a trace capture failure in the status bar"""
+        if hasattr(self, 'animation_timer'):
+            self.animation_timer.stop()
+        self.play_btn.setEnabled(True)
+        self.status_label.setText(f"Trace unavailable: {message}")
         
     def animate_next_step(self):
         """Animate the next step in sequence"""
@@ -492,6 +534,16 @@ class CompleteFlowchartWidget(QWidget):
     
     def next_step(self):
         """Execute next step manually"""
+        if self.animation_mode in ("trace", "replay"):
+            if self.trace_capture is None or self.trace_capture.is_done():
+                self.play_trace()
+                if hasattr(self, 'animation_timer'):
+                    self.animation_timer.stop()
+                self.play_btn.setEnabled(True)
+            else:
+                self.animate_next_trace_event()
+            return
+        
         if not hasattr(self, 'animation_sequence'):
             self.play_animation()
             self.animation_timer.stop()
@@ -518,6 +570,10 @@ class CompleteFlowchartWidget(QWidget):
         if hasattr(self, 'animation_timer'):
             self.animation_timer.stop()
         
+        # Stop a live trace run
+        if self.trace_capture is not None:
+            self.trace_capture.stop()
+        
         self.current_step = 0
         self.play_btn.setEnabled(True)
         self.status_label.setText("Ready to animate complete GameService architecture")
@@ -26,10 +26,12 @@ from code_analyzer_fixed import CodeAnalyzerWidget
 from need_fix_animations import AnimatedFlowchartWidget
 from working_code_viz import (MemoryVisualizerWidget, AnimatedUMLClassNode,
                                     ClassInfo, AnimatedArrow)
+from gc_dashboard import GcDashboardWidget
 from PyQt6.QtWidgets import (QGraphicsScene, QGraphicsView, QPushButton, 
                            QHBoxLayout, QTextBrowser, QLabel)
 from PyQt6.QtGui import QPainter, QColor, QBrush, QPen
-from PyQt6.QtCore import QPropertyAnimation, QSequentialAnimationGroup
+from animation_engine import animator
+from render_profile import ProfiledGraphicsView, RENDER_PROFILES
 
 class UMLDiagramWidget(QWidget):
     """Complete UML diagram with all classes and relationships"""
@@ -64,14 +66,14 @@ class UMLDiagramWidget(QWidget):
         self.scene = QGraphicsScene()
         self.scene.setSceneRect(0, 0, 1000, 600)
         
-        self.view = QGraphicsView(self.scene)
-        self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.view = ProfiledGraphicsView(self.scene)
         layout.addWidget(self.view)
         
         self.setLayout(layout)
         
         # Create UML diagram
         self.create_uml_diagram()
+        self.view.refresh_item_cache()
         
     def create_uml_diagram(self):
         """Create the complete UML class diagram"""
@@ -219,26 +221,18 @@ class UMLDiagramWidget(QWidget):
         for rel in self.relationships:
             rel.setOpacity(0)
         
-        # Create animation sequence
-        animation_group = QSequentialAnimationGroup()
+        # Staggered fades on the shared animation tick
+        delay = 0
         
         # Animate nodes appearing
         for node in self.nodes.values():
-            fade_in = QPropertyAnimation(node, b"opacity")
-            fade_in.setDuration(300)
-            fade_in.setStartValue(0)
-            fade_in.setEndValue(1)
-            animation_group.addAnimation(fade_in)
+            animator().animate(node, "opacity", 1.0, duration=300, delay=delay, start=0.0)
+            delay += 300
         
         # Animate relationships appearing
         for rel in self.relationships:
-            fade_in = QPropertyAnimation(rel, b"opacity")
-            fade_in.setDuration(200)
-            fade_in.setStartValue(0)
-            fade_in.setEndValue(1)
-            animation_group.addAnimation(fade_in)
-        
-        animation_group.start()
+            animator().animate(rel, "opacity", 1.0, duration=200, delay=delay, start=0.0)
+            delay += 200
     
     def expand_all(self):
         """Expand all class nodes"""
@@ -664,6 +658,9 @@ class SingletonVisualizerMain(QMainWindow):
         self.memory_widget = MemoryVisualizerWidget()
         self.tabs.addTab(self.memory_widget, "💾 Memory Management")
         
+        self.gc_dashboard = GcDashboardWidget()
+        self.tabs.addTab(self.gc_dashboard, "⏱ GC Pauses")
+        
         self.docs_widget = DocumentationWidget()
         self.tabs.addTab(self.docs_widget, "📚 Documentation")
         
@@ -701,6 +698,23 @@ class SingletonVisualizerMain(QMainWindow):
         fullscreen_action.triggered.connect(self.toggle_fullscreen)
         view_menu.addAction(fullscreen_action)
         
+        # Rendering profile for every diagram view
+        profile_menu = view_menu.addMenu("Rendering Profile")
+        for name in RENDER_PROFILES:
+            profile_action = QAction(name.capitalize(), self)
+            profile_action.triggered.connect(lambda checked, n=name: self.set_render_profile(n))
+            profile_menu.addAction(profile_action)
+        
+        # One overlay state for all views: F3 in any of them toggles this action
+        self.overlay_action = QAction("Show FPS Overlay", self)
+        self.overlay_action.setCheckable(True)
+        views = self.findChildren(ProfiledGraphicsView)
+        self.overlay_action.setChecked(any(view.show_overlay for view in views))
+        self.overlay_action.toggled.connect(self.set_fps_overlay)
+        for view in views:
+            view.overlay_toggled.connect(self.overlay_action.setChecked)
+        view_menu.addAction(self.overlay_action)
+        
         # Tools menu
         tools_menu = menubar.addMenu("Tools")
         
@@ -786,6 +800,17 @@ class SingletonVisualizerMain(QMainWindow):
         else:
             self.showFullScreen()
     
+    def set_render_profile(self, name):
+        """Apply a rendering profile to all diagram views"""
+        for view in self.findChildren(ProfiledGraphicsView):
+            view.set_profile(name)
+        self.status_bar.showMessage(f"Rendering profile: {name}", 3000)
+    
+    def set_fps_overlay(self, visible):
+        """Show or hide the fps / paint-time overlay on all diagram views"""
+        for view in self.findChildren(ProfiledGraphicsView):
+            view.set_overlay_visible(visible)
+    
     def analyze_all(self):
         """Analyze all project files"""
         self.status_bar.showMessage("Analyzing all project files...", 3000)
@@ -826,6 +851,12 @@ class SingletonVisualizerMain(QMainWindow):
             <li>Includes detailed statistics and benefits</li>
         </ul>
         
+        <h3>GC Pauses Tab</h3>
+        <ul>
+            <li>Open a JVM GC log (-Xlog:gc) or follow one while the game runs</li>
+            <li>Pause-time histogram per collection kind with p50/p99 markers</li>
+        </ul>
+        
         <h3>Documentation Tab</h3>
         <ul>
             <li>Comprehensive analysis and best practices</li>
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Startup profiler for the Singleton visualizers
+Launches a visualizer the way the launcher does (a fresh interpreter) and
+records where the time goes until its window has painted: interpreter start,
+import cost per module (from python -X importtime), QApplication creation,
+construction time of each tab widget (UMLDiagramWidget, CodeAnalyzerWidget,
+...), and the time from show() to the first painted frame. The result is a
+text report plus a Chrome trace (open it in chrome://tracing or Perfetto).
+
+Runs headless on Qt's offscreen platform by default, so it can run in CI;
+--baseline compares against an earlier --json report and exits with status 1
+when startup regressed.
+
+Usage:
+    python startup_profiler.py                               # both apps, trace in startup_trace.json
+    python startup_profiler.py --target analyzer --runs 5 --json startup.json
+    python startup_profiler.py --baseline startup.json --tolerance 0.25
+    python startup_profiler.py --max-first-frame 3000        # fail if any app needs more than 3 s
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tempfile
+from collections import defaultdict
+from statistics import median
+from typing import Dict, List
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# target -> (module, top-level window class, tab widget classes to time inside it)
+TARGETS = {
+    "analyzer": ("singleton_visualizer_integrated", "SingletonVisualizerMain",
+                 ["UMLDiagramWidget", "AnimatedFlowchartWidget", "CodeAnalyzerWidget",
+                  "MemoryVisualizerWidget", "DocumentationWidget"]),
+    "flowchart": ("singleton_flowchart_complete", "CompleteFlowchartWidget", []),
+}
+
+IMPORT_MARKER = "startup_profiler: target imports begin"
+PAINT_TIMEOUT = 10.0             # seconds to wait for the first paint before forcing one
+RUN_TIMEOUT = 120.0
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_SLACK_MS = 50.0          # absolute noise allowance added to every baseline comparison
+TOP_IMPORTS = 15
+
+
+# -- child: the profiled process ------------------------------------------------
+
+def child_main(target, out_path, paint_timeout):
+    """Import, build and show target, then write its timestamps to out_path"""
+    started = time.time()
+    module_name, window_class, widget_classes = TARGETS[target]
+    spans = []
+
+    def span(name, category, start, end=None, **args):
+        spans.append({"name": name, "cat": category, "start": start, "end": end or time.time(), "args": args})
+
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+    # Everything importtime reports after this line is the application's own import cost
+    print(IMPORT_MARKER, file=sys.stderr, flush=True)
+    t = time.time()
+    import importlib
+    module = importlib.import_module(module_name)
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+    span(f"import {module_name}", "import", t)
+
+    t = time.time()
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    span("QApplication()", "qt", t)
+
+    # Time each tab widget's constructor while the real window builds them
+    originals = {}
+    for name in widget_classes:
+        cls = getattr(module, name)
+        originals[cls] = cls.__init__
+
+        def timed_init(self, *args, _cls=cls, _init=cls.__init__, **kwargs):
+            t0 = time.time()
+            try:
+                _init(self, *args, **kwargs)
+            finally:
+                span(_cls.__name__, "widget", t0)
+        cls.__init__ = timed_init
+    t = time.time()
+    try:
+        window = getattr(module, window_class)()
+    finally:
+        for cls, init in originals.items():
+            cls.__init__ = init
+    span(window_class, "window", t)
+
+    paint = {"first_event": None, "first_frame": None, "forced": False}
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, watched, event):
+            if (paint["first_event"] is None and event.type() == QEvent.Type.Paint
+                    and getattr(watched, "window", None) and watched.window() is window):
+                paint["first_event"] = time.time()
+                # The frame is complete once the loop is idle again after the paint batch
+                QTimer.singleShot(0, frame_done)
+            return False
+
+    def frame_done():
+        paint["first_frame"] = time.time()
+        app.quit()
+
+    def force_paint():
+        if paint["first_frame"] is None:
+            paint["forced"] = True
+            window.grab()
+            paint["first_event"] = paint["first_event"] or time.time()
+            frame_done()
+
+    watcher = PaintWatcher()
+    app.installEventFilter(watcher)
+    if target == "flowchart":
+        window.resize(1500, 1100)
+    t = time.time()
+    window.show()
+    span("show()", "qt", t)
+    QTimer.singleShot(int(paint_timeout * 1000), force_paint)
+    loop_start = time.time()
+    app.exec()
+    app.removeEventFilter(watcher)
+    span("event loop to first frame", "paint", loop_start, paint["first_frame"])
+
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({"started": started, "spans": spans, "paint": paint,
+                   "qt_platform": app.platformName()}, f)
+
+
+# -- parent: run the child and turn its output into a report ---------------------
+
+def parse_importtime(lines):
+    """Import tree from -X importtime lines: [{name, self_ms, cumulative_ms, depth, children}]"""
+    stack = []
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue   # the header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        node = {"name": name.strip(), "self_ms": int(fields[0]) / 1000, "cumulative_ms": int(fields[1]) / 1000,
+                "depth": depth, "children": []}
+        # Lines come in post-order: deeper entries printed just before are this module's imports
+        while stack and stack[-1]["depth"] > depth:
+            node["children"].insert(0, stack.pop())
+        stack.append(node)
+    return stack
+
+
+def flatten(nodes):
+    for node in nodes:
+        yield node
+        yield from flatten(node["children"])
+
+
+def package_of(name):
+    top = name.split(".")[0]
+    if top == "PyQt6":
+        return "PyQt6"
+    if os.path.exists(os.path.join(BASE_DIR, top + ".py")) or os.path.isdir(os.path.join(BASE_DIR, top)):
+        return "local"
+    return "stdlib/other"
+
+
+def run_once(target, python=sys.executable, display=False, paint_timeout=PAINT_TIMEOUT):
+    env = dict(os.environ)
+    if not display:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = os.path.join(tmp, "child.json")
+        launched = time.time()
+        result = subprocess.run(
+            [python, "-X", "importtime", os.path.abspath(__file__), "--child", target,
+             "--child-out", out_path, "--paint-timeout", str(paint_timeout)],
+            cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=RUN_TIMEOUT,
+            text=True, errors="replace")
+        if result.returncode != 0 or not os.path.exists(out_path):
+            errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+            raise RuntimeError(f"{target} exited with code {result.returncode}:\n" + "\n".join(errors[-20:]))
+        with open(out_path, encoding="utf-8") as f:
+            child = json.load(f)
+    stderr = result.stderr.splitlines()
+    marker = stderr.index(IMPORT_MARKER) if IMPORT_MARKER in stderr else 0
+    return build_report(target, launched, child, parse_importtime(stderr[marker + 1:]))
+
+
+def build_report(target, launched, child, imports):
+    def ms(timestamp):
+        return round((timestamp - launched) * 1000, 1)
+
+    spans = [{**span, "start_ms": ms(span["start"]), "end_ms": ms(span["end"])} for span in child["spans"]]
+    for span in spans:
+        span["duration_ms"] = round(span["end_ms"] - span["start_ms"], 1)
+    by_category = defaultdict(list)
+    for span in spans:
+        by_category[span["cat"]].append(span)
+    modules = list(flatten(imports))
+    by_package = defaultdict(float)
+    for module in modules:
+        by_package[package_of(module["name"])] += module["self_ms"]
+    paint = child["paint"]
+    return {
+        "target": target,
+        "module": TARGETS[target][0],
+        "python": sys.version.split()[0],
+        "qt_platform": child.get("qt_platform"),
+        "interpreter_start_ms": ms(child["started"]),
+        "imports_ms": by_category["import"][0]["duration_ms"],
+        "import_packages_ms": {name: round(value, 1) for name, value in sorted(by_package.items())},
+        "qapplication_ms": next(s["duration_ms"] for s in spans if s["name"] == "QApplication()"),
+        "window_ms": by_category["window"][0]["duration_ms"],
+        "widgets_ms": {span["name"]: span["duration_ms"] for span in by_category["widget"]},
+        "first_paint_ms": ms(paint["first_event"]),
+        "first_frame_ms": ms(paint["first_frame"]),
+        "paint_forced": paint["forced"],
+        "slowest_imports": [{"name": m["name"], "self_ms": m["self_ms"], "cumulative_ms": m["cumulative_ms"]}
+                            for m in sorted(modules, key=lambda m: -m["self_ms"])[:TOP_IMPORTS]],
+        "spans": [{key: span[key] for key in ("name", "cat", "start_ms", "duration_ms")} for span in spans],
+        "import_tree": imports,
+    }
+
+
+def profile(target, runs=1, **options):
+    """Profile target runs times; the run with the median first frame is returned"""
+    reports = [run_once(target, **options) for _ in range(runs)]
+    reports.sort(key=lambda report: report["first_frame_ms"])
+    chosen = reports[len(reports) // 2]
+    if runs > 1:
+        chosen["runs"] = runs
+        chosen["first_frame_range_ms"] = [reports[0]["first_frame_ms"], reports[-1]["first_frame_ms"]]
+        chosen["first_frame_median_ms"] = median(report["first_frame_ms"] for report in reports)
+    return chosen
+
+
+# -- output ---------------------------------------------------------------------
+
+def format_report(report):
+    lines = [f"Startup profile: {report['target']} ({report['module']}.py, Python {report['python']}, "
+             f"Qt platform {report['qt_platform']})"]
+    packages = ", ".join(f"{name} {value:.1f}" for name, value in report["import_packages_ms"].items())
+    lines.append(f"  interpreter start      {report['interpreter_start_ms']:8.1f} ms")
+    lines.append(f"  imports                {report['imports_ms']:8.1f} ms   (self time: {packages})")
+    lines.append(f"  QApplication()         {report['qapplication_ms']:8.1f} ms")
+    lines.append(f"  window constructor     {report['window_ms']:8.1f} ms")
+    for name, value in report["widgets_ms"].items():
+        lines.append(f"    {name:<24}{value:8.1f} ms")
+    forced = "  (no paint event; frame forced with grab())" if report["paint_forced"] else ""
+    lines.append(f"  first paint at         {report['first_paint_ms']:8.1f} ms after launch")
+    lines.append(f"  first frame at         {report['first_frame_ms']:8.1f} ms after launch{forced}")
+    if "runs" in report:
+        low, high = report["first_frame_range_ms"]
+        lines.append(f"  ({report['runs']} runs: first frame {low:.1f} - {high:.1f} ms, median run shown)")
+    lines.append("  slowest imports (self / cumulative ms):")
+    for module in report["slowest_imports"]:
+        lines.append(f"    {module['self_ms']:8.1f} {module['cumulative_ms']:8.1f}  {module['name']}")
+    return "\n".join(lines)
+
+
+def chrome_trace(reports):
+    """Chrome trace event JSON for one or more reports (one trace process per target)"""
+    events = []
+    for pid, report in enumerate(reports, 1):
+        def complete(name, category, start_ms, duration_ms, **args):
+            events.append({"name": name, "cat": category, "ph": "X", "pid": pid, "tid": 1,
+                           "ts": round(start_ms * 1000), "dur": max(1, round(duration_ms * 1000)), "args": args})
+
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": report["target"]}})
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": 1, "args": {"name": "main"}})
+        complete("startup", "startup", 0, report["first_frame_ms"])
+        complete("interpreter start", "startup", 0, report["interpreter_start_ms"])
+        for span in report["spans"]:
+            complete(span["name"], span["cat"], span["start_ms"], span["duration_ms"])
+            if span["cat"] == "import":
+                # importtime has no timestamps; lay the tree out back to back inside the import span
+                cursor = span["start_ms"]
+                for node in report["import_tree"]:
+                    cursor = layout_import(node, cursor, complete)
+        events.append({"name": "first paint", "cat": "paint", "ph": "i", "s": "p", "pid": pid, "tid": 1,
+                       "ts": round(report["first_paint_ms"] * 1000)})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def layout_import(node, start, complete):
+    complete(node["name"], "module", start, node["cumulative_ms"], self_ms=node["self_ms"])
+    cursor = start
+    for child in node["children"]:
+        cursor = layout_import(child, cursor, complete)
+    return start + node["cumulative_ms"]
+
+
+def compare(reports, baseline, tolerance, slack_ms) -> List[str]:
+    """Regressions of reports against an earlier --json file"""
+    old_by_target = {report["target"]: report for report in baseline}
+    regressions = []
+    for report in reports:
+        old = old_by_target.get(report["target"])
+        if old is None:
+            continue
+        metrics: Dict[str, tuple] = {key: (old.get(key), report[key])
+                                     for key in ("first_frame_ms", "imports_ms", "window_ms")}
+        for name, value in report["widgets_ms"].items():
+            metrics[name] = (old.get("widgets_ms", {}).get(name), value)
+        for name, (before, after) in metrics.items():
+            if before is not None and after > before * (1 + tolerance) + slack_ms:
+                regressions.append(f"{report['target']}: {name} {before:.1f} -> {after:.1f} ms "
+                                   f"(+{(after / before - 1) * 100 if before else float('inf'):.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile visualizer start-up: imports, widgets, first paint")
+    parser.add_argument("--target", action="append", choices=sorted(TARGETS),
+                        help="app to profile (repeatable; default: all)")
+    parser.add_argument("--runs", type=int, default=1, help="runs per app; the median run is reported")
+    parser.add_argument("--trace", default="startup_trace.json", help="Chrome trace output file")
+    parser.add_argument("--json", help="also write the full reports as JSON (usable as --baseline)")
+    parser.add_argument("--baseline", help="earlier --json output to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown against the baseline")
+    parser.add_argument("--slack-ms", type=float, default=DEFAULT_SLACK_MS,
+                        help="allowed absolute slowdown on top of --tolerance")
+    parser.add_argument("--max-first-frame", type=float, help="fail if an app's first frame takes longer (ms)")
+    parser.add_argument("--display", action="store_true", help="use the real display instead of offscreen")
+    parser.add_argument("--paint-timeout", type=float, default=PAINT_TIMEOUT, help=argparse.SUPPRESS)
+    parser.add_argument("--child", choices=sorted(TARGETS), help=argparse.SUPPRESS)
+    parser.add_argument("--child-out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child_main(args.child, args.child_out, args.paint_timeout)
+        return
+
+    reports = []
+    for target in args.target or sorted(TARGETS):
+        try:
+            report = profile(target, args.runs, display=args.display, paint_timeout=args.paint_timeout)
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"Error profiling {target}: {e}")
+            sys.exit(2)
+        reports.append(report)
+        print(format_report(report))
+        print()
+
+    with open(args.trace, "w", encoding="utf-8") as f:
+        json.dump(chrome_trace(reports), f)
+    print(f"Chrome trace written to {args.trace}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=1)
+        print(f"Report written to {args.json}")
+
+    failures = []
+    if args.max_first_frame is not None:
+        failures += [f"{report['target']}: first frame {report['first_frame_ms']:.1f} ms "
+                     f"> {args.max_first_frame:.0f} ms" for report in reports
+                     if report["first_frame_ms"] > args.max_first_frame]
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            failures += compare(reports, json.load(f), args.tolerance, args.slack_ms)
+    if failures:
+        print("Startup checks failed:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
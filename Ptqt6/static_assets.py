@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Preloaded, pre-compressed static assets for the launcher server
+Text assets next to the launcher (launcher.html, launcher_template.html, ...)
+are read once, compressed once with gzip (and brotli when the brotli module is
+installed) and kept in memory with a content ETag and Last-Modified date. A
+stat per request notices edits and reloads the asset. Everything else gets
+metadata only and is sent with sendfile by the server.
+
+Usage:
+    from static_assets import AssetCache
+    cache = AssetCache(root)
+    cache.preload()
+    asset = cache.get("/launcher.html")
+    encoding, body = asset.select(request_headers.get("accept-encoding", ""))
+
+    python static_assets.py                   # preloaded assets and their compressed sizes
+"""
+
+import os
+import gzip
+import hashlib
+import argparse
+import mimetypes
+import posixpath
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PRELOAD_EXTENSIONS = {".html", ".htm", ".css", ".js", ".json", ".svg", ".txt", ".md"}
+PRELOAD_MAX_BYTES = 1 << 20      # larger files are streamed from disk instead
+MIN_COMPRESS_BYTES = 512         # below this the encoding overhead eats the saving
+DEFAULT_DOCUMENT = "launcher.html"
+CACHE_CONTROL = "no-cache"       # always revalidate; an unchanged asset costs one 304
+
+
+def content_type_for(path):
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type in ("application/javascript", "application/json",
+                                                            "image/svg+xml"):
+        content_type += "; charset=utf-8"
+    return content_type
+
+
+def http_date(timestamp):
+    return formatdate(timestamp, usegmt=True)
+
+
+def parse_http_date(value):
+    """Seconds since the epoch for an HTTP date header, or None if it does not parse"""
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def accepted_encodings(header):
+    """Codings from an Accept-Encoding header with a non-zero q value"""
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def compress(data):
+    """{encoding: body} with the encodings that actually make data smaller"""
+    variants = {}
+    if len(data) >= MIN_COMPRESS_BYTES:
+        packed = gzip.compress(data, 9, mtime=0)
+        if len(packed) < len(data):
+            variants["gzip"] = packed
+        if brotli is not None:
+            packed = brotli.compress(data, quality=11)
+            if len(packed) < len(data):
+                variants["br"] = packed
+    return variants
+
+
+class Asset:
+    """One file: validators, plus the bodies when it is preloaded"""
+    __slots__ = ("path", "size", "mtime_ns", "content_type", "etag", "last_modified", "body", "variants")
+
+    def __init__(self, path, stat, body=None):
+        self.path = path
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self.content_type = content_type_for(path)
+        self.last_modified = http_date(stat.st_mtime)
+        self.body = body
+        self.variants: Dict[str, bytes] = {}
+        if body is None:
+            # Same shape as nginx: cheap, changes whenever the file does
+            self.etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        else:
+            self.etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+            self.variants = compress(body)
+
+    @classmethod
+    def load(cls, path, stat):
+        with open(path, "rb") as f:
+            body = f.read()
+        return cls(path, stat, body)
+
+    @property
+    def preloaded(self):
+        return self.body is not None
+
+    def current(self, stat):
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def variant_etag(self, encoding):
+        return self.etag if encoding is None else self.etag[:-1] + "-" + encoding + '"'
+
+    def select(self, accept_encoding):
+        """(encoding or None, body) for an Accept-Encoding header; brotli over gzip over identity"""
+        if self.variants:
+            accepted = accepted_encodings(accept_encoding)
+            for encoding in ("br", "gzip"):
+                if encoding in self.variants and (encoding in accepted or "*" in accepted):
+                    return encoding, self.variants[encoding]
+        return None, self.body
+
+    def not_modified(self, headers):
+        """True if the request's validators match, so a 304 can be sent"""
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            # Weak comparison, and any encoding of the same content matches
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or any(self.variant_etag(encoding) in tags
+                                      for encoding in (None, *self.variants))
+        since = parse_http_date(headers.get("if-modified-since", ""))
+        return since is not None and self.mtime_ns // 1_000_000_000 <= since
+
+    def headers(self, encoding=None):
+        headers = {"ETag": self.variant_etag(encoding), "Last-Modified": self.last_modified,
+                   "Cache-Control": CACHE_CONTROL}
+        if self.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return headers
+
+
+class AssetCache:
+    """URL path -> Asset for the files under root"""
+
+    def __init__(self, root=BASE_DIR, max_bytes=PRELOAD_MAX_BYTES):
+        self.root = os.path.realpath(root)
+        self.max_bytes = max_bytes
+        self.assets: Dict[str, Asset] = {}
+
+    def preloadable(self, path, stat):
+        return (os.path.splitext(path)[1].lower() in PRELOAD_EXTENSIONS
+                and stat.st_size <= self.max_bytes)
+
+    def preload(self):
+        """Load and compress the text assets in root; returns how many were loaded"""
+        for entry in os.scandir(self.root):
+            if entry.is_file():
+                stat = entry.stat()
+                if self.preloadable(entry.path, stat):
+                    self.assets[entry.path] = Asset.load(entry.path, stat)
+        return len(self.assets)
+
+    def resolve(self, url_path):
+        """File system path for a URL path, or None if it escapes root"""
+        relative = posixpath.normpath(url_path).lstrip("/")
+        if relative in ("", "."):
+            relative = DEFAULT_DOCUMENT
+        path = os.path.realpath(os.path.join(self.root, *relative.split("/")))
+        if path != self.root and not path.startswith(self.root + os.sep):
+            return None
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+        return path
+
+    def get(self, url_path) -> Optional[Asset]:
+        """Asset for a URL path (reloaded if the file changed); None if missing or outside root"""
+        path = self.resolve(url_path)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.assets.pop(path, None)
+            return None
+        asset = self.assets.get(path)
+        if asset is not None and asset.current(stat):
+            return asset
+        if self.preloadable(path, stat):
+            asset = self.assets[path] = Asset.load(path, stat)
+            return asset
+        return Asset(path, stat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the launcher's preloaded static assets")
+    parser.add_argument("root", nargs="?", default=BASE_DIR)
+    args = parser.parse_args()
+
+    cache = AssetCache(args.root)
+    cache.preload()
+    print(f"brotli: {'available' if brotli is not None else 'not installed (pip install brotli)'}")
+    print(f"{'asset':<34} {'identity':>10} {'gzip':>10} {'br':>10}")
+    for path, asset in sorted(cache.assets.items()):
+        sizes = [str(len(asset.variants[encoding])) if encoding in asset.variants else "-"
+                 for encoding in ("gzip", "br")]
+        print(f"{os.path.relpath(path, cache.root):<34} {asset.size:>10} {sizes[0]:>10} {sizes[1]:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the Java thread-safety check (concurrency_check.py).
+Run with pytest.
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from concurrency_check import check_source, check_sources
+
+
+def rules(body):
+    """(rule, line) findings for a class with one counter field around body"""
+    source = "public class Counter {\n    private long n = 1;\n" + body + "\n}\n"
+    return [(finding.rule, finding.line) for finding in check_source(source, "Counter.java")]
+
+
+def test_one_line_synchronized_block():
+    """An increment inside a synchronized block on the same line is not flagged"""
+    assert rules("    public long next() {\n        synchronized (this) { n++; }\n        return n;\n    }") == []
+
+
+def test_increment_before_synchronized_block():
+    """Code before the block on the same line is still checked"""
+    assert rules("    public void bump() {\n        n++; synchronized (this) { n--; }\n    }") == [
+        ("unsynchronized-increment", 4)]
+
+
+def test_one_line_method_body():
+    """A method whose body is on its header line is checked"""
+    assert rules("    public long next() { return n++; }") == [("unsynchronized-increment", 3)]
+    assert rules("    public synchronized long next() { return n++; }") == []
+
+
+def test_lazy_singleton_on_one_line():
+    source = ("public class Service {\n    private static Service instance = null;\n"
+              "    public static Service get() { if (instance == null) { instance = new Service(); } "
+              "return instance; }\n}\n")
+    assert [finding.rule for finding in check_source(source)] == ["lazy-singleton"]
+
+
+def test_gamingroom_sources():
+    """The GamingRoom GameService still shows its lazy singleton and counter races"""
+    found = {finding.rule for finding in check_sources()}
+    assert found == {"lazy-singleton", "unsynchronized-increment"}
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the Python gamingroom model (snapshots, store, id allocators).
+Run with pytest.
+"""
+
+import sys
+import os
+import tempfile
+import subprocess
+import multiprocessing
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from gamingroom import EntityStore, GameService
+from gamingroom.ids import IdService
+from gamingroom.snapshot import load_snapshot, restore_service, save_service
+
+
+def saved_world(directory):
+    """A small service whose counters are ahead of its largest ids"""
+    service = GameService()
+    GameService.resetInstance(service)
+    game = service.addGame("Game #1")
+    game.addTeam("t1").addPlayer("p1")
+    game.addTeam("t2").addPlayer("p2")
+    # Drawn but never used: a restored service must not hand these out again
+    service.getNextTeamId()
+    service.getNextPlayerId()
+    path = os.path.join(directory, "world.grsnap")
+    save_service(service, path)
+    return path
+
+
+def test_restore_installs_singleton():
+    """Teams and players added after a restore continue the restored counters"""
+    with tempfile.TemporaryDirectory() as directory:
+        world = load_snapshot(saved_world(directory))
+        try:
+            GameService.resetInstance()
+            service = restore_service(world)
+            assert GameService.getInstance() is service
+            game = service.getGame("Game #1")
+            team = game.addTeam("t3")
+            player = team.addPlayer("p3")
+            assert [t.getId() for t in game.getTeams()] == [1, 2, 4]
+            assert player.getId() == 4
+        finally:
+            world.close()
+            GameService.resetInstance()
+
+
+def test_save_keeps_counters():
+    """Snapshots record the service's counters, not max id + 1"""
+    with tempfile.TemporaryDirectory() as directory:
+        world = load_snapshot(saved_world(directory))
+        try:
+            assert list(world.next_ids.values()) == [2, 4, 4]
+        finally:
+            world.close()
+            GameService.resetInstance()
+
+
+def test_store_lookups_do_not_intern():
+    """Failed lookups and duplicate adds leave the string tables as they were"""
+    store = EntityStore()
+    game = store.addGame("Game #1")
+    team = game.addTeam("Team Alpha")
+    team.addPlayer("Justin")
+    names, folded = len(store.strings), len(store.folded_names)
+    for i in range(1000):
+        assert store.getGame(f"Missing {i}") is None
+    assert game.addTeam("TEAM ALPHA") == team
+    assert team.addPlayer("justin").getName() == "Justin"
+    assert (len(store.strings), len(store.folded_names)) == (names, folded)
+    # Casefolded keys live in their own table, not among the entity names
+    assert names == 3 and len(store) == 3
+
+
+def test_store_module_runs_without_warnings():
+    """python -m gamingroom.store does not find itself imported by the package"""
+    result = subprocess.run([sys.executable, "-W", "error::RuntimeWarning", "-m", "gamingroom.store",
+                             "--players", "1000"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert "RuntimeWarning" not in result.stderr
+
+
+_worker_ids = None
+
+
+def _init_worker(ids):
+    global _worker_ids
+    _worker_ids = ids
+
+
+def _draw_three(_):
+    return [next(_worker_ids.players) for _ in range(3)]
+
+
+def test_forked_workers_get_their_own_blocks():
+    """A block the parent drew from before forking is not continued by the children"""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return
+    context = multiprocessing.get_context("fork")
+    ids = IdService(block_size=3, shared=True, context=context)
+    drawn = [next(ids.players)]
+    with context.Pool(3, initializer=_init_worker, initargs=(ids,)) as pool:
+        for result in pool.map(_draw_three, range(3), chunksize=1):
+            drawn += result
+    drawn.append(next(ids.players))
+    assert len(drawn) == len(set(drawn)), drawn
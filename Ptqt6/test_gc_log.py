@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming GC log parser (gc_log.py): sample unified and JDK 8
+lines, and tailing a log that grows, is cut mid-line, truncated or rotated.
+Run with pytest.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from gc_log import MAX_LINE, GcLogTail, PauseHistogram, parse_line, scan_events
+
+M = 1024 ** 2
+K = 1024
+
+# -Xlog:gc output from G1, with the [gc,start] and heap lines that are not pauses
+UNIFIED_LOG = """\
+[0.012s][info][gc] Using G1
+[0.100s][info][gc,heap] Heap region size: 1M
+[0.510s][info][gc,start] GC(3) Pause Young (Normal) (G1 Evacuation Pause)
+[0.512s][info][gc] GC(3) Pause Young (Normal) (G1 Evacuation Pause) 24M->3M(256M) 2.345ms
+[1.234s][info][gc] GC(7) Pause Full (System.gc()) 10M->2M(64M) 15,678ms
+[2.000s][info][gc] GC(8) Pause Remark 20M->20M(64M) 1.234ms
+[1500ms][info][gc] GC(9) Y: Pause Mark Start 0.012ms
+"""
+
+# -XX:+PrintGCDetails output from the parallel collector (JDK 8)
+LEGACY_LOG = """\
+1.234: [GC (Allocation Failure) [PSYoungGen: 33280K->5112K(38400K)] 33280K->5120K(125952K), 0.0051234 secs] [Times: user=0.01 sys=0.00, real=0.01 secs]
+5.678: [Full GC (Ergonomics) [PSYoungGen: 5112K->0K(38400K)] [ParOldGen: 8K->4955K(87552K)] 5120K->4955K(125952K), [Metaspace: 3000K->3000K(1056768K)], 0.0234567 secs] [Times: user=0.05 sys=0.00, real=0.02 secs]
+Heap
+ PSYoungGen      total 38400K, used 998K
+"""
+
+
+def test_unified_lines():
+    young, full, remark, zgc = (parse_line(line) for line in UNIFIED_LOG.splitlines()[3:])
+    assert (young.kind, young.phase, young.cause) == ("Pause Young", "Normal", "G1 Evacuation Pause")
+    assert (young.pause_ms, young.uptime, young.gc_id) == (2.345, 0.512, 3)
+    assert (young.heap_before, young.heap_after, young.heap_capacity) == (24 * M, 3 * M, 256 * M)
+    # Nested parentheses in the cause, and a comma as the decimal separator
+    assert (full.kind, full.cause, full.phase, full.pause_ms) == ("Pause Full", "System.gc()", "", 15.678)
+    assert (remark.kind, remark.cause) == ("Pause Remark", "")
+    # ZGC's generation prefix, no heap sizes, uptime in milliseconds
+    assert (zgc.kind, zgc.pause_ms, zgc.uptime, zgc.heap_before) == ("Pause Mark Start", 0.012, 1.5, None)
+
+
+def test_non_pause_lines():
+    for line in UNIFIED_LOG.splitlines()[:3] + LEGACY_LOG.splitlines()[2:] + ["", "GC(3) Pause Young"]:
+        assert parse_line(line) is None, line
+
+
+def test_legacy_lines():
+    young, full = (parse_line(line) for line in LEGACY_LOG.splitlines()[:2])
+    assert (young.kind, young.cause, young.uptime) == ("Pause Young", "Allocation Failure", 1.234)
+    assert round(young.pause_ms, 4) == 5.1234
+    # The whole-heap transition, not the PSYoungGen one before it
+    assert (young.heap_before, young.heap_after, young.heap_capacity) == (33280 * K, 5120 * K, 125952 * K)
+    assert (full.kind, full.cause, round(full.pause_ms, 4)) == ("Pause Full", "Ergonomics", 23.4567)
+    assert (full.heap_before, full.heap_after) == (5120 * K, 4955 * K)
+
+
+def test_scan_events_matches_parse_line():
+    for log in (UNIFIED_LOG, LEGACY_LOG):
+        expected = [event for event in map(parse_line, log.splitlines()) if event is not None]
+        assert list(scan_events(log.encode())) == expected
+
+
+def write(path, text, mode="w"):
+    with open(path, mode) as f:
+        f.write(text)
+
+
+def test_tail_waits_for_complete_lines():
+    """A line cut mid-write is parsed once its newline arrives"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gc.log")
+        lines = UNIFIED_LOG.splitlines(keepends=True)
+        write(path, "".join(lines[:4]) + lines[4][:30])
+        tail = GcLogTail(path)
+        assert [event.gc_id for event in tail.poll()] == [3]
+        assert tail.poll() == []
+        write(path, lines[4][30:] + "".join(lines[5:]), "a")
+        assert [event.gc_id for event in tail.poll()] == [7, 8, 9]
+        assert tail.backlog == 0
+
+
+def test_tail_reads_a_backlog_in_steps():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gc.log")
+        write(path, UNIFIED_LOG * 50)
+        tail = GcLogTail(path)
+        events = tail.poll(max_bytes=1000)
+        assert tail.backlog == len(UNIFIED_LOG) * 50 - 1000
+        while tail.backlog:
+            events += tail.poll(max_bytes=1000)
+        assert len(events) == 4 * 50
+
+
+def test_tail_restarts_after_truncation_and_rotation():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gc.log")
+        write(path, UNIFIED_LOG)
+        tail = GcLogTail(path)
+        assert len(tail.poll()) == 4
+        # Truncated in place (same inode, now shorter than the offset)
+        write(path, LEGACY_LOG)
+        assert [event.kind for event in tail.poll()] == ["Pause Young", "Pause Full"]
+        # Rotated: the old log is renamed and a new, longer one takes its place
+        os.rename(path, path + ".1")
+        write(path, UNIFIED_LOG * 2)
+        assert len(tail.poll()) == 8
+        os.remove(path)
+        assert tail.poll() == []
+
+
+def test_tail_drops_runaway_lines():
+    """A "line" longer than MAX_LINE without a newline is discarded, not buffered forever"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gc.log")
+        write(path, "x" * (MAX_LINE + 10))
+        tail = GcLogTail(path)
+        assert tail.poll(max_bytes=MAX_LINE * 2) == [] and tail.partial == b""
+        write(path, "\n" + UNIFIED_LOG, "a")
+        assert len(tail.poll()) == 4
+
+
+def test_pause_histogram_percentiles():
+    histogram = PauseHistogram()
+    for ms in [1.0] * 98 + [100.0] * 2:
+        histogram.add(ms)
+    assert histogram.count == 100
+    assert abs(histogram.percentile(50) - 1.0) / 1.0 < 0.13
+    assert abs(histogram.percentile(99) - 100.0) / 100.0 < 0.13
+    histogram.add(0.0)
+    assert histogram.percentile(0) >= 0
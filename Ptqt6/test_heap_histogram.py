@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the class-histogram parser (heap_histogram.py): jcmd and jmap
+sample output, complete and truncated dumps, streamed and loaded from a file.
+Run with pytest.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from heap_histogram import HistogramParser, load_histogram, parse_histogram
+
+# jcmd <pid> GC.class_histogram (JDK 9+ adds the module column)
+JCMD_HISTOGRAM = """\
+12345:
+ num     #instances         #bytes  class name (module)
+-------------------------------------------------------
+   1:          5432         412568  [B (java.base@17.0.2)
+   2:          4321         103704  java.lang.String (java.base@17.0.2)
+   3:            12            384  com.gamingroom.Player
+   4:             3             96  com.gamingroom.Team
+   5:             1             32  com.gamingroom.Game
+   6:             1             16  com.gamingroom.GameService
+Total          9770         516800
+"""
+
+# jmap -histo <pid> on JDK 8: no pid line, no modules
+JMAP_HISTOGRAM = """\
+
+ num     #instances         #bytes  class name
+----------------------------------------------
+   1:          5432         412568  [B
+   2:            12            384  com.gamingroom.Player
+   3:             7            168  com.gamingroom.PlayerStats
+   4:             1             16  com.gamingroom.GameService
+Total          5452         413136
+"""
+
+
+def counts(histogram):
+    return {name: (entry.rank, entry.instances, entry.bytes) for name, entry in histogram.entries.items()}
+
+
+def test_jcmd_histogram():
+    histogram = parse_histogram(JCMD_HISTOGRAM.splitlines(keepends=True), "pid 12345")
+    assert counts(histogram) == {"com.gamingroom.Player": (3, 12, 384), "com.gamingroom.Team": (4, 3, 96),
+                                 "com.gamingroom.Game": (5, 1, 32), "com.gamingroom.GameService": (6, 1, 16)}
+    assert (histogram.total_instances, histogram.total_bytes, histogram.class_count) == (9770, 516800, 6)
+    assert histogram.get("Team").class_name == "com.gamingroom.Team"
+    assert histogram.get("Player").display_name == "Player"
+    assert histogram.get("Missing") is None and histogram.source == "pid 12345"
+
+
+def test_jmap_histogram():
+    """Classes whose names merely start with a watched one are not watched"""
+    histogram = parse_histogram(JMAP_HISTOGRAM.splitlines())
+    assert counts(histogram) == {"com.gamingroom.Player": (2, 12, 384),
+                                 "com.gamingroom.GameService": (4, 1, 16)}
+    assert (histogram.total_instances, histogram.total_bytes, histogram.class_count) == (5452, 413136, 4)
+
+
+def test_feed_reports_watched_rows_as_they_arrive():
+    parser = HistogramParser()
+    fed = [parser.feed(line) for line in JCMD_HISTOGRAM.splitlines()]
+    assert [entry.display_name for entry in fed if entry is not None] == ["Player", "Team", "Game", "GameService"]
+    assert fed[0] is None                       # the "12345:" line is not a row
+
+
+def test_truncated_histogram_sums_complete_rows():
+    """Without a Total line the totals are the sum of the rows that did arrive"""
+    lines = JCMD_HISTOGRAM.splitlines()[:6] + ["   4:             3"]
+    histogram = parse_histogram(lines)
+    assert list(histogram.entries) == ["com.gamingroom.Player"]
+    assert (histogram.total_instances, histogram.total_bytes, histogram.class_count) == (9765, 516656, 3)
+
+
+def test_malformed_rows_are_skipped():
+    lines = ["   1:   many   96  com.gamingroom.Team", "   2:  3  96", "Total  lots  bytes",
+             "   3:  2  64  com.gamingroom.Team"]
+    histogram = parse_histogram(lines)
+    assert counts(histogram) == {"com.gamingroom.Team": (3, 2, 64)}
+    assert (histogram.total_instances, histogram.total_bytes, histogram.class_count) == (2, 64, 1)
+
+
+def test_load_histogram_matches_the_streaming_parser():
+    """The whole-file fast path and the truncated-file fallback agree with parse_histogram"""
+    with tempfile.TemporaryDirectory() as directory:
+        for name, text in (("jcmd.txt", JCMD_HISTOGRAM), ("jmap.txt", JMAP_HISTOGRAM),
+                           ("truncated.txt", JCMD_HISTOGRAM[:JCMD_HISTOGRAM.index("   5:")] + "   5:   1")):
+            path = os.path.join(directory, name)
+            with open(path, "w") as f:
+                f.write(text)
+            loaded = load_histogram(path)
+            expected = parse_histogram(text.splitlines(), name)
+            assert loaded == expected, name
+
+
+def test_load_histogram_across_chunks():
+    """A watched row that straddles the 1 MB read boundary is still found"""
+    rows = []
+    size = 0
+    while size < (1 << 20) - 200:
+        rows.append(f"{len(rows) + 1:>6}:          1             16  java.lang.Filler{len(rows)}\n")
+        size += len(rows[-1])
+    # One padded filler row ends 30 bytes before the boundary
+    padding = (1 << 20) - 30 - size - len(f"{len(rows) + 1:>6}:          1             16  java.lang.\n")
+    rows.append(f"{len(rows) + 1:>6}:          1             16  java.lang.{'P' * padding}\n")
+    size += len(rows[-1])
+    rows.append(f"{len(rows) + 1:>6}:            12            384  com.gamingroom.Player\n")
+    assert size < 1 << 20 < size + len(rows[-1])
+    rows += [f"{len(rows) + 1:>6}:          1             16  java.lang.Tail\n",
+             f"Total  {len(rows) + 12}  {len(rows) * 16 + 384}\n"]
+    text = "".join(rows)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "big.txt")
+        with open(path, "w") as f:
+            f.write(text)
+        loaded = load_histogram(path)
+    assert loaded == parse_histogram(text.splitlines(), "big.txt")
+    assert loaded.get("Player").instances == 12 and loaded.class_count == len(rows) - 1
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the warm JVM pool (jvm_pool.py), using a Python stand-in for WarmRunner.
+Run with pytest; no JDK needed.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from jvm_pool import JavaRun, JvmPool, WarmJvm
+
+LONG_LINE = 200 * 1024       # well over asyncio's 64 KiB readline limit
+
+# Speaks the WarmRunner protocol: READY, then one long line, "after" and the end marker per RUN
+FAKE_RUNNER = f"""
+import sys
+print("READY", flush=True)
+for line in sys.stdin:
+    if line.strip() == "Q":
+        break
+    if line.startswith("RUN"):
+        sys.stdout.write("x" * {LONG_LINE} + "\\nafter\\n\\0END\\t0\\n")
+        sys.stdout.flush()
+"""
+
+# Prints output without a final newline, so the end marker shares its line
+UNTERMINATED_RUNNER = """
+import sys
+print("READY", flush=True)
+for line in sys.stdin:
+    if line.startswith("RUN"):
+        sys.stdout.write("first\\nno newline\\0END\\t3\\n")
+        sys.stdout.flush()
+"""
+
+
+def run_text(run):
+    entries, _ = run.output.since(0)
+    return [text for _, _, text in entries]
+
+
+def test_warm_run_with_long_line():
+    """Lines over the StreamReader limit are read in pieces and the JVM stays usable"""
+    async def scenario():
+        jvm = WarmJvm([sys.executable, "-c", FAKE_RUNNER])
+        await jvm.start()
+        try:
+            for run_id in (1, 2):
+                run = JavaRun(run_id, [])
+                assert await asyncio.wait_for(jvm.run(run), 10) == 0
+                lines = run_text(run)
+                assert "".join(lines[:-1]) == "x" * LONG_LINE
+                assert lines[-1] == "after"
+        finally:
+            await jvm.close()
+    asyncio.run(scenario())
+
+
+def test_failing_run_still_finishes():
+    """An unexpected error finishes the run, so followers are not left waiting"""
+    async def scenario():
+        pool = JvmPool(size=0)
+        await pool.start()
+
+        async def broken(run):
+            raise ValueError("Separator is not found, and chunk exceed the limit")
+        pool.run_cold = broken
+        finished = []
+        pool.finished_callbacks.append(finished.append)
+        run = pool.run()
+        await asyncio.wait_for(run.wait(), 5)
+        assert run.done and run.status is None and "ValueError" in run.error
+        assert finished == [run]
+    asyncio.run(scenario())
+
+
+def test_end_marker_after_unterminated_output():
+    """A marker in the middle of a line ends the run and keeps the text before it"""
+    async def scenario():
+        jvm = WarmJvm([sys.executable, "-c", UNTERMINATED_RUNNER])
+        await jvm.start()
+        try:
+            run = JavaRun(1, [])
+            assert await asyncio.wait_for(jvm.run(run), 10) == 3
+            assert run_text(run) == ["first", "no newline"]
+        finally:
+            await jvm.close()
+    asyncio.run(scenario())
+
+
+def test_args_cannot_break_the_run_line():
+    """Arguments with tabs or line breaks would inject extra RUN or Q commands"""
+    for arg in ("x\nQ", "x\nRUN", "a\tb", "x\r"):
+        try:
+            JavaRun(1, ["ok", arg])
+        except ValueError:
+            continue
+        raise AssertionError(f"{arg!r} was accepted")
+    assert JavaRun(1, ["two words", "--flag=1"]).args == ["two words", "--flag=1"]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for launch coalescing and rate limiting (launch_control.py), on a fake clock.
+Run with pytest.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from launch_control import Coalescer, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting_launch(results):
+    """launch() returning results in turn; .calls counts the real launches"""
+    async def launch():
+        launch.calls += 1
+        await asyncio.sleep(0)
+        return results[launch.calls - 1]
+    launch.calls = 0
+    return launch
+
+
+def test_duplicates_in_window_reuse_the_result():
+    async def scenario():
+        clock = FakeClock()
+        coalescer = Coalescer(window=2.0, clock=clock)
+        launch = counting_launch(["pid 1", "pid 2", "pid 3"])
+        assert await coalescer.run("flowchart", launch) == ("pid 1", False)
+        clock.now += 1.9
+        assert await coalescer.run("flowchart", launch) == ("pid 1", True)
+        assert await coalescer.run("analyzer", launch) == ("pid 2", False)
+        clock.now += 0.1        # the window counts from the first request, not the last
+        assert await coalescer.run("flowchart", launch) == ("pid 3", False)
+        assert launch.calls == 3
+    asyncio.run(scenario())
+
+
+def test_concurrent_duplicates_share_one_launch():
+    async def scenario():
+        coalescer = Coalescer(window=2.0, clock=FakeClock())
+        launch = counting_launch(["pid 1"])
+        results = await asyncio.gather(*(coalescer.run("flowchart", launch) for _ in range(5)))
+        assert results == [("pid 1", False)] + [("pid 1", True)] * 4
+        assert launch.calls == 1
+    asyncio.run(scenario())
+
+
+def test_results_not_kept_are_not_reused():
+    """A failed launch is shared with requests already waiting, but the next one retries"""
+    async def scenario():
+        coalescer = Coalescer(window=2.0, clock=FakeClock())
+        launch = counting_launch([("failed", 500), ("failed", 500), ("pid 7", 200)])
+        keep = lambda result: result[1] == 200
+        first, waiting = await asyncio.gather(coalescer.run("java", launch, keep),
+                                              coalescer.run("java", launch, keep))
+        assert first == (("failed", 500), False) and waiting == (("failed", 500), True)
+        assert await coalescer.run("java", launch, keep) == (("failed", 500), False)
+        assert await coalescer.run("java", launch, keep) == (("pid 7", 200), False)
+        assert await coalescer.run("java", launch, keep) == (("pid 7", 200), True)
+        assert launch.calls == 3
+    asyncio.run(scenario())
+
+
+def test_exceptions_reach_every_waiter():
+    async def scenario():
+        coalescer = Coalescer(window=2.0, clock=FakeClock())
+        calls = []
+
+        async def broken():
+            calls.append(1)
+            await asyncio.sleep(0)
+            raise OSError("no such file")
+        results = await asyncio.gather(*(coalescer.run("flowchart", broken) for _ in range(3)),
+                                       return_exceptions=True)
+        assert len(calls) == 1
+        assert all(isinstance(result, OSError) for result in results)
+        # The failure is not cached: the next request launches again
+        results = await asyncio.gather(coalescer.run("flowchart", broken), return_exceptions=True)
+        assert isinstance(results[0], OSError) and len(calls) == 2
+        assert not coalescer.entries
+    asyncio.run(scenario())
+
+
+def test_window_zero_disables_coalescing():
+    async def scenario():
+        coalescer = Coalescer(window=0, clock=FakeClock())
+        launch = counting_launch(["pid 1", "pid 2"])
+        assert await coalescer.run("flowchart", launch) == ("pid 1", False)
+        assert await coalescer.run("flowchart", launch) == ("pid 2", False)
+    asyncio.run(scenario())
+
+
+def test_bucket_refills_at_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0.5, burst=3, clock=clock)
+    assert [bucket.acquire()[0] for _ in range(3)] == [True, True, True]
+    assert bucket.acquire() == (False, 2.0)
+    clock.now += 1.5
+    allowed, retry_after = bucket.acquire()
+    assert not allowed and abs(retry_after - 0.5) < 1e-9
+    clock.now += 0.5
+    assert bucket.acquire() == (True, 0.0)
+    # Idle time refills up to burst, never beyond
+    clock.now += 60
+    assert [bucket.acquire()[0] for _ in range(4)] == [True, True, True, False]
+
+
+def test_zero_rate_bucket_never_refills():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0, burst=1, clock=clock)
+    assert bucket.acquire() == (True, 0.0)
+    clock.now += 1000
+    assert bucket.acquire() == (False, float("inf"))
+
+
+def test_rate_limiter_keeps_a_bucket_per_app():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1.0, burst=1, clock=clock)
+    assert limiter.acquire("flowchart") == (True, 0.0)
+    assert limiter.acquire("flowchart") == (False, 1.0)
+    assert limiter.acquire("analyzer") == (True, 0.0)
+    clock.now += 1
+    assert limiter.acquire("flowchart") == (True, 0.0)
+    unlimited = RateLimiter(rate=0, clock=clock)
+    assert all(unlimited.acquire("flowchart") == (True, 0.0) for _ in range(100))
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tests for the launcher's HTTP server (launcher_server.py), served on an ephemeral port:
+request parsing, keep-alive, HEAD, limits, the loopback check, chunked streams, WebSockets.
+Run with pytest.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from launcher_server import MAX_BODY_BYTES, MAX_HEADER_BYTES, LauncherServer, Request
+
+# Stays alive until the server stops it, so /ws/output can find it
+SLEEPER = [sys.executable, "-c", "import time; print('ready', flush=True); time.sleep(60)"]
+
+
+def serve(scenario, **options):
+    """Run scenario(server, port) against a LauncherServer listening on 127.0.0.1"""
+    async def main():
+        server = LauncherServer(java_workers=0, **options)
+        port = await server.start("127.0.0.1", 0, attempts=1)
+        try:
+            await asyncio.wait_for(scenario(server, port), 20)
+        finally:
+            await server.stop()
+    asyncio.run(main())
+
+
+async def exchange(port, raw):
+    """Send raw request bytes; returns the status code and the response head"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(raw)
+        await writer.drain()
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        return int(head.split(" ", 2)[1]), head
+    finally:
+        writer.close()
+
+
+async def read_response(reader, has_body=True):
+    """(status, headers, body) of one response; chunked bodies are reassembled"""
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    status = int(head[0].split(" ", 2)[1])
+    headers = {}
+    for line in head[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    body = b""
+    if not has_body:
+        return status, headers, body
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int(await reader.readuntil(b"\r\n"), 16)
+            body += (await reader.readexactly(size + 2))[:-2]
+            if not size:
+                break
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    return status, headers, body
+
+
+def get(path, method="GET", extra=""):
+    return f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n{extra}\r\n".encode()
+
+
+def upgrade(port, path, origin=None):
+    lines = [f"GET {path} HTTP/1.1", f"Host: 127.0.0.1:{port}", "Upgrade: websocket",
+             "Connection: Upgrade", "Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==",
+             "Sec-WebSocket-Version: 13"]
+    if origin is not None:
+        lines.append(f"Origin: {origin}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+
+def test_ws_output_refuses_cross_origin():
+    """A page on another origin cannot follow a process's output"""
+    async def scenario(server, port):
+        child = await server.supervisor.start("sleeper", SLEEPER)
+        path = f"/ws/output?pid={child.pid}"
+        status, _ = await exchange(port, upgrade(port, path, "http://evil.example"))
+        assert status == 403
+        status, _ = await exchange(port, upgrade(port, path, "null"))
+        assert status == 403
+        status, head = await exchange(port, upgrade(port, path, f"http://127.0.0.1:{port}"))
+        assert status == 101, head
+        status, _ = await exchange(port, upgrade(port, path))
+        assert status == 101
+    serve(scenario)
+
+
+def test_java_run_rejects_line_breaks_in_args():
+    """arg=x%0AQ would stop the warm JVM; it is refused before anything runs"""
+    async def scenario(server, port):
+        for path in ("/java/run?arg=x%0AQ", "/launch?app=java&arg=a%09b"):
+            status, _ = await exchange(port, f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            assert status == 400, path
+        assert not server.jvm_pool.runs
+    serve(scenario)
+
+
+def test_keep_alive_and_head():
+    """Requests share one connection until Connection: close; HEAD sends headers only"""
+    async def scenario(server, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            writer.write(get("/launch?app=status") + get("/launcher.html", "HEAD") + get("/launcher.html"))
+            status, headers, body = await read_response(reader)
+            assert status == 200 and b'"running"' in body
+            status, head_headers, _ = await read_response(reader, has_body=False)
+            assert status == 200
+            status, headers, body = await read_response(reader)
+            assert status == 200 and len(body) == int(headers["content-length"])
+            assert head_headers["content-length"] == headers["content-length"]
+            assert head_headers["etag"] == headers["etag"]
+            writer.write(get("/launch?app=status", extra="Connection: close\r\n"))
+            status, headers, _ = await read_response(reader)
+            assert status == 200 and headers["connection"] == "close"
+            assert await reader.read() == b""
+        finally:
+            writer.close()
+    serve(scenario)
+
+
+def test_malformed_and_oversized_requests():
+    """Bad request lines, unknown methods and oversized heads or bodies are refused"""
+    async def scenario(server, port):
+        assert (await exchange(port, b"nonsense\r\n\r\n"))[0] == 400
+        assert (await exchange(port, b"GET / SPDY/3\r\n\r\n"))[0] == 400
+        assert (await exchange(port, get("/", "DELETE")))[0] == 405
+        assert (await exchange(port, get("/launcher.html", "POST")))[0] == 405
+        too_long = f"Content-Length: {MAX_BODY_BYTES + 1}\r\n"
+        assert (await exchange(port, get("/launch?app=status", "POST", too_long)))[0] == 413
+        huge_header = "X-Padding: " + "a" * MAX_HEADER_BYTES + "\r\n"
+        assert (await exchange(port, get("/", extra=huge_header)))[0] == 431
+        # A body within the limit is read off the connection before the next request
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            writer.write(get("/launch?app=status", "POST", "Content-Length: 5\r\n") + b"hello"
+                         + get("/launch?app=status"))
+            assert (await read_response(reader))[0] == 200
+            assert (await read_response(reader))[0] == 200
+        finally:
+            writer.close()
+    serve(scenario)
+
+
+def test_control_routes_are_loopback_only():
+    """Other machines get the static files but not the launching and process routes"""
+    async def scenario(server, port):
+        def request(path, client):
+            return Request("GET", path, "HTTP/1.1", {"host": "launcher:8080"}, client=client)
+        for client in ("192.0.2.7", "::ffff:10.0.0.3"):
+            assert (await server.dispatch(request("/processes", client))).status == 403
+            assert (await server.dispatch(request("/launch?app=status", client))).status == 403
+            assert (await server.dispatch(request("/launcher.html", client))).status == 200
+        for client in ("127.0.0.1", "::1", "::ffff:127.0.0.1"):
+            assert (await server.dispatch(request("/processes", client))).status == 200
+        server.remote_control = True
+        assert (await server.dispatch(request("/processes", "192.0.2.7"))).status == 200
+    serve(scenario)
+
+
+def test_java_run_streams_chunks():
+    """/java/run sends lines as the program prints them, then a summary line"""
+    async def scenario(server, port):
+        async def program(run):
+            run.mode = "cold"
+            for i in range(3):
+                run.append(f"line {i}".encode())
+                await asyncio.sleep(0.01)
+            run.finish(0)
+        server.jvm_pool.run_cold = program
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            writer.write(get("/java/run?arg=--quiet"))
+            status, headers, body = await read_response(reader)
+        finally:
+            writer.close()
+        assert status == 200 and headers["transfer-encoding"] == "chunked"
+        lines = body.decode().splitlines()
+        assert lines[:3] == ["line 0", "line 1", "line 2"]
+        assert lines[3].startswith("[exit 0, cold")
+        assert server.jvm_pool.get(int(headers["x-java-run"])).args == ["--quiet"]
+    serve(scenario)
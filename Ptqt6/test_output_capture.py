@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the launcher's bounded output capture (output_capture.py).
+Run with pytest.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from output_capture import ENTRY_OVERHEAD, MAX_LINE, READ_CHUNK, OutputBuffer, add_line, read_lines
+
+
+def lines_of(*chunks):
+    """What read_lines yields for a pipe that delivers chunks, then EOF"""
+    async def scenario():
+        reader = asyncio.StreamReader()
+        for chunk in chunks:
+            reader.feed_data(chunk)
+        reader.feed_eof()
+        return [line async for line in read_lines(reader)]
+    return asyncio.run(scenario())
+
+
+def test_since_reads_from_a_cursor():
+    buffer = OutputBuffer()
+    for i in range(5):
+        buffer.append("stdout", f"line {i}")
+    entries, skipped = buffer.since(2)
+    assert entries == [(2, "stdout", "line 2"), (3, "stdout", "line 3"), (4, "stdout", "line 4")]
+    assert skipped == 0
+    assert buffer.since(1, limit=2) == ([(1, "stdout", "line 1"), (2, "stdout", "line 2")], 0)
+    assert buffer.since(5) == ([], 0)
+
+
+def test_eviction_reports_skipped_lines():
+    """A reader behind the ring learns how many lines it missed"""
+    line = "x" * 36                          # 100 bytes per entry with the overhead
+    buffer = OutputBuffer(max_bytes=10 * (len(line) + ENTRY_OVERHEAD))
+    for _ in range(25):
+        buffer.append("stderr", line)
+    assert len(buffer.entries) == 10 and buffer.evicted == 15
+    assert buffer.first_seq == 15 and buffer.next_seq == 25
+    entries, skipped = buffer.since(0)
+    assert skipped == 15 and entries[0][0] == 15 and len(entries) == 10
+    entries, skipped = buffer.since(20)
+    assert skipped == 0 and [seq for seq, _, _ in entries] == [20, 21, 22, 23, 24]
+    assert buffer.size <= buffer.max_bytes
+
+
+def test_oversized_entry_is_kept_alone():
+    """One line bigger than the whole ring still replaces everything before it"""
+    buffer = OutputBuffer(max_bytes=200)
+    buffer.append("stdout", "short")
+    buffer.append("stdout", "y" * 1000)
+    assert [text for _, _, text in buffer.entries] == ["y" * 1000]
+    assert buffer.since(0)[1] == 1
+
+
+def test_follow_ends_after_close():
+    async def scenario():
+        buffer = OutputBuffer(max_bytes=3 * (1 + ENTRY_OVERHEAD))
+        batches = []
+
+        async def reader():
+            async for entries, skipped in buffer.follow(0):
+                batches.append(([text for _, _, text in entries], skipped))
+        task = asyncio.ensure_future(reader())
+        await asyncio.sleep(0)
+        buffer.append("stdout", "a")
+        await asyncio.sleep(0)
+        for text in "bcdef":
+            buffer.append("stdout", text)
+        buffer.close()
+        await asyncio.wait_for(task, 5)
+        return batches
+    batches = asyncio.run(scenario())
+    assert batches == [(["a"], 0), (["d", "e", "f"], 2)]
+
+
+def test_read_lines_splits_long_lines():
+    """Lines over MAX_LINE arrive in pieces; newlines split across chunks are joined"""
+    long_line = b"z" * (MAX_LINE * 2 + 10)
+    assert lines_of(long_line + b"\nend") == [b"z" * MAX_LINE, b"z" * MAX_LINE, b"z" * 10, b"end"]
+    assert lines_of(b"hel", b"lo\nwor", b"ld\n", b"\n") == [b"hello", b"world", b""]
+    huge = b"q" * (READ_CHUNK * 3)
+    assert b"".join(lines_of(huge, b"\n")) == huge
+    assert all(len(line) <= MAX_LINE for line in lines_of(huge))
+
+
+def test_add_line_splits_and_decodes():
+    buffer = OutputBuffer()
+    add_line(buffer, "stdout", "é".encode() * (MAX_LINE + 1) + b"\r")
+    add_line(buffer, "stderr", b"")
+    add_line(buffer, "stderr", b"\xff bad")
+    texts = [text for _, _, text in buffer.entries]
+    assert texts == ["é" * MAX_LINE, "é", "", "� bad"]
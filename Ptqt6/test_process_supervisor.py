@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the launcher's process supervisor (process_supervisor.py).
+Run with pytest; needs a POSIX `sleep`.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from process_supervisor import LimitReached, Supervisor
+
+SLEEP = ["sleep", "30"]
+
+
+async def start_concurrently(supervisor, apps):
+    """Fire every start at once; returns (started children, LimitReached count)"""
+    results = await asyncio.gather(*(supervisor.start(app, SLEEP) for app in apps), return_exceptions=True)
+    for result in results:
+        if not isinstance(result, LimitReached) and isinstance(result, BaseException):
+            raise result
+    children = [result for result in results if not isinstance(result, BaseException)]
+    return children, len(results) - len(children)
+
+
+def test_concurrent_starts_per_app_limit():
+    """Concurrent starts of one app stop at max_per_app"""
+    async def scenario():
+        supervisor = Supervisor(max_per_app=2, max_total=3, sample_interval=0)
+        try:
+            children, refused = await start_concurrently(supervisor, ["flowchart"] * 8)
+            assert len(children) == 2 and refused == 6
+            assert supervisor.instances("flowchart") == 2
+            assert not supervisor.pending
+        finally:
+            await supervisor.shutdown(timeout=1)
+    asyncio.run(scenario())
+
+
+def test_concurrent_starts_total_limit():
+    """Concurrent starts across apps stop at max_total"""
+    async def scenario():
+        supervisor = Supervisor(max_per_app=2, max_total=3, sample_interval=0)
+        try:
+            children, refused = await start_concurrently(supervisor, ["flowchart", "analyzer"] * 4)
+            assert len(children) == 3 and refused == 5
+            assert len(supervisor.children) == 3
+        finally:
+            await supervisor.shutdown(timeout=1)
+    asyncio.run(scenario())
+
+
+def test_failed_spawn_releases_slot():
+    """A start that fails to spawn does not keep its reserved slot"""
+    async def scenario():
+        supervisor = Supervisor(max_per_app=1, max_total=1, sample_interval=0)
+        try:
+            try:
+                await supervisor.start("flowchart", ["/nonexistent/command"])
+            except OSError:
+                pass
+            assert not supervisor.pending
+            child = await supervisor.start("flowchart", SLEEP)
+            assert child.running
+        finally:
+            await supervisor.shutdown(timeout=1)
+    asyncio.run(scenario())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the launcher's static asset cache (static_assets.py): encoding
+negotiation, conditional requests and path resolution.
+Run with pytest.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from static_assets import Asset, AssetCache, http_date
+
+PAGE = b"<html><body>" + b"<p>Singleton pattern</p>" * 200 + b"</body></html>"
+
+
+def page_asset(directory):
+    path = os.path.join(directory, "page.html")
+    with open(path, "wb") as f:
+        f.write(PAGE)
+    return Asset.load(path, os.stat(path))
+
+
+def test_select_negotiates_encoding():
+    """The best accepted coding wins; q=0 refuses one, * accepts any"""
+    with tempfile.TemporaryDirectory() as directory:
+        asset = page_asset(directory)
+        assert "gzip" in asset.variants
+        best = "br" if "br" in asset.variants else "gzip"
+        assert asset.select("") == (None, PAGE)
+        assert asset.select("identity") == (None, PAGE)
+        assert asset.select("gzip, deflate")[0] == "gzip"
+        assert asset.select("GZIP;q=0.5")[0] == "gzip"
+        assert asset.select("gzip;q=0") == (None, PAGE)
+        assert asset.select("gzip;q=oops") == (None, PAGE)
+        assert asset.select("*")[0] == best
+        assert asset.select("br, gzip")[0] == best
+        encoding, body = asset.select("gzip")
+        assert body == asset.variants[encoding] and len(body) < len(PAGE)
+
+
+def test_small_assets_are_not_compressed():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tiny.css")
+        with open(path, "wb") as f:
+            f.write(b"body { margin: 0; }")
+        asset = Asset.load(path, os.stat(path))
+        assert asset.variants == {}
+        assert asset.select("gzip, br") == (None, b"body { margin: 0; }")
+        assert "Vary" not in asset.headers()
+
+
+def test_not_modified_matches_weak_and_variant_etags():
+    """A validator for any encoding of the same content revalidates; If-None-Match wins"""
+    with tempfile.TemporaryDirectory() as directory:
+        asset = page_asset(directory)
+        gzip_etag = asset.headers("gzip")["ETag"]
+        assert gzip_etag != asset.etag and gzip_etag.endswith('-gzip"')
+        for header in (asset.etag, "W/" + asset.etag, gzip_etag, "W/" + gzip_etag,
+                       f'"other", {gzip_etag}', "*"):
+            assert asset.not_modified({"if-none-match": header}), header
+        assert not asset.not_modified({"if-none-match": '"other"'})
+        assert not asset.not_modified({"if-none-match": asset.etag[:-1] + '-deflate"'})
+        # If-Modified-Since is ignored when If-None-Match is present
+        assert not asset.not_modified({"if-none-match": '"other"',
+                                       "if-modified-since": asset.last_modified})
+
+
+def test_not_modified_since():
+    """Dates at or after the file's mtime (to the second) revalidate; bad dates do not"""
+    with tempfile.TemporaryDirectory() as directory:
+        asset = page_asset(directory)
+        mtime = asset.mtime_ns / 1e9
+        assert asset.not_modified({"if-modified-since": asset.last_modified})
+        assert asset.not_modified({"if-modified-since": http_date(mtime + 60)})
+        assert not asset.not_modified({"if-modified-since": http_date(mtime - 60)})
+        assert not asset.not_modified({"if-modified-since": "yesterday"})
+        assert not asset.not_modified({})
+
+
+def test_resolve_stays_inside_root():
+    """Paths that climb out of root, directly or through a symlink, resolve to None"""
+    with tempfile.TemporaryDirectory() as directory:
+        root = os.path.join(directory, "site")
+        os.makedirs(os.path.join(root, "docs"))
+        with open(os.path.join(directory, "secret.txt"), "w") as f:
+            f.write("secret")
+        cache = AssetCache(root)
+        root = cache.root
+        assert cache.resolve("/") == os.path.join(root, "launcher.html")
+        assert cache.resolve("/docs") == os.path.join(root, "docs", "index.html")
+        assert cache.resolve("/docs/../page.html") == os.path.join(root, "page.html")
+        # normpath keeps a leading "..", which resolves above root
+        assert cache.resolve("../secret.txt") is None
+        assert cache.resolve("docs/../../secret.txt") is None
+        # A leading slash pins the path to root, however many ".." follow
+        assert cache.resolve("/../../secret.txt") == os.path.join(root, "secret.txt")
+        if hasattr(os, "symlink"):
+            os.symlink(os.path.join(directory, "secret.txt"), os.path.join(root, "link.txt"))
+            assert cache.resolve("/link.txt") is None
+            assert cache.get("/link.txt") is None
+
+
+def test_get_reloads_changed_files():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AssetCache(directory)
+        page = page_asset(directory)
+        assert cache.preload() == 1
+        asset = cache.get("/page.html")
+        assert asset.etag == page.etag and cache.get("/page.html") is asset
+        with open(page.path, "ab") as f:
+            f.write(b"<!-- edited -->")
+        edited = cache.get("/page.html")
+        assert edited is not asset and edited.body.endswith(b"<!-- edited -->")
+        os.remove(page.path)
+        assert cache.get("/page.html") is None and not cache.assets
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the launcher's WebSocket framing (ws_protocol.py).
+Run with pytest.
+"""
+
+import sys
+import os
+import struct
+import asyncio
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ws_protocol import (MAX_CLIENT_FRAME, OP_CLOSE, OP_PING, OP_TEXT, accept_headers, encode_frame,
+                         is_upgrade, read_frame)
+
+MASK = bytes([0x37, 0xFA, 0x21, 0x3D])
+
+
+def client_frame(opcode, payload, fin=True, mask=MASK):
+    """A frame as a browser sends it: masked, with the shortest length encoding"""
+    length = len(payload)
+    first = (0x80 if fin else 0) | opcode
+    mask_bit = 0x80 if mask is not None else 0
+    if length < 126:
+        header = struct.pack("!BB", first, mask_bit | length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", first, mask_bit | 126, length)
+    else:
+        header = struct.pack("!BBQ", first, mask_bit | 127, length)
+    if mask is None:
+        return header + payload
+    return header + mask + bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+
+
+def read(data):
+    """read_frame over data, as a reader that has received it all"""
+    async def scenario():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await read_frame(reader)
+    return asyncio.run(scenario())
+
+
+def test_handshake():
+    """The RFC 6455 example key gives the RFC's accept value"""
+    headers = {"upgrade": "WebSocket", "connection": "keep-alive, Upgrade",
+               "sec-websocket-key": "dGhlIHNhbXBsZSBub25jZQ=="}
+    assert is_upgrade(headers)
+    assert accept_headers(headers)["Sec-WebSocket-Accept"] == "s3pPLMBiTxaQ9kYGzzhZRbK+xOo="
+    assert not is_upgrade({**headers, "upgrade": "h2c"})
+    assert not is_upgrade({"upgrade": "websocket", "connection": "upgrade"})
+
+
+def test_encode_frame_lengths():
+    """7-bit, 16-bit and 64-bit payload lengths, unmasked and final"""
+    assert encode_frame(OP_TEXT, b"hi") == b"\x81\x02hi"
+    assert encode_frame(OP_CLOSE) == b"\x88\x00"
+    frame = encode_frame(OP_TEXT, b"x" * 125)
+    assert frame[:2] == b"\x81\x7d" and len(frame) == 127
+    frame = encode_frame(OP_TEXT, b"x" * 126)
+    assert frame[:4] == b"\x81\x7e\x00\x7e" and len(frame) == 4 + 126
+    frame = encode_frame(OP_TEXT, b"x" * 65535)
+    assert frame[:4] == b"\x81\x7e\xff\xff"
+    frame = encode_frame(OP_TEXT, b"x" * 65536)
+    assert frame[:2] == b"\x81\x7f" and struct.unpack("!Q", frame[2:10])[0] == 65536
+    assert len(frame) == 10 + 65536
+
+
+def test_read_frame_unmasks():
+    """Payloads of every length encoding and of lengths not divisible by 4 unmask exactly"""
+    for length in (0, 1, 5, 125, 126, 1000, MAX_CLIENT_FRAME):
+        payload = bytes(range(256)) * (length // 256) + bytes(range(length % 256))
+        assert read(client_frame(OP_TEXT, payload)) == (True, OP_TEXT, payload)
+    assert read(client_frame(OP_PING, b"ping", fin=False)) == (False, OP_PING, b"ping")
+    # Leading zero bytes in the payload survive the big-integer XOR
+    assert read(client_frame(OP_TEXT, b"\0\0ab", mask=b"\0\0\0\0")) == (True, OP_TEXT, b"\0\0ab")
+
+
+def test_read_frame_64bit_length():
+    """The 64-bit length form is decoded, and lengths over the limit are refused"""
+    frame = struct.pack("!BBQ", 0x81, 0x80 | 127, 3) + MASK + bytes(b ^ m for b, m in zip(b"abc", MASK))
+    assert read(frame) == (True, OP_TEXT, b"abc")
+    for data in (client_frame(OP_TEXT, b"x" * (MAX_CLIENT_FRAME + 1)),
+                 struct.pack("!BBQ", 0x81, 0x80 | 127, 1 << 40)):
+        try:
+            read(data)
+        except ValueError as e:
+            assert "too large" in str(e)
+        else:
+            raise AssertionError("oversized frame was accepted")
+
+
+def test_read_frame_requires_mask():
+    try:
+        read(client_frame(OP_TEXT, b"hello", mask=None))
+    except ValueError as e:
+        assert "masked" in str(e)
+    else:
+        raise AssertionError("unmasked client frame was accepted")
+
+
+def test_truncated_frame():
+    try:
+        read(client_frame(OP_TEXT, b"hello")[:-2])
+    except asyncio.IncompleteReadError:
+        pass
+    else:
+        raise AssertionError("truncated frame was returned")
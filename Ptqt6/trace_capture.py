@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Live trace capture for the Singleton flowchart
+Runs GamingRoom.jar (ProgramDriver) as a subprocess, streams its stdout line by
+line and maps every line to the flowchart nodes that produced it.
+
+Usage:
+    python trace_capture.py                 # print mapped events as they arrive
+    python trace_capture.py --jar other.jar
+"""
+
+import os
+import re
+import sys
+import shutil
+import argparse
+import subprocess
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+JAR_PATH = os.path.join(os.path.dirname(BASE_DIR), "GamingRoom.jar")
+MAIN_CLASS = "com.gamingroom.ProgramDriver"
+
+# Default number of mapped events held while the animation catches up
+DEFAULT_MAX_PENDING = 256
+
+
+@dataclass
+class TraceEvent:
+    """One flowchart step derived from a line of program output"""
+    node: str
+    description: str
+    line: str = ""
+
+
+def find_jdk_tool(name):
+    """Locate a JDK executable (java, jcmd, jmap...), preferring JAVA_HOME"""
+    java_home = os.environ.get("JAVA_HOME")
+    if java_home:
+        candidate = os.path.join(java_home, "bin", name)
+        if os.path.exists(candidate):
+            return candidate
+    return shutil.which(name)
+
+
+def find_java():
+    """Locate the java executable, preferring JAVA_HOME"""
+    return find_jdk_tool("java")
+
+
+def jar_command(jar_path=JAR_PATH, main_class=MAIN_CLASS):
+    """Build the command line that runs ProgramDriver from the JAR"""
+    java = find_java()
+    if java is None:
+        raise FileNotFoundError("java executable not found (install a JDK or set JAVA_HOME)")
+    return [java, "-cp", jar_path, main_class]
+
+
+# Output patterns printed by the Java program
+CREATED_RE = re.compile(r"^>>> Singleton GameService instance CREATED")
+INIT_DATA_RE = re.compile(r"^About to test initializing game data")
+GAME_RE = re.compile(r"^Game \[id=(\d+), name=(.*)\]$")
+TEAM_RE = re.compile(r"^Team \[id=(\d+), name=(.*)\]$")
+PLAYER_RE = re.compile(r"^Player \[id=(\d+), name=(.*)\]$")
+TEST_START_RE = re.compile(r"^About to test the singleton")
+TEST_AGAIN_RE = re.compile(r"^Testing singleton instance again: (.*)$")
+SERVICE_HASH_RE = re.compile(r"^service(\d) hashcode: (-?\d+)")
+INSTANCE_HASH_RE = re.compile(r"^GameService instance hash: (-?\d+)")
+SAME_INSTANCE_RE = re.compile(r"point to the same instance\? (true|false)")
+
+
+class TraceMapper:
+    """Maps ProgramDriver output lines onto CompleteFlowchartWidget node keys
+
+    The mapper only keeps a handful of counters (never the lines themselves),
+    so it can follow arbitrarily long runs in constant memory.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.instances_created = 0
+        self.max_game_id = 0
+        self.max_team_id = 0
+        self.max_player_id = 0
+        self.hashes_seen = 0
+        self.last_hash = None
+        self.hash_mismatch = False
+
+    def start_events(self) -> List[TraceEvent]:
+        """Events emitted when the JVM process has started"""
+        return [
+            TraceEvent("start", "JVM started: java -cp GamingRoom.jar " + MAIN_CLASS),
+            TraceEvent("main", "Entering ProgramDriver.main()"),
+        ]
+
+    def map_line(self, line: str) -> List[TraceEvent]:
+        """Return the flowchart events produced by one line of output"""
+        # Indented lines belong to a nested toString() listing (Teams:/Players:)
+        if not line.strip() or line[:1].isspace():
+            return []
+
+        if CREATED_RE.match(line):
+            self.instances_created += 1
+            return [
+                TraceEvent("get_instance", "GameService.getInstance() called", line),
+                TraceEvent("check_null", "instance == null -> true", line),
+                TraceEvent("create_new", "Singleton GameService instance CREATED", line),
+                TraceEvent("id_counters", "ID counters initialised (game, team, player)", line),
+            ]
+
+        if INIT_DATA_RE.match(line):
+            return [TraceEvent("instance_ready", "GameService ready - initializing game data", line)]
+
+        match = GAME_RE.match(line)
+        if match:
+            game_id = int(match.group(1))
+            name = match.group(2)
+            events = [
+                TraceEvent("add_game", f"addGame(\"{name}\")", line),
+                TraceEvent("check_game", f"Searching games list for \"{name}\"", line),
+            ]
+            if game_id > self.max_game_id:
+                self.max_game_id = game_id
+                events.append(TraceEvent("create_game", f"new Game(id={game_id}, name={name})", line))
+                events.append(TraceEvent("games_list", f"Game #{game_id} stored in games list", line))
+            else:
+                events.append(TraceEvent("return_game", f"Returned existing Game id={game_id}", line))
+            return events
+
+        match = TEAM_RE.match(line)
+        if match:
+            team_id = int(match.group(1))
+            name = match.group(2)
+            if team_id > self.max_team_id:
+                self.max_team_id = team_id
+                return [
+                    TraceEvent("add_team", f"addTeam(\"{name}\") -> id={team_id} from getNextTeamId()", line),
+                    TraceEvent("id_counters", f"nextTeamId advanced to {team_id + 1}", line),
+                ]
+            return [TraceEvent("add_team", f"Team \"{name}\" (id={team_id}) already exists", line)]
+
+        match = PLAYER_RE.match(line)
+        if match:
+            player_id = int(match.group(1))
+            name = match.group(2)
+            if player_id > self.max_player_id:
+                self.max_player_id = player_id
+                return [
+                    TraceEvent("add_player", f"addPlayer(\"{name}\") -> id={player_id} from getNextPlayerId()", line),
+                    TraceEvent("id_counters", f"nextPlayerId advanced to {player_id + 1}", line),
+                ]
+            return [TraceEvent("add_player", f"Player \"{name}\" (id={player_id})", line)]
+
+        if TEST_START_RE.match(line):
+            return [TraceEvent("test_start", "SingletonTester.testSingleton()", line)]
+
+        match = TEST_AGAIN_RE.match(line)
+        if match:
+            return [
+                TraceEvent("get_service1", f"getInstance() again: {match.group(1)}", line),
+                TraceEvent("check_null", "instance == null -> false", line),
+                TraceEvent("return_existing", "Returning existing instance", line),
+            ]
+
+        match = SERVICE_HASH_RE.match(line)
+        if match:
+            which = match.group(1)
+            node = "get_service1" if which == "1" else "get_service2"
+            return [self._record_hash(node, f"service{which} hashcode: {match.group(2)}", int(match.group(2)), line)]
+
+        match = INSTANCE_HASH_RE.match(line)
+        if match:
+            return [self._record_hash("compare", f"identityHashCode = {match.group(1)}", int(match.group(1)), line)]
+
+        match = SAME_INSTANCE_RE.search(line)
+        if match:
+            same = match.group(1) == "true"
+            return [
+                TraceEvent("compare", "Comparing service1 and service2", line),
+                TraceEvent("verify", "Confirmed: same instance!" if same else "Different instances - singleton broken!", line),
+            ]
+
+        return []
+
+    def finish_events(self, exit_code: int) -> List[TraceEvent]:
+        """Events emitted once the process has exited"""
+        if exit_code != 0:
+            return [TraceEvent("verify", f"Program exited with code {exit_code}")]
+        if self.instances_created == 1 and not self.hash_mismatch:
+            return [TraceEvent("verify", "Run complete: GameService was created exactly once")]
+        return [TraceEvent("verify", f"Run complete: GameService created {self.instances_created} times")]
+
+    def _record_hash(self, node, description, value, line):
+        if self.last_hash is not None and value != self.last_hash:
+            self.hash_mismatch = True
+        self.last_hash = value
+        self.hashes_seen += 1
+        return TraceEvent(node, description, line)
+
+
+def iter_trace(lines: Iterable[str], mapper: Optional[TraceMapper] = None) -> Iterator[TraceEvent]:
+    """Map an iterable of output lines (a saved log, a pipe) to events lazily"""
+    mapper = mapper or TraceMapper()
+    for line in lines:
+        yield from mapper.map_line(line.rstrip("\r\n"))
+
+
+def stream_jar_events(jar_path=JAR_PATH) -> Iterator[TraceEvent]:
+    """Run the JAR without Qt and yield events as each stdout line arrives"""
+    mapper = TraceMapper()
+    process = subprocess.Popen(jar_command(jar_path), stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, bufsize=1)
+    yield from mapper.start_events()
+    try:
+        for line in process.stdout:
+            yield from mapper.map_line(line.rstrip("\r\n"))
+    finally:
+        process.stdout.close()
+        exit_code = process.wait()
+    yield from mapper.finish_events(exit_code)
+
+
+try:
+    from PyQt6.QtCore import QObject, QProcess, pyqtSignal
+except ImportError:  # the command-line mode works without PyQt6
+    QObject = None
+
+if QObject is not None:
+    class TraceCapture(QObject):
+        """Runs the JAR with QProcess and buffers mapped events for an animation
+
+        Lines are read as soon as Qt reports them, so the child never blocks on a
+        full pipe. Mapped events go into a bounded deque: when the consumer falls
+        behind, the oldest events are dropped and counted instead of growing
+        memory without limit.
+        """
+        events_available = pyqtSignal()
+        finished = pyqtSignal(int)
+        error = pyqtSignal(str)
+
+        def __init__(self, jar_path=JAR_PATH, max_pending=DEFAULT_MAX_PENDING, parent=None):
+            super().__init__(parent)
+            self.jar_path = jar_path
+            self.pending = deque(maxlen=max_pending)
+            self.dropped = 0
+            self.running = False
+            self.exit_code = None
+            self.mapper = TraceMapper()
+            self.process = None
+
+        def start(self):
+            """Start the JVM; returns False if it could not be launched"""
+            self.stop()
+            self.pending.clear()
+            self.dropped = 0
+            self.exit_code = None
+            self.mapper.reset()
+
+            try:
+                command = jar_command(self.jar_path)
+            except FileNotFoundError as e:
+                self.error.emit(str(e))
+                return False
+            if not os.path.exists(self.jar_path):
+                self.error.emit(f"JAR not found: {self.jar_path}")
+                return False
+
+            self.process = QProcess(self)
+            self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+            self.process.readyReadStandardOutput.connect(self._read_lines)
+            self.process.started.connect(self._on_started)
+            self.process.finished.connect(self._on_finished)
+            self.process.errorOccurred.connect(self._on_error)
+            self.running = True
+            self.process.start(command[0], command[1:])
+            return True
+
+        def stop(self):
+            """Kill the child process if it is still running"""
+            if self.process is not None:
+                self.process.readyReadStandardOutput.disconnect()
+                self.process.finished.disconnect()
+                self.process.errorOccurred.disconnect()
+                if self.process.state() != QProcess.ProcessState.NotRunning:
+                    self.process.kill()
+                    self.process.waitForFinished(1000)
+                self.process.deleteLater()
+                self.process = None
+            self.running = False
+
+        def next_event(self) -> Optional[TraceEvent]:
+            """Pop the oldest pending event, or None if nothing is buffered"""
+            return self.pending.popleft() if self.pending else None
+
+        def is_done(self):
+            """True once the process has exited and every event was consumed"""
+            return not self.running and not self.pending
+
+        def _push(self, events):
+            for event in events:
+                if len(self.pending) == self.pending.maxlen:
+                    self.dropped += 1
+                self.pending.append(event)
+            if events:
+                self.events_available.emit()
+
+        def _read_lines(self):
+            while self.process.canReadLine():
+                raw = bytes(self.process.readLine()).decode("utf-8", errors="replace")
+                self._push(self.mapper.map_line(raw.rstrip("\r\n")))
+
+        def _on_started(self):
+            self._push(self.mapper.start_events())
+
+        def _on_finished(self, exit_code, exit_status):
+            # Flush a trailing line that had no newline
+            self._read_lines()
+            tail = bytes(self.process.readAllStandardOutput()).decode("utf-8", errors="replace")
+            if tail.strip():
+                self._push(self.mapper.map_line(tail.rstrip("\r\n")))
+            self._push(self.mapper.finish_events(exit_code))
+            self.exit_code = exit_code
+            self.running = False
+            self.finished.emit(exit_code)
+
+        def _on_error(self, process_error):
+            if process_error == QProcess.ProcessError.FailedToStart:
+                self.running = False
+                self.error.emit("Failed to start java - is a JDK installed?")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream flowchart events from a GamingRoom.jar run")
+    parser.add_argument("--jar", default=JAR_PATH, help="path to GamingRoom.jar")
+    args = parser.parse_args()
+
+    try:
+        for event in stream_jar_events(args.jar):
+            print(f"{event.node:16s} {event.description}")
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
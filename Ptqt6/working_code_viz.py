@@ -1,6 +1,7 @@
 import sys
 import os
 import json
+import math
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QVBoxLayout, 
@@ -9,7 +10,8 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QVBoxLa
                            QComboBox, QTreeWidget, QTreeWidgetItem, QMessageBox, QFileDialog,
                            QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsPolygonItem,
                            QSlider, QSpinBox, QCheckBox, QGroupBox, QScrollArea, QTextBrowser,
-                           QListWidget, QListWidgetItem, QProgressBar, QToolBar, QStatusBar)
+                           QListWidget, QListWidgetItem, QProgressBar, QToolBar, QStatusBar,
+                           QStackedWidget)
 from PyQt6.QtGui import (QBrush, QColor, QPen, QFont, QPixmap, QPainter, QPolygonF,
                        QAction, QIcon, QTextCharFormat, QTextCursor, QSyntaxHighlighter,
                        QTextDocument, QPalette, QLinearGradient, QRadialGradient)
@@ -19,6 +21,20 @@ from PyQt6.QtCore import (QRectF, Qt, QPointF, QLineF, QTimer, QPropertyAnimatio
 import re
 from pathlib import Path
 
+from animation_engine import animator
+from heap_histogram import (WATCHED_CLASSES, HistogramCapture, load_histogram,
+                            find_gamingroom_jvms, format_bytes)
+try:
+    from memory_timeline import MemoryTimelineWidget
+except ImportError:  # the timeline needs numpy
+    MemoryTimelineWidget = None
+from memory_layout import SOURCE_DIR, default_estimator, describe_line
+from concurrency_check import check_sources
+from gc_dashboard import GcDashboardWidget
+from object_graph import ObjectGraphWidget
+from edge_geometry import EdgeEndpointMixin, CachedEdgeMixin, arrow_head_polygon, clip_to_rect
+from render_profile import ProfiledGraphicsView
+
 # Data structures for code analysis
 @dataclass
 class CodeLine:
@@ -95,12 +111,16 @@ class JavaSyntaxHighlighter(QSyntaxHighlighter):
                 self.setFormat(match.capturedStart(), match.capturedLength(), format)
 
 # Animated UML Class Node
-class AnimatedUMLClassNode(QGraphicsRectItem):
+class AnimatedUMLClassNode(EdgeEndpointMixin, QGraphicsRectItem):
     def __init__(self, class_info: ClassInfo, x: float, y: float, scene):
         width = 250
         initial_height = 80
         super().__init__(QRectF(x, y, width, initial_height))
         
+        # Draggable; relationship arrows follow moves and resizes
+        self.init_endpoint()
+        self.press_pos = None
+        
         self.class_info = class_info
         self.scene = scene
         self.expanded = False
@@ -142,16 +162,23 @@ class AnimatedUMLClassNode(QGraphicsRectItem):
         return "class"
     
     def mousePressEvent(self, event):
-        self.toggle_expansion()
+        self.press_pos = event.scenePos()
         super().mousePressEvent(event)
     
+    def mouseReleaseEvent(self, event):
+        # A click toggles expansion, a drag just moves the class
+        if self.press_pos is not None and QLineF(self.press_pos, event.scenePos()).length() < 3:
+            self.toggle_expansion()
+        self.press_pos = None
+        super().mouseReleaseEvent(event)
+    
     def toggle_expansion(self):
         if not self.expanded:
             self.expand()
         else:
             self.collapse()
     
-    def expand(self):
+    def expand(self, animate=True):
         self.expanded = True
         y_offset = 60
         
@@ -195,16 +222,15 @@ class AnimatedUMLClassNode(QGraphicsRectItem):
                 self.child_items.append(method_text)
                 y_offset += 18
         
+        # New text follows the node's cache mode from the rendering profile
+        for item in self.child_items:
+            item.setCacheMode(self.cacheMode())
+        
         # Animate expansion
         new_height = y_offset + 20
-        animation = QPropertyAnimation(self, b"rect")
-        animation.setDuration(300)
-        animation.setStartValue(self.rect())
-        animation.setEndValue(QRectF(self.rect().x(), self.rect().y(), self.rect().width(), new_height))
-        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        animation.start()
+        self.resize_to(new_height, animate)
     
-    def collapse(self):
+    def collapse(self, animate=True):
         self.expanded = False
         
         # Remove child items
@@ -213,15 +239,19 @@ class AnimatedUMLClassNode(QGraphicsRectItem):
         self.child_items.clear()
         
         # Animate collapse
-        animation = QPropertyAnimation(self, b"rect")
-        animation.setDuration(300)
-        animation.setStartValue(self.rect())
-        animation.setEndValue(QRectF(self.rect().x(), self.rect().y(), self.rect().width(), 80))
-        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        animation.start()
+        self.resize_to(80, animate)
+    
+    def resize_to(self, height, animate=True):
+        """Grow or shrink to height; arrows follow every frame of the animation"""
+        target = QRectF(self.rect().x(), self.rect().y(), self.rect().width(), height)
+        if animate:
+            animator().animate(self, "rect", target, duration=300)
+        else:
+            animator().stop(self, "rect")
+            self.set_rect(target)
 
 # Animated Arrow for relationships
-class AnimatedArrow(QGraphicsLineItem):
+class AnimatedArrow(CachedEdgeMixin, QGraphicsLineItem):
     def __init__(self, start_item, end_item, arrow_type="association", label=""):
         super().__init__()
         self.start_item = start_item
@@ -251,48 +281,60 @@ class AnimatedArrow(QGraphicsLineItem):
             self.label_text.setDefaultTextColor(QColor("#aaa"))
             self.label_text.setFont(QFont("Arial", 8))
         
-        self.update_position()
-    
-    def update_position(self):
-        # Calculate line from center of start to center of end
-        start_center = self.start_item.rect().center()
-        end_center = self.end_item.rect().center()
-        
-        self.setLine(QLineF(start_center, end_center))
-        
-        # Update arrow head position
-        line = self.line()
-        angle = line.angle()
-        
-        # Create arrow head polygon
-        arrow_length = 10
-        arrow_degrees = 25
-        
-        # Calculate arrow points
-        line_angle = line.angle()
-        p1 = line.p2()
-        p2 = QPointF(
-            p1.x() + arrow_length * 3.14159 / 180 * (line_angle - 180 - arrow_degrees),
-            p1.y() + arrow_length * 3.14159 / 180 * (line_angle - 180 - arrow_degrees)
-        )
-        p3 = QPointF(
-            p1.x() + arrow_length * 3.14159 / 180 * (line_angle - 180 + arrow_degrees),
-            p1.y() + arrow_length * 3.14159 / 180 * (line_angle - 180 + arrow_degrees)
-        )
-        
-        arrow_head = QPolygonF([p1, p2, p3])
-        self.arrow_head.setPolygon(arrow_head)
-        
-        if self.arrow_type == "inheritance":
+        # Head style never changes, so set it once instead of on every update
+        if arrow_type == "inheritance":
             self.arrow_head.setBrush(QBrush(QColor("white")))
             self.arrow_head.setPen(QPen(QColor("#4a90e2"), 2))
         else:
             self.arrow_head.setBrush(QBrush(QColor("#4a90e2")))
+        
+        self.init_edge(start_item, end_item)
+        self.ensure_geometry()
+    
+    def start_rect(self):
+        return self.start_item.scene_rect()
+    
+    def end_rect(self):
+        return self.end_item.scene_rect()
+    
+    def update_position(self):
+        self.mark_geometry_dirty()
+        self.ensure_geometry()
+    
+    def compute_geometry(self, start_rect, end_rect):
+        # Line between the centers, clipped to the class borders so the head stays visible
+        start_center = start_rect.center()
+        end_center = end_rect.center()
+        start_point = clip_to_rect(start_center, end_center, start_rect)
+        end_point = clip_to_rect(end_center, start_center, end_rect)
+        
+        line = QLineF(start_point, end_point)
+        self.setLine(line)
+        self.arrow_head.setPolygon(arrow_head_polygon(line, length=10, degrees=25))
+        
+        # Label sits at the midpoint of the visible segment
+        if self.label:
+            mid_point = line.center()
+            bounds = self.label_text.boundingRect()
+            self.label_text.setPos(mid_point.x() - bounds.width() / 2, mid_point.y() - bounds.height())
 
 # Memory Management Visualizer
+CLASS_BAR_COLORS = {
+    "GameService": "#4a90e2",
+    "Game": "#7c5d2a",
+    "Team": "#2a7c5d",
+    "Player": "#7c2a6b",
+}
+CLASS_BAR_WIDTH = 190
+# Bars use a fixed log scale (1 .. 10^6 instances) so each class updates on its own
+CLASS_BAR_DECADES = 6
+
 class MemoryVisualizerWidget(QWidget):
     def __init__(self):
         super().__init__()
+        self.histogram = None
+        self.class_bars = {}
+        self.bar_values = {}
         layout = QVBoxLayout()
         
         # Title
@@ -300,14 +342,54 @@ class MemoryVisualizerWidget(QWidget):
         title.setStyleSheet("font-size: 16px; font-weight: bold; color: #4a90e2;")
         layout.addWidget(title)
         
-        # Memory timeline
+        # Heap histogram source (saved jmap/jcmd dump or a running GamingRoom JVM)
+        source_layout = QHBoxLayout()
+        source_layout.addWidget(QLabel("View:"))
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(["Snapshot", "Timeline", "Object Graph"])
+        source_layout.addWidget(self.mode_combo)
+        
+        load_btn = QPushButton("📂 Load Histogram...")
+        load_btn.clicked.connect(self.load_histogram_file)
+        source_layout.addWidget(load_btn)
+        
+        capture_btn = QPushButton("🔴 Capture Running JVM")
+        capture_btn.clicked.connect(self.capture_running_jvm)
+        source_layout.addWidget(capture_btn)
+        
+        self.histogram_status = QLabel("No histogram loaded")
+        self.histogram_status.setStyleSheet("color: #888;")
+        source_layout.addWidget(self.histogram_status)
+        source_layout.addStretch()
+        layout.addLayout(source_layout)
+        
+        self.histogram_capture = HistogramCapture(self)
+        self.histogram_capture.entry_parsed.connect(self.apply_histogram_entry)
+        self.histogram_capture.histogram_ready.connect(self.apply_histogram)
+        self.histogram_capture.error.connect(self.histogram_status.setText)
+        
+        # Snapshot scene, sampled timeline and object graph share the same space
         self.scene = QGraphicsScene()
-        self.view = QGraphicsView(self.scene)
+        self.view = ProfiledGraphicsView(self.scene)
         self.view.setMinimumHeight(300)
-        layout.addWidget(self.view)
+        
+        if MemoryTimelineWidget is not None:
+            self.timeline = MemoryTimelineWidget()
+        else:
+            self.timeline = QLabel("The memory timeline needs numpy (pip install numpy)")
+            self.timeline.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        self.pages = QStackedWidget()
+        self.pages.addWidget(self.view)
+        self.pages.addWidget(self.timeline)
+        self.object_graph = ObjectGraphWidget()
+        self.pages.addWidget(self.object_graph)
+        self.mode_combo.currentIndexChanged.connect(self.pages.setCurrentIndex)
+        layout.addWidget(self.pages)
         
         # Create memory visualization
         self.create_memory_visualization()
+        self.view.refresh_item_cache()
         
         # Memory statistics
         stats_group = QGroupBox("Memory Statistics")
@@ -361,38 +443,33 @@ class MemoryVisualizerWidget(QWidget):
         games_label.setPos(255, 60)
         self.scene.addItem(games_label)
         
-        # Draw game instances
-        game1_rect = QGraphicsRectItem(400, 30, 80, 40)
-        game1_rect.setBrush(QBrush(QColor("#7c5d2a")))
-        self.scene.addItem(game1_rect)
-        
-        game1_label = QGraphicsTextItem("Game #1")
-        game1_label.setDefaultTextColor(QColor("white"))
-        game1_label.setPos(405, 35)
-        self.scene.addItem(game1_label)
-        
-        game2_rect = QGraphicsRectItem(400, 90, 80, 40)
-        game2_rect.setBrush(QBrush(QColor("#7c5d2a")))
-        self.scene.addItem(game2_rect)
-        
-        game2_label = QGraphicsTextItem("Game #2")
-        game2_label.setDefaultTextColor(QColor("white"))
-        game2_label.setPos(405, 95)
-        self.scene.addItem(game2_label)
+        # Instance bars per GamingRoom class, filled from a heap histogram
+        self.class_bars.clear()
+        self.bar_values.clear()
+        for row, name in enumerate(WATCHED_CLASSES.values()):
+            y = 20 + row * 46
+            label = QGraphicsTextItem(f"{name}: -")
+            label.setDefaultTextColor(QColor("#ccc"))
+            label.setFont(QFont("Consolas", 8))
+            label.setPos(395, y)
+            self.scene.addItem(label)
+            
+            bar = QGraphicsRectItem(400, y + 22, 0, 12)
+            bar.setBrush(QBrush(QColor(CLASS_BAR_COLORS[name])))
+            bar.setPen(QPen(Qt.PenStyle.NoPen))
+            self.scene.addItem(bar)
+            self.class_bars[name] = (bar, label)
         
         # Draw references
         ref1 = QGraphicsLineItem(200, 90, 250, 80)
         ref1.setPen(QPen(QColor("#4a90e2"), 2))
         self.scene.addItem(ref1)
         
-        ref2 = QGraphicsLineItem(370, 80, 400, 50)
+        game_bar = self.class_bars["Game"][0].rect()
+        ref2 = QGraphicsLineItem(370, 80, 400, game_bar.center().y())
         ref2.setPen(QPen(QColor("#2a7c5d"), 2))
         self.scene.addItem(ref2)
         
-        ref3 = QGraphicsLineItem(370, 90, 400, 110)
-        ref3.setPen(QPen(QColor("#2a7c5d"), 2))
-        self.scene.addItem(ref3)
-        
         # Stack memory
         stack_rect = QGraphicsRectItem(10, 230, 300, 150)
         stack_rect.setBrush(QBrush(QColor("#2a2a2a")))
@@ -423,20 +500,104 @@ class MemoryVisualizerWidget(QWidget):
         frame2_label.setPos(35, 315)
         self.scene.addItem(frame2_label)
     
+    def load_histogram_file(self):
+        filename, _ = QFileDialog.getOpenFileName(self, "Open Class Histogram", "",
+                                                  "Class Histogram (*.txt *.histo);;All Files (*)")
+        if not filename:
+            return
+        try:
+            histogram = load_histogram(filename)
+        except OSError as e:
+            self.histogram_status.setText(f"Could not read histogram: {e}")
+            return
+        for entry in histogram.entries.values():
+            self.apply_histogram_entry(entry)
+        self.apply_histogram(histogram)
+    
+    def capture_running_jvm(self):
+        jvms = find_gamingroom_jvms()
+        if not jvms:
+            self.histogram_status.setText("No running GamingRoom JVM found (jcmd -l)")
+            return
+        pid, description = jvms[0]
+        self.histogram_status.setText(f"Capturing pid {pid} ({description})...")
+        self.histogram_capture.start(pid)
+    
+    def apply_histogram_entry(self, entry):
+        """Update one class bar; rows arrive while the dump is still streaming"""
+        self.set_class_bar(entry.display_name, entry.instances, entry.bytes)
+    
+    def apply_histogram(self, histogram):
+        """A complete dump: clear classes it did not list, then refresh the stats"""
+        self.histogram = histogram
+        for name in self.class_bars:
+            if histogram.get(name) is None:
+                self.set_class_bar(name, 0, 0)
+        self.histogram_status.setText(
+            f"{histogram.source}: {histogram.class_count:,} classes, {format_bytes(histogram.total_bytes)} live")
+        self.update_memory_stats()
+    
+    def set_class_bar(self, name, instances, size):
+        if name not in self.class_bars or self.bar_values.get(name) == (instances, size):
+            return
+        self.bar_values[name] = (instances, size)
+        bar, label = self.class_bars[name]
+        
+        fraction = min(1.0, math.log10(1 + instances) / CLASS_BAR_DECADES)
+        rect = bar.rect()
+        animator().animate(bar, "rect", QRectF(rect.x(), rect.y(), CLASS_BAR_WIDTH * fraction, rect.height()))
+        label.setPlainText(f"{name}: {instances:,} obj, {format_bytes(size)}")
+    
     def update_memory_stats(self):
-        stats = """Singleton Pattern Memory Benefits:
-• Single instance: Only one GameService object in memory
-• Shared state: All games managed by one service
-• Memory saved: ~95% vs creating multiple service instances
-• Reference efficiency: All code points to same instance
-• Garbage collection: Singleton lives for application lifetime
-
-Entity Inheritance Memory Impact:
-• Shared methods in parent class (reduced duplication)
-• Virtual method table for polymorphism
-• Each entity stores only unique fields
-• Estimated savings: 30-40% vs duplicate implementations"""
-        self.stats_text.setPlainText(stats)
+        histogram = self.histogram
+        try:
+            estimator = default_estimator()
+        except OSError:
+            estimator = None
+        
+        if histogram is None:
+            lines = ["Estimated object layout (64-bit JVM, compressed oops):"]
+            if estimator is not None:
+                for name in ("Entity",) + tuple(WATCHED_CLASSES.values()):
+                    layout = estimator.layouts.get(name)
+                    if layout is not None:
+                        lines.append(f"• {name}: {layout.instance_size} B per instance "
+                                     f"(header {layout.header_size}, {len(layout.fields)} fields, padding {layout.padding})")
+                footprint = estimator.graph_footprint((2, 2), (4, 2))
+                lines.append(f"• Sample graph (2 games x 2 teams x 2 players, names included): "
+                             f"{footprint['total']:,} B")
+            lines += ["",
+                      "Singleton: one GameService instance, shared by every caller; "
+                      "Entity subclasses reuse its id/name slots.",
+                      "Load a class histogram (jmap -histo <pid> > histo.txt) or capture a "
+                      "running GamingRoom JVM to compare with real instance counts."]
+            self.stats_text.setPlainText("\n".join(lines))
+            return
+        
+        lines = [f"Heap histogram from {histogram.source}: "
+                 f"{histogram.total_instances:,} objects, {format_bytes(histogram.total_bytes)} "
+                 f"in {histogram.class_count:,} classes", ""]
+        for name in WATCHED_CLASSES.values():
+            entry = histogram.get(name)
+            if entry is None:
+                lines.append(f"• {name}: no live instances")
+                continue
+            share = entry.bytes / histogram.total_bytes * 100 if histogram.total_bytes else 0
+            estimate = ""
+            if estimator is not None and name in estimator.layouts:
+                estimate = f", layout estimate {estimator.instance_size(name)} B"
+            lines.append(f"• {name}: {entry.instances:,} instances, {format_bytes(entry.bytes)} "
+                         f"({entry.bytes // max(entry.instances, 1)} B each{estimate}, {share:.3f}% of heap)")
+        
+        service = histogram.get("GameService")
+        lines.append("")
+        if service is None:
+            lines.append("GameService not yet instantiated (getInstance() has not run)")
+        elif service.instances == 1:
+            lines.append("Singleton verified: exactly one GameService instance on the heap")
+        else:
+            lines.append(f"Warning: {service.instances} GameService instances on the heap - singleton broken")
+        self.stats_text.setPlainText("\n".join(lines))
 
 # Line-by-line Code Analyzer
 class CodeAnalyzerWidget(QWidget):
@@ -559,13 +720,13 @@ class CodeAnalyzerWidget(QWidget):
                     "Template Method Pattern - defines common structure for subclasses",
                     "O(1) - class declaration"),
                 14: CodeLine(14, "private long id;",
-                    "Private field storing unique identifier as primitive long (8 bytes)",
-                    "8 bytes per instance in heap memory",
+                    "Private field storing unique identifier as primitive long",
+                    "Stored inline in every instance",
                     "Encapsulation - data hiding principle",
                     "O(1) - field declaration"),
                 16: CodeLine(16, "private String name;",
-                    "Private field storing entity name as String reference (8 bytes on 64-bit JVM)",
-                    "8 bytes for reference + actual String object size in heap",
+                    "Private field storing entity name as String reference",
+                    "Reference stored inline + the String object in heap",
                     "Encapsulation - data hiding principle",
                     "O(1) - field declaration"),
                 19: CodeLine(19, "public Entity(long id, String name) {",
@@ -597,12 +758,12 @@ class CodeAnalyzerWidget(QWidget):
             "GameService.java": {
                 19: CodeLine(19, "private static GameService instance = null;",
                     "Static field holding single instance - lazy initialization (null initially)",
-                    "8 bytes in metaspace/method area, shared across all references",
+                    "One static slot in the class, shared across all references",
                     "Singleton Pattern - single instance holder",
                     "O(1) - static field"),
                 22: CodeLine(22, "private static List<Game> games = new ArrayList<Game>();",
                     "Static list to hold all games - shared across application",
-                    "ArrayList initial capacity (10) * 8 bytes for references",
+                    "ArrayList object; backing array (capacity 10) allocated on the first add",
                     "Singleton Pattern - centralized storage",
                     "O(1) - initialization"),
                 31: CodeLine(31, "private GameService() {",
@@ -622,7 +783,7 @@ class CodeAnalyzerWidget(QWidget):
                     "O(1) - comparison"),
                 44: CodeLine(44, "instance = new GameService();",
                     "Creates the single instance - happens only once in application lifetime",
-                    "Allocates GameService object in heap (approx 32-48 bytes)",
+                    "Allocates the single GameService object in heap",
                     "Singleton Pattern - instance creation",
                     "O(1) - object creation"),
                 100: CodeLine(100, "return ++nextGameId;",
@@ -634,12 +795,12 @@ class CodeAnalyzerWidget(QWidget):
             "Game.java": {
                 20: CodeLine(20, "public class Game extends Entity {",
                     "Game class inherits from Entity - gains id and name fields",
-                    "Inherits 16 bytes from Entity + own fields",
+                    "Inherits Entity's fields + own fields",
                     "Inheritance - IS-A relationship",
                     "O(1) - class declaration"),
                 23: CodeLine(23, "private List<Team> teams = new ArrayList<Team>();",
                     "Composition - Game HAS-A list of teams",
-                    "8 bytes for reference + ArrayList overhead",
+                    "Reference field + ArrayList overhead",
                     "Composition Pattern",
                     "O(1) - initialization"),
                 26: CodeLine(26, "public Game(long id, String name) {",
@@ -674,7 +835,7 @@ class CodeAnalyzerWidget(QWidget):
         self.current_file = filename
         
         # Load actual file content
-        file_path = f"/Users/jguida941/Downloads/Singleton_GameService--main-2/src/com/gamingroom/{filename}"
+        file_path = os.path.join(SOURCE_DIR, filename)
         try:
             with open(file_path, 'r') as f:
                 content = f.read()
@@ -704,13 +865,23 @@ class CodeAnalyzerWidget(QWidget):
             if line_number in self.code_analysis[self.current_file]:
                 analysis = self.code_analysis[self.current_file][line_number]
                 self.explanation_text.setPlainText(analysis.explanation)
-                self.memory_text.setPlainText(analysis.memory_impact)
+                self.memory_text.setPlainText(self.memory_estimate(line_text, analysis.memory_impact))
                 self.pattern_text.setPlainText(analysis.design_pattern)
             else:
                 self.explanation_text.setPlainText("Click on a highlighted line to see detailed analysis")
-                self.memory_text.setPlainText("Memory impact information will appear here")
+                self.memory_text.setPlainText(self.memory_estimate(line_text, "Memory impact information will appear here"))
                 self.pattern_text.setPlainText("Design pattern information will appear here")
 
+    def memory_estimate(self, line_text, fallback):
+        """Computed layout/allocation figures for the line, followed by the notes"""
+        if not self.current_file:
+            return fallback
+        try:
+            estimate = describe_line(default_estimator(), Path(self.current_file).stem, line_text)
+        except OSError:
+            estimate = None
+        return f"{estimate}\n\n{fallback}" if estimate else fallback
+
 # Main Application Window
 class SingletonVisualizerPro(QMainWindow):
     def __init__(self):
@@ -796,7 +967,11 @@ class SingletonVisualizerPro(QMainWindow):
         self.memory_visualizer = MemoryVisualizerWidget()
         self.tabs.addTab(self.memory_visualizer, "Memory Management")
         
-        # Tab 5: Professional Documentation
+        # Tab 5: GC pauses from a JVM GC log
+        self.gc_dashboard = GcDashboardWidget()
+        self.tabs.addTab(self.gc_dashboard, "GC Pauses")
+        
+        # Tab 6: Professional Documentation
         self.docs_tab = self.create_documentation_tab()
         self.tabs.addTab(self.docs_tab, "Documentation")
         
@@ -826,12 +1001,12 @@ class SingletonVisualizerPro(QMainWindow):
         
         # Create UML scene
         self.uml_scene = QGraphicsScene()
-        self.uml_view = QGraphicsView(self.uml_scene)
-        self.uml_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.uml_view = ProfiledGraphicsView(self.uml_scene)
         layout.addWidget(self.uml_view)
         
         # Create UML diagram
         self.create_uml_diagram()
+        self.uml_view.refresh_item_cache()
         
         widget.setLayout(layout)
         return widget
@@ -963,28 +1138,20 @@ class SingletonVisualizerPro(QMainWindow):
             self.uml_scene.addItem(rel)
     
     def animate_uml_creation(self):
-        # Create animation sequence
-        animation_group = QSequentialAnimationGroup()
+        # Staggered fades, one after another on the shared animation tick
+        delay = 0
         
         # Animate nodes appearing
         for node in self.uml_nodes:
             node.setOpacity(0)
-            fade_in = QPropertyAnimation(node, b"opacity")
-            fade_in.setDuration(500)
-            fade_in.setStartValue(0)
-            fade_in.setEndValue(1)
-            animation_group.addAnimation(fade_in)
+            animator().animate(node, "opacity", 1.0, duration=500, delay=delay, start=0.0)
+            delay += 500
         
         # Animate relationships appearing
         for rel in self.uml_relationships:
             rel.setOpacity(0)
-            fade_in = QPropertyAnimation(rel, b"opacity")
-            fade_in.setDuration(300)
-            fade_in.setStartValue(0)
-            fade_in.setEndValue(1)
-            animation_group.addAnimation(fade_in)
-        
-        animation_group.start()
+            animator().animate(rel, "opacity", 1.0, duration=300, delay=delay, start=0.0)
+            delay += 300
     
     def expand_all_classes(self):
         for node in self.uml_nodes:
@@ -1022,8 +1189,7 @@ class SingletonVisualizerPro(QMainWindow):
         
         # Create flowchart scene
         self.flowchart_scene = QGraphicsScene()
-        self.flowchart_view = QGraphicsView(self.flowchart_scene)
-        self.flowchart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.flowchart_view = ProfiledGraphicsView(self.flowchart_scene)
         layout.addWidget(self.flowchart_view)
         
         # Create initial flowchart
@@ -1217,6 +1383,10 @@ class SingletonVisualizerPro(QMainWindow):
         memory_action = QAction("Memory View", self)
         memory_action.triggered.connect(lambda: self.tabs.setCurrentIndex(3))
         toolbar.addAction(memory_action)
+        
+        gc_action = QAction("GC Pauses", self)
+        gc_action.triggered.connect(lambda: self.tabs.setCurrentIndex(4))
+        toolbar.addAction(gc_action)
     
     def create_status_bar(self):
         self.status_bar = QStatusBar()
@@ -1244,6 +1414,12 @@ class SingletonVisualizerPro(QMainWindow):
     def analyze_all_files(self):
         # Analyze all Java files in the project
         self.status_bar.showMessage("Analyzing all files...")
+        findings = check_sources()
+        self.status_bar.showMessage(f"Thread-safety check: {len(findings)} finding(s) in {SOURCE_DIR}")
+        if findings:
+            QMessageBox.warning(self, "Thread-Safety Check", "\n\n".join(str(f) for f in findings))
+        else:
+            QMessageBox.information(self, "Thread-Safety Check", "No unsynchronized singletons or counters found.")
     
     def export_to_pdf(self):
         file_name, _ = QFileDialog.getSaveFileName(self, "Export to PDF", "", "PDF Files (*.pdf)")
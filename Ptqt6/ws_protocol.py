@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Minimal server-side WebSocket (RFC 6455) for the launcher server
+Enough of the protocol to push text frames to a browser over a connection
+the asyncio HTTP server has upgraded: the handshake, unmasked server frames,
+masked client frames, ping/pong and the close handshake. No extensions or
+fragmentation of outgoing messages.
+
+Usage:
+    from ws_protocol import WebSocket, accept_headers, is_upgrade
+    if is_upgrade(request.headers):
+        headers = accept_headers(request.headers)     # for the 101 response
+        ...
+        ws = WebSocket(reader, writer)
+        ws.start()
+        await ws.send_json({"type": "hello"})
+        await ws.close()
+"""
+
+import json
+import base64
+import struct
+import asyncio
+import hashlib
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+MAX_CLIENT_FRAME = 64 * 1024     # browsers only send small control/text frames here
+SEND_TIMEOUT = 10.0              # a client that cannot take a frame in this long is dropped
+CLOSE_NORMAL = 1000
+CLOSE_GOING_AWAY = 1001
+CLOSE_TOO_BIG = 1009
+
+
+def is_upgrade(headers):
+    return (headers.get("upgrade", "").lower() == "websocket"
+            and "upgrade" in headers.get("connection", "").lower()
+            and "sec-websocket-key" in headers)
+
+
+def accept_headers(headers):
+    """Headers for the 101 Switching Protocols answer to a valid upgrade request"""
+    digest = hashlib.sha1((headers["sec-websocket-key"].strip() + GUID).encode()).digest()
+    return {"Upgrade": "websocket", "Connection": "Upgrade",
+            "Sec-WebSocket-Accept": base64.b64encode(digest).decode()}
+
+
+def encode_frame(opcode, payload=b""):
+    """One final, unmasked frame (server to client)"""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+async def read_frame(reader):
+    """(fin, opcode, payload) of the next client frame; raises ValueError on protocol errors"""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length, = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        length, = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_CLIENT_FRAME:
+        raise ValueError("frame too large")
+    if not second & 0x80:
+        raise ValueError("client frames must be masked")
+    mask = await reader.readexactly(4)
+    data = await reader.readexactly(length)
+    # XOR with the repeated 4-byte mask, done as one big integer operation
+    key = (mask * (length // 4 + 1))[:length]
+    payload = (int.from_bytes(data, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+    return bool(first & 0x80), first & 0x0F, payload
+
+
+class WebSocket:
+    """An upgraded connection: send frames, answer pings, notice the close"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.closed = asyncio.Event()
+        self.messages = asyncio.Queue(maxsize=16)    # client text messages, oldest dropped when full
+        self.receiver = None
+        self.close_sent = False
+
+    def start(self):
+        self.receiver = asyncio.ensure_future(self.receive_loop())
+        return self
+
+    async def receive_loop(self):
+        try:
+            while True:
+                fin, opcode, payload = await read_frame(self.reader)
+                if opcode == OP_PING:
+                    await self.send_frame(OP_PONG, payload)
+                elif opcode == OP_CLOSE:
+                    await self.close(CLOSE_NORMAL)
+                    return
+                elif opcode == OP_TEXT:
+                    if self.messages.full():
+                        self.messages.get_nowait()
+                    self.messages.put_nowait(payload.decode("utf-8", "replace"))
+        except ValueError:
+            await self.close(CLOSE_TOO_BIG)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.closed.set()
+
+    async def send_frame(self, opcode, payload=b""):
+        if self.close_sent:
+            raise ConnectionError("WebSocket is closed")
+        self.writer.write(encode_frame(opcode, payload))
+        try:
+            await asyncio.wait_for(self.writer.drain(), SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.closed.set()
+            raise ConnectionError("WebSocket client is not reading")
+
+    async def send_text(self, text):
+        await self.send_frame(OP_TEXT, text.encode("utf-8"))
+
+    async def send_json(self, payload):
+        await self.send_text(json.dumps(payload, separators=(",", ":")))
+
+    async def close(self, code=CLOSE_NORMAL):
+        if self.close_sent:
+            return
+        try:
+            await self.send_frame(OP_CLOSE, struct.pack("!H", code))
+        except ConnectionError:
+            pass
+        self.close_sent = True
+
+    async def finish(self, timeout=2.0):
+        """Close (if not done yet) and wait briefly for the client's close frame"""
+        await self.close()
+        try:
+            await asyncio.wait_for(self.closed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        if self.receiver is not None:
+            self.receiver.cancel()